@@ -14,6 +14,7 @@ from django.urls import reverse
 from django.utils.html import format_html
 
 from micboard.admin.mixins import MicboardModelAdmin
+from micboard.admin.performance import KeysetChangelistMixin, RecentPeriodListFilter
 from micboard.models.audit.activity_log import ActivityLog, ServiceSyncLog
 
 
@@ -33,10 +34,20 @@ class _ReadOnlyLogAdminMixin:
         return False
 
 
+class _ActivityLogPeriodFilter(RecentPeriodListFilter):
+    field_name = "created_at"
+
+
+class _ServiceSyncLogPeriodFilter(RecentPeriodListFilter):
+    field_name = "started_at"
+
+
 @admin.register(ActivityLog)
-class ActivityLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
+class ActivityLogAdmin(_ReadOnlyLogAdminMixin, KeysetChangelistMixin, MicboardModelAdmin):
     """Admin for ActivityLog."""
 
+    keyset_field = "created_at"
+
     list_display = (
         "summary",
         "activity_type_badge",
@@ -45,7 +56,7 @@ class ActivityLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
         "status_badge",
         "created_at",
     )
-    list_filter = ("activity_type", "operation", "status", "created_at")
+    list_filter = (_ActivityLogPeriodFilter, "activity_type", "operation", "status")
     search_fields = ("summary", "service_code")
     list_select_related = ("user", "content_type")
     readonly_fields = (
@@ -66,7 +77,6 @@ class ActivityLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
         "created_at",
         "updated_at",
     )
-    date_hierarchy = "created_at"
 
     fieldsets = (
         (
@@ -201,9 +211,11 @@ class ActivityLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
 
 
 @admin.register(ServiceSyncLog)
-class ServiceSyncLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
+class ServiceSyncLogAdmin(_ReadOnlyLogAdminMixin, KeysetChangelistMixin, MicboardModelAdmin):
     """Admin for ServiceSyncLog."""
 
+    keyset_field = "started_at"
+
     list_display = (
         "service_name",
         "sync_type_badge",
@@ -213,7 +225,7 @@ class ServiceSyncLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
         "duration",
         "started_at",
     )
-    list_filter = ("sync_type", "status", "started_at")
+    list_filter = (_ServiceSyncLogPeriodFilter, "sync_type", "status")
     search_fields = ("service__name", "service__code")
     list_select_related = ("service",)
     readonly_fields = (
@@ -230,7 +242,6 @@ class ServiceSyncLogAdmin(_ReadOnlyLogAdminMixin, MicboardModelAdmin):
         "details",
         "duration_display",
     )
-    date_hierarchy = "started_at"
 
     fieldsets = (
         (
@@ -14,6 +14,7 @@ from django.utils.html import format_html
 
 from micboard.admin.channel_forms import RFChannelAdminForm, WirelessUnitAdminForm
 from micboard.admin.mixins import MicboardModelAdmin
+from micboard.admin.performance import ScalableChangelistMixin
 from micboard.admin.regulatory_annotations import (
     regulatory_domain_from_annotations,
     with_regulatory_domain,
@@ -33,7 +34,7 @@ from micboard.services.hardware.wireless_unit_service import (
 
 
 @admin.register(RFChannel)
-class RFChannelAdmin(MicboardModelAdmin):
+class RFChannelAdmin(ScalableChangelistMixin, MicboardModelAdmin):
     """Admin configuration for RFChannel model."""
 
     list_display = (
@@ -9,11 +9,13 @@ locations, and system configuration.
 from __future__ import annotations
 
 import logging
+from functools import reduce
+from operator import add
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from django.contrib import admin, messages
 from django.core.exceptions import PermissionDenied
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, F, OuterRef, Subquery
 from django.shortcuts import redirect
 from django.urls import path, reverse
 from django.utils.decorators import method_decorator
@@ -24,6 +26,7 @@ from micboard.admin.mixins import MicboardModelAdmin
 from micboard.models.discovery.registry import DiscoveredDevice, MicboardConfig
 from micboard.models.locations.structure import Location
 from micboard.models.monitoring.group import MonitoringGroup
+from micboard.models.monitoring.inventory_counter import DEVICE_STATUS_FIELDS, InventoryCounter
 from micboard.services.sync.discovered_device_service import (
     can_promote_device_to_chassis,
     get_device_communication_protocol,
@@ -340,11 +343,37 @@ class DiscoveredDeviceAdmin(MicboardModelAdmin):
 class LocationAdmin(MicboardModelAdmin):
     """Admin configuration for Location model."""
 
-    list_display = ("name", "building", "room")
+    list_display = ("name", "building", "room", "device_count_display", "open_alerts_display")
     list_filter = ("building", "room")
     search_fields = ("name", "building", "room")
     list_select_related = ("building", "room")
 
+    def get_queryset(self, request: Any) -> Any:
+        """Read each displayed location's maintained inventory counter."""
+        counters = InventoryCounter.objects.filter(
+            scope=InventoryCounter.Scope.LOCATION, scope_id=OuterRef("pk")
+        )
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _device_count=Subquery(
+                    counters.annotate(
+                        total=reduce(add, (F(name) for name in DEVICE_STATUS_FIELDS.values())),
+                    ).values("total")[:1]
+                ),
+                _open_alerts=Subquery(counters.values("open_alerts")[:1]),
+            )
+        )
+
+    @admin.display(description="Devices", ordering="_device_count")
+    def device_count_display(self, obj: Any) -> int:
+        return getattr(obj, "_device_count", None) or 0
+
+    @admin.display(description="Open alerts", ordering="_open_alerts")
+    def open_alerts_display(self, obj: Any) -> int:
+        return getattr(obj, "_open_alerts", None) or 0
+
 
 @admin.register(MonitoringGroup)
 class MonitoringGroupAdmin(MicboardModelAdmin):
@@ -0,0 +1,212 @@
+"""Changelist primitives that keep large admin tables cheap to browse.
+
+Django's default changelist counts every matching row twice and offsets deep
+into the table for later pages. The pieces here bound that work: counts stop at
+a small exact limit and fall back to PostgreSQL planner statistics, append-only
+logs page by keyset cursor, and log admins open on an index-backed recent
+window instead of the whole history.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import timedelta
+from typing import Any, ClassVar, cast
+
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+EXACT_COUNT_LIMIT = 10_000
+KEYSET_VAR = "after"
+_KEYSET_CURSOR_ATTR = "_micboard_keyset_cursor"
+
+
+def estimated_row_count(queryset: QuerySet[Any]) -> int | None:
+    """Return the planner's row estimate for ``queryset`` on PostgreSQL.
+
+    Unfiltered tables read ``pg_class.reltuples``; filtered querysets read the
+    top-level ``EXPLAIN`` estimate. Other backends, never-analyzed tables, and
+    planner errors return ``None`` so callers can fall back to an exact count.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+                estimate = row[0] if row else None
+            else:
+                sql, params = queryset.order_by().query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]["Plan"]["Plan Rows"]
+    except DatabaseError:
+        logger.debug("Planner row estimate unavailable for %s", queryset.model._meta.label)
+        return None
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator whose count costs at most ``EXACT_COUNT_LIMIT`` rows.
+
+    Result sets under the limit are counted exactly through a bounded subquery.
+    Larger sets report the planner estimate (never less than the bound). Backends
+    without planner statistics run one exact count instead.
+    """
+
+    object_list: QuerySet[Any]
+    exact_count_limit: ClassVar[int] = EXACT_COUNT_LIMIT
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if connections[queryset.db].vendor != "postgresql":
+            return queryset.count()
+        bounded = queryset.order_by()[: self.exact_count_limit + 1].count()
+        if bounded <= self.exact_count_limit:
+            return bounded
+        estimate = estimated_row_count(queryset)
+        if estimate is None:
+            return queryset.count()
+        return max(estimate, bounded)
+
+
+class KeysetChangeList(ChangeList):
+    """Changelist that pages append-only tables by ``(keyset_field, pk)`` cursor.
+
+    Offset pages stay available for the first screens; the "older" link always
+    continues after the last displayed row so deep history costs one index
+    range scan instead of an ``OFFSET`` over every newer row.
+    """
+
+    keyset_next_url: str | None = None
+    keyset_first_url: str | None = None
+
+    def get_results(self, request: Any) -> None:
+        field_name = cast("KeysetChangelistMixin", self.model_admin).keyset_field
+        keyset_ordered = list(self.queryset.query.order_by) == [f"-{field_name}", "-pk"]
+        cursor = getattr(request, _KEYSET_CURSOR_ATTR, None)
+        if cursor is None or not keyset_ordered:
+            super().get_results(request)
+            if keyset_ordered and self.multi_page and not self.show_all:
+                rows = list(self.result_list)
+                if len(rows) == self.list_per_page:
+                    self.keyset_next_url = self.get_query_string(
+                        {KEYSET_VAR: rows[-1].pk}, [PAGE_VAR]
+                    )
+            return
+
+        boundary = self.queryset.filter(pk=cursor).values_list(field_name, flat=True).first()
+        if boundary is None:
+            raise IncorrectLookupParameters
+        rows = list(
+            self.queryset.filter(
+                Q(**{f"{field_name}__lt": boundary}) | Q(**{field_name: boundary, "pk__lt": cursor})
+            )[: self.list_per_page + 1]
+        )
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = rows[: self.list_per_page]
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = paginator
+        self.keyset_first_url = self.get_query_string(remove=[PAGE_VAR])
+        if len(rows) > self.list_per_page:
+            self.keyset_next_url = self.get_query_string({KEYSET_VAR: rows[-2].pk}, [PAGE_VAR])
+
+
+class ScalableChangelistMixin:
+    """Bound the changelist count and skip Django's unfiltered second count."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class KeysetChangelistMixin(ScalableChangelistMixin):
+    """Page an append-only table by cursor on ``keyset_field``.
+
+    ``keyset_field`` names a non-null, indexed column that is also the table's
+    descending default ordering.
+    """
+
+    keyset_field: ClassVar[str]
+    change_list_template = "admin/micboard/keyset_change_list.html"
+
+    def get_changelist(self, request: Any, **kwargs: Any) -> type[ChangeList]:
+        return KeysetChangeList
+
+    def changelist_view(self, request: Any, extra_context: Any = None) -> Any:
+        """Move the cursor out of the lookup parameters Django validates."""
+        if KEYSET_VAR in request.GET:
+            query = request.GET.copy()
+            cursor = query.pop(KEYSET_VAR)[-1]
+            request.GET = query
+            if cursor.isdigit():
+                setattr(request, _KEYSET_CURSOR_ATTR, int(cursor))
+        return super().changelist_view(request, extra_context)  # type: ignore[misc]
+
+
+class RecentPeriodListFilter(admin.SimpleListFilter):
+    """Default a time-ordered changelist to a recent window on an indexed column.
+
+    Subclasses set ``field_name``. Without a selection the changelist shows the
+    last ``default_period``; "All time" opts back into the full history.
+    """
+
+    title = "period"
+    parameter_name = "period"
+    field_name: ClassVar[str] = ""
+    default_period: ClassVar[str] = "7d"
+    all_periods: ClassVar[str] = "all"
+    periods: ClassVar[dict[str, timedelta]] = {
+        "24h": timedelta(hours=24),
+        "7d": timedelta(days=7),
+        "30d": timedelta(days=30),
+    }
+
+    def lookups(self, request: Any, model_admin: Any) -> list[tuple[str, str]]:
+        return [
+            ("24h", "Last 24 hours"),
+            ("7d", "Last 7 days"),
+            ("30d", "Last 30 days"),
+            (self.all_periods, "All time"),
+        ]
+
+    def value(self) -> str:
+        return super().value() or self.default_period
+
+    def choices(self, changelist: Any) -> Any:
+        selected = self.value()
+        for lookup, title in self.lookup_choices:
+            yield {
+                "selected": selected == str(lookup),
+                "query_string": changelist.get_query_string({self.parameter_name: lookup}),
+                "display": title,
+            }
+
+    def queryset(self, request: Any, queryset: Any) -> Any:
+        period = self.periods.get(self.value())
+        if period is None:
+            return queryset
+        return queryset.filter(**{f"{self.field_name}__gte": timezone.now() - period})
@@ -11,15 +11,18 @@ from typing import Any, ClassVar
 from django.contrib import admin, messages
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.shortcuts import render
 from django.urls import path
 from django.utils.html import format_html
 
 from micboard.admin.forms import WirelessChassisAdminForm
 from micboard.admin.mixins import MicboardModelAdmin
+from micboard.admin.performance import ScalableChangelistMixin
 from micboard.admin.receiver_inlines import AccessoryInline, RFChannelInline
 from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.models.rf_coordination.rf_channel import RFChannel
 from micboard.services.hardware.chassis_admin_service import (
     ChassisAdminDTOMapper,
     ChassisAdminService,
@@ -32,8 +35,14 @@ logger = logging.getLogger(__name__)
 MAX_SYNCHRONOUS_REFRESH = 25
 
 
+def _related_count(related: Any) -> Coalesce:
+    """Return a correlated ``COUNT`` of ``related`` rows grouped by the outer key."""
+    total = related.annotate(total=Count("pk")).values("total")
+    return Coalesce(Subquery(total, output_field=IntegerField()), 0)
+
+
 @admin.register(WirelessChassis)
-class WirelessChassisAdmin(MicboardModelAdmin):
+class WirelessChassisAdmin(ScalableChangelistMixin, MicboardModelAdmin):
     """Admin configuration for WirelessChassis model."""
 
     form = WirelessChassisAdminForm
@@ -110,17 +119,17 @@ class WirelessChassisAdmin(MicboardModelAdmin):
                 super().delete_queryset(request, deletion_queryset)
 
     def get_queryset(self, request: Any) -> Any:
+        """Count channels per displayed chassis without grouping the whole table."""
+        channels = RFChannel.objects.filter(chassis=OuterRef("pk")).order_by().values("chassis")
+        active_channels = channels.filter(
+            Q(active_wireless_unit__isnull=False) | Q(active_iem_receiver__isnull=False)
+        )
         return (
             super()
             .get_queryset(request)
             .annotate(
-                _channel_count=Count("rf_channels", distinct=True),
-                _active_units_count=Count(
-                    "rf_channels",
-                    filter=Q(rf_channels__active_wireless_unit__isnull=False)
-                    | Q(rf_channels__active_iem_receiver__isnull=False),
-                    distinct=True,
-                ),
+                _channel_count=_related_count(channels),
+                _active_units_count=_related_count(active_channels),
             )
         )
 
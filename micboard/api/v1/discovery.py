@@ -3,11 +3,12 @@ from django.db.models import QuerySet
 from rest_framework import permissions
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from micboard.api.v1.renderers import FastJSONMixin
 from micboard.models.discovery.registry import DiscoveredDevice
 from micboard.serializers.v1.discovery import DiscoveredDeviceSerializer
 
 
-class DiscoveredDeviceViewSet(ReadOnlyModelViewSet):
+class DiscoveredDeviceViewSet(FastJSONMixin, ReadOnlyModelViewSet):
     """Read-only viewset for DiscoveredDevice."""
 
     serializer_class = DiscoveredDeviceSerializer
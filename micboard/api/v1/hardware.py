@@ -1,52 +1,96 @@
+from datetime import UTC, datetime
 from typing import Any
 
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
 from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from micboard.api.v1.pagination import UpdatedAtKeysetPagination
+from micboard.api.v1.renderers import FastJSONMixin
 from micboard.models.hardware.wireless_chassis import WirelessChassis
 from micboard.models.hardware.wireless_unit import WirelessUnit
 from micboard.models.rf_coordination.rf_channel import RFChannel
 from micboard.serializers.v1.hardware import (
     RFChannelSerializer,
+    SparseHardwareSerializer,
     WirelessChassisSerializer,
     WirelessUnitSerializer,
 )
 
 
-class WirelessChassisViewSet(ReadOnlyModelViewSet):
-    """Read-only viewset for WirelessChassis."""
+class HardwareSyncViewSet(FastJSONMixin, ReadOnlyModelViewSet):
+    """Read-only hardware viewset shaped for incremental inventory sync.
 
-    serializer_class = WirelessChassisSerializer
+    Lists page by ``(updated_at, pk)`` keyset, accept ``updated_since`` to return only
+    rows changed at or after an ISO 8601 timestamp, and accept ``fields`` to render a
+    comma-separated subset of serializer fields.
+    """
+
+    model: type[WirelessChassis | WirelessUnit | RFChannel]
+    serializer_class: type[SparseHardwareSerializer]
     permission_classes = (permissions.IsAuthenticated,)
+    pagination_class = UpdatedAtKeysetPagination
 
-    def get_queryset(self) -> Any:
+    def get_queryset(self) -> QuerySet[Any]:
         user = self.request.user
         if not user.is_authenticated:
-            return WirelessChassis.objects.none()
-        return WirelessChassis.objects.for_user(user=user)
+            return self.model.objects.none()
+        queryset = self.model.objects.for_user(user=user)
+        updated_since = self.updated_since()
+        if updated_since is not None:
+            queryset = queryset.filter(updated_at__gte=updated_since)
+        return queryset
+
+    def get_serializer_context(self) -> dict[str, Any]:
+        context = dict(super().get_serializer_context())
+        context["sparse_fields"] = self.sparse_fields()
+        return context
+
+    def sparse_fields(self) -> frozenset[str] | None:
+        raw_value = self.request.query_params.get("fields")
+        if raw_value is None:
+            return None
+        requested = frozenset(name.strip() for name in raw_value.split(",") if name.strip())
+        if not requested:
+            raise ValidationError({"fields": ["Name at least one field."]})
+        unknown = requested - self.serializer_class.available_fields()
+        if unknown:
+            raise ValidationError({"fields": [f"Unknown fields: {', '.join(sorted(unknown))}"]})
+        return requested
+
+    def updated_since(self) -> datetime | None:
+        raw_value = self.request.query_params.get("updated_since")
+        if raw_value is None:
+            return None
+        try:
+            parsed = parse_datetime(raw_value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({"updated_since": ["Expected an ISO 8601 timestamp."]})
+        return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed, UTC)
+
+
+class WirelessChassisViewSet(HardwareSyncViewSet):
+    """Read-only viewset for WirelessChassis."""
+
+    model = WirelessChassis
+    serializer_class = WirelessChassisSerializer
 
 
-class WirelessUnitViewSet(ReadOnlyModelViewSet):
+class WirelessUnitViewSet(HardwareSyncViewSet):
     """Read-only viewset for WirelessUnit."""
 
+    model = WirelessUnit
     serializer_class = WirelessUnitSerializer
-    permission_classes = (permissions.IsAuthenticated,)
-
-    def get_queryset(self) -> Any:
-        user = self.request.user
-        if not user.is_authenticated:
-            return WirelessUnit.objects.none()
-        return WirelessUnit.objects.for_user(user=user)
 
 
-class RFChannelViewSet(ReadOnlyModelViewSet):
+class RFChannelViewSet(HardwareSyncViewSet):
     """Read-only viewset for RFChannel."""
 
+    model = RFChannel
     serializer_class = RFChannelSerializer
-    permission_classes = (permissions.IsAuthenticated,)
-
-    def get_queryset(self) -> Any:
-        user = self.request.user
-        if not user.is_authenticated:
-            return RFChannel.objects.none()
-        return RFChannel.objects.for_user(user=user)
@@ -3,12 +3,13 @@ from typing import Any
 from rest_framework import permissions
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from micboard.api.v1.renderers import FastJSONMixin
 from micboard.models.monitoring.group import MonitoringGroup
 from micboard.serializers.v1.monitoring import AlertSerializer, MonitoringGroupSerializer
 from micboard.services.monitoring.alerts import get_alerts_for_user
 
 
-class MonitoringGroupViewSet(ReadOnlyModelViewSet):
+class MonitoringGroupViewSet(FastJSONMixin, ReadOnlyModelViewSet):
     """Read-only viewset for MonitoringGroup."""
 
     serializer_class = MonitoringGroupSerializer
@@ -25,7 +26,7 @@ class MonitoringGroupViewSet(ReadOnlyModelViewSet):
         return user.monitoring_groups.filter(is_active=True)
 
 
-class AlertViewSet(ReadOnlyModelViewSet):
+class AlertViewSet(FastJSONMixin, ReadOnlyModelViewSet):
     """Read-only viewset for Alert."""
 
     serializer_class = AlertSerializer
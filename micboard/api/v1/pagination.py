@@ -0,0 +1,104 @@
+import base64
+import binascii
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+
+class UpdatedAtKeysetPagination(BasePagination):
+    """Forward-only keyset pagination over ``(updated_at, pk)``.
+
+    Each page is one indexed range scan with no COUNT query, so a client syncing the
+    whole inventory pays for the rows it reads rather than for the rows it skips.
+    """
+
+    page_size = 100
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[Any] | Sequence[Any],
+        request: Request,
+        view: APIView | None = None,
+    ) -> list[Any]:
+        if not isinstance(queryset, QuerySet):
+            raise TypeError("Keyset pagination requires a QuerySet")
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by("updated_at", "pk")
+        position = self.decode_cursor(request)
+        if position is not None:
+            updated_at, pk = position
+            queryset = queryset.filter(
+                Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, pk__gt=pk)
+            )
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+        self.next_position = (page[-1].updated_at, page[-1].pk) if len(rows) > page_size else None
+        return page
+
+    def get_page_size(self, request: Request) -> int:
+        raw_value = request.query_params.get(self.page_size_query_param)
+        if raw_value is None:
+            return self.page_size
+        try:
+            parsed = int(raw_value)
+        except ValueError:
+            return self.page_size
+        return min(max(parsed, 1), self.max_page_size)
+
+    def decode_cursor(self, request: Request) -> tuple[datetime, int] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            decoded = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            raw_updated_at, raw_pk = decoded.rsplit("|", 1)
+            updated_at = parse_datetime(raw_updated_at)
+            pk = int(raw_pk)
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        if updated_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return updated_at, pk
+
+    def encode_cursor(self, position: tuple[datetime, int]) -> str:
+        updated_at, pk = position
+        token = f"{updated_at.isoformat()}|{pk}".encode("ascii")
+        return base64.urlsafe_b64encode(token).decode("ascii")
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.next_position),
+        )
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,79 @@
+from collections.abc import Mapping
+from typing import Any
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from micboard.utils import json_codec
+
+_DRF_DEFAULT = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` encoding compact responses with the active JSON codec.
+
+    Values orjson and msgspec cannot encode natively go through DRF's ``JSONEncoder``.
+    Indented responses (``?format=json; indent=4`` or a renderer context ``indent``) are
+    rare and human-facing, so they keep the stock encoder, as does the stdlib backend.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        codec = json_codec.active_codec(_DRF_DEFAULT)
+        if codec.name == "stdlib" or self.get_indent(
+            accepted_media_type or "", renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Match the stock renderer, which escapes these for safe embedding in <script>.
+        return (
+            codec.dumps(data)
+            .replace(b"\xe2\x80\xa8", b"\\u2028")
+            .replace(b"\xe2\x80\xa9", b"\\u2029")
+        )
+
+
+class FastJSONParser(JSONParser):
+    """``JSONParser`` decoding UTF-8 request bodies with the active JSON codec."""
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if encoding.lower().replace("_", "-") not in {"utf-8", "utf8"}:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return json_codec.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
+
+
+class FastJSONMixin:
+    """Swap the stock JSON renderer and parser for the codec-backed ones.
+
+    Only exact ``JSONRenderer``/``JSONParser`` instances are replaced, so renderer and
+    parser classes configured by the host project (browsable API, camel-case JSON) are
+    left untouched.
+    """
+
+    def get_renderers(self) -> list[BaseRenderer]:
+        return [
+            FastJSONRenderer() if type(renderer) is JSONRenderer else renderer
+            for renderer in super().get_renderers()  # type: ignore[misc]
+        ]
+
+    def get_parsers(self) -> list[BaseParser]:
+        return [
+            FastJSONParser() if type(parser) is JSONParser else parser
+            for parser in super().get_parsers()  # type: ignore[misc]
+        ]
@@ -3,12 +3,13 @@ from django.db.models import QuerySet
 from rest_framework import permissions
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from micboard.api.v1.renderers import FastJSONMixin
 from micboard.models.settings.registry import Setting, SettingDefinition
 from micboard.serializers.v1.settings import SettingDefinitionSerializer, SettingSerializer
 from micboard.services.settings.visibility_service import settings_visibility
 
 
-class SettingDefinitionViewSet(ReadOnlyModelViewSet):
+class SettingDefinitionViewSet(FastJSONMixin, ReadOnlyModelViewSet):
     """Read-only viewset for SettingDefinition."""
 
     serializer_class = SettingDefinitionSerializer
@@ -18,7 +19,7 @@ class SettingDefinitionViewSet(ReadOnlyModelViewSet):
         return SettingDefinition.objects.filter(is_active=True)
 
 
-class SettingViewSet(ReadOnlyModelViewSet):
+class SettingViewSet(FastJSONMixin, ReadOnlyModelViewSet):
     """Read-only viewset for Setting overrides."""
 
     serializer_class = SettingSerializer
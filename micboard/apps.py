@@ -55,7 +55,10 @@ class MicboardConfig(AppConfig):
         if not huey_is_configured():
             return
 
+        from micboard.tasks.maintenance.audit import prune_operational_logs
         from micboard.tasks.maintenance.charger import poll_charger_data
+        from micboard.tasks.maintenance.inventory import reconcile_inventory_counters
+        from micboard.tasks.monitoring.email_outbox import drain_alert_email_outbox
         from micboard.tasks.monitoring.health import (
             check_manufacturer_api_health,
             check_realtime_connection_health,
@@ -75,7 +78,10 @@ class MicboardConfig(AppConfig):
         )
 
         task_functions = (
+            prune_operational_logs,
             poll_charger_data,
+            reconcile_inventory_counters,
+            drain_alert_email_outbox,
             check_manufacturer_api_health,
             check_realtime_connection_health,
             check_selected_api_server_connections,
@@ -1,17 +1,29 @@
 from functools import wraps
 from typing import Any
 
-from django.http import JsonResponse
-
 from micboard.services.shared.rate_limiting import (
+    RateLimitQuota,
     check_rate_limit,
     get_client_ip,
+    get_tenant_cache_key,
     get_user_cache_key,
 )
+from micboard.utils.json_codec import FastJsonResponse
+
 
+def rate_limit_view(
+    max_requests: int = 60,
+    window_seconds: int = 60,
+    key_func: Any = None,
+    *,
+    burst: int = 0,
+    tenant_max_requests: int | None = None,
+) -> Any:
+    """Rate limit decorator for Django views using a sliding window (delegates to service).
 
-def rate_limit_view(max_requests: int = 60, window_seconds: int = 60, key_func: Any = None) -> Any:
-    """Rate limit decorator for Django views using sliding window algorithm (delegates to service)."""
+    ``burst`` admits that many extra requests per window. ``tenant_max_requests``
+    adds one quota per view shared by every caller in the request's organization.
+    """
 
     def decorator(view_func: Any) -> Any:
         @wraps(view_func)
@@ -22,16 +34,28 @@ def rate_limit_view(max_requests: int = 60, window_seconds: int = 60, key_func:
                 ip = get_client_ip(request)
                 cache_key = f"rate_limit_{view_func.__name__}_{ip}"
 
-            allowed, retry_after, _ = check_rate_limit(cache_key, max_requests, window_seconds)
-            if not allowed:
-                return JsonResponse(
+            shared_quotas = []
+            if tenant_max_requests is not None and (
+                tenant_key := get_tenant_cache_key(request, view_func.__name__)
+            ):
+                shared_quotas.append(RateLimitQuota(tenant_key, tenant_max_requests))
+
+            decision = check_rate_limit(
+                cache_key,
+                max_requests,
+                window_seconds,
+                burst=burst,
+                shared_quotas=shared_quotas,
+            )
+            if not decision.allowed:
+                return FastJsonResponse(
                     {
                         "error": "Rate limit exceeded",
-                        "detail": f"Maximum {max_requests} requests per {window_seconds} seconds",
-                        "retry_after": retry_after,
+                        "detail": f"Maximum {decision.limit} requests per {window_seconds} seconds",
+                        "retry_after": decision.retry_after,
                     },
                     status=429,
-                    headers={"Retry-After": str(retry_after)},
+                    headers={"Retry-After": str(decision.retry_after)},
                 )
             return view_func(request, *args, **kwargs)
 
@@ -40,13 +64,25 @@ def rate_limit_view(max_requests: int = 60, window_seconds: int = 60, key_func:
     return decorator
 
 
-def rate_limit_user(max_requests: int = 100, window_seconds: int = 60) -> Any:
+def rate_limit_user(
+    max_requests: int = 100,
+    window_seconds: int = 60,
+    *,
+    burst: int = 0,
+    tenant_max_requests: int | None = None,
+) -> Any:
     """Rate limit decorator for authenticated users (delegates to service for cache key)."""
 
     def decorator(view_func: Any) -> Any:
         def key_func(request: Any) -> Any:
             return get_user_cache_key(request, view_func_name=view_func.__name__)
 
-        return rate_limit_view(max_requests, window_seconds, key_func)(view_func)
+        return rate_limit_view(
+            max_requests,
+            window_seconds,
+            key_func,
+            burst=burst,
+            tenant_max_requests=tenant_max_requests,
+        )(view_func)
 
     return decorator
@@ -10,6 +10,7 @@ from micboard.services.common.base.plugin import ManufacturerPlugin
 
 if TYPE_CHECKING:
     from micboard.models.hardware.manufacturer import Manufacturer
+    from micboard.services.core.hardware import NormalizedHardware
 
 from .client import SennheiserSystemAPIClient
 
@@ -55,6 +56,10 @@ class SennheiserPlugin(ManufacturerPlugin):
         """Transform Sennheiser SSCv2 API data to micboard format."""
         return self.transformer.transform_device_data(api_data)
 
+    def normalize_device_data(self, api_data: dict[str, Any]) -> NormalizedHardware | None:
+        """Normalize Sennheiser SSCv2 API data straight from its typed payload."""
+        return self.transformer.normalize_device_data(api_data)
+
     def transform_transmitter_data(
         self, tx_data: dict[str, Any], channel_num: int
     ) -> dict[str, Any] | None:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, Protocol
@@ -13,6 +12,7 @@ from micboard.services.common.network_limits import (
     SSE_READ_CHUNK_BYTES,
     SSEStreamLimits,
 )
+from micboard.utils import json_codec
 from micboard.utils.exception_logging import sanitized_exception_info
 
 from .exceptions import SennheiserAPIError
@@ -208,7 +208,11 @@ async def _dispatch_sse_event(
         logger.warning("Discarded SSE event data that exceeded the byte limit")
         return
     try:
-        data = json.loads(event_data)
-        await callback(data)
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        logger.debug("Invalid JSON in SSE event data")
+        data = json_codec.loads(event_data)
+    except ValueError as exc:
+        logger.warning(
+            "Discarded SSE event with invalid JSON data",
+            exc_info=sanitized_exception_info(exc),
+        )
+        return
+    await callback(data)
@@ -10,6 +10,7 @@ from micboard.services.common.base.plugin import ManufacturerPlugin
 
 if TYPE_CHECKING:
     from micboard.models.discovery.manufacturer import Manufacturer
+    from micboard.services.core.hardware import NormalizedHardware
 
 from .client import ShureSystemAPIClient
 from .transformers import ShureDataTransformer
@@ -56,6 +57,10 @@ class ShurePlugin(ManufacturerPlugin):
         """Transform Shure API data to micboard format."""
         return self.transformer.transform_device_data(api_data)
 
+    def normalize_device_data(self, api_data: dict[str, Any]) -> NormalizedHardware | None:
+        """Normalize Shure API data straight from its typed payload."""
+        return self.transformer.normalize_device_data(api_data)
+
     def transform_transmitter_data(
         self, tx_data: dict[str, Any], channel_num: int
     ) -> dict[str, Any] | None:
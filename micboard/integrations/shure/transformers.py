@@ -10,12 +10,18 @@ This module handles all data transformation logic, including:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from micboard.services.common.base.wireless_payloads import (
+    DevicePayload,
+    TransmitterPayload,
+    format_runtime,
+)
 from micboard.utils.exception_logging import sanitized_exception_info
 
 if TYPE_CHECKING:
-    pass
+    from micboard.services.core.hardware import NormalizedHardware
 
 logger = logging.getLogger(__name__)
 
@@ -34,68 +40,56 @@ class ShureDataTransformer:
             Transformed device data dict, or None if transformation fails
         """
         try:
-            device_id = api_data.get("id")
+            payload = DevicePayload.from_mapping(api_data)
+            device_id = payload.api_device_id
             if not device_id:
                 logger.error("Device data missing 'id' field")
                 return None
 
-            identity = ShureDataTransformer.identify_device_model(api_data)
-            device_type = identity["type"]
+            identity = ShureDataTransformer._identify(payload)
             logger.debug("Transforming Shure device payload")
 
             result = {
                 "api_device_id": device_id,
-                "ip": api_data.get("ip")
-                or api_data.get("ip_address")
-                or api_data.get("ipAddress")
-                or "",
-                "type": device_type,
-                "name": api_data.get("name")
-                or api_data.get("device_name")
-                or api_data.get("deviceName")
-                or identity.get("model", ""),
-                "firmware": identity.get("firmware", ""),
+                "ip": payload.ip,
+                "type": identity["type"],
+                "name": payload.name or identity["model"],
+                "firmware": identity["firmware"],
                 # Additional device details (populated if present or via enrichment)
-                "serial": api_data.get("serial_number", api_data.get("serialNumber")),
-                "hostname": api_data.get("hostname"),
-                "mac_address": api_data.get("mac_address", api_data.get("macAddress")),
-                "model_variant": api_data.get("model_variant", api_data.get("modelVariant")),
-                "band": api_data.get("frequency_band", api_data.get("frequencyBand")),
-                "location": api_data.get("location"),
+                "serial": payload.serial,
+                "hostname": payload.hostname,
+                "mac_address": payload.mac_address,
+                "model_variant": payload.model_variant,
+                "band": payload.band,
+                "location": payload.location,
                 # Best-effort extra info bucket for consumers that want more detail
                 "info": {
-                    "raw_type": identity.get("raw_type", ""),
-                    "raw_model": identity.get("raw_model", ""),
-                    "uptime_minutes": api_data.get("uptime_minutes", api_data.get("uptimeMinutes")),
-                    "temperature_c": api_data.get("temperature_c", api_data.get("temperatureC")),
+                    "raw_type": identity["raw_type"],
+                    "raw_model": identity["raw_model"],
+                    "uptime_minutes": payload.uptime_minutes,
+                    "temperature_c": payload.temperature_c,
                 },
                 "channels": [],
             }
 
-            # Transform channel data
-            channels_data = api_data.get("channels", [])
-            logger.debug("Processing %d Shure channel payloads", len(channels_data))
-
-            for channel_data in channels_data:
-                channel_num = channel_data.get("channel", channel_data.get("channelNumber", 0))
-                tx_data = channel_data.get("tx", channel_data.get("transmitter", {}))
+            logger.debug("Processing %d Shure channel payloads", len(payload.raw_channels))
 
-                # Only add channel if transmitter data exists
-                if tx_data and isinstance(tx_data, dict):
-                    transformed_tx = ShureDataTransformer.transform_transmitter_data(
-                        tx_data, channel_num
-                    )
-                    if transformed_tx:
-                        result["channels"].append(
-                            {
-                                "channel": channel_num,
-                                "tx": transformed_tx,
-                            }
-                        )
-                else:
+            for channel in payload.channels():
+                if channel.transmitter is None:
                     logger.debug(
                         "Shure channel payload contains no transmitter data",
                     )
+                    continue
+                transformed_tx = ShureDataTransformer.transform_transmitter_data(
+                    channel.transmitter, channel.channel
+                )
+                if transformed_tx:
+                    result["channels"].append(
+                        {
+                            "channel": channel.channel,
+                            "tx": transformed_tx,
+                        }
+                    )
 
             logger.debug(
                 "Successfully transformed Shure device payload with %d channels",
@@ -109,6 +103,27 @@ class ShureDataTransformer:
             )
             return None
 
+    @staticmethod
+    def normalize_device_data(api_data: dict) -> NormalizedHardware | None:
+        """Normalize Shure API device data for inventory sync without transforming channels.
+
+        Returns the same payload as ``NormalizedHardware.from_api`` applied to
+        ``transform_device_data``, or None when the device cannot be normalized.
+        """
+        try:
+            payload = DevicePayload.from_mapping(api_data)
+            if not payload.api_device_id:
+                logger.error("Device data missing 'id' field")
+                return None
+            fallback_name = "" if payload.name else ShureDataTransformer._identify(payload)["model"]
+            return payload.normalized_hardware(fallback_name=fallback_name)
+        except Exception as exc:
+            logger.exception(
+                "Error normalizing Shure device data; payload redacted",
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
+
     @staticmethod
     def identify_device_model(api_data: dict) -> dict:
         """Identify and normalize device model information from Shure System API payload.
@@ -124,9 +139,12 @@ class ShureDataTransformer:
                 - raw_type: Raw API 'type' value (if available)
                 - raw_model: Raw API model field value (if available)
         """
-        raw_type = api_data.get("type")
-        raw_model = api_data.get("model_name", api_data.get("modelName"))
-        firmware = api_data.get("firmware_version", api_data.get("firmwareVersion")) or ""
+        return ShureDataTransformer._identify(DevicePayload.from_mapping(api_data))
+
+    @staticmethod
+    def _identify(payload: DevicePayload) -> dict:
+        raw_type = payload.raw_type
+        raw_model = payload.raw_model
 
         norm_type = ShureDataTransformer._map_device_type(raw_type or "unknown")
 
@@ -146,13 +164,13 @@ class ShureDataTransformer:
         return {
             "model": model,
             "type": norm_type,
-            "firmware": str(firmware),
+            "firmware": payload.firmware,
             "raw_type": raw_type or "",
             "raw_model": raw_model or "",
         }
 
     @staticmethod
-    def transform_transmitter_data(tx_data: dict, channel_num: int) -> dict | None:
+    def transform_transmitter_data(tx_data: Mapping[str, Any], channel_num: int) -> dict | None:
         """Transform transmitter data from Shure API format to micboard format.
 
         Handles various field name variations and provides sensible defaults.
@@ -165,78 +183,7 @@ class ShureDataTransformer:
             Transformed transmitter data dict, or None if transformation fails
         """
         try:
-            # Battery data - handle both 'bars' and 'charge' formats
-            battery_bars = tx_data.get("battery_bars", tx_data.get("batteryBars", 255))
-            battery_charge = tx_data.get("battery_charge", tx_data.get("batteryCharge"))
-            battery_runtime = tx_data.get(
-                "battery_runtime_minutes", tx_data.get("batteryRuntimeMinutes")
-            )
-
-            # Audio and RF levels
-            audio_level = tx_data.get("audio_level", tx_data.get("audioLevel", 0))
-            rf_level = tx_data.get("rf_level", tx_data.get("rfLevel", 0))
-
-            # Frequency and antenna
-            frequency = tx_data.get("frequency", "")
-            antenna = tx_data.get("antenna", "")
-
-            # Status and quality
-            status = tx_data.get("status", "")
-            quality = tx_data.get("audio_quality", tx_data.get("audioQuality", 255))
-            tx_offset = tx_data.get("tx_offset", tx_data.get("txOffset", 255))
-
-            # Transmitter name
-            name = tx_data.get("name", tx_data.get("deviceName", ""))
-
-            # Slot assignment - use channel number if not explicitly provided
-            slot = tx_data.get("slot", channel_num)
-
-            # Battery health data (extract from API)
-            battery_health = tx_data.get("battery_health", tx_data.get("batteryHealth", ""))
-            battery_cycles = tx_data.get("battery_cycles", tx_data.get("batteryCycles"))
-            battery_temperature_c = tx_data.get(
-                "battery_temperature_c", tx_data.get("batteryTemperatureC")
-            )
-
-            # Optional extra details not required by core micboard views
-            extra = {
-                "encryption": tx_data.get("encryption"),
-                "rf_quality": tx_data.get("rf_quality", tx_data.get("rfQuality")),
-                "diversity": tx_data.get("diversity"),
-                "antenna_metrics": {
-                    "a": tx_data.get("rfAntennaA", tx_data.get("rf_antenna_a")),
-                    "b": tx_data.get("rfAntennaB", tx_data.get("rf_antenna_b")),
-                },
-                "clip": tx_data.get("clip"),
-                "peak": tx_data.get("peak"),
-            }
-
-            return {
-                "battery": battery_bars,
-                "battery_charge": battery_charge,
-                "battery_health": battery_health,
-                "battery_cycles": battery_cycles,
-                "battery_temperature_c": battery_temperature_c,
-                "audio_level": audio_level,
-                "rf_level": rf_level,
-                "frequency": str(frequency) if frequency else "",
-                "antenna": str(antenna) if antenna else "",
-                "tx_offset": tx_offset,
-                "quality": quality,
-                "runtime": ShureDataTransformer._format_runtime(battery_runtime),
-                "status": str(status) if status else "",
-                # Additional transmitter details when available
-                "mute": tx_data.get("mute", tx_data.get("isMuted")),
-                "power": tx_data.get("power", tx_data.get("txPower")),
-                "battery_type": tx_data.get("battery_type", tx_data.get("batteryType")),
-                "temperature": tx_data.get("temperature"),
-                "rf_antenna_a": tx_data.get("rfAntennaA", tx_data.get("rf_antenna_a")),
-                "rf_antenna_b": tx_data.get("rfAntennaB", tx_data.get("rf_antenna_b")),
-                "name": str(name) if name else "",
-                "name_raw": str(name) if name else "",
-                "slot": slot,
-                "extra": extra,
-            }
+            return TransmitterPayload.from_mapping(tx_data, channel_num).as_micboard_dict()
         except Exception as exc:
             logger.exception(
                 "Error transforming Shure transmitter payload",
@@ -287,11 +234,4 @@ class ShureDataTransformer:
         Returns:
             Formatted runtime string (HH:MM) or empty string if invalid
         """
-        if minutes is None or minutes < 0:
-            return ""
-        try:
-            hours = int(minutes) // 60
-            mins = int(minutes) % 60
-            return f"{hours:02d}:{mins:02d}"
-        except (ValueError, TypeError):
-            return ""
+        return format_runtime(minutes)
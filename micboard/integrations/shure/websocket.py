@@ -26,7 +26,6 @@ See docs/shure-integration.md for full details on Shure System API integration.
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import AsyncIterable, Awaitable, Callable
 from inspect import isawaitable
@@ -34,6 +33,7 @@ from typing import Any, Protocol, cast
 
 from asgiref.sync import sync_to_async
 
+from micboard.utils import json_codec
 from micboard.utils.exception_logging import sanitized_exception_info
 
 websockets: Any
@@ -79,11 +79,9 @@ class ShureWebSocketError(Exception):
 
 def _parse_transport_id_from_message(message: str | bytes) -> str | None:
     try:
-        if isinstance(message, bytes):
-            message = message.decode("utf-8")
-        payload = json.loads(message)
+        payload = json_codec.loads(message)
         return cast(str | None, payload.get("transportId"))
-    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+    except ValueError as exc:
         logger.exception(
             "Failed to parse WebSocket transport ID message",
             exc_info=sanitized_exception_info(exc),
@@ -119,17 +117,18 @@ async def _read_and_dispatch_messages(
 ) -> None:
     async for message in websocket:
         try:
-            data = json.loads(message)
-            logger.debug("Received Shure WebSocket message")
-            callback_result = callback(data)
-            if isawaitable(callback_result):
-                await callback_result
-        except json.JSONDecodeError as exc:
+            data = json_codec.loads(message)
+        except ValueError as exc:
             logger.exception(
                 "Failed to parse Shure WebSocket message",
                 exc_info=sanitized_exception_info(exc),
             )
             continue
+        try:
+            logger.debug("Received Shure WebSocket message")
+            callback_result = callback(data)
+            if isawaitable(callback_result):
+                await callback_result
         except Exception as exc:
             logger.exception(
                 "Error processing WebSocket message",
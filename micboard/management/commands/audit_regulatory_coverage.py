@@ -132,7 +132,7 @@ class Command(BaseCommand):
         """Audit active RFChannel frequencies."""
         channels_qs = RFChannel.objects.filter(
             resource_state__in=["active", "reserved"], frequency__isnull=False
-        ).select_related("chassis", "chassis__location")
+        ).select_related("chassis", "chassis__location__building")
 
         total = channels_qs.count()
         missing_coverage = 0
@@ -0,0 +1,26 @@
+"""Management command to reconcile the maintained inventory counters."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+
+class Command(BaseCommand):
+    help = "Recount inventory counters from the hardware tables and repair drifted rows"
+
+    def add_arguments(self, parser: Any) -> Any:
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to reconcile (default: default)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        result = InventoryCounterService.reconcile(using=options["database"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {result.checked} inventory counter row(s): {result.corrected} corrected"
+            )
+        )
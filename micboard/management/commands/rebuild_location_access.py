@@ -0,0 +1,27 @@
+"""Management command to rebuild the materialized monitoring location access."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from micboard.services.monitoring.location_access_service import LocationAccessService
+
+
+class Command(BaseCommand):
+    help = "Recompute every user's monitoring location access from their groups"
+
+    def add_arguments(self, parser: Any) -> Any:
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to rebuild (default: default)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        result = LocationAccessService.rebuild(using=options["database"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt location access for {result.users} user(s): "
+                f"{result.created} granted, {result.deleted} revoked"
+            )
+        )
@@ -0,0 +1,32 @@
+"""Show queue depth and wait time for each background task lane."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from micboard.utils.task_lanes import lane_budget, lane_snapshot
+
+
+def _seconds(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}s"
+
+
+class Command(BaseCommand):
+    help = "Show queue depth and enqueue-to-start wait per background task lane"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write(
+            f"{'Lane':<12} {'Priority':>8} {'Workers':>7} {'Depth':>6} "
+            f"{'Enqueued':>8} {'Started':>7} {'Avg wait':>9} {'Last wait':>9}"
+        )
+        for status in lane_snapshot():
+            budget = lane_budget(status.lane)
+            self.stdout.write(
+                f"{status.lane.value:<12} {budget.priority:>8} {budget.workers:>7} "
+                f"{status.depth:>6} {status.enqueued:>8} {status.started:>7} "
+                f"{_seconds(status.average_wait_seconds):>9} "
+                f"{_seconds(status.last_wait_seconds):>9}"
+            )
+        self.stdout.write("Counts and waits cover the current hour.")
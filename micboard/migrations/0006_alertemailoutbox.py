@@ -0,0 +1,35 @@
+# Generated by Django 6.1.2 on 2026-10-18 21:32
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0005_setting_setting_exactly_one_scope_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlertEmailOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recipient', models.EmailField(help_text='Address resolved from preferences at queue time', max_length=254)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed'), ('cancelled', 'Cancelled')], default='pending', help_text='Current delivery state', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='Delivery attempts claimed so far')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest time a drain may claim this email')),
+                ('last_error', models.CharField(blank=True, help_text='Exception type of the last failed attempt', max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='When the email was queued')),
+                ('sent_at', models.DateTimeField(blank=True, help_text='When the email was sent', null=True)),
+                ('alert', models.OneToOneField(help_text='Alert this email notifies about', on_delete=django.db.models.deletion.CASCADE, related_name='email_outbox', to='micboard.alert')),
+            ],
+            options={
+                'verbose_name': 'Alert Email',
+                'verbose_name_plural': 'Alert Email Outbox',
+                'ordering': ['next_attempt_at', 'pk'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='micboard_al_status_c32c98_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.1.2 on 2026-10-18 22:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0006_alertemailoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rfchannel',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Last update timestamp'),
+        ),
+        migrations.AddField(
+            model_name='wirelesschassis',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Last update timestamp'),
+        ),
+        migrations.AddIndex(
+            model_name='rfchannel',
+            index=models.Index(fields=['updated_at', 'id'], name='micboard_rf_updated_3d20a0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wirelesschassis',
+            index=models.Index(fields=['updated_at', 'id'], name='micboard_wi_updated_a735df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wirelessunit',
+            index=models.Index(fields=['updated_at', 'id'], name='micboard_wi_updated_581209_idx'),
+        ),
+    ]
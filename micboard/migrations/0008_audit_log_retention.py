@@ -0,0 +1,53 @@
+# Generated by Django 6.1.2 on 2026-10-18 23:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0007_hardware_sync_keyset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLogDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('service_sync', 'Service Sync'), ('api_health', 'API Health')], help_text='Summarized log', max_length=20)),
+                ('day', models.DateField(help_text='Day the summarized rows were recorded')),
+                ('row_count', models.PositiveIntegerField(default=0, help_text='Rows summarized')),
+                ('status_counts', models.JSONField(blank=True, default=dict, help_text='Summarized rows per status')),
+                ('device_count_total', models.PositiveBigIntegerField(default=0, help_text='Sum of devices synced (service sync rows only)')),
+                ('response_time_total', models.FloatField(default=0.0, help_text='Sum of response times in seconds (API health rows only)')),
+                ('response_time_samples', models.PositiveIntegerField(default=0, help_text='Rows that reported a response time')),
+            ],
+            options={
+                'verbose_name': 'Audit Log Daily Summary',
+                'verbose_name_plural': 'Audit Log Daily Summaries',
+                'ordering': ['-day', 'kind'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='apihealthlog',
+            index=models.Index(fields=['timestamp'], name='micboard_ap_timesta_62521c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicesynclog',
+            index=models.Index(fields=['started_at'], name='micboard_se_started_6555a1_idx'),
+        ),
+        migrations.AddField(
+            model_name='auditlogdailysummary',
+            name='manufacturer',
+            field=models.ForeignKey(help_text='Manufacturer the summarized rows belonged to', on_delete=django.db.models.deletion.CASCADE, related_name='audit_log_summaries', to='micboard.manufacturer'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlogdailysummary',
+            index=models.Index(fields=['kind', 'day'], name='micboard_au_kind_7a20ec_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='auditlogdailysummary',
+            constraint=models.UniqueConstraint(fields=('kind', 'manufacturer', 'day'), name='micboard_audit_summary_unique_day'),
+        ),
+    ]
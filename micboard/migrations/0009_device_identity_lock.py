@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-18 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0008_audit_log_retention'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeviceIdentityLock',
+            fields=[
+                ('bucket', models.PositiveIntegerField(help_text='Identity hash bucket', primary_key=True, serialize=False)),
+            ],
+            options={
+                'verbose_name': 'Device Identity Lock',
+                'verbose_name_plural': 'Device Identity Locks',
+                'ordering': ['bucket'],
+            },
+        ),
+    ]
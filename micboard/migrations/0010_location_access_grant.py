@@ -0,0 +1,86 @@
+# Generated by Django 6.1.2 on 2026-10-19 08:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def build_location_access(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Materialize access for existing monitoring-group members."""
+    MonitoringGroup = apps.get_model('micboard', 'MonitoringGroup')
+    MonitoringGroupLocation = apps.get_model('micboard', 'MonitoringGroupLocation')
+    Location = apps.get_model('micboard', 'Location')
+    LocationAccessGrant = apps.get_model('micboard', 'LocationAccessGrant')
+    database = schema_editor.connection.alias
+
+    members = MonitoringGroup.users.through.objects.using(database).filter(
+        monitoringgroup__is_active=True
+    )
+    users_by_group: dict[int, set[int]] = {}
+    for user_id, group_id in members.values_list('user_id', 'monitoringgroup_id'):
+        users_by_group.setdefault(group_id, set()).add(user_id)
+
+    locations_by_user: dict[int, set[int]] = {}
+    buildings_by_user: dict[int, set[int]] = {}
+    links = MonitoringGroupLocation.objects.using(database).filter(
+        monitoring_group_id__in=users_by_group
+    )
+    for group_id, location_id, building_id, include_all_rooms in links.values_list(
+        'monitoring_group_id', 'location_id', 'location__building_id', 'include_all_rooms'
+    ):
+        for user_id in users_by_group[group_id]:
+            locations_by_user.setdefault(user_id, set()).add(location_id)
+            if include_all_rooms:
+                buildings_by_user.setdefault(user_id, set()).add(building_id)
+
+    all_buildings: set[int] = set().union(*buildings_by_user.values())
+    all_locations: set[int] = set().union(*locations_by_user.values())
+    active = Location.objects.using(database).filter(is_active=True)
+    rows = {
+        pk: (building_id, room_id)
+        for pk, building_id, room_id in active.filter(
+            models.Q(pk__in=all_locations) | models.Q(building_id__in=all_buildings)
+        ).values_list('pk', 'building_id', 'room_id')
+    }
+    grants = []
+    for user_id in set(locations_by_user) | set(buildings_by_user):
+        explicit = locations_by_user.get(user_id, set())
+        buildings = buildings_by_user.get(user_id, set())
+        for pk, (building_id, room_id) in rows.items():
+            if pk in explicit or building_id in buildings:
+                grants.append(
+                    LocationAccessGrant(
+                        user_id=user_id, location_id=pk, building_id=building_id, room_id=room_id
+                    )
+                )
+    LocationAccessGrant.objects.using(database).bulk_create(grants, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0009_device_identity_lock'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LocationAccessGrant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('building', models.ForeignKey(help_text='Building of the location', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='micboard.building')),
+                ('location', models.ForeignKey(help_text='Location the user may monitor', on_delete=django.db.models.deletion.CASCADE, related_name='access_grants', to='micboard.location')),
+                ('room', models.ForeignKey(blank=True, help_text='Room of the location, if any', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='micboard.room')),
+                ('user', models.ForeignKey(help_text='User granted access', on_delete=django.db.models.deletion.CASCADE, related_name='location_access_grants', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Location Access Grant',
+                'verbose_name_plural': 'Location Access Grants',
+                'indexes': [models.Index(fields=['user', 'building'], name='micboard_lo_user_id_85ce1d_idx'), models.Index(fields=['user', 'room'], name='micboard_lo_user_id_77ff16_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'location'), name='micboard_location_access_unique')],
+            },
+        ),
+        migrations.RunPython(build_location_access, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.1.2 on 2026-10-19 10:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0010_location_access_grant'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='servicesynclog',
+            name='micboard_se_status_e0fdbd_idx',
+        ),
+        migrations.AddIndex(
+            model_name='servicesynclog',
+            index=models.Index(fields=['status', '-started_at'], name='micboard_se_status_d9ffbe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicesynclog',
+            index=models.Index(fields=['sync_type', '-started_at'], name='micboard_se_sync_ty_85aafe_idx'),
+        ),
+    ]
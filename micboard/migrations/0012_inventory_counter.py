@@ -0,0 +1,138 @@
+# Generated by Django 6.1.2 on 2026-10-19 00:50
+
+from typing import Any
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+DEVICE_STATUS_FIELDS = {
+    'discovered': 'devices_discovered',
+    'provisioning': 'devices_provisioning',
+    'online': 'devices_online',
+    'degraded': 'devices_degraded',
+    'offline': 'devices_offline',
+    'maintenance': 'devices_maintenance',
+    'retired': 'devices_retired',
+}
+COUNTER_FIELDS = (
+    *DEVICE_STATUS_FIELDS.values(),
+    'active_units',
+    'open_alerts',
+    'online_chargers',
+)
+PARENT_COLUMNS = {'organization': 'organization_id', 'campus': 'campus_id', 'site': 'site_id'}
+
+
+def build_inventory_counters(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Count existing inventory into location rows and roll them up."""
+    WirelessChassis = apps.get_model('micboard', 'WirelessChassis')
+    WirelessUnit = apps.get_model('micboard', 'WirelessUnit')
+    Alert = apps.get_model('micboard', 'Alert')
+    Charger = apps.get_model('micboard', 'Charger')
+    Location = apps.get_model('micboard', 'Location')
+    Building = apps.get_model('micboard', 'Building')
+    InventoryCounter = apps.get_model('micboard', 'InventoryCounter')
+    database = schema_editor.connection.alias
+
+    def zeros() -> dict[str, int]:
+        return dict.fromkeys(COUNTER_FIELDS, 0)
+
+    locations: dict[int, dict[str, Any]] = {0: {**zeros(), 'building_id': None}}
+    for pk, building_id in Location.objects.using(database).values_list('pk', 'building_id'):
+        locations[pk] = {**zeros(), 'building_id': building_id}
+    chassis = WirelessChassis.objects.using(database).values_list('location_id', 'status')
+    for location_id, status, total in chassis.annotate(total=models.Count('pk')).order_by():
+        if status in DEVICE_STATUS_FIELDS:
+            locations[location_id or 0][DEVICE_STATUS_FIELDS[status]] += total
+    grouped = (
+        (
+            'active_units',
+            WirelessUnit.objects.filter(status__in=['online', 'degraded', 'provisioning']),
+            'base_chassis__location_id',
+        ),
+        (
+            'open_alerts',
+            Alert.objects.filter(status__in=['pending', 'sent', 'acknowledged']),
+            'channel__chassis__location_id',
+        ),
+        ('online_chargers', Charger.objects.filter(is_active=True, status='online'), 'location_id'),
+    )
+    for name, queryset, path in grouped:
+        counts = queryset.using(database).values_list(path).annotate(total=models.Count('pk'))
+        for location_id, total in counts.order_by():
+            locations[location_id or 0][name] += total
+
+    buildings: dict[int, dict[str, Any]] = {}
+    for values in Building.objects.using(database).values('pk', *PARENT_COLUMNS.values()):
+        building_id = values.pop('pk')
+        buildings[building_id] = {**zeros(), **values}
+    for values in locations.values():
+        if values['building_id'] is not None:
+            for name in COUNTER_FIELDS:
+                buildings[values['building_id']][name] += values[name]
+    deployment = {name: locations[0][name] for name in COUNTER_FIELDS}
+    parents: dict[tuple[str, int], dict[str, int]] = {}
+    for values in buildings.values():
+        for name in COUNTER_FIELDS:
+            deployment[name] += values[name]
+        for scope, column in PARENT_COLUMNS.items():
+            if values[column] is not None:
+                parent = parents.setdefault((scope, values[column]), zeros())
+                for name in COUNTER_FIELDS:
+                    parent[name] += values[name]
+
+    rows = [InventoryCounter(scope='deployment', scope_id=0, **deployment)]
+    rows += [
+        InventoryCounter(scope='location', scope_id=pk, **values)
+        for pk, values in locations.items()
+    ]
+    rows += [
+        InventoryCounter(scope='building', scope_id=pk, **values)
+        for pk, values in buildings.items()
+    ]
+    rows += [
+        InventoryCounter(scope=scope, scope_id=pk, **values)
+        for (scope, pk), values in parents.items()
+    ]
+    InventoryCounter.objects.using(database).bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('micboard', '0011_service_sync_log_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventoryCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('deployment', 'Deployment'), ('organization', 'Organization'), ('campus', 'Campus'), ('site', 'Site'), ('building', 'Building'), ('location', 'Location')], help_text='Kind of scope these totals cover', max_length=20)),
+                ('scope_id', models.PositiveBigIntegerField(help_text='Identifier of the scope (0 for the deployment and unplaced inventory)')),
+                ('building_id', models.PositiveBigIntegerField(blank=True, help_text='Building of a location row', null=True)),
+                ('organization_id', models.PositiveBigIntegerField(blank=True, help_text='Organization of a building row', null=True)),
+                ('campus_id', models.PositiveBigIntegerField(blank=True, help_text='Campus of a building row', null=True)),
+                ('site_id', models.PositiveBigIntegerField(blank=True, help_text='Site of a building row', null=True)),
+                ('devices_discovered', models.PositiveIntegerField(default=0)),
+                ('devices_provisioning', models.PositiveIntegerField(default=0)),
+                ('devices_online', models.PositiveIntegerField(default=0)),
+                ('devices_degraded', models.PositiveIntegerField(default=0)),
+                ('devices_offline', models.PositiveIntegerField(default=0)),
+                ('devices_maintenance', models.PositiveIntegerField(default=0)),
+                ('devices_retired', models.PositiveIntegerField(default=0)),
+                ('active_units', models.PositiveIntegerField(default=0, help_text='Wireless units that are online, degraded, or provisioning')),
+                ('open_alerts', models.PositiveIntegerField(default=0, help_text='Alerts that are pending, sent, or acknowledged')),
+                ('online_chargers', models.PositiveIntegerField(default=0, help_text='Active chargers reporting online')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Inventory Counter',
+                'verbose_name_plural': 'Inventory Counters',
+                'indexes': [models.Index(fields=['scope', 'building_id'], name='micboard_in_scope_5abec7_idx'), models.Index(fields=['scope', 'organization_id'], name='micboard_in_scope_0be510_idx'), models.Index(fields=['scope', 'campus_id'], name='micboard_in_scope_778883_idx'), models.Index(fields=['scope', 'site_id'], name='micboard_in_scope_f9b8aa_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'scope_id'), name='micboard_inventory_counter_unique_scope')],
+            },
+        ),
+        migrations.RunPython(build_inventory_counters, migrations.RunPython.noop),
+    ]
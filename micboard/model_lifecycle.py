@@ -6,12 +6,15 @@ pre/post-save events into service-layer calls and task-layer dispatches.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Any
 
-from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.apps import apps
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import Signal
 
 from micboard.services.sync.discovery_trigger_service import schedule_discovery_on_commit
 
@@ -19,6 +22,10 @@ _CHASSIS_CONTEXT = "_micboard_chassis_save_context"
 _CHANNEL_CONTEXT = "_micboard_channel_save_context"
 _MANUFACTURER_CONTEXT = "_micboard_manufacturer_save_context"
 _UNIT_CONTEXT = "_micboard_unit_save_context"
+_CHARGER_CONTEXT = "_micboard_charger_save_context"
+_MANUFACTURER_INVENTORY_CONTEXT = "_micboard_manufacturer_inventory_context"
+_GROUP_ACCESS_CONTEXT = "_micboard_group_access_context"
+_ASSIGNMENT_UNIT_CONTEXT = "_micboard_assignment_unit_context"
 _chassis_delete_hooks_enabled: ContextVar[bool] = ContextVar(
     "micboard_chassis_delete_hooks_enabled", default=True
 )
@@ -39,7 +46,9 @@ def _take_context(instance: Any, name: str) -> Any:
 
 def _originates_from_model(origin: Any, model: type[Any]) -> bool:
     """Return whether a delete originated from an instance/queryset of ``model``."""
-    return origin is not None and getattr(origin, "model", type(origin)) is model
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return type(origin) is model
 
 
 def _persist_derived_fields(
@@ -105,11 +114,22 @@ def _finish_chassis(
     if kwargs.get("raw", False):
         return
     from micboard.services.core.hardware_post_save_hooks import HardwarePostSaveHooks
+    from micboard.services.deduplication.warm_identity_index import WarmDeviceIdentityIndex
     from micboard.services.hardware.chassis_lifecycle_service import finalize_chassis_save
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
 
     context = _take_context(instance, _CHASSIS_CONTEXT)
     _persist_derived_fields(instance, context, using=using, update_fields=update_fields)
+    if context.identity_changed:
+        WarmDeviceIdentityIndex.record_changes([instance.pk], using=using)
     finalize_chassis_save(instance, context, using=using)
+    InventoryCounterService.chassis_saved(
+        instance,
+        created=context.created,
+        status_changed=context.status_changed,
+        old_location_id=context.old_location_id,
+        using=using,
+    )
     HardwarePostSaveHooks.handle_chassis_save(
         chassis=instance,
         created=created,
@@ -154,6 +174,28 @@ def _prepare_charger(sender: type[Any], instance: Any, using: str, **kwargs: Any
     from micboard.services.hardware.ip_ownership_service import HardwareIPOwnershipService
 
     HardwareIPOwnershipService.validate_for_instance(instance=instance, using=using)
+    previous = None
+    if not instance._state.adding:
+        previous = (
+            sender._default_manager.using(using)
+            .filter(pk=instance.pk)
+            .values("location_id", "is_active", "status")
+            .first()
+        )
+    _remember_context(instance, _CHARGER_CONTEXT, previous)
+
+
+def _finish_charger(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Recount inventory after a charger's online state or location changes."""
+    if kwargs.get("raw", False):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.charger_saved(
+        instance,
+        previous=_take_context(instance, _CHARGER_CONTEXT),
+        using=using,
+    )
 
 
 def _prepare_unit(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
@@ -180,10 +222,17 @@ def _finish_unit(
     if kwargs.get("raw", False):
         return
     from micboard.services.hardware.wireless_unit_service import finalize_unit_save
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
 
     context = _take_context(instance, _UNIT_CONTEXT)
     _persist_derived_fields(instance, context, using=using, update_fields=update_fields)
     finalize_unit_save(instance, context, using=using)
+    InventoryCounterService.unit_saved(
+        instance,
+        old_status=context["old_status"],
+        old_chassis_id=context["old_base_chassis_id"],
+        using=using,
+    )
 
 
 def _prepare_channel(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
@@ -213,6 +262,9 @@ def _finish_channel(
 
     context = _take_context(instance, _CHANNEL_CONTEXT)
     _persist_derived_fields(instance, context, using=using, update_fields=update_fields)
+    instance.remember_loaded_state(
+        None if update_fields is None else {*update_fields, *context.get("update_fields", ())}
+    )
     finalize_channel_save(instance, context, using=using)
 
 
@@ -319,14 +371,292 @@ def _registry_entry_changed(sender: type[Any], instance: Any, using: str, **kwar
         )
 
 
+def _compliance_changed(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Invalidate the shared regulatory index after compliance data changes."""
+    from micboard.services.hardware.regulatory_index_service import RegulatoryIndexService
+
+    RegulatoryIndexService.compliance_changed(using=using)
+
+
+def _tenant_scope_changed(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Retire memoized tenant contexts after memberships or tenant structure change."""
+    from micboard.multitenancy.context import tenant_scope_changed
+
+    tenant_scope_changed(using=using)
+
+
+def _refresh_location_access(user_ids: Any, *, using: str) -> None:
+    """Recompute the monitoring access closure of users a change may affect."""
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    LocationAccessService.refresh_users(user_ids, using=using)
+
+
+def _monitoring_group_saved(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Grant or revoke a group's locations when it is activated or deactivated."""
+    if kwargs.get("raw", False) or kwargs.get("created", False):
+        return
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    _refresh_location_access(
+        LocationAccessService.users_of_groups([instance.pk], using=using), using=using
+    )
+
+
+def _prepare_monitoring_group_delete(
+    sender: type[Any], instance: Any, using: str, **kwargs: Any
+) -> None:
+    """Remember a group's members before its membership rows are removed."""
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    _remember_context(
+        instance,
+        _GROUP_ACCESS_CONTEXT,
+        LocationAccessService.users_of_groups([instance.pk], using=using),
+    )
+
+
+def _monitoring_group_deleted(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Revoke the deleted group's locations from its former members."""
+    _refresh_location_access(_take_context(instance, _GROUP_ACCESS_CONTEXT), using=using)
+
+
+def _group_members_changed(
+    sender: type[Any],
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    using: str,
+    **kwargs: Any,
+) -> None:
+    """Refresh users added to or removed from monitoring groups."""
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    if reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            _refresh_location_access([instance.pk], using=using)
+        return
+    if action == "pre_clear":
+        _remember_context(
+            instance,
+            _GROUP_ACCESS_CONTEXT,
+            LocationAccessService.users_of_groups([instance.pk], using=using),
+        )
+    elif action == "post_clear":
+        _refresh_location_access(_take_context(instance, _GROUP_ACCESS_CONTEXT), using=using)
+    elif action in {"post_add", "post_remove"}:
+        _refresh_location_access(pk_set or (), using=using)
+
+
+def _group_locations_changed(
+    sender: type[Any],
+    instance: Any,
+    action: str,
+    reverse: bool,
+    using: str,
+    **kwargs: Any,
+) -> None:
+    """Refresh members whose groups gained or lost monitored locations."""
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    if reverse:
+        users = LocationAccessService.users_for_location(instance, using=using)
+    else:
+        users = LocationAccessService.users_of_groups([instance.pk], using=using)
+    _refresh_location_access(users, using=using)
+
+
+def _group_location_changed(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Refresh the members of a group whose location assignment changed."""
+    if kwargs.get("raw", False):
+        return
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    _refresh_location_access(
+        LocationAccessService.users_of_groups([instance.monitoring_group_id], using=using),
+        using=using,
+    )
+
+
+def _location_saved(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Refresh users affected by a location's activation, building, or room."""
+    if kwargs.get("raw", False):
+        return
+    from micboard.services.monitoring.location_access_service import LocationAccessService
+
+    _refresh_location_access(
+        LocationAccessService.users_for_location(instance, using=using), using=using
+    )
+
+
+def _hardware_deleted(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Recount the location of a chassis or charger deleted directly, not by a cascade."""
+    if not _originates_from_model(kwargs.get("origin"), sender):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_locations([instance.location_id], using=using)
+
+
+def _chassis_identity_deleted(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Stamp a deleted chassis, including cascades, so warm identity indexes drop it."""
+    from micboard.services.deduplication.warm_identity_index import WarmDeviceIdentityIndex
+
+    WarmDeviceIdentityIndex.record_changes([instance.pk], using=using)
+
+
+def _chassis_identities_written(
+    sender: type[Any],
+    chassis_ids: list[int] | None,
+    using: str,
+    **kwargs: Any,
+) -> None:
+    """Stamp chassis rows changed by queryset bulk writes."""
+    from micboard.services.deduplication.warm_identity_index import WarmDeviceIdentityIndex
+
+    WarmDeviceIdentityIndex.record_changes(chassis_ids, using=using)
+
+
+def _unit_deleted(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Recount the chassis location of a wireless unit deleted directly."""
+    if not _originates_from_model(kwargs.get("origin"), sender):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_chassis([instance.base_chassis_id], using=using)
+
+
+def _location_moved(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Move a location's totals when it changes building."""
+    if kwargs.get("raw", False) or kwargs.get("created", False):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_locations([instance.pk], using=using)
+
+
+def _location_deleted(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Drop a deleted location's totals; its chassis become unplaced."""
+    if not _originates_from_model(kwargs.get("origin"), sender):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_locations([instance.pk, None], using=using)
+
+
+def _building_moved(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Move a building's totals when its organization, campus, or site changes."""
+    if kwargs.get("raw", False) or kwargs.get("created", False):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_buildings([instance.pk], using=using)
+
+
+def _building_deleted(sender: type[Any], instance: Any, using: str, **kwargs: Any) -> None:
+    """Drop the totals of a deleted building and its cascaded locations."""
+    if not _originates_from_model(kwargs.get("origin"), sender):
+        return
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_buildings([instance.pk], using=using)
+
+
+def _prepare_manufacturer_inventory(
+    sender: type[Any], instance: Any, using: str, **kwargs: Any
+) -> None:
+    """Remember where a manufacturer's hardware is before its rows cascade away."""
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    _remember_context(
+        instance,
+        _MANUFACTURER_INVENTORY_CONTEXT,
+        InventoryCounterService.locations_of_manufacturer(instance.pk, using=using),
+    )
+
+
+def _manufacturer_inventory_deleted(
+    sender: type[Any], instance: Any, using: str, **kwargs: Any
+) -> None:
+    """Recount the locations that held a deleted manufacturer's hardware."""
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+
+    InventoryCounterService.refresh_locations(
+        _take_context(instance, _MANUFACTURER_INVENTORY_CONTEXT) or (), using=using
+    )
+
+
+def _alert_fragment_changed(sender: type[Any], instance: Any, **kwargs: Any) -> None:
+    """Refresh the live alert tables showing a saved or deleted alert."""
+    if kwargs.get("raw", False):
+        return
+    from micboard.services.notification.live_fragment_service import LiveFragmentService
+
+    LiveFragmentService.alerts_changed((instance.channel_id,))
+
+
+def _prepare_assignment_fragment(
+    sender: type[Any], instance: Any, using: str, **kwargs: Any
+) -> None:
+    """Remember the unit an edited assignment may leave, so its screens refresh too."""
+    update_fields = kwargs.get("update_fields")
+    if (
+        kwargs.get("raw", False)
+        or instance._state.adding
+        or (update_fields is not None and "wireless_unit" not in update_fields)
+    ):
+        return
+    _remember_context(
+        instance,
+        _ASSIGNMENT_UNIT_CONTEXT,
+        sender._default_manager.using(using)
+        .filter(pk=instance.pk)
+        .values_list("wireless_unit_id", flat=True)
+        .first(),
+    )
+
+
+def _assignment_fragment_changed(sender: type[Any], instance: Any, **kwargs: Any) -> None:
+    """Refresh the live assignment tables of a saved or deleted assignment's units."""
+    if kwargs.get("raw", False):
+        return
+    from micboard.services.notification.live_fragment_service import LiveFragmentService
+
+    previous_unit_id = _take_context(instance, _ASSIGNMENT_UNIT_CONTEXT) or None
+    LiveFragmentService.assignments_changed((previous_unit_id, instance.wireless_unit_id))
+
+
+def _charger_slot_fragment_changed(sender: type[Any], instance: Any, **kwargs: Any) -> None:
+    """Refresh the live charger tables showing a saved or deleted slot."""
+    if kwargs.get("raw", False):
+        return
+    from micboard.services.notification.live_fragment_service import LiveFragmentService
+
+    LiveFragmentService.chargers_changed((instance.charger_id,))
+
+
 def register_model_lifecycle() -> None:
     """Connect all model lifecycle adapters exactly once."""
     from micboard.models.discovery.manufacturer import Manufacturer
     from micboard.models.discovery.registry import DiscoveryCIDR, DiscoveryFQDN, MicboardConfig
-    from micboard.models.hardware.charger import Charger
-    from micboard.models.hardware.wireless_chassis import WirelessChassis
+    from micboard.models.hardware.charger import Charger, ChargerSlot
+    from micboard.models.hardware.wireless_chassis import (
+        WirelessChassis,
+        chassis_identities_written,
+    )
     from micboard.models.hardware.wireless_unit import WirelessUnit
-    from micboard.models.locations.structure import Building
+    from micboard.models.locations.structure import Building, Location
+    from micboard.models.monitoring.alert import Alert
+    from micboard.models.monitoring.group import MonitoringGroup, MonitoringGroupLocation
+    from micboard.models.monitoring.performer_assignment import PerformerAssignment
+    from micboard.models.rf_coordination.compliance import (
+        ExclusionZone,
+        FrequencyBand,
+        RegulatoryDomain,
+    )
     from micboard.models.rf_coordination.rf_channel import RFChannel
 
     connections = (
@@ -334,6 +664,7 @@ def register_model_lifecycle() -> None:
         (post_save, _finish_chassis, WirelessChassis, "micboard.finish_chassis"),
         (pre_delete, _delete_chassis, WirelessChassis, "micboard.delete_chassis"),
         (pre_save, _prepare_charger, Charger, "micboard.prepare_charger"),
+        (post_save, _finish_charger, Charger, "micboard.finish_charger"),
         (pre_save, _prepare_unit, WirelessUnit, "micboard.prepare_unit"),
         (post_save, _finish_unit, WirelessUnit, "micboard.finish_unit"),
         (pre_save, _prepare_channel, RFChannel, "micboard.prepare_channel"),
@@ -346,6 +677,130 @@ def register_model_lifecycle() -> None:
         (post_save, _registry_entry_changed, DiscoveryCIDR, "micboard.cidr_saved"),
         (post_save, _registry_entry_changed, DiscoveryFQDN, "micboard.fqdn_saved"),
         (post_delete, _registry_entry_changed, DiscoveryFQDN, "micboard.fqdn_deleted"),
+        (post_save, _compliance_changed, RegulatoryDomain, "micboard.regulatory_domain_saved"),
+        (post_delete, _compliance_changed, RegulatoryDomain, "micboard.regulatory_domain_deleted"),
+        (post_save, _compliance_changed, FrequencyBand, "micboard.frequency_band_saved"),
+        (post_delete, _compliance_changed, FrequencyBand, "micboard.frequency_band_deleted"),
+        (post_save, _compliance_changed, ExclusionZone, "micboard.exclusion_zone_saved"),
+        (post_delete, _compliance_changed, ExclusionZone, "micboard.exclusion_zone_deleted"),
+    )
+    tenant_scope_models: list[type[Any]] = [Building]
+    if apps.is_installed("micboard.multitenancy"):
+        from micboard.multitenancy.models import Campus, Organization, OrganizationMembership
+
+        tenant_scope_models += [Organization, Campus, OrganizationMembership]
+    tenant_connections = tuple(
+        (signal, _tenant_scope_changed, model, f"micboard.tenant_{model._meta.model_name}_{event}")
+        for model in tenant_scope_models
+        for signal, event in ((post_save, "saved"), (post_delete, "deleted"))
+    )
+    access_connections = (
+        (post_save, _monitoring_group_saved, MonitoringGroup, "micboard.access_group_saved"),
+        (
+            pre_delete,
+            _prepare_monitoring_group_delete,
+            MonitoringGroup,
+            "micboard.access_group_deleting",
+        ),
+        (post_delete, _monitoring_group_deleted, MonitoringGroup, "micboard.access_group_deleted"),
+        (
+            m2m_changed,
+            _group_members_changed,
+            MonitoringGroup.users.through,
+            "micboard.access_group_members_changed",
+        ),
+        (
+            m2m_changed,
+            _group_locations_changed,
+            MonitoringGroupLocation,
+            "micboard.access_group_locations_changed",
+        ),
+        (
+            post_save,
+            _group_location_changed,
+            MonitoringGroupLocation,
+            "micboard.access_group_location_saved",
+        ),
+        (
+            post_delete,
+            _group_location_changed,
+            MonitoringGroupLocation,
+            "micboard.access_group_location_deleted",
+        ),
+        (post_save, _location_saved, Location, "micboard.access_location_saved"),
+    )
+    inventory_connections = (
+        (post_delete, _hardware_deleted, WirelessChassis, "micboard.inventory_chassis_deleted"),
+        (post_delete, _unit_deleted, WirelessUnit, "micboard.inventory_unit_deleted"),
+        (post_delete, _hardware_deleted, Charger, "micboard.inventory_charger_deleted"),
+        (post_save, _location_moved, Location, "micboard.inventory_location_saved"),
+        (post_delete, _location_deleted, Location, "micboard.inventory_location_deleted"),
+        (post_save, _building_moved, Building, "micboard.inventory_building_saved"),
+        (post_delete, _building_deleted, Building, "micboard.inventory_building_deleted"),
+        (
+            pre_delete,
+            _prepare_manufacturer_inventory,
+            Manufacturer,
+            "micboard.inventory_manufacturer_deleting",
+        ),
+        (
+            post_delete,
+            _manufacturer_inventory_deleted,
+            Manufacturer,
+            "micboard.inventory_manufacturer_deleted",
+        ),
+    )
+    identity_connections = (
+        (
+            post_delete,
+            _chassis_identity_deleted,
+            WirelessChassis,
+            "micboard.identity_chassis_deleted",
+        ),
+        (
+            chassis_identities_written,
+            _chassis_identities_written,
+            WirelessChassis,
+            "micboard.identity_chassis_written",
+        ),
+    )
+    # Bulk writes send no signals; their services announce the change themselves.
+    fragment_connections = (
+        (post_save, _alert_fragment_changed, Alert, "micboard.fragment_alert_saved"),
+        (post_delete, _alert_fragment_changed, Alert, "micboard.fragment_alert_deleted"),
+        (
+            pre_save,
+            _prepare_assignment_fragment,
+            PerformerAssignment,
+            "micboard.fragment_assignment_saving",
+        ),
+        (
+            post_save,
+            _assignment_fragment_changed,
+            PerformerAssignment,
+            "micboard.fragment_assignment_saved",
+        ),
+        (
+            post_delete,
+            _assignment_fragment_changed,
+            PerformerAssignment,
+            "micboard.fragment_assignment_deleted",
+        ),
+        (post_save, _charger_slot_fragment_changed, ChargerSlot, "micboard.fragment_slot_saved"),
+        (
+            post_delete,
+            _charger_slot_fragment_changed,
+            ChargerSlot,
+            "micboard.fragment_slot_deleted",
+        ),
+    )
+    all_connections: tuple[tuple[Signal, Callable[..., Any], type[Any], str], ...] = (
+        *connections,
+        *tenant_connections,
+        *access_connections,
+        *inventory_connections,
+        *identity_connections,
+        *fragment_connections,
     )
-    for signal, receiver, sender, dispatch_uid in connections:
+    for signal, receiver, sender, dispatch_uid in all_connections:
         signal.connect(receiver, sender=sender, dispatch_uid=dispatch_uid, weak=False)
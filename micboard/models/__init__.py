@@ -6,11 +6,19 @@ defining domain module so dependencies remain explicit.
 
 # Import defining modules for Django's app registry without package re-exports.
 from . import integrations
-from .audit import activity_log, configuration_log
+from .audit import activity_log, configuration_log, retention
 from .discovery import configuration, discovery_queue, manufacturer, registry
-from .hardware import charger, display_wall, wireless_chassis, wireless_unit
+from .hardware import charger, display_wall, identity_lock, wireless_chassis, wireless_unit
 from .locations import structure
-from .monitoring import alert, group, performer, performer_assignment
+from .monitoring import (
+    alert,
+    alert_outbox,
+    group,
+    inventory_counter,
+    location_access,
+    performer,
+    performer_assignment,
+)
 from .realtime import connection
 from .rf_coordination import compliance, rf_channel
 from .settings import registry as settings_registry
@@ -263,7 +263,11 @@ class ServiceSyncLog(models.Model):
         ordering = ["-started_at"]
         indexes = [
             models.Index(fields=["service", "-started_at"]),
-            models.Index(fields=["status"]),
+            # Admin changelist filters read the newest rows of one value.
+            models.Index(fields=["status", "-started_at"]),
+            models.Index(fields=["sync_type", "-started_at"]),
+            # Retention pruning deletes by time range across all services.
+            models.Index(fields=["started_at"]),
         ]
 
     def __str__(self) -> str:
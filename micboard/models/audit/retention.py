@@ -0,0 +1,66 @@
+"""Daily rollups kept after high-volume operational logs are pruned."""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class AuditLogDailySummary(models.Model):
+    """Per-manufacturer daily totals for pruned sync and API-health log rows."""
+
+    class Kind(models.TextChoices):
+        """Log table a summary was rolled up from."""
+
+        SERVICE_SYNC = "service_sync", "Service Sync"
+        API_HEALTH = "api_health", "API Health"
+
+    kind = models.CharField(max_length=20, choices=Kind.choices, help_text="Summarized log")
+    manufacturer = models.ForeignKey(
+        "micboard.Manufacturer",
+        on_delete=models.CASCADE,
+        related_name="audit_log_summaries",
+        help_text="Manufacturer the summarized rows belonged to",
+    )
+    day = models.DateField(help_text="Day the summarized rows were recorded")
+    row_count = models.PositiveIntegerField(default=0, help_text="Rows summarized")
+    status_counts = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Summarized rows per status",
+    )
+    device_count_total = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Sum of devices synced (service sync rows only)",
+    )
+    response_time_total = models.FloatField(
+        default=0.0,
+        help_text="Sum of response times in seconds (API health rows only)",
+    )
+    response_time_samples = models.PositiveIntegerField(
+        default=0,
+        help_text="Rows that reported a response time",
+    )
+
+    class Meta:
+        verbose_name = "Audit Log Daily Summary"
+        verbose_name_plural = "Audit Log Daily Summaries"
+        ordering = ["-day", "kind"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "manufacturer", "day"],
+                name="micboard_audit_summary_unique_day",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "day"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} - {self.manufacturer_id} - {self.day}"
+
+    @property
+    def average_response_time(self) -> float | None:
+        """Mean response time of the summarized API-health rows."""
+        if not self.response_time_samples:
+            return None
+        return self.response_time_total / self.response_time_samples
@@ -1,8 +1,9 @@
 """Band plan specifications: frequency ranges and regional allocations.
 
-Loads band plan specifications from fixtures/band_plans.yaml.
+Loads band plan specifications from fixtures/band_plans.yaml on first use.
 Each band plan defines a frequency range, region, and name for wireless
-microphone systems.
+microphone systems. Detection runs against precomputed indexes and is
+memoized per manufacturer and API band string.
 """
 
 from __future__ import annotations
@@ -10,7 +11,12 @@ from __future__ import annotations
 import importlib.resources
 import logging
 import re
-from typing import Any
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from micboard.utils.exception_logging import sanitized_exception_info
 
@@ -48,8 +54,226 @@ def _load_band_plans() -> dict[str, dict[str, dict]]:
         return {}
 
 
-# Band plan specifications by manufacturer
-BAND_PLAN_SPECIFICATIONS: dict[str, dict[str, dict]] = _load_band_plans()
+_MEMO_LIMIT = 4096
+
+_BAND_CODE_PATTERN = re.compile(r"^([a-zA-Z0-9]+)")
+_FREQUENCY_RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)")
+_NAME_RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*MHz", re.IGNORECASE)
+_MODEL_BAND_PATTERNS = (
+    re.compile(r"[_-]?([GHJKLBCABw]+\d+(?:\+)?)", re.IGNORECASE),  # G50, J7, Aw+, etc.
+    re.compile(r"^([GHJKLBCABw]+\d+(?:\+)?)", re.IGNORECASE),  # At start of model
+)
+
+
+_KEY_SEPARATOR = "\0"
+
+
+class _LRUMemo:
+    """Bounded memo that evicts the least recently used answer when full."""
+
+    __slots__ = ("_entries", "_limit", "_lock")
+
+    def __init__(self, limit: int) -> None:
+        self._entries: OrderedDict[Hashable, str | None] = OrderedDict()
+        self._limit = limit
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[bool, str | None]:
+        """Return ``(found, value)`` and mark a found key as recently used."""
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def put(self, key: Hashable, value: str | None) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._limit:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True, slots=True)
+class _BandPlanIndex:
+    """Precomputed lookups over one manufacturer's band plans.
+
+    Every lookup keeps the first registry entry in fixture order, so indexed
+    answers match the original first-match linear scans. Index size is linear
+    in the total length of the registry keys.
+    """
+
+    plans: Mapping[str, dict]
+    names: tuple[str | None, ...]
+    keys: tuple[str, ...]
+    by_key: Mapping[str, int]
+    by_prefix: Mapping[str, int]
+    by_range: Mapping[tuple[float, float], int]
+    key_lengths: tuple[int, ...]
+    joined_keys: str
+    key_offsets: tuple[int, ...]
+
+    @classmethod
+    def build(cls, plans: Mapping[str, dict]) -> _BandPlanIndex:
+        keys = tuple(plans)
+        by_prefix: dict[str, int] = {}
+        by_range: dict[tuple[float, float], int] = {}
+        key_offsets: list[int] = []
+        offset = 0
+        for position, key in enumerate(keys):
+            # Flattened prefix trie of each registry key.
+            for end in range(1, len(key) + 1):
+                by_prefix.setdefault(key[:end], position)
+            key_offsets.append(offset)
+            offset += len(key) + len(_KEY_SEPARATOR)
+            plan = plans[key]
+            low, high = plan.get("min_mhz"), plan.get("max_mhz")
+            if low is not None and high is not None:
+                by_range.setdefault((float(low), float(high)), position)
+        return cls(
+            plans=plans,
+            names=tuple(plans[key].get("name") for key in keys),
+            keys=keys,
+            by_key={key: position for position, key in enumerate(keys)},
+            by_prefix=by_prefix,
+            by_range=by_range,
+            key_lengths=tuple(sorted({len(key) for key in keys if key})),
+            joined_keys=_KEY_SEPARATOR.join(keys),
+            key_offsets=tuple(key_offsets),
+        )
+
+    def _name(self, position: int | None) -> str | None:
+        return self.names[position] if position is not None else None
+
+    def by_code(self, api_band_value: str) -> str | None:
+        """Return the first plan whose key starts with the value's leading code."""
+        code = _extract_band_code(api_band_value)
+        return self._name(self.by_prefix.get(code)) if code else None
+
+    def by_frequency_range(self, api_band_value: str) -> str | None:
+        """Return the first plan whose bounds equal the value's frequency range."""
+        frequency_range = _extract_freq_range(api_band_value)
+        return self._name(self.by_range.get(frequency_range)) if frequency_range else None
+
+    def by_partial_key(self, api_band_value: str) -> str | None:
+        """Return the first plan whose key contains, or is contained in, the value.
+
+        Keys inside the value are found by looking up each window of the value whose
+        length equals some key's length. Keys containing the value are found by one
+        search of all keys joined in fixture order, so the first hit is the first key.
+        """
+        normalized_value = _normalize_band_key(api_band_value)
+        if not normalized_value:
+            return None
+        matches: list[int] = []
+        for length in self.key_lengths:
+            if length > len(normalized_value):
+                break
+            for start in range(len(normalized_value) - length + 1):
+                position = self.by_key.get(normalized_value[start : start + length])
+                if position is not None:
+                    matches.append(position)
+        if _KEY_SEPARATOR not in normalized_value:
+            offset = self.joined_keys.find(normalized_value)
+            if offset >= 0:
+                matches.append(bisect_right(self.key_offsets, offset) - 1)
+        return self._name(min(matches)) if matches else None
+
+    def detect(self, api_band_value: str) -> str | None:
+        """Apply exact key, code prefix, frequency range, then partial key matching."""
+        plan = self.plans.get(_normalize_band_key(api_band_value))
+        if plan:
+            return plan.get("name")
+        return (
+            self.by_code(api_band_value)
+            or self.by_frequency_range(api_band_value)
+            or self.by_partial_key(api_band_value)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BandPlanCatalog:
+    """Band plan registry indexed for detection, with memoized answers.
+
+    Built from the packaged fixture on first use rather than at import time.
+    """
+
+    specifications: dict[str, dict[str, dict]]
+    indexes: Mapping[str, _BandPlanIndex]
+    _detected: _LRUMemo = field(default_factory=lambda: _LRUMemo(_MEMO_LIMIT), compare=False)
+    _models: _LRUMemo = field(default_factory=lambda: _LRUMemo(_MEMO_LIMIT), compare=False)
+
+    _current: ClassVar[BandPlanCatalog | None] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def current(cls, assigned: dict[str, dict[str, dict]] | None = None) -> BandPlanCatalog:
+        """Return the shared catalog, building it on first use.
+
+        ``assigned`` is a registry set on the module as ``BAND_PLAN_SPECIFICATIONS``;
+        a different registry rebuilds the catalog.
+        """
+        catalog = cls._current
+        if catalog is not None and (assigned is None or catalog.specifications is assigned):
+            return catalog
+        with cls._lock:
+            catalog = cls._current
+            if catalog is None or (assigned is not None and catalog.specifications is not assigned):
+                catalog = cls.build(assigned if assigned is not None else _load_band_plans())
+                cls._current = catalog
+        return catalog
+
+    @classmethod
+    def build(cls, specifications: dict[str, dict[str, dict]]) -> BandPlanCatalog:
+        return cls(
+            specifications=specifications,
+            indexes={
+                manufacturer: _BandPlanIndex.build(plans)
+                for manufacturer, plans in specifications.items()
+            },
+        )
+
+    def detect(self, manufacturer: str, api_band_value: str) -> str | None:
+        """Return the plan name for an API band string, memoized per manufacturer."""
+        memo_key = (manufacturer, api_band_value)
+        found, name = self._detected.get(memo_key)
+        if found:
+            return name
+        index = self.indexes.get(manufacturer)
+        name = index.detect(api_band_value) if index is not None else None
+        self._detected.put(memo_key, name)
+        return name
+
+    def detect_model(self, manufacturer: str, model: str) -> str | None:
+        """Return the plan name hinted by a model code, memoized per manufacturer."""
+        memo_key = (manufacturer, model)
+        found, name = self._models.get(memo_key)
+        if found:
+            return name
+        name = None
+        for pattern in _MODEL_BAND_PATTERNS:
+            match = pattern.search(model)
+            if match:
+                name = self.detect(manufacturer, match.group(1).lower())
+                if name:
+                    break
+        self._models.put(memo_key, name)
+        return name
+
+
+def get_band_plan_catalog() -> BandPlanCatalog:
+    """Return the band plan catalog, loading the fixture on first use."""
+    return BandPlanCatalog.current(globals().get("BAND_PLAN_SPECIFICATIONS"))
+
+
+def __getattr__(name: str) -> Any:
+    # ``BAND_PLAN_SPECIFICATIONS`` stays importable but is loaded on first access.
+    if name == "BAND_PLAN_SPECIFICATIONS":
+        return get_band_plan_catalog().specifications
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_band_plan(*, manufacturer: str | None, band_plan_key: str | None) -> dict | None:
@@ -66,12 +290,12 @@ def get_band_plan(*, manufacturer: str | None, band_plan_key: str | None) -> dic
     if not manufacturer or not band_plan_key:
         return None
 
-    mfg_lower = manufacturer.lower()
-    if mfg_lower not in BAND_PLAN_SPECIFICATIONS:
+    plans = get_band_plan_catalog().specifications.get(manufacturer.lower())
+    if plans is None:
         return None
 
     band_key_lower = band_plan_key.lower().replace(" ", "_").replace("-", "_")
-    return BAND_PLAN_SPECIFICATIONS[mfg_lower].get(band_key_lower)
+    return plans.get(band_key_lower)
 
 
 def get_available_band_plans(*, manufacturer: str | None) -> list[tuple[str, str]]:
@@ -87,11 +311,11 @@ def get_available_band_plans(*, manufacturer: str | None) -> list[tuple[str, str
     if not manufacturer:
         return []
 
-    mfg_lower = manufacturer.lower()
-    if mfg_lower not in BAND_PLAN_SPECIFICATIONS:
+    plans = get_band_plan_catalog().specifications.get(manufacturer.lower())
+    if plans is None:
         return []
 
-    return [(key, plan["name"]) for key, plan in BAND_PLAN_SPECIFICATIONS[mfg_lower].items()]
+    return [(key, plan["name"]) for key, plan in plans.items()]
 
 
 def parse_band_plan_from_name(*, name: str) -> dict | None:
@@ -110,7 +334,7 @@ def parse_band_plan_from_name(*, name: str) -> dict | None:
         None if unable to parse
     """
     # Match pattern like "470-534 MHz" or "470-534MHz"
-    match = re.search(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*MHz", name, re.IGNORECASE)
+    match = _NAME_RANGE_PATTERN.search(name)
     if match:
         return {
             "min_mhz": float(match.group(1)),
@@ -125,54 +349,25 @@ def _normalize_band_key(val: str) -> str:
 
 
 def _extract_band_code(val: str) -> str | None:
-    m = re.match(r"^([a-zA-Z0-9]+)", val)
+    m = _BAND_CODE_PATTERN.match(val)
     return m.group(1).lower() if m else None
 
 
 def _extract_freq_range(val: str) -> tuple[float, float] | None:
-    m = re.search(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)", val)
+    m = _FREQUENCY_RANGE_PATTERN.search(val)
     if not m:
         return None
     return float(m.group(1)), float(m.group(2))
 
 
-def _find_plan_by_code(band_plans: dict[str, dict], api_band_value: str) -> str | None:
-    code = _extract_band_code(api_band_value)
-    if not code:
-        return None
-    for registry_key, plan_data in band_plans.items():
-        if registry_key.startswith(code):
-            return plan_data.get("name")
-    return None
-
-
-def _find_plan_by_frequency_range(band_plans: dict[str, dict], api_band_value: str) -> str | None:
-    frequency_range = _extract_freq_range(api_band_value)
-    if not frequency_range:
-        return None
-    api_min, api_max = frequency_range
-    for plan_data in band_plans.values():
-        if plan_data.get("min_mhz") == api_min and plan_data.get("max_mhz") == api_max:
-            return plan_data.get("name")
-    return None
-
-
-def _find_plan_by_partial_key(band_plans: dict[str, dict], api_band_value: str) -> str | None:
-    normalized_value = _normalize_band_key(api_band_value)
-    for registry_key, plan_data in band_plans.items():
-        if normalized_value in registry_key or registry_key in normalized_value:
-            return plan_data.get("name")
-    return None
-
-
 def detect_band_plan_from_api_string(
     *, api_band_value: str | None, manufacturer: str | None = "shure"
 ) -> str | None:
     """Detect and return band plan name from API frequencyBand string.
 
-    Uses module-level helpers to keep this function concise and easier to
-    maintain; strategies include exact key match, code-prefix match, exact
-    frequency-range match, and partial string match.
+    Strategies include exact key match, code-prefix match, exact
+    frequency-range match, and partial string match, answered from the
+    catalog's precomputed indexes and memoized per manufacturer and value.
     """
     if not api_band_value:
         return None
@@ -181,20 +376,7 @@ def detect_band_plan_from_api_string(
     if not api_band_value:
         return None
 
-    mfg = (manufacturer or "shure").lower()
-    band_plans = BAND_PLAN_SPECIFICATIONS.get(mfg, {})
-
-    # Strategy 1: Exact registry key
-    key = _normalize_band_key(api_band_value)
-    plan = band_plans.get(key)
-    if plan:
-        return plan.get("name")
-
-    return (
-        _find_plan_by_code(band_plans, api_band_value)
-        or _find_plan_by_frequency_range(band_plans, api_band_value)
-        or _find_plan_by_partial_key(band_plans, api_band_value)
-    )
+    return get_band_plan_catalog().detect((manufacturer or "shure").lower(), api_band_value)
 
 
 def get_band_plan_from_model_code(*, manufacturer: str | None, model: str | None) -> str | None:
@@ -214,25 +396,5 @@ def get_band_plan_from_model_code(*, manufacturer: str | None, model: str | None
     if not manufacturer or not model:
         return None
 
-    # Parse model for band hints
-    # e.g., "ULXD4Q-G50" → G50
-    # e.g., "EM 6062-G3 (-E)" → G band (not specific enough)
-    # Try to extract band code from model string
-    # Patterns like "G50", "G5", "Aw+" etc.
-    band_patterns = [
-        r"[_-]?([GHJKLBCABw]+\d+(?:\+)?)",  # G50, J7, Aw+, etc.
-        r"^([GHJKLBCABw]+\d+(?:\+)?)",  # At start of model
-    ]
-
-    for pattern in band_patterns:
-        match = re.search(pattern, model, re.IGNORECASE)
-        if match:
-            band_code = match.group(1).lower()
-            # Try to find this in band plans
-            band_plan = detect_band_plan_from_api_string(
-                api_band_value=band_code, manufacturer=manufacturer
-            )
-            if band_plan:
-                return band_plan
-
-    return None
+    # Model suffixes and prefixes carry band hints, e.g. "ULXD4Q-G50" -> G50.
+    return get_band_plan_catalog().detect_model(manufacturer.lower(), model)
@@ -11,11 +11,11 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, Protocol, TypeVar
 
-from django.apps import apps
 from django.conf import settings as django_settings
 from django.db import models
-from django.db.models import F, Q
+from django.db.models import Q
 
+from micboard.multitenancy.context import TenantContext, tenant_context_for_user
 from micboard.settings.deployment_controls import deployment_controls
 
 _ModelT = TypeVar("_ModelT", bound=models.Model)
@@ -49,6 +49,10 @@ _EXPLICIT_TENANT_LOOKUPS: dict[str, tuple[str, str | None]] = {
         "wall__location__building__organization_id",
         "wall__location__building__campus_id",
     ),
+    "micboard.wirelessunitsample": (
+        "session__wireless_unit__base_chassis__location__building__organization_id",
+        "session__wireless_unit__base_chassis__location__building__campus_id",
+    ),
 }
 
 _EXPLICIT_SITE_LOOKUPS: dict[str, str] = {
@@ -56,6 +60,9 @@ _EXPLICIT_SITE_LOOKUPS: dict[str, str] = {
     "micboard.chargerslot": "charger__location__building__site_id",
     "micboard.devicemovementlog": "device__location__building__site_id",
     "micboard.wallsection": "wall__location__building__site_id",
+    "micboard.wirelessunitsample": (
+        "session__wireless_unit__base_chassis__location__building__site_id"
+    ),
 }
 
 _RELATIONSHIP_TENANT_LOOKUPS: tuple[tuple[str, tuple[str, str]], ...] = (
@@ -217,44 +224,40 @@ class TenantOptimizedQuerySet(models.QuerySet[_ModelT]):
             return self.none()
         return self.filter(tenant_filter).distinct()
 
-    def for_user(self, *, user: Any) -> TenantOptimizedQuerySet[_ModelT]:
-        """Filter based on user permissions and tenant context.
-
-        Respects MSP, multi-site, and single-site modes.
-        """
-        if not getattr(user, "is_authenticated", True):
+    def for_context(self, context: TenantContext) -> TenantOptimizedQuerySet[_ModelT]:
+        """Filter to the tenant boundary captured by a resolved tenant context."""
+        if not context.is_authenticated:
             return self.none()
 
-        multi_site_enabled = deployment_controls.multi_site_mode
-        if user.is_superuser and deployment_controls.allow_cross_org_view:
-            return self.for_site() if multi_site_enabled else self
-
-        if deployment_controls.msp_enabled:
-            if not apps.is_installed("micboard.multitenancy"):
-                return self.none()
+        if context.unrestricted:
+            return self.for_site() if context.multi_site_mode else self
 
-            memberships = list(
-                user.org_memberships.filter(
-                    Q(campus__isnull=True)
-                    | Q(
-                        campus__is_active=True,
-                        campus__organization_id=F("organization_id"),
-                    ),
-                    is_active=True,
-                    organization__is_active=True,
-                ).values_list("organization_id", "campus_id")
-            )
-
-            if not memberships:
+        if context.msp_enabled:
+            if not context.memberships:
                 return self.none()
 
-            queryset = self.for_memberships(memberships)
-            if multi_site_enabled:
+            queryset = self.for_memberships(context.scopes)
+            if context.multi_site_mode:
                 return queryset.for_site()
             return queryset
 
-        if multi_site_enabled:
+        if context.multi_site_mode:
             return self.for_site()
+        return self
+
+    def for_user(self, *, user: Any) -> TenantOptimizedQuerySet[_ModelT]:
+        """Filter based on user permissions and tenant context.
+
+        Respects MSP, multi-site, and single-site modes.
+        """
+        context = tenant_context_for_user(user)
+        if (
+            not context.is_authenticated
+            or context.unrestricted
+            or context.msp_enabled
+            or context.multi_site_mode
+        ):
+            return TenantOptimizedQuerySet.for_context(self, context)
 
         # Single-site: use monitoring group filtering if available
         if hasattr(self.model, "location") and hasattr(user, "monitoring_groups"):
@@ -317,6 +320,9 @@ class TenantOptimizedManager(models.Manager[_ModelT]):
     def for_campus(self, *, campus_id: int | None = None) -> TenantOptimizedQuerySet[_ModelT]:
         return self.get_queryset().for_campus(campus_id=campus_id)
 
+    def for_context(self, context: TenantContext) -> TenantOptimizedQuerySet[_ModelT]:
+        return self.get_queryset().for_context(context)
+
     def for_user(self, *, user: Any) -> TenantOptimizedQuerySet[_ModelT]:
         return self.get_queryset().for_user(user=user)
 
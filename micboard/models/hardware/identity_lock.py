@@ -0,0 +1,24 @@
+"""Lock rows that serialize overlapping device identity mutations."""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class DeviceIdentityLock(models.Model):
+    """One hashed bucket of serial, MAC, IP, and API-ID identities.
+
+    Writers lock the buckets of every identity they read or write, in bucket
+    order, so syncs over disjoint devices proceed in parallel. PostgreSQL uses
+    transaction-scoped advisory locks instead and never touches this table.
+    """
+
+    bucket = models.PositiveIntegerField(primary_key=True, help_text="Identity hash bucket")
+
+    class Meta:
+        verbose_name = "Device Identity Lock"
+        verbose_name_plural = "Device Identity Locks"
+        ordering = ["bucket"]
+
+    def __str__(self) -> str:
+        return f"Identity lock bucket {self.bucket}"
@@ -44,16 +44,67 @@ Architecture & Future-Proofing Notes:
 
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
 from typing import Any, ClassVar
 
 from django.db import models, router, transaction
+from django.dispatch import Signal
 
 from micboard.models.base_managers import TenantOptimizedManager, TenantOptimizedQuerySet
+from micboard.models.mixins import SyncTimestampModel
 
+# Columns that identify a chassis to device deduplication and identity locks.
+CHASSIS_IDENTITY_FIELDS: frozenset[str] = frozenset(
+    {"manufacturer", "manufacturer_id", "api_device_id", "ip", "serial_number", "mac_address"}
+)
 
-class WirelessChassisQuerySet(TenantOptimizedQuerySet):
+# Sent after queryset bulk writes that may change chassis identities, which
+# bypass save and delete signals. ``chassis_ids`` is ``None`` when unknown.
+chassis_identities_written = Signal()
+
+
+class WirelessChassisQuerySet(TenantOptimizedQuerySet["WirelessChassis"]):
     """Enhanced queryset for WirelessChassis model with role and tenant filtering."""
 
+    def bulk_create(
+        self,
+        objs: Iterable[WirelessChassis],
+        batch_size: int | None = None,
+        ignore_conflicts: bool = False,
+        update_conflicts: bool = False,
+        update_fields: Collection[str] | None = None,
+        unique_fields: Collection[str] | None = None,
+    ) -> list[WirelessChassis]:
+        created = super().bulk_create(
+            objs,
+            batch_size=batch_size,
+            ignore_conflicts=ignore_conflicts,
+            update_conflicts=update_conflicts,
+            update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
+        ids = [chassis.pk for chassis in created]
+        self._identities_written(None if None in ids else ids)
+        return created
+
+    def bulk_update(self, objs: Any, fields: Any, *args: Any, **kwargs: Any) -> int:
+        objs = list(objs)
+        updated = super().bulk_update(objs, fields, *args, **kwargs)
+        if CHASSIS_IDENTITY_FIELDS.intersection(fields):
+            self._identities_written([chassis.pk for chassis in objs])
+        return updated
+
+    def update(self, **kwargs: Any) -> int:
+        if not CHASSIS_IDENTITY_FIELDS.intersection(kwargs):
+            return super().update(**kwargs)
+        ids = list(self.values_list("pk", flat=True))
+        updated = super().update(**kwargs)
+        self._identities_written(ids)
+        return updated
+
+    def _identities_written(self, chassis_ids: list[int] | None) -> None:
+        chassis_identities_written.send(sender=self.model, chassis_ids=chassis_ids, using=self.db)
+
     def active(self) -> WirelessChassisQuerySet:
         """Get all active devices (not offline)."""
         return self.filter(status__in=["online", "degraded", "provisioning"])
@@ -81,7 +132,7 @@ class WirelessChassisQuerySet(TenantOptimizedQuerySet):
         return self.prefetch_related("rf_channels")
 
 
-class WirelessChassisManager(TenantOptimizedManager):
+class WirelessChassisManager(TenantOptimizedManager["WirelessChassis"]):
     """Enhanced manager for WirelessChassis model with tenant support."""
 
     def get_queryset(self) -> WirelessChassisQuerySet:
@@ -112,7 +163,7 @@ class WirelessChassisManager(TenantOptimizedManager):
         return self.get_queryset().with_channels()
 
 
-class WirelessChassis(models.Model):
+class WirelessChassis(SyncTimestampModel):
     """BASE STATION/RACK UNIT for wireless audio systems (receiver/transmitter/transceiver).
 
     This model represents the STATIONARY, RACK-MOUNTED chassis hardware.
@@ -317,6 +368,10 @@ class WirelessChassis(models.Model):
         default=0,
         help_text="Cumulative uptime in minutes",
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Last update timestamp",
+    )
 
     # Device capabilities (from specification registry)
     max_channels = models.PositiveIntegerField(
@@ -356,6 +411,7 @@ class WirelessChassis(models.Model):
             models.Index(fields=["role", "status"]),
             models.Index(fields=["serial_number"]),
             models.Index(fields=["mac_address"]),
+            models.Index(fields=["updated_at", "id"]),
         ]
         unique_together: ClassVar[list[list[str]]] = [
             ["manufacturer", "api_device_id"],
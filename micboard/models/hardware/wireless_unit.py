@@ -19,6 +19,7 @@ from django.db import models
 from django.utils import timezone
 
 from micboard.models.base_managers import TenantOptimizedManager, TenantOptimizedQuerySet
+from micboard.models.mixins import SyncTimestampModel
 
 
 class WirelessUnitQuerySet(TenantOptimizedQuerySet):
@@ -88,7 +89,7 @@ class WirelessUnitManager(TenantOptimizedManager):
         return self.get_queryset().low_battery(threshold=threshold)
 
 
-class WirelessUnit(models.Model):
+class WirelessUnit(SyncTimestampModel):
     """Field-side wireless audio device (bodypack, handheld, IEM receiver, etc.)."""
 
     UNKNOWN_BYTE_VALUE: ClassVar = 255
@@ -317,6 +318,7 @@ class WirelessUnit(models.Model):
             models.Index(fields=["serial_number"]),
             models.Index(fields=["status", "last_seen"]),
             models.Index(fields=["device_type"]),
+            models.Index(fields=["updated_at", "id"]),
         ]
 
     def __str__(self) -> str:
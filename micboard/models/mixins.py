@@ -2,6 +2,29 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from django.db import models
+
 
 class DiscoveryTriggerMixin:
     """Migration-stable marker retained for historical model state loading."""
+
+
+class SyncTimestampModel(models.Model):
+    """Abstract base whose partial saves also advance ``updated_at``.
+
+    API clients sync incrementally from ``updated_at``. ``auto_now`` only
+    refreshes a field that is being written, so ``save(update_fields=...)``
+    adds the timestamp to every partial save. Subclasses declare the field.
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Include ``updated_at`` in partial saves."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+        super().save(*args, **kwargs)
@@ -0,0 +1,55 @@
+# file: micboard/models/monitoring/alert_outbox.py
+from __future__ import annotations
+
+from typing import ClassVar
+
+from django.db import models
+from django.utils import timezone
+
+
+class AlertEmailOutbox(models.Model):
+    """Alert email queued in the alert's own transaction and delivered by a drain task."""
+
+    DELIVERY_STATUS: ClassVar[list[tuple[str, str]]] = [
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+        ("cancelled", "Cancelled"),
+    ]
+
+    alert = models.OneToOneField(
+        "micboard.Alert",
+        on_delete=models.CASCADE,
+        related_name="email_outbox",
+        help_text="Alert this email notifies about",
+    )
+    recipient = models.EmailField(help_text="Address resolved from preferences at queue time")
+    status = models.CharField(
+        max_length=20,
+        choices=DELIVERY_STATUS,
+        default="pending",
+        help_text="Current delivery state",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, help_text="Delivery attempts claimed so far"
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, help_text="Earliest time a drain may claim this email"
+    )
+    last_error = models.CharField(
+        max_length=100, blank=True, help_text="Exception type of the last failed attempt"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True, help_text="When the email was queued")
+    sent_at = models.DateTimeField(null=True, blank=True, help_text="When the email was sent")
+
+    class Meta:
+        verbose_name = "Alert Email"
+        verbose_name_plural = "Alert Email Outbox"
+        ordering: ClassVar[list[str]] = ["next_attempt_at", "pk"]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Alert {self.alert_id} email to {self.recipient} ({self.status})"
@@ -0,0 +1,117 @@
+"""Precomputed inventory totals per location, building, tenant, and site."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from django.db import models
+
+DEVICE_STATUS_FIELDS: dict[str, str] = {
+    "discovered": "devices_discovered",
+    "provisioning": "devices_provisioning",
+    "online": "devices_online",
+    "degraded": "devices_degraded",
+    "offline": "devices_offline",
+    "maintenance": "devices_maintenance",
+    "retired": "devices_retired",
+}
+COUNTER_FIELDS: tuple[str, ...] = (
+    *DEVICE_STATUS_FIELDS.values(),
+    "active_units",
+    "open_alerts",
+    "online_chargers",
+)
+
+
+class InventoryCounter(models.Model):
+    """Maintained inventory totals for one scope.
+
+    Location rows are counted from the hardware tables; location ``0`` holds
+    chassis without a location. Building rows sum their locations, and
+    organization, campus, and site rows sum their buildings. The single
+    deployment row sums every building plus the unplaced location. Rows are
+    kept current by the inventory counter service inside the transaction that
+    changed the hardware.
+    """
+
+    class Scope(models.TextChoices):
+        DEPLOYMENT = "deployment", "Deployment"
+        ORGANIZATION = "organization", "Organization"
+        CAMPUS = "campus", "Campus"
+        SITE = "site", "Site"
+        BUILDING = "building", "Building"
+        LOCATION = "location", "Location"
+
+    scope = models.CharField(
+        max_length=20,
+        choices=Scope.choices,
+        help_text="Kind of scope these totals cover",
+    )
+    scope_id = models.PositiveBigIntegerField(
+        help_text="Identifier of the scope (0 for the deployment and unplaced inventory)",
+    )
+    building_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Building of a location row",
+    )
+    organization_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Organization of a building row",
+    )
+    campus_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Campus of a building row",
+    )
+    site_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Site of a building row",
+    )
+
+    devices_discovered = models.PositiveIntegerField(default=0)
+    devices_provisioning = models.PositiveIntegerField(default=0)
+    devices_online = models.PositiveIntegerField(default=0)
+    devices_degraded = models.PositiveIntegerField(default=0)
+    devices_offline = models.PositiveIntegerField(default=0)
+    devices_maintenance = models.PositiveIntegerField(default=0)
+    devices_retired = models.PositiveIntegerField(default=0)
+    active_units = models.PositiveIntegerField(
+        default=0,
+        help_text="Wireless units that are online, degraded, or provisioning",
+    )
+    open_alerts = models.PositiveIntegerField(
+        default=0,
+        help_text="Alerts that are pending, sent, or acknowledged",
+    )
+    online_chargers = models.PositiveIntegerField(
+        default=0,
+        help_text="Active chargers reporting online",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Inventory Counter"
+        verbose_name_plural = "Inventory Counters"
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["scope", "scope_id"],
+                name="micboard_inventory_counter_unique_scope",
+            ),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["scope", "building_id"]),
+            models.Index(fields=["scope", "organization_id"]),
+            models.Index(fields=["scope", "campus_id"]),
+            models.Index(fields=["scope", "site_id"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.scope} {self.scope_id}: {self.devices} devices"
+
+    @property
+    def devices(self) -> int:
+        """Return the number of chassis in every lifecycle status."""
+        return sum(getattr(self, field) for field in DEVICE_STATUS_FIELDS.values())
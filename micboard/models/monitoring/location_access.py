@@ -0,0 +1,62 @@
+"""Materialized user-to-location access derived from monitoring groups."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from django.conf import settings
+from django.db import models
+
+
+class LocationAccessGrant(models.Model):
+    """One active location a user may monitor through an active monitoring group.
+
+    Rows are the closure of explicit group locations and ``include_all_rooms``
+    buildings, kept current by the monitoring location access service. Building
+    and room are copied from the location so building and room visibility is
+    one indexed lookup. Tenant and site boundaries are applied at query time.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="location_access_grants",
+        help_text="User granted access",
+    )
+    location = models.ForeignKey(
+        "micboard.Location",
+        on_delete=models.CASCADE,
+        related_name="access_grants",
+        help_text="Location the user may monitor",
+    )
+    building = models.ForeignKey(
+        "micboard.Building",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="Building of the location",
+    )
+    room = models.ForeignKey(
+        "micboard.Room",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text="Room of the location, if any",
+    )
+
+    class Meta:
+        verbose_name = "Location Access Grant"
+        verbose_name_plural = "Location Access Grants"
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=["user", "location"],
+                name="micboard_location_access_unique",
+            ),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["user", "building"]),
+            models.Index(fields=["user", "room"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"User {self.user_id} -> location {self.location_id}"
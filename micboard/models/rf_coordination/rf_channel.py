@@ -8,13 +8,15 @@ Each RF channel represents an RF communication path with direction awareness:
 
 from __future__ import annotations
 
-from typing import ClassVar, cast
+from collections.abc import Iterable
+from typing import Any, ClassVar, cast
 
 from django.contrib.auth.models import User
 from django.db import models
 from django.db.models import Q
 
 from micboard.models.base_managers import TenantOptimizedManager, TenantOptimizedQuerySet
+from micboard.models.mixins import SyncTimestampModel
 
 
 class RFChannelQuerySet(TenantOptimizedQuerySet):
@@ -97,7 +99,7 @@ class RFChannelManager(TenantOptimizedManager):
         return self.get_queryset().with_wireless_unit()
 
 
-class RFChannel(models.Model):
+class RFChannel(SyncTimestampModel):
     """Represents a directional RF communication channel on a wireless chassis."""
 
     LINK_DIRECTIONS: ClassVar[list[tuple[str, str]]] = [
@@ -220,6 +222,18 @@ class RFChannel(models.Model):
         related_name="active_on_send_channels",
         help_text="Currently active IEM receiver on this channel (SEND direction)",
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Last update timestamp",
+    )
+
+    # Persisted values tracked from load so lifecycle validation needs no extra read.
+    LOADED_STATE_FIELDS: ClassVar[tuple[str, ...]] = (
+        "resource_state",
+        "enabled",
+        "channel_number",
+        "chassis_id",
+    )
 
     objects = RFChannelManager()
 
@@ -231,8 +245,47 @@ class RFChannel(models.Model):
         indexes: ClassVar[list[models.Index]] = [
             models.Index(fields=["chassis", "channel_number"]),
             models.Index(fields=["link_direction"]),
+            models.Index(fields=["updated_at", "id"]),
         ]
 
     def __str__(self) -> str:
         direction_label = dict(self.LINK_DIRECTIONS).get(self.link_direction, self.link_direction)
         return f"{self.chassis.name} - RF Ch {self.channel_number} ({direction_label})"
+
+    @classmethod
+    def from_db(cls, *args: Any, **kwargs: Any) -> RFChannel:
+        """Snapshot persisted lifecycle fields so saves can validate without re-reading."""
+        instance = super().from_db(*args, **kwargs)
+        instance.remember_loaded_state()
+        return instance
+
+    def remember_loaded_state(self, fields: Iterable[str] | None = None) -> None:
+        """Record the persisted value of loaded lifecycle fields.
+
+        ``fields`` limits the refresh to fields just written or reloaded. Deferred
+        fields are never recorded, so validation reads them from the database.
+        """
+        names = None if fields is None else set(fields)
+        snapshot = dict(getattr(self, "_loaded_state", {}))
+        for attname in self.LOADED_STATE_FIELDS:
+            if attname not in self.__dict__:
+                continue
+            if names is None or {attname, self._meta.get_field(attname).name} & names:
+                snapshot[attname] = self.__dict__[attname]
+        self._loaded_state = snapshot
+
+    @property
+    def loaded_state(self) -> dict[str, Any]:
+        """Persisted lifecycle field values known without a query, keyed by attname."""
+        return dict(getattr(self, "_loaded_state", {}))
+
+    def refresh_from_db(
+        self,
+        using: str | None = None,
+        fields: Iterable[str] | None = None,
+        from_queryset: models.QuerySet[RFChannel] | None = None,
+    ) -> None:
+        """Reload fields and refresh their loaded-state snapshot."""
+        fields = None if fields is None else list(fields)
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self.remember_loaded_state(fields)
@@ -33,6 +33,8 @@ class APIHealthLog(models.Model):
         indexes: ClassVar[list[models.Index]] = [
             models.Index(fields=["manufacturer", "timestamp"]),
             models.Index(fields=["status"]),
+            # Retention pruning deletes by time range across all manufacturers.
+            models.Index(fields=["timestamp"]),
         ]
 
     def __str__(self) -> str:
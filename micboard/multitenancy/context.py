@@ -0,0 +1,248 @@
+"""Immutable tenant scope resolved once per user object.
+
+Tenant-scoped querysets, monitoring services, and the tenant middleware all
+need the same active memberships and visible buildings. ``TenantContext``
+captures them on first use and is memoized on the user instance, which Django
+creates once per request and Channels keeps for a consumer connection. A shared
+generation token retires every memoized context when memberships,
+organizations, campuses, or buildings change. Each process re-reads that token
+at most once per ``MICBOARD_TENANT_CONTEXT_REFRESH_SECONDS``, so resolving a
+memoized context does not cost a cache round trip.
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
+
+from micboard.settings.deployment_controls import deployment_controls
+
+TENANT_ADMIN_ROLES = frozenset({"admin", "owner"})
+
+_VERSION_CACHE_KEY = "micboard:tenant-context-version"
+_USER_ATTRIBUTE = "_micboard_tenant_context"
+DEFAULT_REFRESH_SECONDS = 5
+HARD_REFRESH_SECONDS = 60
+
+# Shared generation token and the monotonic time this process re-reads it.
+_version_snapshot: tuple[str, float] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TenantMembership:
+    """One active organization membership, optionally limited to a campus."""
+
+    organization_id: int
+    campus_id: int | None
+    role: str
+    site_id: int | None
+
+
+@dataclass(frozen=True)
+class TenantContext:
+    """Tenant scope of one user under the deployment controls in force.
+
+    ``organization_id`` and ``campus_id`` are the request's selected tenant;
+    every other field describes what the user may see regardless of selection.
+    """
+
+    version: str
+    user_id: int | None
+    is_authenticated: bool
+    is_superuser: bool
+    unrestricted: bool
+    msp_enabled: bool
+    multi_site_mode: bool
+    site_id: int
+    memberships: tuple[TenantMembership, ...] = ()
+    organization_id: int | None = None
+    campus_id: int | None = None
+
+    @property
+    def scopes(self) -> list[tuple[int, int | None]]:
+        """Return organization/campus pairs the user may view."""
+        return [(item.organization_id, item.campus_id) for item in self.memberships]
+
+    @property
+    def organization_ids(self) -> frozenset[int]:
+        """Return every organization the user holds an active membership in."""
+        return frozenset(item.organization_id for item in self.memberships)
+
+    @property
+    def is_tenant_admin(self) -> bool:
+        """Return whether any membership grants an administrative role."""
+        return bool(self.management_scopes())
+
+    def management_scopes(
+        self, roles: frozenset[str] = TENANT_ADMIN_ROLES
+    ) -> list[tuple[int, int | None]]:
+        """Return organization/campus pairs where the user holds one of ``roles``."""
+        return [
+            (item.organization_id, item.campus_id)
+            for item in self.memberships
+            if item.role in roles and (not self.multi_site_mode or item.site_id == self.site_id)
+        ]
+
+    def membership_for(self, organization_id: int) -> TenantMembership | None:
+        """Return the user's membership in ``organization_id``, if active."""
+        return next(
+            (item for item in self.memberships if item.organization_id == organization_id),
+            None,
+        )
+
+    def with_selection(
+        self, *, organization_id: int | None, campus_id: int | None
+    ) -> TenantContext:
+        """Return this context with the request's selected organization and campus."""
+        return replace(self, organization_id=organization_id, campus_id=campus_id)
+
+    @cached_property
+    def visible_building_ids(self) -> frozenset[int] | None:
+        """Return the buildings inside the tenant boundary, or ``None`` when unbounded."""
+        buildings = self.visible_buildings()
+        if buildings is None:
+            return None
+        return frozenset(buildings)
+
+    def visible_buildings(self) -> QuerySet[Any] | None:
+        """Return a subquery of visible building keys, or ``None`` when unbounded.
+
+        Filter with ``building_id__in=context.visible_buildings()`` so the
+        boundary is applied inside the database instead of as a literal list.
+        """
+        if not (self.msp_enabled or self.multi_site_mode):
+            return None
+        if self.unrestricted and not self.multi_site_mode:
+            return None
+
+        buildings = apps.get_model("micboard", "Building")._default_manager.all()
+        if not self.is_authenticated:
+            return buildings.none().values_list("pk", flat=True)
+        if self.msp_enabled and not self.unrestricted:
+            if not self.memberships:
+                return buildings.none().values_list("pk", flat=True)
+            scope = Q()
+            for organization_id, campus_id in self.scopes:
+                membership = Q(organization_id=organization_id)
+                if campus_id is not None:
+                    membership &= Q(campus_id=campus_id)
+                scope |= membership
+            buildings = buildings.filter(scope)
+        if self.multi_site_mode:
+            buildings = buildings.filter(site_id=self.site_id)
+        return buildings.values_list("pk", flat=True)
+
+    def matches(self, other: TenantContext) -> bool:
+        """Return whether ``other`` was resolved for the same generation and controls."""
+        return self._key() == other._key()
+
+    def _key(self) -> tuple[object, ...]:
+        return (
+            self.version,
+            self.user_id,
+            self.is_authenticated,
+            self.is_superuser,
+            self.unrestricted,
+            self.msp_enabled,
+            self.multi_site_mode,
+            self.site_id,
+        )
+
+
+def tenant_context_for_user(user: Any) -> TenantContext:
+    """Return ``user``'s tenant context, resolving it at most once per generation."""
+    is_superuser = bool(getattr(user, "is_superuser", False))
+    allow_cross_org_view = deployment_controls.allow_cross_org_view
+    probe = TenantContext(
+        version=_version(),
+        user_id=getattr(user, "pk", None),
+        is_authenticated=bool(getattr(user, "is_authenticated", True)),
+        is_superuser=is_superuser,
+        unrestricted=is_superuser and allow_cross_org_view,
+        msp_enabled=deployment_controls.msp_enabled,
+        multi_site_mode=deployment_controls.multi_site_mode,
+        site_id=getattr(django_settings, "SITE_ID", 1),
+    )
+    cached = getattr(user, _USER_ATTRIBUTE, None)
+    if isinstance(cached, TenantContext) and cached.matches(probe):
+        return cached
+
+    context = replace(probe, memberships=_load_memberships(user, probe))
+    with suppress(AttributeError):
+        setattr(user, _USER_ATTRIBUTE, context)
+    return context
+
+
+def tenant_scope_changed(*, using: str | None = None) -> None:
+    """Retire memoized contexts now and again once the writing transaction commits."""
+    invalidate_tenant_contexts()
+    transaction.on_commit(invalidate_tenant_contexts, using=using)
+
+
+def invalidate_tenant_contexts() -> None:
+    """Start a new shared generation so every process re-resolves on next use.
+
+    This process adopts the new generation at once; other processes see it
+    within ``MICBOARD_TENANT_CONTEXT_REFRESH_SECONDS``.
+    """
+    version = secrets.token_hex(8)
+    cache.set(_VERSION_CACHE_KEY, version, timeout=None)
+    _remember_version(version)
+
+
+def _version() -> str:
+    snapshot = _version_snapshot
+    if snapshot is not None and time.monotonic() < snapshot[1]:
+        return snapshot[0]
+    version = cache.get(_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(_VERSION_CACHE_KEY, "0", timeout=None)
+        version = cache.get(_VERSION_CACHE_KEY, "0")
+    return _remember_version(str(version))
+
+
+def _remember_version(version: str) -> str:
+    global _version_snapshot
+    _version_snapshot = (version, time.monotonic() + _refresh_seconds())
+    return version
+
+
+def _refresh_seconds() -> int:
+    return deployment_controls.get_bounded_int(
+        "MICBOARD_TENANT_CONTEXT_REFRESH_SECONDS",
+        default=DEFAULT_REFRESH_SECONDS,
+        hard_limit=HARD_REFRESH_SECONDS,
+        minimum=0,
+    )
+
+
+def _load_memberships(user: Any, probe: TenantContext) -> tuple[TenantMembership, ...]:
+    """Load active memberships with internally consistent campuses, newest first."""
+    if not probe.msp_enabled or not probe.is_authenticated:
+        return ()
+    if not apps.is_installed("micboard.multitenancy"):
+        return ()
+    rows = (
+        user.org_memberships.filter(
+            Q(campus__isnull=True)
+            | Q(
+                campus__is_active=True,
+                campus__organization_id=F("organization_id"),
+            ),
+            is_active=True,
+            organization__is_active=True,
+        )
+        .order_by("-created_at")
+        .values_list("organization_id", "campus_id", "role", "organization__site_id")
+    )
+    return tuple(TenantMembership(*row) for row in rows)
@@ -9,10 +9,12 @@ Attaches organization context to requests based on:
 from __future__ import annotations
 
 from contextlib import suppress
+from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 
 from django.utils.functional import SimpleLazyObject
 
+from micboard.multitenancy.context import tenant_context_for_user
 from micboard.services.settings.settings_service import settings as micboard_settings
 
 if TYPE_CHECKING:
@@ -22,7 +24,7 @@ if TYPE_CHECKING:
 
 
 def _get_org_from_session(request: HttpRequest) -> Any:
-    from micboard.multitenancy.models import Organization, OrganizationMembership
+    from micboard.multitenancy.models import Organization
 
     if not hasattr(request, "session"):
         return None
@@ -36,9 +38,7 @@ def _get_org_from_session(request: HttpRequest) -> Any:
         if request.user.is_authenticated:
             if (
                 request.user.is_superuser
-                or OrganizationMembership._default_manager.filter(
-                    user=request.user, organization=org, is_active=True
-                ).exists()
+                or org.pk in tenant_context_for_user(request.user).organization_ids
             ):
                 return org
             # User lost access, clear session
@@ -63,18 +63,15 @@ def _get_org_from_user_profile(request: HttpRequest) -> Any:
 def _get_org_from_membership(request: HttpRequest) -> Any:
     if not request.user.is_authenticated:
         return None
-    from micboard.multitenancy.models import OrganizationMembership
-
-    membership = (
-        OrganizationMembership._default_manager.filter(user=request.user, is_active=True)
-        .select_related("organization")
-        .order_by("-created_at")
-        .first()
-    )
+    memberships = tenant_context_for_user(request.user).memberships
+    if not memberships:
+        return None
+    from micboard.multitenancy.models import Organization
 
-    if membership and getattr(membership.organization, "is_active", False):
-        return membership.organization
-    return None
+    # Memberships are newest first and already limited to active organizations.
+    return Organization._default_manager.filter(
+        pk=memberships[0].organization_id, is_active=True
+    ).first()
 
 
 def _get_org_from_subdomain(request: HttpRequest) -> Any:
@@ -142,8 +139,6 @@ def get_current_campus(request: HttpRequest) -> int | None:
     if not micboard_settings.msp_enabled:
         return None
 
-    from micboard.multitenancy.models import OrganizationMembership
-
     # Check session
     if hasattr(request, "session"):
         campus_id = request.session.get("current_campus_id")
@@ -155,10 +150,7 @@ def get_current_campus(request: HttpRequest) -> int | None:
         tenant_request: Any = request
         org = tenant_request.organization
         if org:
-            membership = OrganizationMembership._default_manager.filter(
-                user=request.user, organization=org, is_active=True
-            ).first()
-
+            membership = tenant_context_for_user(request.user).membership_for(org.pk)
             if membership and membership.campus_id:
                 return membership.campus_id
 
@@ -171,6 +163,7 @@ class TenantMiddleware:
     Adds:
     - request.organization: Current Organization instance (or None)
     - request.campus_id: Current Campus ID (or None)
+    - request.tenant_context: The user's TenantContext with that selection
     """
 
     def __init__(self, get_response: Any) -> None:
@@ -180,11 +173,22 @@ class TenantMiddleware:
     def __call__(self, request: HttpRequest) -> Any:
         """Populate request with tenant context before dispatching."""
         tenant_request: Any = request
+        resolve_organization = cache(lambda: get_current_organization(request))
+        resolve_campus = cache(lambda: get_current_campus(request))
+
         # Attach organization as lazy object (evaluated on access)
-        tenant_request.organization = SimpleLazyObject(lambda: get_current_organization(request))
+        tenant_request.organization = SimpleLazyObject(resolve_organization)
 
         # Attach campus ID (also lazy)
-        tenant_request.campus_id = SimpleLazyObject(lambda: get_current_campus(request))
+        tenant_request.campus_id = SimpleLazyObject(resolve_campus)
+
+        # Scope queries share one context; its memberships are loaded at most once.
+        tenant_request.tenant_context = SimpleLazyObject(
+            lambda: tenant_context_for_user(request.user).with_selection(
+                organization_id=getattr(resolve_organization(), "pk", None),
+                campus_id=resolve_campus(),
+            )
+        )
 
         response = self.get_response(request)
         return response
@@ -1,3 +1,5 @@
+from typing import Any
+
 from rest_framework import serializers
 
 from micboard.models.hardware.wireless_chassis import WirelessChassis
@@ -5,19 +7,34 @@ from micboard.models.hardware.wireless_unit import WirelessUnit
 from micboard.models.rf_coordination.rf_channel import RFChannel
 
 
-class WirelessChassisSerializer(serializers.ModelSerializer):
+class SparseHardwareSerializer(serializers.ModelSerializer):
+    """Hardware serializer that renders only the ``sparse_fields`` named in its context."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        sparse_fields = self.context.get("sparse_fields")
+        if sparse_fields is not None:
+            for field_name in set(self.fields) - set(sparse_fields):
+                self.fields.pop(field_name)
+
+    @classmethod
+    def available_fields(cls) -> frozenset[str]:
+        return frozenset(cls(context={}).fields)
+
+
+class WirelessChassisSerializer(SparseHardwareSerializer):
     class Meta:
         model = WirelessChassis
         fields = "__all__"
 
 
-class WirelessUnitSerializer(serializers.ModelSerializer):
+class WirelessUnitSerializer(SparseHardwareSerializer):
     class Meta:
         model = WirelessUnit
         fields = "__all__"
 
 
-class RFChannelSerializer(serializers.ModelSerializer):
+class RFChannelSerializer(SparseHardwareSerializer):
     class Meta:
         model = RFChannel
         fields = "__all__"
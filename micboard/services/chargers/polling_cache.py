@@ -11,6 +11,7 @@ from pydantic import ValidationError
 
 from micboard.services.chargers.polling_dtos import (
     ChargerInventoryPage,
+    ChargerInventorySnapshot,
     ChargerPollingCursor,
     ChargerStationSnapshot,
 )
@@ -20,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 CHARGER_POLL_CURSOR_TIMEOUT_SECONDS = 7 * 24 * 60 * 60
 CHARGER_SNAPSHOT_TIMEOUT_SECONDS = 60
+# Station payload digests outlive single cycles so unchanged slots are not rewritten.
+CHARGER_STATION_DIGEST_LIMIT = 256
 
 
 class ChargerPollingCacheAdapter:
@@ -35,6 +38,16 @@ class ChargerPollingCacheAdapter:
         """Return the public complete-snapshot key for one manufacturer."""
         return f"charger_data_{manufacturer.code}"
 
+    @staticmethod
+    def inventory_key(manufacturer: Any) -> str:
+        """Return the private versioned inventory snapshot key for one manufacturer."""
+        return f"micboard:charger-inventory:v1:{manufacturer.pk}:{manufacturer.code}"
+
+    @staticmethod
+    def station_digest_key(manufacturer: Any) -> str:
+        """Return the private persisted-slot digest key for one manufacturer."""
+        return f"micboard:charger-slot-digests:v1:{manufacturer.pk}:{manufacturer.code}"
+
     @classmethod
     def read_cursor(cls, manufacturer: Any) -> ChargerPollingCursor:
         """Read validated continuation state without making polling cache-dependent."""
@@ -147,3 +160,83 @@ class ChargerPollingCacheAdapter:
         # A one-shot iterable cannot be resumed safely. Preserve the last complete
         # public snapshot instead of replacing it with a partial first page.
         cls.clear_cursor(manufacturer)
+
+    @classmethod
+    def read_inventory_snapshot(
+        cls,
+        manufacturer: Any,
+        *,
+        version: str,
+    ) -> ChargerInventorySnapshot | None:
+        """Return the cached inventory only when it is the version a cursor was built from."""
+        try:
+            value = cache.get(cls.inventory_key(manufacturer))
+        except Exception as exc:
+            logger.exception(
+                "Could not read charger inventory snapshot for manufacturer %s",
+                manufacturer.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
+        try:
+            snapshot = ChargerInventorySnapshot.model_validate(value)
+        except (TypeError, ValidationError):
+            return None
+        return snapshot if snapshot.version == version else None
+
+    @classmethod
+    def write_inventory_snapshot(
+        cls,
+        manufacturer: Any,
+        snapshot: ChargerInventorySnapshot,
+    ) -> None:
+        """Persist one inventory version for continuation pages of the same cycle."""
+        try:
+            cache.set(
+                cls.inventory_key(manufacturer),
+                snapshot.model_dump(),
+                timeout=CHARGER_POLL_CURSOR_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            logger.exception(
+                "Could not persist charger inventory snapshot for manufacturer %s",
+                manufacturer.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+
+    @classmethod
+    def read_station_digests(cls, manufacturer: Any) -> dict[str, str]:
+        """Return payload digests of station slots already written to the database."""
+        try:
+            value = cache.get(cls.station_digest_key(manufacturer))
+        except Exception as exc:
+            logger.exception(
+                "Could not read charger slot digests for manufacturer %s",
+                manufacturer.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return {}
+        if not isinstance(value, dict):
+            return {}
+        return {
+            station_id: digest
+            for station_id, digest in value.items()
+            if isinstance(station_id, str) and isinstance(digest, str)
+        }
+
+    @classmethod
+    def write_station_digests(cls, manufacturer: Any, digests: dict[str, str]) -> None:
+        """Persist the most recently written station digests under a fixed entry bound."""
+        retained = dict(list(digests.items())[-CHARGER_STATION_DIGEST_LIMIT:])
+        try:
+            cache.set(
+                cls.station_digest_key(manufacturer),
+                retained,
+                timeout=CHARGER_POLL_CURSOR_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            logger.exception(
+                "Could not persist charger slot digests for manufacturer %s",
+                manufacturer.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
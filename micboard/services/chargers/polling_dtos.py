@@ -19,6 +19,12 @@ class ChargerPollingLimits(PydanticBaseDTO):
         description="Maximum vendor-order station prefix retained in a complete snapshot.",
     )
     max_slots: int = Field(ge=1, le=128)
+    slot_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Maximum station slot requests in flight at once.",
+    )
 
 
 class ChargerSlotSnapshot(PydanticBaseDTO):
@@ -39,6 +45,20 @@ class ChargerStationSnapshot(PydanticBaseDTO):
     slots: list[ChargerSlotSnapshot] = Field(max_length=128)
 
 
+class ChargerStationIdentity(PydanticBaseDTO):
+    """Vendor address and serial used to match a polled station to a persisted charger."""
+
+    ip: str = Field(default="", max_length=45)
+    serial: str = Field(default="", max_length=100)
+
+
+class ChargerInventorySnapshot(PydanticBaseDTO):
+    """One inventory version that continuation pages iterate without refetching."""
+
+    version: str = Field(min_length=64, max_length=64, pattern=r"^[0-9a-f]{64}$")
+    items: list[dict[str, Any]] = Field(max_length=5_000)
+
+
 class ChargerInventoryPage(PydanticBaseDTO):
     """One deterministic bounded page from a vendor inventory."""
 
@@ -89,3 +109,4 @@ class ChargerPollResult(PydanticBaseDTO):
     inventory_truncated: bool = False
     stations_truncated: bool = False
     slots_truncated: bool = False
+    stations_changed: int = Field(default=0, ge=0, le=256)
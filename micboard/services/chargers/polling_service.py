@@ -3,19 +3,28 @@
 from __future__ import annotations
 
 import hashlib
+import ipaddress
+import json
 import logging
 from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
-from typing import Any
+from typing import Any, cast
+
+from django.db import connections
 
 from micboard.services.chargers.polling_cache import ChargerPollingCacheAdapter
 from micboard.services.chargers.polling_dtos import (
     ChargerInventoryPage,
+    ChargerInventorySnapshot,
+    ChargerPollingCursor,
     ChargerPollingLimits,
     ChargerPollResult,
     ChargerSlotSnapshot,
+    ChargerStationIdentity,
     ChargerStationSnapshot,
 )
+from micboard.services.chargers.slot_sync_service import ChargerSlotSyncService
 from micboard.services.common.base.plugin import get_manufacturer_plugin
 from micboard.services.settings.settings_service import settings as micboard_settings
 from micboard.utils.exception_logging import sanitized_exception_info
@@ -28,9 +37,22 @@ DEFAULT_MAX_CHARGER_SLOTS = 32
 HARD_MAX_CHARGER_DEVICES = 500
 HARD_MAX_CHARGER_STATIONS = 256
 HARD_MAX_CHARGER_SLOTS = 128
-# A full materialized inventory is fingerprinted once per page. Reject larger
-# plugin results before iteration so hashing and cursor validation remain bounded.
+DEFAULT_CHARGER_SLOT_CONCURRENCY = 4
+HARD_MAX_CHARGER_SLOT_CONCURRENCY = 16
+# A full materialized inventory is fingerprinted once per cycle and cached as the
+# cycle's snapshot. Reject larger plugin results before iteration so hashing,
+# snapshot size, and cursor validation remain bounded.
 HARD_MAX_CHARGER_INVENTORY_SIZE = 5_000
+# Text is cut to the longest prefix polling reads, so cached snapshots stay bounded
+# without changing how identifiers and names are later normalized.
+INVENTORY_FIELD_LENGTHS = {
+    "api_device_id": 255,
+    "model": 255,
+    "device_type": 255,
+    "name": 200,
+    "ip": 45,
+    "serial": 100,
+}
 
 CHARGING_STATION_MODELS = frozenset({"SBC250", "SBC850", "MXWNCS8", "MXWNCS4", "SBC220"})
 
@@ -45,15 +67,9 @@ class ChargerPollingService:
         plugin_class = get_manufacturer_plugin(manufacturer.code)
         plugin = plugin_class(manufacturer)
         cursor = ChargerPollingCacheAdapter.read_cursor(manufacturer)
-        inventory_page = cls._inventory_page(
-            plugin.get_devices(),
-            limits.max_devices,
-            start_offset=cursor.next_offset,
-            expected_inventory_size=cursor.inventory_size if cursor.next_offset else None,
-            expected_inventory_fingerprint=(
-                cursor.inventory_fingerprint if cursor.next_offset else None
-            ),
-        )
+        inventory_page = cls._resumed_page(manufacturer, cursor, limits.max_devices)
+        if inventory_page is None:
+            inventory_page = cls._live_page(manufacturer, plugin, cursor, limits.max_devices)
 
         try:
             is_healthy = bool(plugin.get_client().is_healthy())
@@ -70,33 +86,28 @@ class ChargerPollingService:
             () if inventory_page.start_offset == 0 else cursor.stations,
             limits.max_stations,
         )
-        stations_truncated = cursor_rebounded or (
-            cursor.stations_truncated if continuing_cycle else False
+        candidates, failed_count, page_truncated = cls._page_candidates(
+            inventory_page.items,
+            accumulated,
+            limits.max_stations,
+        )
+        stations_truncated = (
+            cursor_rebounded
+            or page_truncated
+            or (cursor.stations_truncated if continuing_cycle else False)
         )
-        failed_count = 0
         slots_truncated = cursor.slots_truncated if continuing_cycle else False
         cycle_failed = cursor.cycle_failed if continuing_cycle else False
-        for raw_device in inventory_page.items:
-            if not cls._is_station(raw_device):
-                continue
-
-            device_id = cls._bounded_text(raw_device.get("api_device_id"), 255)
-            if not device_id:
-                failed_count += 1
-                continue
-            if device_id in accumulated:
-                continue
-            if len(accumulated) >= limits.max_stations:
-                # Keep a stable prefix: rotating station cohorts would make each
-                # complete public snapshot appear to delete still-live stations.
-                stations_truncated = True
-                continue
-
-            station_slots, channel_truncated, channel_failed = cls._station_slots(
-                plugin,
-                device_id=device_id,
-                limit=limits.max_slots,
-            )
+        fetched = cls._fetch_station_slots(
+            plugin,
+            [device_id for device_id, _raw_device in candidates],
+            limit=limits.max_slots,
+            concurrency=limits.slot_concurrency,
+        )
+        page_stations: list[tuple[Mapping[str, Any], ChargerStationSnapshot]] = []
+        for (device_id, raw_device), (station_slots, channel_truncated, channel_failed) in zip(
+            candidates, fetched, strict=True
+        ):
             slots_truncated = slots_truncated or channel_truncated
             if channel_failed:
                 failed_count += 1
@@ -109,7 +120,9 @@ class ChargerPollingService:
                 status="online" if is_healthy else "offline",
                 slots=station_slots,
             )
+            page_stations.append((raw_device, accumulated[device_id]))
 
+        stations_changed = cls._persist_changed_slots(manufacturer, page_stations)
         stations = [
             station.model_copy(update={"status": "online" if is_healthy else "offline"})
             for station in accumulated.values()
@@ -137,29 +150,218 @@ class ChargerPollingService:
             inventory_truncated=inventory_page.inventory_truncated,
             stations_truncated=stations_truncated,
             slots_truncated=slots_truncated,
+            stations_changed=stations_changed,
         )
 
     @staticmethod
     def limits() -> ChargerPollingLimits:
         """Resolve host settings under immutable package ceilings."""
         return ChargerPollingLimits(
-            max_devices=_bounded_setting(
+            max_devices=micboard_settings.get_bounded_int(
                 "MICBOARD_CHARGER_MAX_DEVICES",
-                DEFAULT_MAX_CHARGER_DEVICES,
-                HARD_MAX_CHARGER_DEVICES,
+                default=DEFAULT_MAX_CHARGER_DEVICES,
+                hard_limit=HARD_MAX_CHARGER_DEVICES,
             ),
-            max_stations=_bounded_setting(
+            max_stations=micboard_settings.get_bounded_int(
                 "MICBOARD_CHARGER_MAX_STATIONS",
-                DEFAULT_MAX_CHARGER_STATIONS,
-                HARD_MAX_CHARGER_STATIONS,
+                default=DEFAULT_MAX_CHARGER_STATIONS,
+                hard_limit=HARD_MAX_CHARGER_STATIONS,
             ),
-            max_slots=_bounded_setting(
+            max_slots=micboard_settings.get_bounded_int(
                 "MICBOARD_CHARGER_MAX_SLOTS",
-                DEFAULT_MAX_CHARGER_SLOTS,
-                HARD_MAX_CHARGER_SLOTS,
+                default=DEFAULT_MAX_CHARGER_SLOTS,
+                hard_limit=HARD_MAX_CHARGER_SLOTS,
+            ),
+            slot_concurrency=micboard_settings.get_bounded_int(
+                "MICBOARD_CHARGER_SLOT_CONCURRENCY",
+                default=DEFAULT_CHARGER_SLOT_CONCURRENCY,
+                hard_limit=HARD_MAX_CHARGER_SLOT_CONCURRENCY,
             ),
         )
 
+    @classmethod
+    def _resumed_page(
+        cls,
+        manufacturer: Any,
+        cursor: ChargerPollingCursor,
+        limit: int,
+    ) -> ChargerInventoryPage | None:
+        """Continue a cycle over its cached inventory version without asking the vendor."""
+        if not cursor.next_offset or cursor.inventory_fingerprint is None:
+            return None
+        snapshot = ChargerPollingCacheAdapter.read_inventory_snapshot(
+            manufacturer,
+            version=cursor.inventory_fingerprint,
+        )
+        if snapshot is None:
+            return None
+        return cls._inventory_page(
+            snapshot.items,
+            limit,
+            start_offset=cursor.next_offset,
+            expected_inventory_size=cursor.inventory_size,
+            expected_inventory_fingerprint=cursor.inventory_fingerprint,
+            inventory_fingerprint=snapshot.version,
+        )
+
+    @classmethod
+    def _live_page(
+        cls,
+        manufacturer: Any,
+        plugin: Any,
+        cursor: ChargerPollingCursor,
+        limit: int,
+    ) -> ChargerInventoryPage:
+        """Read the vendor inventory and keep its version for the rest of the cycle."""
+        inventory = plugin.get_devices()
+        inventory_page = cls._inventory_page(
+            inventory,
+            limit,
+            start_offset=cursor.next_offset,
+            expected_inventory_size=cursor.inventory_size if cursor.next_offset else None,
+            expected_inventory_fingerprint=(
+                cursor.inventory_fingerprint if cursor.next_offset else None
+            ),
+        )
+        if inventory_page.next_offset and inventory_page.inventory_fingerprint is not None:
+            ChargerPollingCacheAdapter.write_inventory_snapshot(
+                manufacturer,
+                ChargerInventorySnapshot(
+                    version=inventory_page.inventory_fingerprint,
+                    items=[
+                        cls._inventory_item(item) if isinstance(item, Mapping) else {}
+                        for item in cast(Sequence[object], inventory)
+                    ],
+                ),
+            )
+        return inventory_page
+
+    @classmethod
+    def _page_candidates(
+        cls,
+        items: Iterable[Mapping[str, Any]],
+        accumulated: Mapping[str, ChargerStationSnapshot],
+        limit: int,
+    ) -> tuple[list[tuple[str, Mapping[str, Any]]], int, bool]:
+        """Select unique page stations under the station cap before any channel request."""
+        candidates: dict[str, Mapping[str, Any]] = {}
+        failed_count = 0
+        truncated = False
+        for raw_device in items:
+            if not cls._is_station(raw_device):
+                continue
+
+            device_id = cls._bounded_text(raw_device.get("api_device_id"), 255)
+            if not device_id:
+                failed_count += 1
+                continue
+            if device_id in accumulated or device_id in candidates:
+                continue
+            if len(accumulated) + len(candidates) >= limit:
+                # Keep a stable prefix: rotating station cohorts would make each
+                # complete public snapshot appear to delete still-live stations.
+                truncated = True
+                continue
+            candidates[device_id] = raw_device
+        return list(candidates.items()), failed_count, truncated
+
+    @classmethod
+    def _fetch_station_slots(
+        cls,
+        plugin: Any,
+        device_ids: Sequence[str],
+        *,
+        limit: int,
+        concurrency: int,
+    ) -> list[tuple[list[ChargerSlotSnapshot], bool, bool]]:
+        """Read station slot sets in page order with a bounded number of requests in flight."""
+        if concurrency <= 1 or len(device_ids) <= 1:
+            return [
+                cls._station_slots(plugin, device_id=device_id, limit=limit)
+                for device_id in device_ids
+            ]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(device_ids))) as executor:
+            return list(
+                executor.map(
+                    lambda device_id: cls._threaded_station_slots(plugin, device_id, limit),
+                    device_ids,
+                )
+            )
+
+    @classmethod
+    def _threaded_station_slots(
+        cls,
+        plugin: Any,
+        device_id: str,
+        limit: int,
+    ) -> tuple[list[ChargerSlotSnapshot], bool, bool]:
+        try:
+            return cls._station_slots(plugin, device_id=device_id, limit=limit)
+        finally:
+            connections.close_all()
+
+    @classmethod
+    def _persist_changed_slots(
+        cls,
+        manufacturer: Any,
+        page_stations: Sequence[tuple[Mapping[str, Any], ChargerStationSnapshot]],
+    ) -> int:
+        """Write slot rows only for identifiable stations whose payload digest changed."""
+        identified = [
+            (identity, station)
+            for raw_device, station in page_stations
+            if (identity := cls._station_identity(raw_device)).ip or identity.serial
+        ]
+        if not identified:
+            return 0
+
+        digests = ChargerPollingCacheAdapter.read_station_digests(manufacturer)
+        changed = {
+            station.id: (identity, station, digest)
+            for identity, station in identified
+            if digests.get(station.id) != (digest := cls._station_digest(identity, station))
+        }
+        if not changed:
+            return 0
+
+        try:
+            ChargerSlotSyncService.apply(
+                manufacturer,
+                [(identity, station) for identity, station, _digest in changed.values()],
+            )
+        except Exception as exc:
+            logger.exception(
+                "Could not persist charger slots for manufacturer %s",
+                manufacturer.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return 0
+
+        for station_id, (_identity, _station, digest) in changed.items():
+            digests.pop(station_id, None)
+            digests[station_id] = digest
+        ChargerPollingCacheAdapter.write_station_digests(manufacturer, digests)
+        return len(changed)
+
+    @classmethod
+    def _station_identity(cls, device: Mapping[str, Any]) -> ChargerStationIdentity:
+        raw_ip = cls._bounded_text(device.get("ip"), 45)
+        try:
+            ip = str(ipaddress.ip_address(raw_ip)) if raw_ip else ""
+        except ValueError:
+            ip = ""
+        return ChargerStationIdentity(ip=ip, serial=cls._bounded_text(device.get("serial"), 100))
+
+    @staticmethod
+    def _station_digest(identity: ChargerStationIdentity, station: ChargerStationSnapshot) -> str:
+        """Hash the persisted fields of one station so unchanged payloads skip the database."""
+        payload = {
+            "identity": identity.model_dump(),
+            "slots": [slot.model_dump() for slot in station.slots],
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
     @staticmethod
     def _bounded_items(value: object, limit: int) -> tuple[list[Mapping[str, Any]], bool]:
         """Consume at most one item beyond a limit from an arbitrary vendor iterable."""
@@ -206,6 +408,7 @@ class ChargerPollingService:
         start_offset: int,
         expected_inventory_size: int | None,
         expected_inventory_fingerprint: str | None,
+        inventory_fingerprint: str | None = None,
     ) -> ChargerInventoryPage:
         """Return a bounded list page while retaining a safe fallback for invalid plugins."""
         if isinstance(value, Sequence) and not isinstance(value, str | bytes):
@@ -219,7 +422,7 @@ class ChargerPollingService:
                     inventory_truncated=True,
                     cycle_complete=False,
                 )
-            inventory_fingerprint = cls._inventory_fingerprint(value)
+            inventory_fingerprint = inventory_fingerprint or cls._inventory_fingerprint(value)
             inventory_unchanged = expected_inventory_size in (None, total) and (
                 expected_inventory_fingerprint in (None, inventory_fingerprint)
             )
@@ -262,20 +465,22 @@ class ChargerPollingService:
                 digest.update(encoded)
         return digest.hexdigest()
 
-    @staticmethod
-    def _inventory_items(items: Iterable[object], limit: int) -> list[dict[str, Any]]:
+    @classmethod
+    def _inventory_items(cls, items: Iterable[object], limit: int) -> list[dict[str, Any]]:
         """Copy only fields consumed by polling from already bounded inventory rows."""
         return [
-            {
-                "api_device_id": item.get("api_device_id"),
-                "model": item.get("model"),
-                "device_type": item.get("device_type"),
-                "name": item.get("name"),
-            }
-            for item in islice(items, limit)
-            if isinstance(item, Mapping)
+            cls._inventory_item(item) for item in islice(items, limit) if isinstance(item, Mapping)
         ]
 
+    @staticmethod
+    def _inventory_item(item: Mapping[str, Any]) -> dict[str, Any]:
+        """Copy consumed text fields, shortened only to the length polling reads."""
+        return {
+            field_name: value[:maximum]
+            for field_name, maximum in INVENTORY_FIELD_LENGTHS.items()
+            if isinstance(value := item.get(field_name), str)
+        }
+
     @staticmethod
     def _station_accumulator(
         stations: Iterable[ChargerStationSnapshot],
@@ -339,14 +544,3 @@ class ChargerPollingService:
         return "".join(
             character for character in value[:maximum] if character.isprintable()
         ).strip()
-
-
-def _bounded_setting(name: str, default: int, hard_limit: int) -> int:
-    raw_value = micboard_settings.get(name, default)
-    if isinstance(raw_value, bool):
-        return default
-    try:
-        parsed = int(raw_value)
-    except (TypeError, ValueError):
-        return default
-    return min(max(parsed, 1), hard_limit)
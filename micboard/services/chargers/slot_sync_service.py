@@ -0,0 +1,139 @@
+"""Bulk persistence of polled charger station slots."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+
+from micboard.models.hardware.charger import Charger, ChargerSlot
+from micboard.services.chargers.polling_dtos import ChargerStationIdentity, ChargerStationSnapshot
+from micboard.services.notification.live_fragment_service import LiveFragmentService
+
+SLOT_SYNC_FIELDS = ("occupied", "battery_percent", "device_status")
+SLOT_SYNC_BATCH_SIZE = 500
+
+
+class ChargerSlotSyncService:
+    """Mirror polled station slots onto persisted charger slot rows."""
+
+    @classmethod
+    def apply(
+        cls,
+        manufacturer: Any,
+        stations: Sequence[tuple[ChargerStationIdentity, ChargerStationSnapshot]],
+    ) -> int:
+        """Write slot rows for stations matched to chargers and return rows written.
+
+        Stations are matched by address first and serial second within the manufacturer.
+        Unmatched stations are ignored; slots no longer reported are marked empty.
+        """
+        matched = cls._matched_chargers(manufacturer, stations)
+        if not matched:
+            return 0
+
+        existing: dict[int, dict[int, ChargerSlot]] = defaultdict(dict)
+        for slot in ChargerSlot.objects.filter(charger_id__in=matched):
+            existing[slot.charger_id][slot.slot_number] = slot
+
+        created: list[ChargerSlot] = []
+        updated: list[ChargerSlot] = []
+        for charger_id, station in matched.items():
+            station_created, station_updated = cls._slot_changes(
+                charger_id, station, existing.get(charger_id, {})
+            )
+            created.extend(station_created)
+            updated.extend(station_updated)
+
+        with transaction.atomic():
+            if created:
+                ChargerSlot.objects.bulk_create(
+                    created,
+                    batch_size=SLOT_SYNC_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=["charger", "slot_number"],
+                    update_fields=list(SLOT_SYNC_FIELDS),
+                )
+            if updated:
+                ChargerSlot.objects.bulk_update(
+                    updated,
+                    list(SLOT_SYNC_FIELDS),
+                    batch_size=SLOT_SYNC_BATCH_SIZE,
+                )
+            LiveFragmentService.chargers_changed({slot.charger_id for slot in (*created, *updated)})
+        return len(created) + len(updated)
+
+    @staticmethod
+    def _matched_chargers(
+        manufacturer: Any,
+        stations: Sequence[tuple[ChargerStationIdentity, ChargerStationSnapshot]],
+    ) -> dict[int, ChargerStationSnapshot]:
+        """Resolve stations to charger primary keys with one query."""
+        ips = {identity.ip for identity, _station in stations if identity.ip}
+        serials = {identity.serial for identity, _station in stations if identity.serial}
+        if not ips and not serials:
+            return {}
+
+        chargers = Charger.objects.filter(manufacturer_id=manufacturer.pk).filter(
+            Q(ip__in=ips) | Q(serial_number__in=serials)
+        )
+        by_ip: dict[str, int] = {}
+        by_serial: dict[str, int] = {}
+        for pk, ip, serial_number in chargers.values_list("pk", "ip", "serial_number"):
+            if ip:
+                by_ip[ip] = pk
+            if serial_number:
+                by_serial[serial_number] = pk
+
+        matched: dict[int, ChargerStationSnapshot] = {}
+        for identity, station in stations:
+            charger_id = by_ip.get(identity.ip) if identity.ip else None
+            if charger_id is None and identity.serial:
+                charger_id = by_serial.get(identity.serial)
+            if charger_id is not None:
+                matched.setdefault(charger_id, station)
+        return matched
+
+    @classmethod
+    def _slot_changes(
+        cls,
+        charger_id: int,
+        station: ChargerStationSnapshot,
+        rows: dict[int, ChargerSlot],
+    ) -> tuple[list[ChargerSlot], list[ChargerSlot]]:
+        """Return new and modified slot rows for one charger's reported slots."""
+        created: list[ChargerSlot] = []
+        updated: list[ChargerSlot] = []
+        reported: set[int] = set()
+        for snapshot in station.slots:
+            reported.add(snapshot.slot_number)
+            values = {
+                "occupied": True,
+                "battery_percent": snapshot.battery_level,
+                "device_status": "charging" if snapshot.charging else "docked",
+            }
+            row = rows.get(snapshot.slot_number)
+            if row is None:
+                created.append(
+                    ChargerSlot(charger_id=charger_id, slot_number=snapshot.slot_number, **values)
+                )
+            elif cls._assign(row, values):
+                updated.append(row)
+        vacated = {"occupied": False, "battery_percent": None, "device_status": ""}
+        for slot_number, row in rows.items():
+            if slot_number not in reported and cls._assign(row, vacated):
+                updated.append(row)
+        return created, updated
+
+    @staticmethod
+    def _assign(row: ChargerSlot, values: dict[str, Any]) -> bool:
+        """Apply values to a slot row and report whether anything changed."""
+        changed = False
+        for field_name, value in values.items():
+            if getattr(row, field_name) != value:
+                setattr(row, field_name, value)
+                changed = True
+        return changed
@@ -4,7 +4,6 @@ import logging
 import math
 import time
 from abc import ABC, abstractmethod
-from json import JSONDecodeError
 from typing import Any, NoReturn, Self
 
 import httpx
@@ -14,6 +13,8 @@ from micboard.exceptions import APIError, APIRateLimitError
 from micboard.services.common.base.bounded_transport import BoundedHTTPTransport
 from micboard.services.common.network_limits import HTTPClientLimits
 from micboard.services.monitoring.base_health_mixin import HealthCheckMixin
+from micboard.services.shared.api_traffic_health import APITrafficHealth
+from micboard.utils import json_codec
 from micboard.utils.exception_logging import sanitized_exception_info
 
 from .circuit_breaker import CircuitBreaker
@@ -104,6 +105,10 @@ class BaseHTTPClient(BaseAPIClient, HealthCheckMixin):
         """Get the configuration prefix for this client."""
         raise NotImplementedError()
 
+    def _get_health_code(self) -> str:
+        """Return the manufacturer code whose passive health this client's traffic feeds."""
+        return self._get_config_prefix().removesuffix("_API").lower()
+
     @abstractmethod
     def _get_default_base_url(self) -> str:
         """Get the default base URL for this client."""
@@ -202,10 +207,12 @@ class BaseHTTPClient(BaseAPIClient, HealthCheckMixin):
 
         attempt = 0
         while True:
+            started = time.monotonic()
             try:
                 response = self._send_bounded_request(method, url, **request_kwargs)
             except RequestError as exc:
                 self._record_request_failure()
+                self._observe_traffic(started, ok=False)
                 if attempt < max_retries:
                     logger.exception(
                         "API request failed for %s; retrying attempt %d/%d: %s",
@@ -240,6 +247,7 @@ class BaseHTTPClient(BaseAPIClient, HealthCheckMixin):
                 raise
             except Exception as exc:
                 self._record_request_failure()
+                self._observe_traffic(started, ok=False)
                 logger.exception(
                     "Unexpected API request failure for %s %s request",
                     self._get_config_prefix(),
@@ -251,13 +259,30 @@ class BaseHTTPClient(BaseAPIClient, HealthCheckMixin):
 
             if response.status_code in retry_status_codes and attempt < max_retries:
                 self._record_request_failure()
+                self._observe_traffic(started, ok=False)
                 self._sleep_before_retry(attempt, response=response)
                 attempt += 1
                 continue
 
             # Keep response handling outside the request exception block. This preserves
             # canonical API/rate-limit exceptions raised by `_handle_response`.
-            return self._handle_response(response, method, url)
+            handled = False
+            try:
+                result = self._handle_response(response, method, url)
+                handled = True
+            finally:
+                self._observe_traffic(started, ok=handled)
+            return result
+
+    def _observe_traffic(self, started: float, *, ok: bool) -> None:
+        """Feed one request attempt into the manufacturer's passive health window."""
+        circuit = getattr(self, "_circuit", None)
+        APITrafficHealth.observe(
+            self._get_health_code(),
+            ok=ok,
+            latency=time.monotonic() - started,
+            breaker_state=circuit.state if circuit is not None else "closed",
+        )
 
     def _send_bounded_request(
         self,
@@ -364,8 +389,8 @@ class BaseHTTPClient(BaseAPIClient, HealthCheckMixin):
                 )
 
         try:
-            result = response.json() if content else None
-        except JSONDecodeError as exc:
+            result = json_codec.loads(content) if content else None
+        except ValueError as exc:
             self._record_request_failure()
             logger.exception(
                 "Failed to parse JSON response for %s %s request; body redacted",
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from micboard.models.hardware.manufacturer import Manufacturer
+    from micboard.services.core.hardware import NormalizedHardware
 
     from .client import BaseAPIClient
 
@@ -94,11 +95,30 @@ class ManufacturerPlugin(BasePlugin):
         """Transform raw API device data into the standardized application format."""
         raise NotImplementedError()
 
+    def normalize_device_data(self, api_data: dict[str, Any]) -> NormalizedHardware | None:
+        """Normalize raw API device data into the identity payload used by inventory sync.
+
+        The default normalizes ``transform_device_data`` output. Integrations with typed
+        payload decoders override it to skip the transformed dict.
+        """
+        from micboard.services.core.hardware import NormalizedHardware
+
+        transformed = self.transform_device_data(api_data)
+        return NormalizedHardware.from_api(transformed) if transformed else None
+
     @abstractmethod
     def get_device(self, device_id: str) -> dict[str, Any] | None:
         """Fetch details for a single device by its identifier."""
         raise NotImplementedError()
 
+    def get_devices_by_ids(self, device_ids: list[str]) -> dict[str, dict[str, Any]] | None:
+        """Fetch several devices in one request, keyed by device identifier.
+
+        Return None when the integration has no bulk read; callers then fall back
+        to ``get_device`` per identifier.
+        """
+        return None
+
     @abstractmethod
     def is_healthy(self) -> bool:
         """Check if the plugin and its underlying integrations are currently healthy."""
@@ -0,0 +1,287 @@
+"""Typed, slotted decoders for wireless receiver payloads from vendor APIs.
+
+Shure System API and Sennheiser SSCv2 device, channel, and transmitter payloads
+share one set of snake_case and camelCase key aliases. Each struct below lists its
+aliases once, in a module-level schema. Decoding a payload resolves every alias in
+one pass and stores the result on a slotted object. Vendor transformers then read
+attributes instead of repeating ``.get()`` chains.
+
+Alias resolution keeps the transformers' original rules. A plain field takes the
+first alias present in the payload, even when its value is ``None``. A *truthy*
+field takes the first alias with a truthy value.
+
+Devices keep their channel list undecoded. Inventory sync needs only identity
+fields, so it goes straight from a ``DevicePayload`` to ``NormalizedHardware``
+and never walks channels or transmitters.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from micboard.utils import json_codec
+from micboard.utils.mac_address import canonicalize_mac_address
+
+if TYPE_CHECKING:
+    from micboard.services.core.hardware import NormalizedHardware
+
+_MISSING = object()
+
+# (attribute, aliases in priority order, default, truthy)
+type FieldSchema = tuple[tuple[str, tuple[str, ...], Any, bool], ...]
+
+
+def _decode_fields(data: Mapping[str, Any], schema: FieldSchema) -> list[Any]:
+    """Resolve each schema field against ``data`` in declaration order."""
+    values = []
+    for _attribute, aliases, default, truthy in schema:
+        value = default
+        for alias in aliases:
+            found = data.get(alias, _MISSING)
+            if found is _MISSING or (truthy and not found):
+                continue
+            value = found
+            break
+        values.append(value)
+    return values
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def format_runtime(minutes: int | None) -> str:
+    """Format battery runtime from minutes to HH:MM, or ``""`` when invalid."""
+    if minutes is None or minutes < 0:
+        return ""
+    try:
+        hours = int(minutes) // 60
+        mins = int(minutes) % 60
+        return f"{hours:02d}:{mins:02d}"
+    except (ValueError, TypeError):
+        return ""
+
+
+_TRANSMITTER_SCHEMA: FieldSchema = (
+    ("battery_bars", ("battery_bars", "batteryBars"), 255, False),
+    ("battery_charge", ("battery_charge", "batteryCharge"), None, False),
+    ("battery_runtime_minutes", ("battery_runtime_minutes", "batteryRuntimeMinutes"), None, False),
+    ("battery_health", ("battery_health", "batteryHealth"), "", False),
+    ("battery_cycles", ("battery_cycles", "batteryCycles"), None, False),
+    ("battery_temperature_c", ("battery_temperature_c", "batteryTemperatureC"), None, False),
+    ("battery_type", ("battery_type", "batteryType"), None, False),
+    ("audio_level", ("audio_level", "audioLevel"), 0, False),
+    ("rf_level", ("rf_level", "rfLevel"), 0, False),
+    ("frequency", ("frequency",), "", False),
+    ("antenna", ("antenna",), "", False),
+    ("status", ("status",), "", False),
+    ("audio_quality", ("audio_quality", "audioQuality"), 255, False),
+    ("tx_offset", ("tx_offset", "txOffset"), 255, False),
+    ("name", ("name", "deviceName"), "", False),
+    ("slot", ("slot",), _MISSING, False),
+    ("mute", ("mute", "isMuted"), None, False),
+    ("power", ("power", "txPower"), None, False),
+    ("temperature", ("temperature",), None, False),
+    ("rf_antenna_a", ("rfAntennaA", "rf_antenna_a"), None, False),
+    ("rf_antenna_b", ("rfAntennaB", "rf_antenna_b"), None, False),
+    ("rf_quality", ("rf_quality", "rfQuality"), None, False),
+    ("encryption", ("encryption",), None, False),
+    ("diversity", ("diversity",), None, False),
+    ("clip", ("clip",), None, False),
+    ("peak", ("peak",), None, False),
+)
+_SLOT_INDEX = next(
+    index for index, (attribute, *_rest) in enumerate(_TRANSMITTER_SCHEMA) if attribute == "slot"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TransmitterPayload:
+    """One transmitter as reported on a receiver channel."""
+
+    battery_bars: Any
+    battery_charge: Any
+    battery_runtime_minutes: Any
+    battery_health: Any
+    battery_cycles: Any
+    battery_temperature_c: Any
+    battery_type: Any
+    audio_level: Any
+    rf_level: Any
+    frequency: Any
+    antenna: Any
+    status: Any
+    audio_quality: Any
+    tx_offset: Any
+    name: Any
+    slot: Any
+    mute: Any
+    power: Any
+    temperature: Any
+    rf_antenna_a: Any
+    rf_antenna_b: Any
+    rf_quality: Any
+    encryption: Any
+    diversity: Any
+    clip: Any
+    peak: Any
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any], channel_num: int) -> TransmitterPayload:
+        """Decode a transmitter, defaulting its slot to the channel number."""
+        values = _decode_fields(data, _TRANSMITTER_SCHEMA)
+        if values[_SLOT_INDEX] is _MISSING:
+            values[_SLOT_INDEX] = channel_num
+        return cls(*values)
+
+    def as_micboard_dict(self) -> dict[str, Any]:
+        """Return the transmitter in micboard's transformed-payload format."""
+        name = str(self.name) if self.name else ""
+        return {
+            "battery": self.battery_bars,
+            "battery_charge": self.battery_charge,
+            "battery_health": self.battery_health,
+            "battery_cycles": self.battery_cycles,
+            "battery_temperature_c": self.battery_temperature_c,
+            "audio_level": self.audio_level,
+            "rf_level": self.rf_level,
+            "frequency": str(self.frequency) if self.frequency else "",
+            "antenna": str(self.antenna) if self.antenna else "",
+            "tx_offset": self.tx_offset,
+            "quality": self.audio_quality,
+            "runtime": format_runtime(self.battery_runtime_minutes),
+            "status": str(self.status) if self.status else "",
+            "mute": self.mute,
+            "power": self.power,
+            "battery_type": self.battery_type,
+            "temperature": self.temperature,
+            "rf_antenna_a": self.rf_antenna_a,
+            "rf_antenna_b": self.rf_antenna_b,
+            "name": name,
+            "name_raw": name,
+            "slot": self.slot,
+            "extra": {
+                "encryption": self.encryption,
+                "rf_quality": self.rf_quality,
+                "diversity": self.diversity,
+                "antenna_metrics": {"a": self.rf_antenna_a, "b": self.rf_antenna_b},
+                "clip": self.clip,
+                "peak": self.peak,
+            },
+        }
+
+
+_CHANNEL_SCHEMA: FieldSchema = (
+    ("channel", ("channel", "channelNumber"), 0, False),
+    ("transmitter", ("tx", "transmitter"), None, False),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelPayload:
+    """One receiver channel; ``transmitter`` is the undecoded transmitter mapping."""
+
+    channel: Any
+    transmitter: Mapping[str, Any] | None
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> ChannelPayload:
+        channel, transmitter = _decode_fields(data, _CHANNEL_SCHEMA)
+        if not transmitter or not isinstance(transmitter, dict):
+            transmitter = None
+        return cls(channel=channel, transmitter=transmitter)
+
+
+_DEVICE_SCHEMA: FieldSchema = (
+    ("api_device_id", ("id",), None, False),
+    ("ip", ("ip", "ip_address", "ipAddress"), "", True),
+    ("name", ("name", "device_name", "deviceName"), "", True),
+    ("raw_type", ("type",), None, False),
+    ("raw_model", ("model_name", "modelName"), None, False),
+    ("firmware_version", ("firmware_version", "firmwareVersion"), None, False),
+    ("serial", ("serial_number", "serialNumber"), None, False),
+    ("hostname", ("hostname",), None, False),
+    ("mac_address", ("mac_address", "macAddress"), None, False),
+    ("model_variant", ("model_variant", "modelVariant"), None, False),
+    ("band", ("frequency_band", "frequencyBand"), None, False),
+    ("location", ("location",), None, False),
+    ("uptime_minutes", ("uptime_minutes", "uptimeMinutes"), None, False),
+    ("temperature_c", ("temperature_c", "temperatureC"), None, False),
+    ("raw_channels", ("channels",), (), False),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DevicePayload:
+    """One receiver's identity and status fields; channels stay undecoded."""
+
+    api_device_id: Any
+    ip: Any
+    name: Any
+    raw_type: Any
+    raw_model: Any
+    firmware_version: Any
+    serial: Any
+    hostname: Any
+    mac_address: Any
+    model_variant: Any
+    band: Any
+    location: Any
+    uptime_minutes: Any
+    temperature_c: Any
+    raw_channels: Any
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> DevicePayload:
+        return cls(*_decode_fields(data, _DEVICE_SCHEMA))
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> DevicePayload:
+        """Decode a JSON device document with the configured JSON codec."""
+        document = json_codec.loads(data)
+        if not isinstance(document, dict):
+            raise ValueError("Device payload must be a JSON object")
+        return cls.from_mapping(document)
+
+    @property
+    def firmware(self) -> str:
+        return str(self.firmware_version or "")
+
+    def channels(self) -> Iterator[ChannelPayload]:
+        """Decode channels one at a time, on demand."""
+        for channel in self.raw_channels:
+            yield ChannelPayload.from_mapping(channel)
+
+    def normalized_hardware(self, *, fallback_name: str) -> NormalizedHardware | None:
+        """Build ``NormalizedHardware`` directly, without a transformed-dict round trip.
+
+        The result equals ``NormalizedHardware.from_api`` applied to the vendor
+        transformer's output. Every field is already a stripped string here, so
+        validation is skipped.
+        """
+        from micboard.services.core.hardware import NormalizedHardware
+
+        api_device_id = _text(self.api_device_id)
+        ip = _text(self.ip)
+        if not api_device_id or not ip:
+            return None
+        # Vendor transforms emit neither ``model`` nor ``device_type``; keep parity with
+        # ``from_api``, which reads only those keys for these fields.
+        return NormalizedHardware.model_construct(
+            api_device_id=api_device_id,
+            ip=ip,
+            serial_number=_text(self.serial or ""),
+            mac_address=canonicalize_mac_address(_text(self.mac_address or "")) or "",
+            name=_text(self.name or fallback_name),
+            model="",
+            device_type="",
+            firmware_version=self.firmware.strip(),
+            hosted_firmware_version="",
+            description="",
+            subnet_mask=None,
+            gateway=None,
+            network_mode="auto",
+            interface_id="",
+        )
@@ -33,9 +33,12 @@ class HardwareSyncService:
     ) -> tuple[int, int]:
         """Ensure RFChannel rows for a chassis match its model capacity.
 
+        Missing channels are validated as one batch and inserted with one query.
+
         Returns (created_count, deleted_count).
         """
         from micboard.models.rf_coordination.rf_channel import RFChannel
+        from micboard.services.hardware.rf_channel_service import validate_channels_for_save
 
         expected = chassis.get_expected_channel_count()
         channels = RFChannel.objects.using(using)
@@ -44,24 +47,24 @@ class HardwareSyncService:
         )
         expected_channels = set(range(1, expected + 1))
 
-        created_count = 0
+        if chassis.role == "receiver":
+            link_direction = "receive"
+        elif chassis.role == "transmitter":
+            link_direction = "send"
+        else:
+            link_direction = "bidirectional"
+        missing = [
+            RFChannel(chassis_id=chassis.pk, channel_number=ch_num, link_direction=link_direction)
+            for ch_num in sorted(expected_channels - current_channels)
+        ]
+        if missing:
+            # bulk_create skips save signals, so validate the batch against the
+            # chassis already in hand. New channels have no state transition to audit.
+            validate_channels_for_save(missing, chassis_by_id={chassis.pk: chassis}, using=using)
+            channels.bulk_create(missing)
+        created_count = len(missing)
         deleted_count = 0
 
-        for ch_num in sorted(expected_channels - current_channels):
-            if chassis.role == "receiver":
-                link_direction = "receive"
-            elif chassis.role == "transmitter":
-                link_direction = "send"
-            else:
-                link_direction = "bidirectional"
-
-            channels.create(
-                chassis_id=chassis.pk,
-                channel_number=ch_num,
-                link_direction=link_direction,
-            )
-            created_count += 1
-
         for ch_num in sorted(current_channels - expected_channels):
             channels.filter(chassis_id=chassis.pk, channel_number=ch_num).delete()
             deleted_count += 1
@@ -5,13 +5,17 @@ from __future__ import annotations
 from collections.abc import Hashable, Iterator
 from dataclasses import dataclass, field
 from itertools import islice
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from django.db import connection
 from django.db.models import QuerySet
 from django.utils.ipv6 import clean_ipv6_address
 
 from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.services.deduplication.warm_identity_index import (
+    IdentityRecord,
+    WarmDeviceIdentityIndex,
+)
 from micboard.utils.mac_address import canonicalize_mac_address, mac_address_query_variants
 
 if TYPE_CHECKING:
@@ -40,25 +44,31 @@ class DeviceIdentityIndex:
         *,
         manufacturer: Manufacturer,
     ) -> DeviceIdentityIndex:
-        """Fetch relevant identities in backend-safe chunks, never per device."""
-        payload_list = list(payloads)
-        serials = {payload.serial_number for payload in payload_list if payload.serial_number}
-        macs = {
-            normalized_mac
-            for payload in payload_list
-            if (normalized_mac := canonicalize_mac_address(payload.mac_address))
-        }
-        ips = {cls._ip_key(payload.ip) for payload in payload_list}
-        api_ids = {payload.api_device_id for payload in payload_list}
+        """Fetch relevant identities in backend-safe chunks, never per device.
 
-        chassis_by_pk: dict[int, WirelessChassis] = {}
-        querysets = cls._identity_querysets(
+        While the process-wide warm index is available, only the chassis it
+        matched are loaded, by primary key.
+        """
+        serials, macs, ips, api_ids = cls._identity_keys(payloads)
+        records = WarmDeviceIdentityIndex.lookup(
             serials=serials,
             macs=macs,
             ips=ips,
             api_ids=api_ids,
-            manufacturer=manufacturer,
+            manufacturer_id=manufacturer.pk,
         )
+        if records is None:
+            querysets = cls._identity_querysets(
+                serials=serials,
+                macs=macs,
+                ips=ips,
+                api_ids=api_ids,
+                manufacturer=manufacturer,
+            )
+        else:
+            querysets = cls._chunked_querysets("pk", {record.pk for record in records})
+
+        chassis_by_pk: dict[int, WirelessChassis] = {}
         for queryset in querysets:
             for chassis in queryset.select_related("manufacturer").order_by():
                 chassis_by_pk.setdefault(chassis.pk, chassis)
@@ -78,6 +88,31 @@ class DeviceIdentityIndex:
                 index._append(index.by_api_id, api_key, chassis)
         return index
 
+    @classmethod
+    def stored_identities(
+        cls,
+        payloads: Iterable[Any],
+        *,
+        manufacturer: Manufacturer,
+    ) -> list[IdentityRecord] | list[WirelessChassis]:
+        """Return every stored chassis identity the payloads resolve to.
+
+        Served from the warm index without loading chassis when it is
+        available; otherwise this is ``build(...).chassis()``.
+        """
+        payload_list = list(payloads)
+        serials, macs, ips, api_ids = cls._identity_keys(payload_list)
+        records = WarmDeviceIdentityIndex.lookup(
+            serials=serials,
+            macs=macs,
+            ips=ips,
+            api_ids=api_ids,
+            manufacturer_id=manufacturer.pk,
+        )
+        if records is not None:
+            return records
+        return cls.build(payload_list, manufacturer=manufacturer).chassis()
+
     def serial(self, value: str) -> WirelessChassis | None:
         """Resolve one serial using the same ambiguity behavior as ``QuerySet.get``."""
         return self._unique(self.by_serial, value, "serial_number")
@@ -97,6 +132,15 @@ class DeviceIdentityIndex:
         """Resolve a manufacturer-scoped API device identifier."""
         return self._unique(self.by_api_id, (manufacturer_id, value), "api_device_id")
 
+    def chassis(self) -> list[WirelessChassis]:
+        """Return every distinct stored chassis any indexed identity resolved to."""
+        unique: dict[int, WirelessChassis] = {}
+        for mapping in (self.by_serial, self.by_mac, self.by_ip, self.by_api_id):
+            for matches in mapping.values():
+                for chassis in matches:
+                    unique.setdefault(chassis.pk, chassis)
+        return list(unique.values())
+
     def add(self, chassis: WirelessChassis) -> None:
         """Add a chassis created during this batch so later payloads see it."""
         if chassis.serial_number:
@@ -119,6 +163,23 @@ class DeviceIdentityIndex:
             self.by_ip.pop(old_key, None)
         self._append(self.by_ip, self._ip_key(chassis.ip), chassis)
 
+    @classmethod
+    def _identity_keys(
+        cls,
+        payloads: Iterable[Any],
+    ) -> tuple[set[str], set[str], set[str], set[str]]:
+        """Return the serials, canonical MACs, IP keys, and API IDs to resolve."""
+        payload_list = list(payloads)
+        serials = {payload.serial_number for payload in payload_list if payload.serial_number}
+        macs = {
+            normalized_mac
+            for payload in payload_list
+            if (normalized_mac := canonicalize_mac_address(payload.mac_address))
+        }
+        ips = {cls._ip_key(payload.ip) for payload in payload_list}
+        api_ids = {payload.api_device_id for payload in payload_list}
+        return serials, macs, ips, api_ids
+
     @classmethod
     def _identity_querysets(
         cls,
@@ -142,7 +203,7 @@ class DeviceIdentityIndex:
     @staticmethod
     def _chunked_querysets(
         field_name: str,
-        values: set[str],
+        values: set[str] | set[int],
         *,
         manufacturer: Manufacturer | None = None,
     ) -> Iterator[QuerySet[WirelessChassis]]:
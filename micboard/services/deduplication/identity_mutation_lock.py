@@ -1,26 +1,177 @@
-"""Database-backed serialization for device identity mutations."""
+"""Database-backed serialization for device identity mutations.
+
+Writers lock 64-bit hashes of the serials, MAC addresses, IPs, and API device
+IDs they touch instead of one global row, so syncs over disjoint devices run
+in parallel. Locks are always acquired in ascending order, which rules out
+lock-order deadlocks between writers. PostgreSQL takes transaction-scoped
+advisory locks on the hashes themselves; other backends lock
+``DeviceIdentityLock`` rows, folding the hashes into a large bucket space.
+
+A writer must also hold the locks of every stored chassis its identities
+resolve to, because a move rewrites that chassis' old IP. Those rows are only
+known after reading them, so the read is repeated under the lock: if it found
+an identity outside the held locks, the transaction ends and the lock is
+retaken with the union. The last attempt locks every ``Manufacturer`` row in
+primary-key order instead. Each writer holds its own manufacturer row before
+any identity lock, so this excludes every other writer, like the old global
+sentinel, and always succeeds.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import hashlib
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import batched
 
-from django.db import transaction
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.ipv6 import clean_ipv6_address
 
 from micboard.models.discovery.manufacturer import Manufacturer
+from micboard.models.hardware.identity_lock import DeviceIdentityLock
+from micboard.services.deduplication.identity_index import DeviceIdentityIndex
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.utils.mac_address import canonicalize_mac_address
+
+# Lock-row buckets; 100-device syncs hold ~400 of them, so disjoint ones rarely collide.
+DEFAULT_IDENTITY_LOCK_BUCKETS = 1 << 24
+# Largest ``DeviceIdentityLock.bucket`` value.
+HARD_IDENTITY_LOCK_BUCKETS = 2_147_483_647
+MAX_IDENTITY_LOCK_ATTEMPTS = 3
+LOCK_ROWS_PER_QUERY = 500
+# blake2b personalization keeping identity lock keys apart from other advisory lock users.
+IDENTITY_LOCK_PERSON = b"micboard-ident"
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceIdentity:
+    """Identity values one device mutation reads or writes."""
+
+    ip: str
+    api_device_id: str
+    serial_number: str | None = None
+    mac_address: str | None = None
+
+    @classmethod
+    def from_payload(cls, payload: object) -> DeviceIdentity:
+        """Take the identity fields from a normalized payload or chassis."""
+        return cls(
+            ip=str(getattr(payload, "ip", "") or ""),
+            api_device_id=str(getattr(payload, "api_device_id", "") or ""),
+            serial_number=getattr(payload, "serial_number", None) or None,
+            mac_address=getattr(payload, "mac_address", None) or None,
+        )
+
+    def lock_keys(self, manufacturer_id: int) -> Iterator[str]:
+        """Yield the canonical keys two writers of this device would share."""
+        if self.serial_number:
+            yield f"serial:{self.serial_number}"
+        if mac := canonicalize_mac_address(self.mac_address):
+            yield f"mac:{mac}"
+        if self.ip:
+            yield f"ip:{clean_ipv6_address(self.ip) if ':' in self.ip else self.ip}"
+        if self.api_device_id:
+            yield f"api:{manufacturer_id}:{self.api_device_id}"
+
+
+def identity_lock_keys(keys: Iterable[str]) -> frozenset[int]:
+    """Hash identity keys to signed 64-bit lock keys, the ``bigint`` advisory lock range."""
+    return frozenset(
+        int.from_bytes(
+            hashlib.blake2b(key.encode(), digest_size=8, person=IDENTITY_LOCK_PERSON).digest(),
+            "big",
+            signed=True,
+        )
+        for key in keys
+    )
 
 
 class DeviceIdentityMutationLockService:
-    """Serialize global chassis identity reads and writes without a lock model."""
+    """Serialize overlapping chassis identity reads and writes."""
 
-    @staticmethod
+    @classmethod
     @contextmanager
-    def acquire(*, manufacturer: Manufacturer) -> Iterator[Manufacturer]:
-        """Lock the shared sentinel first, then yield a fresh locked manufacturer."""
-        with transaction.atomic():
-            sentinel = Manufacturer.objects.select_for_update().only("pk").order_by("pk").first()
-            if sentinel is None:
-                raise Manufacturer.DoesNotExist("Device identity mutation lock is unavailable")
-
-            locked_manufacturer = Manufacturer.objects.select_for_update().get(pk=manufacturer.pk)
-            yield locked_manufacturer
+    def acquire(
+        cls,
+        *,
+        manufacturer: Manufacturer,
+        identities: Iterable[DeviceIdentity],
+    ) -> Iterator[Manufacturer]:
+        """Lock the manufacturer and the touched identities, then yield it fresh.
+
+        Identity reads and writes for ``identities`` must happen inside the
+        block; the lock is released when its transaction ends.
+        """
+        identities = list(identities)
+        keys = identity_lock_keys(
+            key for identity in identities for key in identity.lock_keys(manufacturer.pk)
+        )
+        for attempt in range(1, MAX_IDENTITY_LOCK_ATTEMPTS + 1):
+            with transaction.atomic():
+                if attempt == MAX_IDENTITY_LOCK_ATTEMPTS:
+                    yield cls._lock_every_manufacturer(manufacturer)
+                    return
+                locked_manufacturer = Manufacturer.objects.select_for_update().get(
+                    pk=manufacturer.pk
+                )
+                cls._lock_keys(sorted(keys))
+                stored = cls._stored_keys(identities, manufacturer=locked_manufacturer)
+                if stored <= keys:
+                    yield locked_manufacturer
+                    return
+            keys |= stored
+
+    @staticmethod
+    def _lock_every_manufacturer(manufacturer: Manufacturer) -> Manufacturer:
+        """Exclude every other identity writer, each of which holds its manufacturer row."""
+        locked = list(Manufacturer.objects.select_for_update().order_by("pk"))
+        return next(row for row in locked if row.pk == manufacturer.pk)
+
+    @staticmethod
+    def _stored_keys(
+        identities: list[DeviceIdentity],
+        *,
+        manufacturer: Manufacturer,
+    ) -> frozenset[int]:
+        """Return the lock keys of every stored chassis the identities resolve to."""
+        if not identities:
+            return frozenset()
+        stored = DeviceIdentityIndex.stored_identities(identities, manufacturer=manufacturer)
+        return identity_lock_keys(
+            key
+            for chassis in stored
+            for key in DeviceIdentity.from_payload(chassis).lock_keys(chassis.manufacturer_id)
+        )
+
+    @staticmethod
+    def _lock_keys(keys: list[int]) -> None:
+        """Block until every key is held, taking them in ascending order."""
+        if not keys:
+            return
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(ordered.key) "
+                    "FROM (SELECT unnest(%s::bigint[]) AS key ORDER BY 1) AS ordered",
+                    [keys],
+                )
+            return
+        bucket_count = micboard_settings.get_bounded_int(
+            "MICBOARD_DEVICE_IDENTITY_LOCK_BUCKETS",
+            default=DEFAULT_IDENTITY_LOCK_BUCKETS,
+            hard_limit=HARD_IDENTITY_LOCK_BUCKETS,
+        )
+        buckets = sorted({key % bucket_count for key in keys})
+        DeviceIdentityLock.objects.bulk_create(
+            [DeviceIdentityLock(bucket=bucket) for bucket in buckets],
+            ignore_conflicts=True,
+        )
+        for chunk in batched(buckets, LOCK_ROWS_PER_QUERY, strict=False):
+            list(
+                DeviceIdentityLock.objects.select_for_update()
+                .filter(bucket__in=chunk)
+                .order_by("bucket")
+                .values_list("bucket", flat=True)
+            )
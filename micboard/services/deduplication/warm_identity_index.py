@@ -0,0 +1,479 @@
+"""Per-process chassis identity index kept warm across poll cycles.
+
+Every manufacturer sync resolves its payloads against stored chassis twice:
+once to size the identity lock and once to match devices. The identity set
+barely changes between polls, so each process keeps one compact record per
+chassis (primary key, manufacturer, API device ID, IP, serial, MAC) plus
+reverse maps from canonical identity keys to primary keys.
+
+Writers stamp a cache-wide version once per changed chassis. This covers saves
+that touch an identity field, deletes, and ``WirelessChassis`` queryset bulk
+writes (through ``chassis_identities_written``). A stamp is written as pending
+when the row changes and is settled again after commit. A reader compares its
+version with the cache in one read and refetches only the stamped rows. It
+reseeds from scratch when stamps have expired or it has fallen too far behind.
+Pending rows may be uncommitted or rolled back, so lookups never trust their
+shared entries. Each lookup instead reads them in the caller's own
+transaction.
+
+An index over more than ``MICBOARD_DEVICE_IDENTITY_INDEX_MAX_CHASSIS`` chassis
+is dropped, and callers fall back to bounded identity queries. So do callers
+whose default cache is process-local (local-memory or dummy), where stamps from
+other processes are never seen. Single-process deployments can opt in with
+``MICBOARD_DEVICE_IDENTITY_INDEX_ALLOW_LOCAL_CACHE``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import secrets
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import batched
+from typing import Any, ClassVar
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.ipv6 import clean_ipv6_address
+
+from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.utils.exception_logging import sanitized_exception_info
+from micboard.utils.mac_address import canonicalize_mac_address
+
+logger = logging.getLogger(__name__)
+
+IDENTITY_INDEX_CACHE_PREFIX = "micboard:device-identity:v1:"
+DEFAULT_IDENTITY_INDEX_MAX_CHASSIS = 20_000
+HARD_IDENTITY_INDEX_MAX_CHASSIS = 200_000
+# Beyond this many unseen stamps a full reseed is cheaper than replaying them.
+MAX_REPLAYED_VERSIONS = 1_000
+STAMP_TIMEOUT_SECONDS = 3_600
+# A pending stamp never settled (its transaction rolled back) expires after this.
+PENDING_SECONDS = 600
+COLD_RETRY_SECONDS = 300
+RELOAD_CHUNK_SIZE = 500
+_RECORD_FIELDS = ("pk", "manufacturer_id", "api_device_id", "ip", "serial_number", "mac_address")
+
+
+def max_indexed_chassis() -> int:
+    """Return how many chassis one process may keep in its warm identity index."""
+    return micboard_settings.get_bounded_int(
+        "MICBOARD_DEVICE_IDENTITY_INDEX_MAX_CHASSIS",
+        default=DEFAULT_IDENTITY_INDEX_MAX_CHASSIS,
+        hard_limit=HARD_IDENTITY_INDEX_MAX_CHASSIS,
+    )
+
+
+def index_enabled() -> bool:
+    """Return whether version stamps can reach every process using the database."""
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if isinstance(backend, DummyCache):
+        return False
+    if isinstance(backend, LocMemCache):
+        return (
+            micboard_settings.get("MICBOARD_DEVICE_IDENTITY_INDEX_ALLOW_LOCAL_CACHE", False) is True
+        )
+    return True
+
+
+def _version_key(using: str) -> str:
+    return f"{IDENTITY_INDEX_CACHE_PREFIX}{using}:version"
+
+
+def _stamp_key(using: str, version: int) -> str:
+    return f"{IDENTITY_INDEX_CACHE_PREFIX}{using}:stamp:{version}"
+
+
+def _ip_key(value: str) -> str:
+    """Match GenericIPAddressField's canonical IPv6 representation."""
+    return clean_ipv6_address(value) if ":" in value else value
+
+
+@dataclass(frozen=True, slots=True)
+class IdentityRecord:
+    """Identity columns of one stored chassis."""
+
+    pk: int
+    manufacturer_id: int
+    api_device_id: str
+    ip: str
+    serial_number: str | None
+    mac_address: str | None
+
+
+@dataclass(slots=True)
+class _IdentityStore:
+    """Identity records of one database alias and their reverse lookups."""
+
+    version: int | None = None
+    cold_until: float = -math.inf
+    records: dict[int, IdentityRecord] = field(default_factory=dict)
+    by_serial: dict[str, list[int]] = field(default_factory=dict)
+    by_mac: dict[str, list[int]] = field(default_factory=dict)
+    by_ip: dict[str, list[int]] = field(default_factory=dict)
+    by_api_id: dict[tuple[int, str], list[int]] = field(default_factory=dict)
+
+    def put(self, record: IdentityRecord) -> None:
+        self.discard(record.pk)
+        self.records[record.pk] = record
+        for mapping, key in self._keys(record):
+            mapping.setdefault(key, []).append(record.pk)
+
+    def discard(self, pk: int) -> None:
+        record = self.records.pop(pk, None)
+        if record is None:
+            return
+        for mapping, key in self._keys(record):
+            matches = mapping.get(key, [])
+            if pk in matches:
+                matches.remove(pk)
+            if not matches:
+                mapping.pop(key, None)
+
+    def clear(self) -> None:
+        self.version = None
+        for mapping in (self.records, self.by_serial, self.by_mac, self.by_ip, self.by_api_id):
+            mapping.clear()
+
+    def match(
+        self,
+        *,
+        serials: set[str],
+        macs: set[str],
+        ips: set[str],
+        api_ids: set[str],
+        manufacturer_id: int,
+    ) -> set[int]:
+        """Return primary keys of every record sharing any of the given keys."""
+        matched: set[int] = set()
+        lookups: tuple[tuple[dict[Any, list[int]], Iterable[Hashable]], ...] = (
+            (self.by_serial, serials),
+            (self.by_mac, macs),
+            (self.by_ip, ips),
+            (self.by_api_id, ((manufacturer_id, api_id) for api_id in api_ids)),
+        )
+        for mapping, keys in lookups:
+            for key in keys:
+                matched.update(mapping.get(key, ()))
+        return matched
+
+    def _keys(self, record: IdentityRecord) -> list[tuple[dict[Any, list[int]], Hashable]]:
+        keys: list[tuple[dict[Any, list[int]], Hashable]] = [
+            (self.by_ip, _ip_key(record.ip)),
+            (self.by_api_id, (record.manufacturer_id, record.api_device_id)),
+        ]
+        if record.serial_number:
+            keys.append((self.by_serial, record.serial_number))
+        if mac := canonicalize_mac_address(record.mac_address):
+            keys.append((self.by_mac, mac))
+        return keys
+
+
+class WarmDeviceIdentityIndex:
+    """Process-wide chassis identities refreshed from cache-wide version stamps."""
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _stores: ClassVar[dict[str, _IdentityStore]] = {}
+    # Outstanding pending stamps: alias -> chassis pk -> stamp version -> expiry.
+    _pending_lock: ClassVar[threading.Lock] = threading.Lock()
+    _pending: ClassVar[dict[str, dict[int, dict[int, float]]]] = {}
+
+    @classmethod
+    def lookup(
+        cls,
+        *,
+        serials: set[str],
+        macs: set[str],
+        ips: set[str],
+        api_ids: set[str],
+        manufacturer_id: int,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> list[IdentityRecord] | None:
+        """Return stored identities sharing any key, or ``None`` while the index is cold.
+
+        Serials, canonical MACs, and IP keys match any manufacturer; API device
+        IDs match only within ``manufacturer_id``.
+        """
+        if not index_enabled():
+            return None
+
+        def match(store: _IdentityStore) -> set[int]:
+            return store.match(
+                serials=serials,
+                macs=macs,
+                ips=ips,
+                api_ids=api_ids,
+                manufacturer_id=manufacturer_id,
+            )
+
+        with cls._lock:
+            store = cls._stores.setdefault(using, _IdentityStore())
+            if not cls._refresh(store, using=using):
+                return None
+            pending = cls._pending_ids(using)
+            matched = [store.records[pk] for pk in match(store) if pk not in pending]
+        if pending:
+            overlay = _IdentityStore()
+            for record in cls._fetch(pending, using=using):
+                overlay.put(record)
+            matched.extend(overlay.records[pk] for pk in match(overlay))
+        return matched
+
+    @classmethod
+    def record_changes(
+        cls,
+        chassis_ids: Iterable[int | None] | None,
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> None:
+        """Stamp changed chassis identities now and settle them once committed.
+
+        ``None`` means the changed rows are unknown, which makes every process
+        reseed its index.
+        """
+        ids = None if chassis_ids is None else sorted({pk for pk in chassis_ids if pk is not None})
+        if ids == [] or not index_enabled():
+            return
+        tokens = cls._stamp_pending(ids, using=using)
+        transaction.on_commit(
+            partial(cls._stamp_settled, ids, tokens=tokens, using=using),
+            using=using,
+        )
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget every index and pending stamp held by this process."""
+        with cls._lock:
+            cls._stores.clear()
+        with cls._pending_lock:
+            cls._pending.clear()
+
+    @classmethod
+    def _refresh(cls, store: _IdentityStore, *, using: str) -> bool:
+        now = time.monotonic()
+        if now < store.cold_until:
+            return False
+        try:
+            current = cls._current_version(using)
+            stamps: list[tuple[int, int, bool]] | None = None
+            if (
+                store.version is not None
+                and store.version < current <= store.version + MAX_REPLAYED_VERSIONS
+            ):
+                stamps = cls._unseen_stamps(store.version, current, using=using)
+        except Exception as exc:
+            logger.warning(
+                "Reading chassis identity versions failed; using identity queries",
+                exc_info=sanitized_exception_info(exc),
+            )
+            return False
+
+        if (
+            store.version is None
+            or not store.version <= current <= store.version + MAX_REPLAYED_VERSIONS
+            or (store.version < current and stamps is None)
+        ):
+            return cls._seed(store, current, now=now, using=using)
+
+        changed = cls._apply_stamps(stamps or [], now=now, using=using)
+        changed.update(cls._expire_pending(now, using=using))
+        if changed:
+            fetched = {record.pk: record for record in cls._fetch(changed, using=using)}
+            for pk in changed:
+                if pk in fetched:
+                    store.put(fetched[pk])
+                else:
+                    store.discard(pk)
+        store.version = current
+        if len(store.records) > max_indexed_chassis():
+            return cls._go_cold(store, now=now)
+        return True
+
+    @classmethod
+    def _seed(cls, store: _IdentityStore, current: int, *, now: float, using: str) -> bool:
+        store.clear()
+        limit = max_indexed_chassis()
+        rows = (
+            WirelessChassis.objects.using(using)
+            .order_by()
+            .values_list(*_RECORD_FIELDS)[: limit + 1]
+        )
+        for row in rows.iterator(chunk_size=2_000):
+            if len(store.records) == limit:
+                return cls._go_cold(store, now=now)
+            store.put(IdentityRecord(*row))
+        store.version = current
+        return True
+
+    @staticmethod
+    def _go_cold(store: _IdentityStore, *, now: float) -> bool:
+        logger.info(
+            "Chassis inventory exceeds MICBOARD_DEVICE_IDENTITY_INDEX_MAX_CHASSIS; "
+            "using identity queries"
+        )
+        store.clear()
+        store.cold_until = now + COLD_RETRY_SECONDS
+        return False
+
+    @staticmethod
+    def _fetch(pks: Iterable[int], *, using: str) -> list[IdentityRecord]:
+        records: list[IdentityRecord] = []
+        for chunk in batched(sorted(pks), RELOAD_CHUNK_SIZE, strict=False):
+            rows = (
+                WirelessChassis.objects.using(using)
+                .filter(pk__in=chunk)
+                .order_by()
+                .values_list(*_RECORD_FIELDS)
+            )
+            records.extend(IdentityRecord(*row) for row in rows)
+        return records
+
+    @staticmethod
+    def _current_version(using: str) -> int:
+        key = _version_key(using)
+        current = cache.get(key)
+        if current is None:
+            # A random base keeps a recreated counter away from versions readers hold.
+            cache.add(key, secrets.randbelow(2**62), timeout=None)
+            current = cache.get(key)
+        return int(current)
+
+    @staticmethod
+    def _unseen_stamps(
+        version: int,
+        current: int,
+        *,
+        using: str,
+    ) -> list[tuple[int, int, bool]] | None:
+        keys = [_stamp_key(using, unseen) for unseen in range(version + 1, current + 1)]
+        stamps = cache.get_many(keys)
+        if len(stamps) < len(keys):
+            return None
+        return [stamps[key] for key in keys]
+
+    @classmethod
+    def _apply_stamps(
+        cls,
+        stamps: list[tuple[int, int, bool]],
+        *,
+        now: float,
+        using: str,
+    ) -> set[int]:
+        changed: set[int] = set()
+        with cls._pending_lock:
+            pending = cls._pending.setdefault(using, {})
+            for pk, token, settled in stamps:
+                changed.add(pk)
+                tokens = pending.setdefault(pk, {})
+                if settled:
+                    tokens.pop(token, None)
+                else:
+                    tokens.setdefault(token, now + PENDING_SECONDS)
+                if not tokens:
+                    pending.pop(pk)
+        return changed
+
+    @classmethod
+    def _expire_pending(cls, now: float, *, using: str) -> set[int]:
+        expired: set[int] = set()
+        with cls._pending_lock:
+            pending = cls._pending.get(using, {})
+            for pk, tokens in list(pending.items()):
+                for token, expires_at in list(tokens.items()):
+                    if expires_at <= now:
+                        del tokens[token]
+                if not tokens:
+                    del pending[pk]
+                    expired.add(pk)
+        return expired
+
+    @classmethod
+    def _pending_ids(cls, using: str) -> set[int]:
+        with cls._pending_lock:
+            return set(cls._pending.get(using, ()))
+
+    @classmethod
+    def _stamp_pending(cls, ids: list[int] | None, *, using: str) -> list[int] | None:
+        if ids is None:
+            cls._force_reseed(using)
+            return None
+        try:
+            last = cls._increment(using, len(ids))
+            tokens = list(range(last - len(ids) + 1, last + 1))
+            # Hold the stamps locally too: a reseed could otherwise skip past them.
+            cls._apply_stamps(
+                [(pk, token, False) for pk, token in zip(ids, tokens, strict=True)],
+                now=time.monotonic(),
+                using=using,
+            )
+            cache.set_many(
+                {
+                    _stamp_key(using, token): (pk, token, False)
+                    for pk, token in zip(ids, tokens, strict=True)
+                },
+                timeout=STAMP_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Recording chassis identity changes failed",
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
+        return tokens
+
+    @classmethod
+    def _stamp_settled(cls, ids: list[int] | None, *, tokens: list[int] | None, using: str) -> None:
+        if ids is None or tokens is None:
+            cls._force_reseed(using)
+            return
+        try:
+            last = cls._increment(using, len(ids))
+            cls._apply_stamps(
+                [(pk, token, True) for pk, token in zip(ids, tokens, strict=True)],
+                now=time.monotonic(),
+                using=using,
+            )
+            cache.set_many(
+                {
+                    _stamp_key(using, version): (pk, token, True)
+                    for version, pk, token in zip(
+                        range(last - len(ids) + 1, last + 1), ids, tokens, strict=True
+                    )
+                },
+                timeout=STAMP_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Settling chassis identity changes failed",
+                exc_info=sanitized_exception_info(exc),
+            )
+            cls._force_reseed(using)
+
+    @classmethod
+    def _force_reseed(cls, using: str) -> None:
+        """Move every reader past the replay limit so it reseeds."""
+        try:
+            cls._increment(using, MAX_REPLAYED_VERSIONS + 1)
+        except Exception as exc:
+            logger.warning(
+                "Invalidating chassis identity indexes failed",
+                exc_info=sanitized_exception_info(exc),
+            )
+        with cls._lock:
+            cls._stores.pop(using, None)
+
+    @staticmethod
+    def _increment(using: str, delta: int) -> int:
+        key = _version_key(using)
+        try:
+            return int(cache.incr(key, delta))
+        except ValueError:
+            cache.add(key, secrets.randbelow(2**62), timeout=None)
+            return int(cache.incr(key, delta))
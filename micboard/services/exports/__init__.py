@@ -0,0 +1 @@
+"""Streaming data export services."""
@@ -0,0 +1,172 @@
+"""Tenant-scoped NDJSON and CSV exports streamed row by row from a database cursor."""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import batched
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from micboard.models.base_managers import TenantOptimizedQuerySet
+from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.models.telemetry.sessions import WirelessUnitSample
+from micboard.services.monitoring.alerts import get_alerts_for_user
+from micboard.services.settings.settings_service import settings as micboard_settings
+
+DEFAULT_EXPORT_CHUNK_SIZE = 2_000
+HARD_EXPORT_CHUNK_SIZE = 10_000
+EXPORT_ROWS_PER_WRITE = 500
+EXPORT_CONTENT_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+# Spreadsheet applications evaluate cells that start with these characters.
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _inventory_for_user(user: Any) -> QuerySet:
+    return WirelessChassis.objects.for_user(user=user)
+
+
+def _telemetry_for_user(user: Any) -> QuerySet:
+    return TenantOptimizedQuerySet(
+        WirelessUnitSample,
+        using=WirelessUnitSample.objects.db,
+    ).for_user(user=user)
+
+
+@dataclass(frozen=True, slots=True)
+class ExportDataset:
+    """One exportable dataset: its tenant-scoped source and its ordered columns."""
+
+    scoped_queryset: Callable[[Any], QuerySet]
+    columns: tuple[tuple[str, str], ...]
+
+    @property
+    def headers(self) -> tuple[str, ...]:
+        return tuple(header for header, _ in self.columns)
+
+    @property
+    def lookups(self) -> tuple[str, ...]:
+        return tuple(lookup for _, lookup in self.columns)
+
+
+EXPORT_DATASETS: dict[str, ExportDataset] = {
+    "inventory": ExportDataset(
+        scoped_queryset=_inventory_for_user,
+        columns=(
+            ("id", "pk"),
+            ("api_device_id", "api_device_id"),
+            ("manufacturer", "manufacturer__code"),
+            ("model", "model"),
+            ("name", "name"),
+            ("serial_number", "serial_number"),
+            ("ip", "ip"),
+            ("firmware_version", "firmware_version"),
+            ("location_id", "location_id"),
+            ("status", "status"),
+            ("is_online", "is_online"),
+            ("last_seen", "last_seen"),
+            ("updated_at", "updated_at"),
+        ),
+    ),
+    "alerts": ExportDataset(
+        scoped_queryset=get_alerts_for_user,
+        columns=(
+            ("id", "pk"),
+            ("alert_type", "alert_type"),
+            ("status", "status"),
+            ("message", "message"),
+            ("channel_id", "channel_id"),
+            ("assignment_id", "assignment_id"),
+            ("created_at", "created_at"),
+            ("acknowledged_at", "acknowledged_at"),
+            ("resolved_at", "resolved_at"),
+        ),
+    ),
+    "telemetry": ExportDataset(
+        scoped_queryset=_telemetry_for_user,
+        columns=(
+            ("id", "pk"),
+            ("wireless_unit_id", "session__wireless_unit_id"),
+            ("timestamp", "timestamp"),
+            ("battery", "battery"),
+            ("battery_charge", "battery_charge"),
+            ("audio_level", "audio_level"),
+            ("rf_level", "rf_level"),
+            ("quality", "quality"),
+            ("status", "status"),
+            ("frequency", "frequency"),
+        ),
+    ),
+}
+
+
+class _EchoBuffer:
+    """File-like sink that hands each CSV row straight back to the caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class ExportStreamService:
+    """Stream tenant-scoped datasets without materializing them.
+
+    Rows are read as ``values_list`` tuples through ``QuerySet.iterator`` so the
+    database driver hands them over in chunks and no model instances are built;
+    memory stays flat however many rows the tenant owns.
+    """
+
+    @staticmethod
+    def chunk_size() -> int:
+        """Return how many rows each cursor fetch pulls from the database."""
+        return micboard_settings.get_bounded_int(
+            "MICBOARD_EXPORT_CHUNK_SIZE",
+            default=DEFAULT_EXPORT_CHUNK_SIZE,
+            hard_limit=HARD_EXPORT_CHUNK_SIZE,
+        )
+
+    @classmethod
+    def rows(cls, *, user: Any, dataset: str) -> Iterator[tuple[Any, ...]]:
+        """Yield the dataset's rows visible to ``user`` in primary-key order."""
+        definition = EXPORT_DATASETS[dataset]
+        queryset = definition.scoped_queryset(user).order_by("pk").values_list(*definition.lookups)
+        return queryset.iterator(chunk_size=cls.chunk_size())
+
+    @classmethod
+    def stream(cls, *, user: Any, dataset: str, export_format: str) -> Iterator[str]:
+        """Yield encoded text blocks of the export for a streaming response."""
+        if export_format not in EXPORT_CONTENT_TYPES:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        headers = EXPORT_DATASETS[dataset].headers
+        rows = cls.rows(user=user, dataset=dataset)
+        if export_format == "csv":
+            return cls._csv_blocks(headers, rows)
+        return cls._ndjson_blocks(headers, rows)
+
+    @staticmethod
+    def _ndjson_blocks(headers: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+        encoder = DjangoJSONEncoder(separators=(",", ":"))
+        for batch in batched(rows, EXPORT_ROWS_PER_WRITE, strict=False):
+            yield "".join(
+                f"{encoder.encode(dict(zip(headers, row, strict=True)))}\n" for row in batch
+            )
+
+    @staticmethod
+    def _csv_blocks(headers: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+        writer = csv.writer(_EchoBuffer())
+        yield writer.writerow(headers)
+        for batch in batched(rows, EXPORT_ROWS_PER_WRITE, strict=False):
+            yield "".join(writer.writerow(_csv_cells(row)) for row in batch)
+
+
+def _csv_cells(row: tuple[Any, ...]) -> list[Any]:
+    """Neutralize text cells a spreadsheet would otherwise evaluate as formulas."""
+    return [
+        f"'{value}" if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES) else value
+        for value in row
+    ]
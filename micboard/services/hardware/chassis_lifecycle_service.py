@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from micboard.models.hardware.wireless_chassis import WirelessChassis
 
 _OPERATIONAL_STATES: set[str] = {"online", "degraded"}
+_IDENTITY_ATTNAMES = ("manufacturer_id", "api_device_id", "ip", "serial_number", "mac_address")
 _VALID_STATUS_TRANSITIONS: dict[str, set[str]] = {
     "discovered": {"provisioning", "offline", "retired"},
     "provisioning": {"online", "offline", "discovered"},
@@ -35,16 +36,25 @@ def prepare_chassis_for_save(
 ) -> ChassisSaveContext:
     """Validate lifecycle state and enrich regulatory fields before persistence."""
     created = chassis._state.adding
-    old_status, lifecycle_update_fields = _prepare_lifecycle_fields(
+    previous, lifecycle_update_fields = _prepare_lifecycle_fields(
         chassis,
         created=created,
         using=using,
     )
     prepare_chassis_regulatory_fields(chassis)
+    old_status = previous.status if previous is not None else None
+    old_location_id = previous.location_id if previous is not None else None
     return ChassisSaveContext(
         created=created,
         old_status=old_status,
         status_changed=old_status is not None and old_status != chassis.status,
+        old_location_id=old_location_id,
+        location_changed=not created and old_location_id != chassis.location_id,
+        identity_changed=previous is None
+        or any(
+            getattr(previous, attname) != getattr(chassis, attname)
+            for attname in _IDENTITY_ATTNAMES
+        ),
         update_fields=lifecycle_update_fields,
     )
 
@@ -79,25 +89,32 @@ def _prepare_lifecycle_fields(
     *,
     created: bool,
     using: str,
-) -> tuple[str | None, set[str]]:
-    old_status: str | None = None
+) -> tuple[WirelessChassis | None, set[str]]:
+    """Apply status lifecycle fields and return the stored row they were derived from."""
     lifecycle_update_fields: set[str] = set()
     if created:
         if chassis.status in _OPERATIONAL_STATES:
             chassis.is_online = True
             chassis.last_online_at = timezone.now()
             lifecycle_update_fields.update({"is_online", "last_online_at"})
-        return old_status, lifecycle_update_fields
+        return None, lifecycle_update_fields
 
     previous = (
         type(chassis)
         .objects.using(using)
-        .only("status", "is_online", "last_online_at", "total_uptime_minutes")
+        .only(
+            "status",
+            "location",
+            "is_online",
+            "last_online_at",
+            "total_uptime_minutes",
+            *_IDENTITY_ATTNAMES,
+        )
         .get(pk=chassis.pk)
     )
     old_status = previous.status
     if old_status == chassis.status:
-        return old_status, lifecycle_update_fields
+        return previous, lifecycle_update_fields
 
     allowed = _VALID_STATUS_TRANSITIONS.get(old_status, set())
     if chassis.status not in allowed:
@@ -124,7 +141,7 @@ def _prepare_lifecycle_fields(
             )
             chassis.total_uptime_minutes = previous.total_uptime_minutes + elapsed_minutes
             lifecycle_update_fields.add("total_uptime_minutes")
-    return old_status, lifecycle_update_fields
+    return previous, lifecycle_update_fields
 
 
 def _broadcast_persisted_chassis_status(*, chassis_id: int, using: str) -> None:
@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from django.contrib.auth import get_user_model
-from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 from django.utils import timezone
 
 from micboard.services.hardware.dtos import ChassisRefreshResult, WirelessChassisWrite
 from micboard.services.hardware.wireless_chassis_persistence_service import (
     WirelessChassisPersistenceService,
 )
+from micboard.services.settings.settings_service import settings as micboard_settings
 from micboard.services.shared.access_policy import tenant_role_access
 from micboard.utils.exception_logging import sanitized_exception_info
 
@@ -22,103 +24,237 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
     from micboard.models.hardware.wireless_chassis import WirelessChassis
+    from micboard.services.common.base.plugin import ManufacturerPlugin
+    from micboard.services.core.hardware_lifecycle import HardwareLifecycleManager
 
 logger = logging.getLogger(__name__)
 
 MAX_CHASSIS_REFRESH_BATCH = 100
+DEFAULT_CHASSIS_REFRESH_CONCURRENCY = 4
+HARD_MAX_CHASSIS_REFRESH_CONCURRENCY = 16
 
 
 class ChassisRefreshService:
-    """Refresh only the chassis explicitly present in a caller-scoped queryset."""
+    """Refresh only the chassis explicitly present in a caller-scoped queryset.
+
+    Selected chassis are grouped by manufacturer so each group shares one plugin
+    instance. Device reads run outside any transaction, either as one bulk read
+    when the plugin offers ``get_devices_by_ids`` or as bounded concurrent
+    ``get_device`` calls. Each group's writes then land in one short transaction.
+    """
 
     @classmethod
-    def _refresh_chassis(cls, chassis: WirelessChassis) -> bool:
-        """Fetch one chassis outside a transaction, then persist atomically."""
-        from micboard.services.manufacturer.plugin_registry import PluginRegistry
+    def refresh(cls, *, queryset: QuerySet[WirelessChassis]) -> ChassisRefreshResult:
+        """Refresh a scoped selection and report successes without aborting siblings."""
+        groups: dict[int | None, list[WirelessChassis]] = {}
+        for chassis in queryset.select_related("manufacturer").order_by("pk"):
+            groups.setdefault(chassis.manufacturer_id, []).append(chassis)
 
-        plugin_class = PluginRegistry.get_plugin_class(chassis.manufacturer.code)
-        plugin = plugin_class(chassis.manufacturer)
-        device_data = plugin.get_device(chassis.api_device_id)
-        if not device_data:
-            return False
+        synced_count = 0
+        failed_ids: list[int] = []
+        for group in groups.values():
+            refreshed_ids = cls._refresh_group(group)
+            synced_count += len(refreshed_ids)
+            failed_ids.extend(chassis.pk for chassis in group if chassis.pk not in refreshed_ids)
+
+        return ChassisRefreshResult(
+            synced_count=synced_count,
+            failed_count=len(failed_ids),
+            failed_chassis_ids=failed_ids,
+        )
+
+    @classmethod
+    def _refresh_group(cls, group: Sequence[WirelessChassis]) -> set[int]:
+        """Fetch one manufacturer's chassis with a shared plugin, then persist together."""
+        from micboard.services.manufacturer.plugin_registry import PluginRegistry
 
-        transformed_data: dict[str, Any] | None = plugin.transform_device_data(device_data)
-        if not transformed_data:
-            return False
+        manufacturer = group[0].manufacturer
+        try:
+            plugin_class = PluginRegistry.get_plugin_class(manufacturer.code)
+            plugin = plugin_class(manufacturer)
+        except Exception as exc:
+            logger.exception(
+                "Failed to load refresh plugin for %d chassis",
+                len(group),
+                exc_info=sanitized_exception_info(exc),
+            )
+            return set()
 
-        return cls._apply_refresh(
-            chassis_id=chassis.pk,
-            transformed_data=transformed_data,
-            using=chassis._state.db or DEFAULT_DB_ALIAS,
+        fetched = cls._fetch_group(plugin, group)
+        if not fetched:
+            return set()
+        return cls._apply_refreshes(
+            fetched,
+            using=group[0]._state.db or DEFAULT_DB_ALIAS,
         )
 
+    @classmethod
+    def _fetch_group(
+        cls,
+        plugin: ManufacturerPlugin,
+        group: Sequence[WirelessChassis],
+    ) -> dict[int, dict[str, Any]]:
+        """Return transformed device data by chassis id for every responding chassis."""
+        responses = cls._bulk_devices(plugin, group)
+        if responses is None:
+            concurrency = micboard_settings.get_bounded_int(
+                "MICBOARD_CHASSIS_REFRESH_CONCURRENCY",
+                default=DEFAULT_CHASSIS_REFRESH_CONCURRENCY,
+                hard_limit=HARD_MAX_CHASSIS_REFRESH_CONCURRENCY,
+            )
+            if concurrency <= 1 or len(group) <= 1:
+                responses = [cls._fetch_device(plugin, chassis) for chassis in group]
+            else:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(group))) as executor:
+                    responses = list(
+                        executor.map(
+                            lambda chassis: cls._threaded_fetch_device(plugin, chassis),
+                            group,
+                        )
+                    )
+
+        fetched: dict[int, dict[str, Any]] = {}
+        for chassis, device_data in zip(group, responses, strict=True):
+            transformed_data = cls._transform(plugin, chassis, device_data)
+            if transformed_data:
+                fetched[chassis.pk] = transformed_data
+        return fetched
+
     @staticmethod
-    def _apply_refresh(
+    def _bulk_devices(
+        plugin: ManufacturerPlugin,
+        group: Sequence[WirelessChassis],
+    ) -> list[dict[str, Any] | None] | None:
+        """Read a multi-chassis group in one call when the plugin supports it."""
+        get_devices_by_ids = getattr(plugin, "get_devices_by_ids", None)
+        if len(group) <= 1 or not callable(get_devices_by_ids):
+            return None
+        try:
+            devices = get_devices_by_ids([chassis.api_device_id for chassis in group])
+        except Exception as exc:
+            logger.exception(
+                "Bulk refresh read failed for %d chassis; reading individually",
+                len(group),
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
+        if devices is None:
+            return None
+        return [devices.get(chassis.api_device_id) for chassis in group]
+
+    @staticmethod
+    def _fetch_device(
+        plugin: ManufacturerPlugin, chassis: WirelessChassis
+    ) -> dict[str, Any] | None:
+        try:
+            return plugin.get_device(chassis.api_device_id)
+        except Exception as exc:
+            logger.exception(
+                "Failed to refresh chassis %s",
+                chassis.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
+
+    @classmethod
+    def _threaded_fetch_device(
+        cls,
+        plugin: ManufacturerPlugin,
+        chassis: WirelessChassis,
+    ) -> dict[str, Any] | None:
+        try:
+            return cls._fetch_device(plugin, chassis)
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def _transform(
+        plugin: ManufacturerPlugin,
+        chassis: WirelessChassis,
+        device_data: dict[str, Any] | None,
+    ) -> dict[str, Any] | None:
+        if not device_data:
+            return None
+        try:
+            return plugin.transform_device_data(device_data)
+        except Exception as exc:
+            logger.exception(
+                "Failed to normalize refreshed chassis %s",
+                chassis.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
+
+    @classmethod
+    def _apply_refreshes(
+        cls,
+        fetched: Mapping[int, dict[str, Any]],
         *,
-        chassis_id: int,
-        transformed_data: dict[str, Any],
         using: str,
-    ) -> bool:
-        """Persist fetched details and lifecycle changes in one short transaction."""
+    ) -> set[int]:
+        """Persist a group's fetched details in one transaction, isolating each chassis."""
         from micboard.models.hardware.wireless_chassis import WirelessChassis
+        from micboard.services.core.hardware_lifecycle import HardwareLifecycleManager
 
+        refreshed_ids: set[int] = set()
+        lifecycle = HardwareLifecycleManager()
         with transaction.atomic(using=using):
-            chassis = (
+            locked = (
                 WirelessChassis._default_manager.using(using)
                 .select_for_update()
                 .select_related("manufacturer")
-                .get(pk=chassis_id)
-            )
-
-            update_values: dict[str, Any] = {"last_seen": timezone.now()}
-            if name := transformed_data.get("name"):
-                update_values["name"] = str(name)
-            if firmware := transformed_data.get("firmware"):
-                update_values["firmware_version"] = str(firmware)
-            WirelessChassisPersistenceService.update(
-                chassis=chassis,
-                write=WirelessChassisWrite(**update_values),
-                using=using,
+                .filter(pk__in=fetched)
+                .order_by("pk")
             )
+            for chassis in locked:
+                try:
+                    with transaction.atomic(using=using):
+                        cls._apply_refresh(
+                            chassis,
+                            transformed_data=fetched[chassis.pk],
+                            lifecycle=lifecycle,
+                            using=using,
+                        )
+                except Exception as exc:
+                    logger.exception(
+                        "Failed to persist refreshed chassis %s",
+                        chassis.pk,
+                        exc_info=sanitized_exception_info(exc),
+                    )
+                    continue
+                refreshed_ids.add(chassis.pk)
+        return refreshed_ids
 
-            if chassis.status == "retired":
-                return True
-
-            from micboard.services.core.hardware_lifecycle import HardwareLifecycleManager
-
-            lifecycle = HardwareLifecycleManager()
-            if chassis.status == "discovered":
-                lifecycle.transition_device(
-                    chassis,
-                    "provisioning",
-                    reason="Selected chassis refreshed from manufacturer API",
-                )
-            lifecycle.mark_online(chassis, health_data=transformed_data)
-        return True
-
-    @classmethod
-    def refresh(cls, *, queryset: QuerySet[WirelessChassis]) -> ChassisRefreshResult:
-        """Refresh a scoped selection and report successes without aborting siblings."""
-        synced_count = 0
-        failed_count = 0
-        for chassis in queryset.select_related("manufacturer").order_by("pk"):
-            try:
-                refreshed = cls._refresh_chassis(chassis)
-            except Exception as exc:
-                logger.exception(
-                    "Failed to refresh chassis %s",
-                    chassis.pk,
-                    exc_info=sanitized_exception_info(exc),
-                )
-                refreshed = False
-            synced_count += int(refreshed)
-            failed_count += int(not refreshed)
-
-        return ChassisRefreshResult(
-            synced_count=synced_count,
-            failed_count=failed_count,
+    @staticmethod
+    def _apply_refresh(
+        chassis: WirelessChassis,
+        *,
+        transformed_data: dict[str, Any],
+        lifecycle: HardwareLifecycleManager,
+        using: str,
+    ) -> None:
+        """Persist fetched details and lifecycle changes for one locked chassis."""
+        update_values: dict[str, Any] = {"last_seen": timezone.now()}
+        if name := transformed_data.get("name"):
+            update_values["name"] = str(name)
+        if firmware := transformed_data.get("firmware"):
+            update_values["firmware_version"] = str(firmware)
+        WirelessChassisPersistenceService.update(
+            chassis=chassis,
+            write=WirelessChassisWrite(**update_values),
+            using=using,
         )
 
+        if chassis.status == "retired":
+            return
+        if chassis.status == "discovered":
+            lifecycle.transition_device(
+                chassis,
+                "provisioning",
+                reason="Selected chassis refreshed from manufacturer API",
+            )
+        lifecycle.mark_online(chassis, health_data=transformed_data)
+
     @classmethod
     def refresh_authorized_ids(
         cls,
@@ -178,5 +314,6 @@ class ChassisRefreshService:
         return ChassisRefreshResult(
             synced_count=result.synced_count,
             failed_count=result.failed_count + len(selected_ids) - visible_count,
+            failed_chassis_ids=result.failed_chassis_ids,
             truncated=truncated,
         )
@@ -10,6 +10,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from micboard.services.hardware.dtos import BandPlanInfo
+from micboard.services.hardware.regulatory_index_service import RegulatoryIndexService
 from micboard.services.hardware.rf_channel_service import (
     get_regulatory_domain_for_location,
 )
@@ -189,20 +190,11 @@ def has_band_plan_regulatory_coverage(chassis: WirelessChassis) -> bool:
     if domain.min_frequency_mhz <= band_min and domain.max_frequency_mhz >= band_max:
         return True
 
-    from micboard.models.rf_coordination.compliance import FrequencyBand
-
-    overlapping_bands = FrequencyBand.objects.filter(
-        regulatory_domain=domain,
-        start_frequency_mhz__lt=band_max,
-        end_frequency_mhz__gt=band_min,
-    ).exclude(band_type="forbidden")
-
-    if not overlapping_bands.exists():
+    covered = RegulatoryIndexService.current().covered_range(domain.pk, band_min, band_max)
+    if covered is None:
         return False
 
-    covered_min = min(band.start_frequency_mhz for band in overlapping_bands)
-    covered_max = max(band.end_frequency_mhz for band in overlapping_bands)
-
+    covered_min, covered_max = covered
     return covered_min <= band_min and covered_max >= band_max
 
 
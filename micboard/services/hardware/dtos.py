@@ -28,6 +28,7 @@ class ChassisRefreshResult(PydanticBaseDTO):
 
     synced_count: int
     failed_count: int
+    failed_chassis_ids: list[int] = Field(default_factory=list)
     denied: bool = False
     truncated: bool = False
 
@@ -38,6 +39,9 @@ class ChassisSaveContext(PydanticBaseDTO):
     created: bool
     old_status: str | None = None
     status_changed: bool = False
+    old_location_id: int | None = None
+    location_changed: bool = False
+    identity_changed: bool = False
     update_fields: set[str] = Field(default_factory=set)
     discovery_manufacturer_ids: tuple[int, ...] = ()
 
@@ -87,3 +91,27 @@ class RegulatoryDomainDTO(PydanticBaseDTO):
     code: str
     min_frequency_mhz: float
     max_frequency_mhz: float
+
+
+class CoordinationConflict(PydanticBaseDTO):
+    """One coordination problem found on an active RF channel.
+
+    ``kind`` is ``spacing``, ``imd3_2tone``, ``imd5_2tone``, ``imd3_3tone``, or
+    ``regulatory``. ``product_mhz`` is the offending product or neighbour frequency.
+    """
+
+    kind: str
+    channel_id: int
+    frequency_mhz: float
+    product_mhz: float | None = None
+    source_channel_ids: list[int] = Field(default_factory=list)
+
+
+class CoordinationReport(PydanticBaseDTO):
+    """Intermodulation and regulatory check of a location's active carriers."""
+
+    carrier_count: int
+    regulatory_domain: str | None = None
+    conflicts: list[CoordinationConflict] = Field(default_factory=list)
+    truncated: bool = False
+    suggested_frequencies_mhz: list[float] = Field(default_factory=list)
@@ -0,0 +1,425 @@
+"""Intermodulation and frequency coordination over active RF channels.
+
+Third-order products ``a + b - c`` and ``2a - b`` and fifth-order products
+``3a - 2b`` land on a carrier ``d`` exactly when two sums agree, for example
+``a + b`` and ``c + d``. The engine therefore sorts pair sums once and matches
+them with binary search and a sliding window, which costs O(n² log n) plus the
+reported conflicts instead of enumerating every O(n³) product.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import combinations, permutations
+
+from django.db.models import QuerySet
+
+from micboard.models.locations.structure import Location
+from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.services.hardware.dtos import CoordinationConflict, CoordinationReport
+from micboard.services.hardware.regulatory_index_service import (
+    RegulatoryIndex,
+    RegulatoryIndexService,
+)
+from micboard.services.settings.settings_service import settings as micboard_settings
+
+logger = logging.getLogger(__name__)
+
+COORDINATED_RESOURCE_STATES = ("active", "reserved")
+
+
+@dataclass(frozen=True, slots=True)
+class Carrier:
+    """One active transmitter frequency, in integer kHz to keep sums exact."""
+
+    channel_id: int
+    frequency_khz: int
+
+
+@dataclass(frozen=True, slots=True)
+class CoordinationRules:
+    """Guard bands and limits applied by one coordination run."""
+
+    spacing_khz: int = 350
+    imd3_guard_khz: int = 100
+    imd5_guard_khz: int = 50
+    step_khz: int = 25
+    max_conflicts: int = 500
+
+    @classmethod
+    def from_settings(cls) -> CoordinationRules:
+        """Read the configured guard bands and bounds."""
+        return cls(
+            spacing_khz=micboard_settings.get_bounded_int(
+                "MICBOARD_COORDINATION_SPACING_KHZ", default=350, hard_limit=5000
+            ),
+            imd3_guard_khz=micboard_settings.get_bounded_int(
+                "MICBOARD_COORDINATION_IMD3_GUARD_KHZ", default=100, hard_limit=1000
+            ),
+            imd5_guard_khz=micboard_settings.get_bounded_int(
+                "MICBOARD_COORDINATION_IMD5_GUARD_KHZ", default=50, hard_limit=1000
+            ),
+            step_khz=micboard_settings.get_bounded_int(
+                "MICBOARD_COORDINATION_STEP_KHZ", default=25, hard_limit=1000
+            ),
+            max_conflicts=micboard_settings.get_bounded_int(
+                "MICBOARD_COORDINATION_MAX_CONFLICTS", default=500, hard_limit=10000
+            ),
+        )
+
+
+class _ConflictCollector:
+    """Deduplicate conflicts and stop collecting once the report bound is reached."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.truncated = False
+        self.conflicts: dict[tuple[str, int, tuple[int, ...]], CoordinationConflict] = {}
+
+    def add(
+        self,
+        kind: str,
+        victim: Carrier,
+        product_khz: int | None,
+        sources: Iterable[Carrier] = (),
+    ) -> bool:
+        """Record a conflict; return False once the bound stops collection."""
+        source_ids = tuple(sorted(source.channel_id for source in sources))
+        key = (kind, victim.channel_id, source_ids)
+        if key in self.conflicts:
+            return True
+        if len(self.conflicts) >= self.limit:
+            self.truncated = True
+            return False
+        self.conflicts[key] = CoordinationConflict(
+            kind=kind,
+            channel_id=victim.channel_id,
+            frequency_mhz=victim.frequency_khz / 1000,
+            product_mhz=None if product_khz is None else product_khz / 1000,
+            source_channel_ids=list(source_ids),
+        )
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class _SumTables:
+    """Sorted pair sums shared by conflict detection and frequency suggestions."""
+
+    pairs: tuple[tuple[int, int, int], ...]
+    pair_sums: tuple[int, ...]
+    weighted: tuple[tuple[int, int, int], ...]
+    weighted_sums: tuple[int, ...]
+
+    @classmethod
+    def build(cls, frequencies: Sequence[int]) -> _SumTables:
+        pairs = sorted(
+            (frequencies[i] + frequencies[j], i, j)
+            for i, j in combinations(range(len(frequencies)), 2)
+        )
+        weighted = sorted(
+            (frequencies[c] + 2 * frequencies[j], c, j)
+            for c, j in permutations(range(len(frequencies)), 2)
+        )
+        return cls(
+            pairs=tuple(pairs),
+            pair_sums=tuple(pair[0] for pair in pairs),
+            weighted=tuple(weighted),
+            weighted_sums=tuple(entry[0] for entry in weighted),
+        )
+
+
+def _window(values: Sequence[int], target: int, guard: int) -> range:
+    """Return the index range of sorted ``values`` within ``guard`` of ``target``."""
+    return range(bisect_left(values, target - guard), bisect_right(values, target + guard))
+
+
+class FrequencyCoordinationService:
+    """Check active carriers for intermodulation, spacing, and regulatory conflicts."""
+
+    @classmethod
+    def coordinate_location(
+        cls,
+        location_id: int,
+        *,
+        suggestions: int = 5,
+        rules: CoordinationRules | None = None,
+    ) -> CoordinationReport:
+        """Coordinate the active channels of chassis at one location."""
+        building_id = Location.objects.values_list("building_id", flat=True).get(pk=location_id)
+        channels = RFChannel.objects.filter(chassis__location_id=location_id)
+        return cls._coordinate(channels, building_id, suggestions=suggestions, rules=rules)
+
+    @classmethod
+    def coordinate_building(
+        cls,
+        building_id: int,
+        *,
+        suggestions: int = 5,
+        rules: CoordinationRules | None = None,
+    ) -> CoordinationReport:
+        """Coordinate the active channels of every chassis in one building."""
+        channels = RFChannel.objects.filter(chassis__location__building_id=building_id)
+        return cls._coordinate(channels, building_id, suggestions=suggestions, rules=rules)
+
+    @classmethod
+    def analyze(
+        cls,
+        carriers: Iterable[tuple[int, float]],
+        *,
+        regulatory_domain_id: int | None = None,
+        index: RegulatoryIndex | None = None,
+        rules: CoordinationRules | None = None,
+        suggestions: int = 5,
+        search_range_mhz: tuple[float, float] | None = None,
+    ) -> CoordinationReport:
+        """Find conflicts among ``(channel_id, frequency_mhz)`` carriers.
+
+        Suggestions are independent alternatives for one additional carrier. They
+        search ``search_range_mhz``, else the regulatory domain bounds, else the
+        span of the current carriers.
+        """
+        rules = rules or CoordinationRules.from_settings()
+        ordered = sorted(
+            (Carrier(channel_id, round(frequency * 1000)) for channel_id, frequency in carriers),
+            key=lambda carrier: (carrier.frequency_khz, carrier.channel_id),
+        )
+        if regulatory_domain_id is not None and index is None:
+            index = RegulatoryIndexService.current()
+        domain = index.domain(regulatory_domain_id) if index is not None else None
+
+        tables = _SumTables.build([carrier.frequency_khz for carrier in ordered])
+        collector = _ConflictCollector(rules.max_conflicts)
+        checks: tuple[Callable[[], bool], ...] = (
+            lambda: cls._regulatory_conflicts(ordered, index, regulatory_domain_id, collector),
+            lambda: cls._spacing_conflicts(ordered, rules, collector),
+            lambda: cls._two_tone_conflicts(ordered, tables, rules, collector),
+            lambda: cls._three_tone_conflicts(ordered, tables, rules, collector),
+        )
+        for check in checks:
+            if not check():
+                break
+
+        if search_range_mhz is None and domain is not None:
+            search_range_mhz = (domain.min_frequency_mhz, domain.max_frequency_mhz)
+        if search_range_mhz is None and ordered:
+            search_range_mhz = (ordered[0].frequency_khz / 1000, ordered[-1].frequency_khz / 1000)
+        suggested = (
+            _FrequencySuggester(ordered, tables, rules, index, regulatory_domain_id).suggest(
+                search_range_mhz, limit=suggestions
+            )
+            if suggestions > 0 and search_range_mhz is not None
+            else []
+        )
+        return CoordinationReport(
+            carrier_count=len(ordered),
+            regulatory_domain=domain.code if domain is not None else None,
+            conflicts=list(collector.conflicts.values()),
+            truncated=collector.truncated,
+            suggested_frequencies_mhz=suggested,
+        )
+
+    @classmethod
+    def _coordinate(
+        cls,
+        channels: QuerySet[RFChannel],
+        building_id: int | None,
+        *,
+        suggestions: int,
+        rules: CoordinationRules | None,
+    ) -> CoordinationReport:
+        rows = (
+            RFChannel.objects.filter(pk__in=channels.values("pk"))
+            .filter(
+                enabled=True,
+                resource_state__in=COORDINATED_RESOURCE_STATES,
+                frequency__isnull=False,
+            )
+            .values_list("pk", "frequency")
+        )
+        carriers = ((pk, frequency) for pk, frequency in rows if frequency is not None)
+        index = RegulatoryIndexService.current()
+        domain = None
+        if building_id is not None:
+            domain = RegulatoryIndexService.domains_for_buildings([building_id]).get(building_id)
+        return cls.analyze(
+            carriers,
+            regulatory_domain_id=domain.pk if domain is not None else None,
+            index=index,
+            rules=rules,
+            suggestions=suggestions,
+        )
+
+    @staticmethod
+    def _regulatory_conflicts(
+        carriers: Sequence[Carrier],
+        index: RegulatoryIndex | None,
+        domain_id: int | None,
+        collector: _ConflictCollector,
+    ) -> bool:
+        """Flag carriers outside domain bounds, in forbidden bands, or in exclusions."""
+        if index is None or domain_id is None:
+            return True
+        for carrier in carriers:
+            if not index.is_allowed(domain_id, carrier.frequency_khz / 1000) and not (
+                collector.add("regulatory", carrier, None)
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def _spacing_conflicts(
+        carriers: Sequence[Carrier],
+        rules: CoordinationRules,
+        collector: _ConflictCollector,
+    ) -> bool:
+        """Flag every pair of carriers closer than the minimum spacing."""
+        for position, left in enumerate(carriers):
+            for right in carriers[position + 1 :]:
+                if right.frequency_khz - left.frequency_khz >= rules.spacing_khz:
+                    break
+                if not (
+                    collector.add("spacing", left, right.frequency_khz, (right,))
+                    and collector.add("spacing", right, left.frequency_khz, (left,))
+                ):
+                    return False
+        return True
+
+    @staticmethod
+    def _two_tone_conflicts(
+        carriers: Sequence[Carrier],
+        tables: _SumTables,
+        rules: CoordinationRules,
+        collector: _ConflictCollector,
+    ) -> bool:
+        """Flag ``2a - b`` and ``3a - 2b`` products landing on another carrier."""
+        for i, carrier in enumerate(carriers):
+            doubled = 2 * carrier.frequency_khz
+            for position in _window(tables.pair_sums, doubled, rules.imd3_guard_khz):
+                _sum, c, j = tables.pairs[position]
+                if i in (c, j):
+                    continue
+                for victim, other in ((c, j), (j, c)):
+                    product = doubled - carriers[other].frequency_khz
+                    if not collector.add(
+                        "imd3_2tone", carriers[victim], product, (carrier, carriers[other])
+                    ):
+                        return False
+            tripled = 3 * carrier.frequency_khz
+            for position in _window(tables.weighted_sums, tripled, rules.imd5_guard_khz):
+                _sum, c, j = tables.weighted[position]
+                if i in (c, j):
+                    continue
+                product = tripled - 2 * carriers[j].frequency_khz
+                if not collector.add("imd5_2tone", carriers[c], product, (carrier, carriers[j])):
+                    return False
+        return True
+
+    @staticmethod
+    def _three_tone_conflicts(
+        carriers: Sequence[Carrier],
+        tables: _SumTables,
+        rules: CoordinationRules,
+        collector: _ConflictCollector,
+    ) -> bool:
+        """Flag ``a + b - c`` products landing on a fourth carrier.
+
+        Pair sums ``a + b`` and ``c + d`` within the guard mean each of the four
+        carriers is hit by the product of the other three.
+        """
+        pairs = tables.pairs
+        for position, (first_sum, i, j) in enumerate(pairs):
+            for second_sum, c, k in pairs[position + 1 :]:
+                if second_sum - first_sum > rules.imd3_guard_khz:
+                    break
+                if i in (c, k) or j in (c, k):
+                    continue
+                for victim, (x, y, z) in (
+                    (c, (i, j, k)),
+                    (k, (i, j, c)),
+                    (i, (c, k, j)),
+                    (j, (c, k, i)),
+                ):
+                    product = (
+                        carriers[x].frequency_khz
+                        + carriers[y].frequency_khz
+                        - carriers[z].frequency_khz
+                    )
+                    sources = (carriers[x], carriers[y], carriers[z])
+                    if not collector.add("imd3_3tone", carriers[victim], product, sources):
+                        return False
+        return True
+
+
+class _FrequencySuggester:
+    """Scan a frequency grid for slots clear of carriers, products, and regulation."""
+
+    def __init__(
+        self,
+        carriers: Sequence[Carrier],
+        tables: _SumTables,
+        rules: CoordinationRules,
+        index: RegulatoryIndex | None,
+        domain_id: int | None,
+    ) -> None:
+        frequencies = [carrier.frequency_khz for carrier in carriers]
+        self.frequencies = frequencies
+        self.tables = tables
+        self.rules = rules
+        self.index = index
+        self.domain_id = domain_id
+        ordered_pairs = list(permutations(frequencies, 2))
+        # Existing products a new carrier must avoid, and 3a - d for 3a - 2x hitting d.
+        self.imd3_products = sorted(2 * a - b for a, b in ordered_pairs)
+        self.imd5_products = sorted(3 * a - 2 * b for a, b in ordered_pairs)
+        self.imd5_reflections = sorted(3 * a - d for a, d in ordered_pairs)
+
+    def suggest(self, search_range_mhz: tuple[float, float], *, limit: int) -> list[float]:
+        """Return up to ``limit`` clear frequencies in MHz, ascending.
+
+        Suggestions stay one carrier spacing apart so each is a distinct option.
+        """
+        step = self.rules.step_khz
+        low = -(-round(search_range_mhz[0] * 1000) // step) * step
+        high = round(search_range_mhz[1] * 1000)
+        suggestions: list[float] = []
+        next_allowed = low
+        for candidate in range(low, high + 1, step):
+            if candidate < next_allowed or not self._is_clear(candidate):
+                continue
+            suggestions.append(candidate / 1000)
+            if len(suggestions) >= limit:
+                break
+            next_allowed = candidate + self.rules.spacing_khz
+        return suggestions
+
+    def _is_clear(self, candidate: int) -> bool:
+        position = bisect_left(self.frequencies, candidate)
+        neighbours = self.frequencies[max(position - 1, 0) : position + 1]
+        if any(abs(candidate - neighbour) < self.rules.spacing_khz for neighbour in neighbours):
+            return False
+        if (
+            self.index is not None
+            and self.domain_id is not None
+            and not self.index.is_allowed(self.domain_id, candidate / 1000)
+        ):
+            return False
+        imd3 = self.rules.imd3_guard_khz
+        imd5 = self.rules.imd5_guard_khz
+        # Existing products on the candidate, and candidate products 2x - a, 3x - 2a,
+        # 3a - 2x on a carrier. Three-tone products with the candidate in any role
+        # reduce to x + a matching a pair sum.
+        if (
+            _window(self.imd3_products, candidate, imd3)
+            or _window(self.imd5_products, candidate, imd5)
+            or _window(self.tables.pair_sums, 2 * candidate, imd3)
+            or _window(self.tables.weighted_sums, 3 * candidate, imd5)
+            or _window(self.imd5_reflections, 2 * candidate, imd5)
+        ):
+            return False
+        return not any(
+            _window(self.tables.pair_sums, candidate + frequency, imd3)
+            for frequency in self.frequencies
+        )
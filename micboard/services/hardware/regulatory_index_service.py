@@ -0,0 +1,311 @@
+"""In-memory regulatory index for bulk domain resolution and frequency lookups.
+
+Compliance reference data is small and changes rarely, while coverage checks run
+once per channel in admin lists and audits. The index loads every regulatory
+domain, frequency band, and exclusion zone once per shared cache generation and
+answers frequency questions from sorted interval lists without further queries.
+
+Each process re-reads the shared generation at most once per
+``MICBOARD_REGULATORY_INDEX_REFRESH_SECONDS``, so a lookup on a warm index is a
+local comparison rather than a cache round trip.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import ClassVar
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from micboard.models.locations.structure import Building
+from micboard.models.rf_coordination.compliance import (
+    ExclusionZone,
+    FrequencyBand,
+    RegulatoryDomain,
+)
+from micboard.services.settings.settings_service import settings as micboard_settings
+
+_VERSION_CACHE_KEY = "micboard:regulatory-index-version"
+DEFAULT_REFRESH_SECONDS = 5
+HARD_REFRESH_SECONDS = 300
+
+
+@dataclass(frozen=True, slots=True)
+class _IntervalIndex[T]:
+    """Closed frequency intervals answering point lookups by binary search.
+
+    ``segments[i]`` holds every interval containing ``boundaries[i]``, so the
+    intervals containing a frequency are among those of the nearest boundary
+    at or below it.
+    """
+
+    boundaries: tuple[float, ...]
+    segments: tuple[tuple[tuple[float, float, T], ...], ...]
+
+    @classmethod
+    def build(cls, intervals: Iterable[tuple[float, float, T]]) -> _IntervalIndex[T]:
+        ordered = sorted(
+            (interval for interval in intervals if interval[0] <= interval[1]),
+            key=lambda interval: (interval[0], interval[1]),
+        )
+        boundaries = tuple(sorted({edge for start, end, _ in ordered for edge in (start, end)}))
+        segments: list[list[tuple[float, float, T]]] = [[] for _ in boundaries]
+        for interval in ordered:
+            first = bisect_right(boundaries, interval[0]) - 1
+            last = bisect_right(boundaries, interval[1]) - 1
+            for position in range(first, last + 1):
+                segments[position].append(interval)
+        return cls(boundaries, tuple(tuple(segment) for segment in segments))
+
+    def at(self, frequency: float) -> tuple[T, ...]:
+        """Return the items whose interval contains ``frequency``, by start."""
+        position = bisect_right(self.boundaries, frequency) - 1
+        if position < 0:
+            return ()
+        return tuple(
+            item for start, end, item in self.segments[position] if start <= frequency <= end
+        )
+
+    def overlapping(self, low: float, high: float) -> tuple[T, ...]:
+        """Return the items whose interval overlaps the open range ``(low, high)``."""
+        first = max(bisect_right(self.boundaries, low) - 1, 0)
+        last = bisect_right(self.boundaries, high)
+        seen: dict[int, T] = {}
+        for segment in self.segments[first:last]:
+            for start, end, item in segment:
+                if start < high and end > low:
+                    seen.setdefault(id(item), item)
+        return tuple(seen.values())
+
+
+@dataclass(frozen=True, slots=True)
+class RegulatoryIndex:
+    """Immutable snapshot of regulatory domains, bands, and exclusion zones."""
+
+    version: str
+    domains: Mapping[int, RegulatoryDomain]
+    country_domains: Mapping[str, int]
+    bands: Mapping[int, _IntervalIndex[FrequencyBand]]
+    exclusions: Mapping[int | None, _IntervalIndex[ExclusionZone]]
+
+    def domain(self, domain_id: int | None) -> RegulatoryDomain | None:
+        """Return a domain by primary key."""
+        return self.domains.get(domain_id) if domain_id is not None else None
+
+    def domain_for_building(
+        self,
+        *,
+        regulatory_domain_id: int | None,
+        country: str | None,
+    ) -> RegulatoryDomain | None:
+        """Resolve a building's explicit domain, then its country's domain."""
+        if regulatory_domain_id is not None:
+            return self.domain(regulatory_domain_id)
+        if country:
+            return self.domain(self.country_domains.get(country.upper()))
+        return None
+
+    def bands_at(self, domain_id: int, frequency: float) -> tuple[FrequencyBand, ...]:
+        """Return the domain's bands containing a frequency."""
+        bands = self.bands.get(domain_id)
+        return bands.at(frequency) if bands else ()
+
+    def exclusions_at(self, domain_id: int, frequency: float) -> tuple[ExclusionZone, ...]:
+        """Return active exclusion zones for the domain, or for every domain, at a frequency.
+
+        Buildings carry no coordinates, so zones match by domain and frequency only.
+        """
+        return tuple(
+            zone
+            for key in (domain_id, None)
+            if (zones := self.exclusions.get(key))
+            for zone in zones.at(frequency)
+        )
+
+    def is_allowed(self, domain_id: int, frequency: float) -> bool:
+        """Return whether a frequency is inside domain bounds and not blocked."""
+        domain = self.domain(domain_id)
+        if domain is None:
+            return False
+        if not domain.min_frequency_mhz <= frequency <= domain.max_frequency_mhz:
+            return False
+        if any(band.band_type == "forbidden" for band in self.bands_at(domain_id, frequency)):
+            return False
+        return not self.exclusions_at(domain_id, frequency)
+
+    def covered_range(self, domain_id: int, low: float, high: float) -> tuple[float, float] | None:
+        """Return the extent of non-forbidden bands overlapping ``(low, high)``."""
+        bands = self.bands.get(domain_id)
+        overlapping = [
+            band
+            for band in (bands.overlapping(low, high) if bands else ())
+            if band.band_type != "forbidden"
+        ]
+        if not overlapping:
+            return None
+        return (
+            min(band.start_frequency_mhz for band in overlapping),
+            max(band.end_frequency_mhz for band in overlapping),
+        )
+
+
+class RegulatoryIndexService:
+    """Build, share, and invalidate the process-local regulatory index.
+
+    A shared cache generation token lets every process notice compliance edits.
+    Transactions that changed compliance rows read a private fresh index until
+    they commit, so uncommitted or rolled-back rows never enter the shared one.
+    """
+
+    _indexes: ClassVar[dict[str, RegulatoryIndex]] = {}
+    # Shared generation as last read, and the monotonic time to re-read it.
+    _version_snapshot: ClassVar[tuple[str, float] | None] = None
+    _lock = threading.Lock()
+    _pending = threading.local()
+
+    @classmethod
+    def current(cls, *, using: str = DEFAULT_DB_ALIAS) -> RegulatoryIndex:
+        """Return the index for the current cache generation, rebuilding if stale."""
+        if cls._has_pending_changes(using):
+            return cls._build(version="", using=using)
+        version = cls._version()
+        index = cls._indexes.get(using)
+        if index is not None and index.version == version:
+            return index
+        with cls._lock:
+            index = cls._indexes.get(using)
+            if index is None or index.version != version:
+                index = cls._build(version=version, using=using)
+                cls._indexes[using] = index
+        return index
+
+    @classmethod
+    def domains_for_buildings(
+        cls,
+        building_ids: Iterable[int],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> dict[int, RegulatoryDomain | None]:
+        """Resolve many buildings to their regulatory domains in one query."""
+        identifiers = {building_id for building_id in building_ids if building_id is not None}
+        if not identifiers:
+            return {}
+        index = cls.current(using=using)
+        rows = (
+            Building.objects.using(using)
+            .filter(pk__in=identifiers)
+            .values_list("pk", "regulatory_domain_id", "country")
+        )
+        return {
+            building_id: index.domain_for_building(
+                regulatory_domain_id=domain_id,
+                country=country,
+            )
+            for building_id, domain_id, country in rows
+        }
+
+    @classmethod
+    def compliance_changed(cls, *, using: str = DEFAULT_DB_ALIAS) -> None:
+        """Invalidate the index once a compliance write is visible to other processes."""
+        connection = transaction.get_connection(using)
+        if not connection.in_atomic_block:
+            cls.invalidate()
+            return
+        pending = cls._pending_transactions()
+        if pending.get(using) is connection.atomic_blocks[0]:
+            return
+        pending[using] = connection.atomic_blocks[0]
+
+        def publish() -> None:
+            cls._pending_transactions().pop(using, None)
+            cls.invalidate()
+
+        transaction.on_commit(publish, using=using)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Start a new shared generation so every process rebuilds on next use."""
+        version = secrets.token_hex(8)
+        cache.set(_VERSION_CACHE_KEY, version, timeout=None)
+        cls._remember_version(version)
+        cls._indexes.clear()
+
+    @classmethod
+    def _has_pending_changes(cls, using: str) -> bool:
+        pending = cls._pending_transactions()
+        if using not in pending:
+            return False
+        connection = transaction.get_connection(using)
+        if connection.atomic_blocks and connection.atomic_blocks[0] is pending[using]:
+            return True
+        # The writing transaction ended; a commit already published the change.
+        del pending[using]
+        return False
+
+    @classmethod
+    def _pending_transactions(cls) -> dict[str, transaction.Atomic]:
+        """Map each alias to the outermost atomic block that wrote compliance rows."""
+        blocks = getattr(cls._pending, "blocks", None)
+        if blocks is None:
+            blocks = cls._pending.blocks = {}
+        return blocks
+
+    @classmethod
+    def _version(cls) -> str:
+        snapshot = cls._version_snapshot
+        if snapshot is not None and time.monotonic() < snapshot[1]:
+            return snapshot[0]
+        version = cache.get(_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(_VERSION_CACHE_KEY, "0", timeout=None)
+            version = cache.get(_VERSION_CACHE_KEY, "0")
+        return cls._remember_version(str(version))
+
+    @classmethod
+    def _remember_version(cls, version: str) -> str:
+        interval = micboard_settings.get_bounded_int(
+            "MICBOARD_REGULATORY_INDEX_REFRESH_SECONDS",
+            default=DEFAULT_REFRESH_SECONDS,
+            hard_limit=HARD_REFRESH_SECONDS,
+        )
+        cls._version_snapshot = (version, time.monotonic() + interval)
+        return version
+
+    @staticmethod
+    def _build(*, version: str, using: str) -> RegulatoryIndex:
+        domains = {domain.pk: domain for domain in RegulatoryDomain.objects.using(using)}
+        country_domains: dict[str, int] = {}
+        # Matches the historical ``filter(country_code=...).first()`` ordering by code.
+        for domain in sorted(domains.values(), key=lambda domain: domain.code):
+            if domain.country_code:
+                country_domains.setdefault(domain.country_code.upper(), domain.pk)
+
+        bands_by_domain: dict[int, list[tuple[float, float, FrequencyBand]]] = {}
+        for band in FrequencyBand.objects.using(using):
+            bands_by_domain.setdefault(band.regulatory_domain_id, []).append(
+                (band.start_frequency_mhz, band.end_frequency_mhz, band)
+            )
+        zones_by_domain: dict[int | None, list[tuple[float, float, ExclusionZone]]] = {}
+        for zone in ExclusionZone.objects.using(using).filter(is_active=True):
+            zones_by_domain.setdefault(zone.regulatory_domain_id, []).append(
+                (zone.start_frequency_mhz, zone.end_frequency_mhz, zone)
+            )
+        return RegulatoryIndex(
+            version=version,
+            domains=domains,
+            country_domains=country_domains,
+            bands={
+                domain_id: _IntervalIndex.build(intervals)
+                for domain_id, intervals in bands_by_domain.items()
+            },
+            exclusions={
+                domain_id: _IntervalIndex.build(intervals)
+                for domain_id, intervals in zones_by_domain.items()
+            },
+        )
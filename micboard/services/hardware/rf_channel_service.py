@@ -7,11 +7,13 @@ reporting for RF channels, separated from the model layer per ADR-002.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 
 from micboard.services.hardware.dtos import RegulatoryDomainDTO
 
 if TYPE_CHECKING:
+    from micboard.models.hardware.wireless_chassis import WirelessChassis
     from micboard.models.locations.structure import Location
     from micboard.models.rf_coordination.compliance import RegulatoryDomain
     from micboard.models.rf_coordination.rf_channel import RFChannel
@@ -37,6 +39,9 @@ def get_regulatory_domain_for_location(location: Location | None) -> RegulatoryD
     1. location.building.regulatory_domain (if set)
     2. location.building.country lookup
     3. None if no regulatory info available
+
+    Domains come from the shared regulatory index, so resolution issues no
+    query once the building is loaded.
     """
     if not location:
         return None
@@ -45,15 +50,12 @@ def get_regulatory_domain_for_location(location: Location | None) -> RegulatoryD
     if not building:
         return None
 
-    if building.regulatory_domain:
-        return cast("RegulatoryDomain", building.regulatory_domain)
-
-    if building.country:
-        from micboard.models.rf_coordination.compliance import RegulatoryDomain
-
-        return RegulatoryDomain.objects.filter(country_code=building.country.upper()).first()
+    from micboard.services.hardware.regulatory_index_service import RegulatoryIndexService
 
-    return None
+    return RegulatoryIndexService.current().domain_for_building(
+        regulatory_domain_id=building.regulatory_domain_id,
+        country=building.country,
+    )
 
 
 def get_regulatory_domain(channel: RFChannel) -> RegulatoryDomain | None:
@@ -149,46 +151,177 @@ def is_send_channel(channel: RFChannel) -> bool:
 
 
 def prepare_channel_for_save(channel: RFChannel, *, using: str = "default") -> dict[str, Any]:
-    """Validate a channel and prepare derived lifecycle fields for persistence."""
-    from django.core.exceptions import ValidationError
+    """Validate a channel and prepare derived lifecycle fields for persistence.
+
+    Channels loaded from ``using`` validate against their loaded-state snapshot;
+    only instances without one, such as deferred loads, read the stored row.
+    """
+    previous = None
+    if not channel._state.adding:
+        previous = _loaded_state(channel, using=using)
+        if previous is None:
+            previous = (
+                type(channel)
+                .objects.using(using)
+                .values(*type(channel).LOADED_STATE_FIELDS)
+                .get(pk=channel.pk)
+            )
+    context = _derive_lifecycle_context(channel, previous)
+    if _capacity_may_change(channel, previous):
+        _validate_channel_capacity(channel, channel.chassis)
+    return context
+
+
+def validate_channels_for_save(
+    channels: Sequence[RFChannel],
+    *,
+    chassis_by_id: Mapping[int, WirelessChassis] | None = None,
+    using: str = "default",
+) -> list[dict[str, Any]]:
+    """Validate a batch of channels for bulk persistence.
+
+    Applies the same transition and capacity rules as ``prepare_channel_for_save``
+    and returns its per-channel contexts in order. Stored rows are read in one
+    query for channels without a loaded-state snapshot, and chassis missing from
+    ``chassis_by_id`` and the channels' own caches are read in one more.
+    """
+    previous_states = _previous_states(channels, using=using)
+    contexts = [
+        _derive_lifecycle_context(channel, previous)
+        for channel, previous in zip(channels, previous_states, strict=True)
+    ]
+    capacity_checks = [
+        channel
+        for channel, previous in zip(channels, previous_states, strict=True)
+        if _capacity_may_change(channel, previous)
+    ]
+    chassis_lookup = _chassis_for_channels(capacity_checks, chassis_by_id or {}, using=using)
+    for channel in capacity_checks:
+        _validate_channel_capacity(channel, chassis_lookup[channel.chassis_id])
+    return contexts
+
+
+def _previous_states(
+    channels: Sequence[RFChannel],
+    *,
+    using: str,
+) -> list[Mapping[str, Any] | None]:
+    """Return each channel's stored lifecycle fields, or None for new channels."""
+    from micboard.models.rf_coordination.rf_channel import RFChannel
+
+    previous_states: list[Mapping[str, Any] | None] = []
+    unloaded: dict[int, list[int]] = {}
+    for index, channel in enumerate(channels):
+        previous = None if channel._state.adding else _loaded_state(channel, using=using)
+        if previous is None and not channel._state.adding:
+            unloaded.setdefault(channel.pk, []).append(index)
+        previous_states.append(previous)
+    if not unloaded:
+        return previous_states
+
+    stored_rows = RFChannel.objects.using(using).filter(pk__in=unloaded)
+    for row in stored_rows.values("pk", *RFChannel.LOADED_STATE_FIELDS):
+        for index in unloaded.pop(row.pop("pk")):
+            previous_states[index] = row
+    if unloaded:
+        raise RFChannel.DoesNotExist(f"RF channels {sorted(unloaded)} do not exist")
+    return previous_states
+
+
+def _chassis_for_channels(
+    channels: Sequence[RFChannel],
+    chassis_by_id: Mapping[int, WirelessChassis],
+    *,
+    using: str,
+) -> dict[int, WirelessChassis]:
+    """Resolve each channel's chassis from preloads and caches, then one query."""
+    from micboard.models.hardware.wireless_chassis import WirelessChassis
+    from micboard.models.rf_coordination.rf_channel import RFChannel
+
+    chassis_lookup = dict(chassis_by_id)
+    for channel in channels:
+        if channel.chassis_id not in chassis_lookup and RFChannel.chassis.is_cached(channel):
+            chassis_lookup[channel.chassis_id] = channel.chassis
+    missing_ids = {channel.chassis_id for channel in channels} - set(chassis_lookup)
+    if missing_ids:
+        chassis_lookup.update(WirelessChassis.objects.using(using).in_bulk(sorted(missing_ids)))
+    if missing_ids - set(chassis_lookup):
+        raise WirelessChassis.DoesNotExist(
+            f"Wireless chassis {sorted(missing_ids - set(chassis_lookup))} do not exist"
+        )
+    return chassis_lookup
+
+
+def _loaded_state(channel: RFChannel, *, using: str) -> Mapping[str, Any] | None:
+    """Return a channel's complete loaded-state snapshot for ``using``, if it has one."""
+    if channel._state.db != using:
+        return None
+    loaded = channel.loaded_state
+    if not all(field in loaded for field in type(channel).LOADED_STATE_FIELDS):
+        return None
+    return loaded
+
 
+def _derive_lifecycle_context(
+    channel: RFChannel,
+    previous: Mapping[str, Any] | None,
+) -> dict[str, Any]:
+    """Derive the disabled state and validate the transition from the stored row."""
     context: dict[str, Any] = {
         "old_resource_state": None,
         "state_changed": False,
         "update_fields": set(),
     }
-    if not channel._state.adding:
-        previous = (
-            type(channel).objects.using(using).only("resource_state", "enabled").get(pk=channel.pk)
-        )
-        context["old_resource_state"] = previous.resource_state
-
-        if previous.enabled and not channel.enabled:
-            channel.resource_state = "disabled"
-            context["update_fields"].add("resource_state")
-
-        if previous.resource_state != channel.resource_state:
-            allowed = _VALID_RESOURCE_STATE_TRANSITIONS.get(previous.resource_state, set())
-            if channel.resource_state not in allowed:
-                allowed_label = ", ".join(sorted(allowed)) if allowed else "none (terminal state)"
-                raise ValueError(
-                    "Invalid resource_state transition: "
-                    f"{previous.resource_state} → {channel.resource_state}. "
-                    f"Allowed: {allowed_label}"
-                )
-            context["state_changed"] = True
-
-    expected_count = channel.chassis.get_expected_channel_count()
-    if not channel.chassis.wmas_capable and channel.channel_number > expected_count:
+    if previous is None:
+        return context
+
+    old_state = previous["resource_state"]
+    context["old_resource_state"] = old_state
+
+    if previous["enabled"] and not channel.enabled:
+        channel.resource_state = "disabled"
+        context["update_fields"].add("resource_state")
+
+    if old_state != channel.resource_state:
+        allowed = _VALID_RESOURCE_STATE_TRANSITIONS.get(old_state, set())
+        if channel.resource_state not in allowed:
+            allowed_label = ", ".join(sorted(allowed)) if allowed else "none (terminal state)"
+            raise ValueError(
+                "Invalid resource_state transition: "
+                f"{old_state} → {channel.resource_state}. "
+                f"Allowed: {allowed_label}"
+            )
+        context["state_changed"] = True
+    return context
+
+
+def _capacity_may_change(channel: RFChannel, previous: Mapping[str, Any] | None) -> bool:
+    """Return whether a save can move the channel outside its chassis capacity.
+
+    Unchanged rows are deliberately not re-validated: when a chassis model's
+    capacity drops, ``HardwareSyncService.ensure_channel_count`` deletes the
+    channels above it, so an in-place edit of a surviving row cannot exceed it.
+    """
+    return (
+        previous is None
+        or previous["channel_number"] != channel.channel_number
+        or previous["chassis_id"] != channel.chassis_id
+    )
+
+
+def _validate_channel_capacity(channel: RFChannel, chassis: WirelessChassis) -> None:
+    """Reject channel numbers outside the chassis model's capacity."""
+    from django.core.exceptions import ValidationError
+
+    expected_count = chassis.get_expected_channel_count()
+    if not chassis.wmas_capable and channel.channel_number > expected_count:
         raise ValidationError(
-            f"Channel {channel.channel_number} exceeds {channel.chassis.model} capacity "
+            f"Channel {channel.channel_number} exceeds {chassis.model} capacity "
             f"({expected_count} channels max)"
         )
     if channel.channel_number < 1:
         raise ValidationError("Channel number must be at least 1")
 
-    return context
-
 
 def finalize_channel_save(
     channel: RFChannel,
@@ -212,12 +212,15 @@ def prepare_unit_for_save(unit: WirelessUnit, *, using: str = "default") -> dict
         return {
             "old_status": None,
             "old_battery": None,
+            "old_base_chassis_id": None,
             "status_changed": False,
             "battery_changed": False,
             "update_fields": set(),
         }
 
-    previous = type(unit).objects.using(using).only("status", "battery").get(pk=unit.pk)
+    previous = (
+        type(unit).objects.using(using).only("status", "battery", "base_chassis").get(pk=unit.pk)
+    )
     status_changed = previous.status != unit.status
     battery_changed = previous.battery != unit.battery
     update_fields: set[str] = set()
@@ -238,6 +241,7 @@ def prepare_unit_for_save(unit: WirelessUnit, *, using: str = "default") -> dict
     return {
         "old_status": previous.status,
         "old_battery": previous.battery,
+        "old_base_chassis_id": previous.base_chassis_id,
         "status_changed": status_changed,
         "battery_changed": battery_changed,
         "update_fields": update_fields,
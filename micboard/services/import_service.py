@@ -16,6 +16,7 @@ from micboard.services.core.hardware_lifecycle import (
 )
 from micboard.services.deduplication.check import check_device
 from micboard.services.deduplication.identity_mutation_lock import (
+    DeviceIdentity,
     DeviceIdentityMutationLockService,
 )
 from micboard.services.hardware.dtos import WirelessChassisWrite
@@ -106,7 +107,15 @@ class ImportService:
         )
 
         with DeviceIdentityMutationLockService.acquire(
-            manufacturer=manufacturer
+            manufacturer=manufacturer,
+            identities=[
+                DeviceIdentity(
+                    ip=ip,
+                    api_device_id=api_device_id,
+                    serial_number=serial,
+                    mac_address=mac,
+                )
+            ],
         ) as locked_manufacturer:
             deduplication = check_device(
                 serial_number=serial,
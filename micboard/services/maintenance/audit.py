@@ -18,8 +18,9 @@ from django.db import models
 from django.http import HttpRequest
 from django.utils import timezone
 
-from micboard.models.audit.activity_log import ActivityLog, ServiceSyncLog
-from micboard.models.telemetry.health import APIHealthLog
+from micboard.models.audit.activity_log import ActivityLog
+from micboard.models.audit.retention import AuditLogDailySummary
+from micboard.services.maintenance.audit_retention import AuditLogRetentionService
 from micboard.services.maintenance.logging_mode import LoggingModeService, LogMode
 from micboard.services.manufacturer.secret_redaction import redact_secrets
 
@@ -150,7 +151,7 @@ class AuditService:
 
     @staticmethod
     def prune_service_sync_logs(*, retention_days: int | None = None) -> int:
-        """Delete expired service-sync logs and return deleted row count."""
+        """Delete expired service-sync logs in summarized chunks and return the count."""
         from micboard.services.settings.settings_service import settings
 
         days = AuditService._resolve_retention_days(
@@ -158,12 +159,11 @@ class AuditService:
             default=settings.service_sync_log_retention_days,
         )
         cutoff = timezone.now() - timedelta(days=days)
-        deleted, _ = ServiceSyncLog.objects.filter(started_at__lt=cutoff).delete()
-        return deleted
+        return AuditLogRetentionService.prune(AuditLogDailySummary.Kind.SERVICE_SYNC, cutoff=cutoff)
 
     @staticmethod
     def prune_api_health_logs(*, retention_days: int | None = None) -> int:
-        """Delete expired API-health logs and return deleted row count."""
+        """Delete expired API-health logs in summarized chunks and return the count."""
         from micboard.services.settings.settings_service import settings
 
         days = AuditService._resolve_retention_days(
@@ -171,8 +171,7 @@ class AuditService:
             default=settings.api_health_log_retention_days,
         )
         cutoff = timezone.now() - timedelta(days=days)
-        deleted, _ = APIHealthLog.objects.filter(timestamp__lt=cutoff).delete()
-        return deleted
+        return AuditLogRetentionService.prune(AuditLogDailySummary.Kind.API_HEALTH, cutoff=cutoff)
 
     @staticmethod
     def _resolve_retention_days(retention_days: int | None, *, default: int) -> int:
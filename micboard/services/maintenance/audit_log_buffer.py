@@ -0,0 +1,125 @@
+"""Batched persistence for high-volume operational log rows.
+
+Polling and health checks each produce one ``ServiceSyncLog`` or
+``APIHealthLog`` row. Writing them one ``INSERT`` at a time makes every task
+pay a round trip and an index update per row. The buffer collects unsaved rows
+per model and database and writes them with one ``bulk_create`` once
+``MICBOARD_AUDIT_LOG_BUFFER_SIZE`` rows are pending or
+``MICBOARD_AUDIT_LOG_FLUSH_SECONDS`` have passed since the last flush. At low
+write rates every row is therefore written immediately; rows left over from a
+burst are written by a timer when the flush window ends, so no row waits for
+the next ``add()``.
+
+Rows added inside an atomic block are written at once instead: a buffered row
+would otherwise outlive a rollback of the rows it refers to, or be committed by
+an unrelated caller's transaction. Pending rows are flushed at interpreter
+exit; a hard crash can lose at most one buffer of operational telemetry.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from typing import ClassVar
+
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AUDIT_LOG_BUFFER_SIZE = 50
+HARD_AUDIT_LOG_BUFFER_SIZE = 1_000
+DEFAULT_AUDIT_LOG_FLUSH_SECONDS = 5
+HARD_AUDIT_LOG_FLUSH_SECONDS = 300
+
+
+class AuditLogBuffer:
+    """Process-wide write buffer for append-only log models."""
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _pending: ClassVar[dict[tuple[type[models.Model], str], list[models.Model]]] = {}
+    _last_flush: ClassVar[float] = 0.0
+    _timer: ClassVar[threading.Timer | None] = None
+    _exit_hook_registered: ClassVar[bool] = False
+
+    @classmethod
+    def add(cls, row: models.Model, *, using: str = DEFAULT_DB_ALIAS) -> None:
+        """Queue one unsaved row, writing the buffer when it is full or due.
+
+        Failures writing a row inside an atomic block propagate to the caller;
+        failures flushing the shared buffer are logged and the batch dropped.
+        """
+        if connections[using].in_atomic_block:
+            type(row)._default_manager.using(using).bulk_create([row])
+            return
+
+        with cls._lock:
+            cls._pending.setdefault((type(row), using), []).append(row)
+            if not cls._exit_hook_registered:
+                atexit.register(cls.flush)
+                cls._exit_hook_registered = True
+            pending = sum(len(rows) for rows in cls._pending.values())
+            window = micboard_settings.get_bounded_int(
+                "MICBOARD_AUDIT_LOG_FLUSH_SECONDS",
+                default=DEFAULT_AUDIT_LOG_FLUSH_SECONDS,
+                hard_limit=HARD_AUDIT_LOG_FLUSH_SECONDS,
+            )
+            waited = time.monotonic() - cls._last_flush
+            due = waited >= window
+            full = pending >= micboard_settings.get_bounded_int(
+                "MICBOARD_AUDIT_LOG_BUFFER_SIZE",
+                default=DEFAULT_AUDIT_LOG_BUFFER_SIZE,
+                hard_limit=HARD_AUDIT_LOG_BUFFER_SIZE,
+            )
+            if not (due or full) and cls._timer is None:
+                cls._timer = threading.Timer(window - waited, cls._flush_on_timer)
+                cls._timer.daemon = True
+                cls._timer.start()
+        if due or full:
+            cls.flush()
+
+    @classmethod
+    def flush(cls) -> int:
+        """Write every pending row and return how many were persisted."""
+        with cls._lock:
+            batches, cls._pending = cls._pending, {}
+            cls._last_flush = time.monotonic()
+            timer, cls._timer = cls._timer, None
+        if timer is not None:
+            timer.cancel()
+        written = 0
+        for (model, using), rows in batches.items():
+            try:
+                model._default_manager.using(using).bulk_create(rows)
+            except Exception as exc:
+                logger.exception(
+                    "Failed to write %d buffered %s rows",
+                    len(rows),
+                    model._meta.label,
+                    exc_info=sanitized_exception_info(exc),
+                )
+                continue
+            written += len(rows)
+        return written
+
+    @classmethod
+    def _flush_on_timer(cls) -> None:
+        """Write rows left pending at the end of a flush window.
+
+        The timer thread opens its own database connections, so they are closed
+        again before the thread exits.
+        """
+        try:
+            cls.flush()
+        finally:
+            connections.close_all()
+
+    @classmethod
+    def pending_count(cls) -> int:
+        """Return how many rows are waiting to be written."""
+        with cls._lock:
+            return sum(len(rows) for rows in cls._pending.values())
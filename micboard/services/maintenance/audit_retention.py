@@ -0,0 +1,166 @@
+"""Chunked retention pruning with daily rollups for operational logs.
+
+Expired ``ServiceSyncLog`` and ``APIHealthLog`` rows are deleted oldest first
+in chunks of ``MICBOARD_AUDIT_PRUNE_CHUNK_SIZE`` primary keys selected through
+the time index, each chunk in its own short transaction, and at most
+``MICBOARD_AUDIT_PRUNE_MAX_CHUNKS`` chunks per run. Before a chunk is deleted
+its rows are folded into ``AuditLogDailySummary`` so per-day history outlives
+the raw rows.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+from micboard.models.audit.activity_log import ServiceSyncLog
+from micboard.models.audit.retention import AuditLogDailySummary
+from micboard.models.telemetry.health import APIHealthLog
+from micboard.services.settings.settings_service import settings as micboard_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AUDIT_PRUNE_CHUNK_SIZE = 1_000
+HARD_AUDIT_PRUNE_CHUNK_SIZE = 10_000
+DEFAULT_AUDIT_PRUNE_MAX_CHUNKS = 100
+HARD_AUDIT_PRUNE_MAX_CHUNKS = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class _RetainedLog:
+    """Where one log model keeps the columns a daily summary needs."""
+
+    model: type[models.Model]
+    time_field: str
+    manufacturer_field: str
+    device_field: str | None = None
+    response_time_field: str | None = None
+
+
+_RETAINED_LOGS: dict[str, _RetainedLog] = {
+    AuditLogDailySummary.Kind.SERVICE_SYNC: _RetainedLog(
+        ServiceSyncLog, "started_at", "service", device_field="device_count"
+    ),
+    AuditLogDailySummary.Kind.API_HEALTH: _RetainedLog(
+        APIHealthLog, "timestamp", "manufacturer", response_time_field="response_time"
+    ),
+}
+
+
+class AuditLogRetentionService:
+    """Delete expired operational logs in bounded, summarized chunks."""
+
+    @classmethod
+    def prune(cls, kind: str, *, cutoff: datetime, using: str = DEFAULT_DB_ALIAS) -> int:
+        """Delete rows of ``kind`` older than ``cutoff`` and return the count.
+
+        Work per call is bounded; a backlog larger than one run is left for the
+        next run rather than holding a long transaction.
+        """
+        retained = _RETAINED_LOGS[kind]
+        chunk_size = micboard_settings.get_bounded_int(
+            "MICBOARD_AUDIT_PRUNE_CHUNK_SIZE",
+            default=DEFAULT_AUDIT_PRUNE_CHUNK_SIZE,
+            hard_limit=HARD_AUDIT_PRUNE_CHUNK_SIZE,
+        )
+        max_chunks = micboard_settings.get_bounded_int(
+            "MICBOARD_AUDIT_PRUNE_MAX_CHUNKS",
+            default=DEFAULT_AUDIT_PRUNE_MAX_CHUNKS,
+            hard_limit=HARD_AUDIT_PRUNE_MAX_CHUNKS,
+        )
+        expired = (
+            retained.model._default_manager.using(using)
+            .filter(**{f"{retained.time_field}__lt": cutoff})
+            .order_by(retained.time_field)
+        )
+        deleted = 0
+        for _ in range(max_chunks):
+            with transaction.atomic(using=using):
+                ids = list(expired.values_list("pk", flat=True)[:chunk_size])
+                if ids:
+                    cls._summarize(kind, retained, ids, using=using)
+                    retained.model._default_manager.using(using).filter(pk__in=ids).delete()
+            deleted += len(ids)
+            if len(ids) < chunk_size:
+                break
+        if deleted:
+            logger.info("Pruned %d %s rows older than %s", deleted, kind, cutoff.isoformat())
+        return deleted
+
+    @staticmethod
+    def _summarize(kind: str, retained: _RetainedLog, ids: list[int], *, using: str) -> None:
+        """Fold one chunk of rows into their per-manufacturer daily summaries."""
+        aggregates: dict[str, Any] = {"rows": Count("pk")}
+        if retained.device_field:
+            aggregates["devices"] = Sum(retained.device_field)
+        if retained.response_time_field:
+            aggregates["response_total"] = Sum(retained.response_time_field)
+            aggregates["response_samples"] = Count(retained.response_time_field)
+        groups = (
+            retained.model._default_manager.using(using)
+            .filter(pk__in=ids)
+            .annotate(day=TruncDate(retained.time_field))
+            .values("day", "status", manufacturer_ref=F(retained.manufacturer_field))
+            .annotate(**aggregates)
+            .order_by()
+        )
+
+        totals: dict[tuple[int, date], AuditLogDailySummary] = {}
+        for group in groups:
+            key = (group["manufacturer_ref"], group["day"])
+            summary = totals.setdefault(
+                key,
+                AuditLogDailySummary(kind=kind, manufacturer_id=key[0], day=key[1]),
+            )
+            summary.row_count += group["rows"]
+            summary.status_counts[group["status"]] = (
+                summary.status_counts.get(group["status"], 0) + group["rows"]
+            )
+            summary.device_count_total += group.get("devices") or 0
+            summary.response_time_total += group.get("response_total") or 0.0
+            summary.response_time_samples += group.get("response_samples") or 0
+        if not totals:
+            return
+
+        # Concurrent runs may both find a day unsummarized; inserting empty rows
+        # first and skipping conflicts lets them serialize on the row lock below.
+        summaries = AuditLogDailySummary.objects.using(using)
+        summaries.bulk_create(
+            [
+                AuditLogDailySummary(kind=kind, manufacturer_id=manufacturer_id, day=day)
+                for manufacturer_id, day in totals
+            ],
+            ignore_conflicts=True,
+        )
+        updated = []
+        for summary in summaries.select_for_update().filter(
+            kind=kind,
+            manufacturer_id__in={manufacturer_id for manufacturer_id, _day in totals},
+            day__in={day for _manufacturer_id, day in totals},
+        ):
+            chunk_total = totals.get((summary.manufacturer_id, summary.day))
+            if chunk_total is None:
+                continue
+            summary.row_count += chunk_total.row_count
+            for status, count in chunk_total.status_counts.items():
+                summary.status_counts[status] = summary.status_counts.get(status, 0) + count
+            summary.device_count_total += chunk_total.device_count_total
+            summary.response_time_total += chunk_total.response_time_total
+            summary.response_time_samples += chunk_total.response_time_samples
+            updated.append(summary)
+        summaries.bulk_update(
+            updated,
+            [
+                "row_count",
+                "status_counts",
+                "device_count_total",
+                "response_time_total",
+                "response_time_samples",
+            ],
+        )
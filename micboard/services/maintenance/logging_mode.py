@@ -6,43 +6,81 @@ Manages verbosity state:
   - high: Fine-grained debugging/trace logging
 
 Supports automatic expiry (TTL) to prevent accidental high-churn modes.
+
+The mode lives in the shared cache so one ``set_logging_mode`` call reaches
+every process, but each process reads it through a local snapshot refreshed
+at most once per ``MICBOARD_LOGGING_MODE_REFRESH_SECONDS``. Checking the mode
+is therefore a local comparison; expiry is evaluated against the snapshot
+without writing back to the cache.
 """
 
 from __future__ import annotations
 
 import logging
 import time
-from typing import Literal, cast
+from dataclasses import dataclass
+from typing import ClassVar, Literal, cast
 
 from django.core.cache import cache
 
+from micboard.services.settings.settings_service import settings as micboard_settings
+
 logger = logging.getLogger(__name__)
 
 LogMode = Literal["passive", "normal", "high"]
 CACHE_KEY = "micboard_logging_mode"
 CACHE_EXPIRY_KEY = "micboard_logging_mode_expiry"
 
+DEFAULT_REFRESH_SECONDS = 5
+HARD_REFRESH_SECONDS = 300
 
-class LoggingModeService:
-    """Business logic for dynamic logging levels."""
+_PRIORITY: dict[str, int] = {"passive": 0, "normal": 1, "high": 2}
+_MODE_LEVELS: dict[str, int] = {
+    "passive": logging.WARNING,
+    "normal": logging.INFO,
+    "high": logging.DEBUG,
+}
 
-    @staticmethod
-    def get_current_mode() -> LogMode:
-        """Get the currently active logging mode."""
-        mode = cache.get(CACHE_KEY, "normal")
-        expiry = cache.get(CACHE_EXPIRY_KEY)
 
-        if expiry and time.time() > expiry:
-            # Mode has expired, reset to normal
-            LoggingModeService.set_mode("normal")
+@dataclass(frozen=True, slots=True)
+class _ModeSnapshot:
+    """Process-local copy of the shared mode and when to re-read it."""
+
+    mode: LogMode
+    expires_at: float | None
+    refresh_at: float
+
+    def effective_mode(self, now: float) -> LogMode:
+        if self.expires_at is not None and now > self.expires_at:
             return "normal"
+        return self.mode
 
-        if mode not in ("passive", "normal", "high"):
+
+class LoggingModeService:
+    """Business logic for dynamic logging levels."""
+
+    _snapshot: ClassVar[_ModeSnapshot | None] = None
+
+    @classmethod
+    def get_current_mode(cls) -> LogMode:
+        """Get the currently active logging mode."""
+        snapshot = cls._snapshot
+        if snapshot is None or time.monotonic() >= snapshot.refresh_at:
+            snapshot = cls.refresh()
+        return snapshot.effective_mode(time.time())
+
+    @classmethod
+    def refresh(cls) -> _ModeSnapshot:
+        """Re-read the shared mode into this process's snapshot."""
+        values = cache.get_many([CACHE_KEY, CACHE_EXPIRY_KEY])
+        mode = values.get(CACHE_KEY, "normal")
+        if mode not in _PRIORITY:
             mode = "normal"
-        return cast(LogMode, mode)
+        expiry = values.get(CACHE_EXPIRY_KEY)
+        return cls._store(cast(LogMode, mode), float(expiry) if expiry else None)
 
-    @staticmethod
-    def set_mode(mode: LogMode, ttl_seconds: int | None = None) -> None:
+    @classmethod
+    def set_mode(cls, mode: LogMode, ttl_seconds: int | None = None) -> None:
         """Set the active logging mode with optional TTL."""
         cache.set(CACHE_KEY, mode, timeout=None)
 
@@ -51,14 +89,36 @@ class LoggingModeService:
             cache.set(CACHE_EXPIRY_KEY, expiry, timeout=None)
             logger.info("Logging mode set to '%s' for %ss", mode, ttl_seconds)
         else:
+            expiry = None
             cache.delete(CACHE_EXPIRY_KEY)
             logger.info("Logging mode set to '%s' (no expiry)", mode)
+        # Other processes pick the change up on their next refresh.
+        cls._store(mode, expiry)
 
     @staticmethod
     def should_log(level: LogMode) -> bool:
         """Check if an event should be logged based on current mode."""
         current = LoggingModeService.get_current_mode()
+        return _PRIORITY.get(level, 1) <= _PRIORITY.get(current, 1)
+
+    @classmethod
+    def _store(cls, mode: LogMode, expires_at: float | None) -> _ModeSnapshot:
+        interval = micboard_settings.get_bounded_int(
+            "MICBOARD_LOGGING_MODE_REFRESH_SECONDS",
+            default=DEFAULT_REFRESH_SECONDS,
+            hard_limit=HARD_REFRESH_SECONDS,
+        )
+        cls._snapshot = _ModeSnapshot(mode, expires_at, time.monotonic() + interval)
+        return cls._snapshot
+
+
+class LoggingModeFilter(logging.Filter):
+    """Admit records at or above the level the current logging mode allows.
+
+    Passive mode keeps warnings and above, normal mode adds info, and high mode
+    passes debug records. Attach it to a handler whose logger level is DEBUG so
+    the mode, not the static level, decides what is emitted.
+    """
 
-        # Priority mapping
-        priority = {"passive": 0, "normal": 1, "high": 2}
-        return priority.get(level, 1) <= priority.get(current, 1)
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= _MODE_LEVELS[LoggingModeService.get_current_mode()]
@@ -12,6 +12,7 @@ from django.utils import timezone
 
 from pydantic import Field
 
+from micboard.services.maintenance.audit_log_buffer import AuditLogBuffer
 from micboard.services.shared.base_dto import PydanticBaseDTO
 from micboard.utils.exception_logging import sanitized_exception_info
 
@@ -68,7 +69,14 @@ class ServiceSyncAuditService:
         started_at: datetime,
         result: Mapping[str, Any],
     ) -> ServiceSyncLog | None:
-        """Record one bounded run, containing and redacting audit failures."""
+        """Record one bounded run, containing and redacting audit failures.
+
+        The row is written through the shared audit buffer, so outside a
+        transaction it may be persisted with a later batch. The returned row is
+        the instance handed to the buffer and may still be unsaved: its ``pk``
+        is ``None`` until the buffer writes it, so callers must not treat it as a
+        saved object. Returns ``None`` when the audit could not be recorded.
+        """
         from micboard.models.audit.activity_log import ServiceSyncLog
 
         try:
@@ -76,8 +84,7 @@ class ServiceSyncAuditService:
                 started_at=started_at,
                 result=result,
             )
-            using = manufacturer._state.db or DEFAULT_DB_ALIAS
-            return ServiceSyncLog.objects.using(using).create(
+            row = ServiceSyncLog(
                 service=manufacturer,
                 sync_type="full",
                 started_at=audit.started_at,
@@ -98,6 +105,7 @@ class ServiceSyncAuditService:
                     "inventory_complete": audit.inventory_complete,
                 },
             )
+            AuditLogBuffer.add(row, using=manufacturer._state.db or DEFAULT_DB_ALIAS)
         except Exception as exc:
             logger.exception(
                 "Failed to record manufacturer sync audit for manufacturer %s",
@@ -105,3 +113,4 @@ class ServiceSyncAuditService:
                 exc_info=sanitized_exception_info(exc),
             )
             return None
+        return row
@@ -10,9 +10,11 @@ import logging
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
+from micboard.services.common.base.plugin import ManufacturerPlugin
 from micboard.services.core.hardware_lifecycle import HardwareLifecycleManager, HardwareStatus
 from micboard.services.deduplication.identity_index import DeviceIdentityIndex
 from micboard.services.deduplication.identity_mutation_lock import (
+    DeviceIdentity,
     DeviceIdentityMutationLockService,
 )
 from micboard.services.deduplication.tracking import log_device_movement
@@ -224,11 +226,12 @@ class ManufacturerSyncService:
         identity_index_class: Any,
         force: bool = False,
     ) -> tuple[int, int] | None:
-        """Serialize identity reads and writes across manufacturer pollers."""
+        """Serialize identity reads and writes with pollers touching the same devices."""
         created_count = 0
         updated_count = 0
         with DeviceIdentityMutationLockService.acquire(
-            manufacturer=manufacturer
+            manufacturer=manufacturer,
+            identities=[DeviceIdentity.from_payload(payload) for payload in normalized_devices],
         ) as locked_manufacturer:
             if not force and not locked_manufacturer.is_active:
                 logger.info(
@@ -331,12 +334,11 @@ class ManufacturerSyncService:
 
         normalized: list[NormalizedHardware] = []
         for raw in api_devices:
-            transformed = plugin.transform_device_data(raw)
-            if not transformed:
-                continue
-
-            payload = NormalizedHardware.from_api(transformed)
-            if not payload:
-                continue
-            normalized.append(payload)
+            if isinstance(plugin, ManufacturerPlugin):
+                payload = plugin.normalize_device_data(raw)
+            else:
+                transformed = plugin.transform_device_data(raw)
+                payload = NormalizedHardware.from_api(transformed) if transformed else None
+            if payload:
+                normalized.append(payload)
         return normalized
@@ -1,28 +1,32 @@
-"""Authorized, deduplicated alert persistence and email delivery."""
+"""Authorized, deduplicated alert persistence and email queueing."""
 
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 from typing import Any
 
 from django.db import transaction
+from django.db.models import Max
 from django.utils import timezone
 
 from micboard.models.hardware.wireless_unit import WirelessUnit
 from micboard.models.monitoring.alert import Alert
 from micboard.models.monitoring.performer_assignment import PerformerAssignment
 from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.services.monitoring.alert_email_outbox_service import AlertEmailOutboxService
 from micboard.services.monitoring.alert_fanout_dtos import AlertFanoutBudget
 from micboard.services.monitoring.alert_fanout_service import AlertFanoutService
-from micboard.services.notification.email_notification import email_service
-from micboard.utils.exception_logging import sanitized_exception_info
+from micboard.services.monitoring.alert_rules import AlertCandidate, AlertRuleTable
+from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+from micboard.services.notification.live_fragment_service import LiveFragmentService
 
 logger = logging.getLogger(__name__)
 
 
 class AlertDeliveryService:
-    """Persist and email one bounded alert after fresh authorization checks."""
+    """Persist one bounded alert and queue its email after fresh authorization checks."""
 
     @classmethod
     def create_alert(
@@ -115,62 +119,132 @@ class AlertDeliveryService:
                 message=message,
                 channel_data=unit_data or {},
             )
+            AlertEmailOutboxService.enqueue([(alert, current_user)])
+            InventoryCounterService.refresh_channels((alert.channel_id,))
 
         logger.info("Created alert %s for user %s", alert.pk, current_user.pk)
-        cls._send_email_if_allowed(
-            alert=alert,
-            unit=unit,
-            assignment=performer_assignment,
-            user=current_user,
-        )
         return alert
 
-    @staticmethod
-    def _send_email_if_allowed(
+    @classmethod
+    def create_alerts(
+        cls,
+        candidates: Sequence[AlertCandidate],
         *,
-        alert: Alert,
-        unit: WirelessUnit,
-        assignment: PerformerAssignment,
-        user: Any,
-    ) -> None:
-        """Revalidate a recipient and deliver one already-budgeted alert email."""
-        try:
-            current_user = AlertFanoutService.current_authorized_recipient(
-                unit=unit,
-                assignment=assignment,
-                user=user,
-            )
-            if current_user is None:
+        rules: AlertRuleTable,
+        budget: AlertFanoutBudget,
+    ) -> list[Alert]:
+        """Revalidate, deduplicate, and bulk-persist a page of candidates in one transaction.
+
+        Channel locks, recipient revalidation, and the open-alert lookup each cost one
+        query for the whole page; emails are queued in the same transaction and sent later.
+        """
+        scoped: list[AlertCandidate] = []
+        for candidate in candidates:
+            if candidate.unit.assigned_resource_id is None:
                 logger.warning(
-                    "Skipped alert email after recipient scope changed: alert=%s user=%s",
-                    alert.pk,
-                    getattr(user, "pk", None),
+                    "Cannot create %s alert for unassigned unit %s",
+                    candidate.alert_type,
+                    candidate.unit.pk,
                 )
-                return
-            preferences = getattr(current_user, "alert_preferences", None)
-            if preferences is not None:
-                if preferences.notification_method not in {"email", "both"}:
-                    return
-                if preferences.is_quiet_hours():
-                    return
-            recipient = getattr(preferences, "email_address", "") or getattr(
-                current_user, "email", ""
+                continue
+            scoped.append(candidate)
+        if not scoped:
+            return []
+
+        with transaction.atomic():
+            list(
+                RFChannel.objects.select_for_update()
+                .filter(pk__in={candidate.unit.assigned_resource_id for candidate in scoped})
+                .order_by("pk")
+                .values_list("pk", flat=True)
             )
-            if not recipient:
+            authorized = cls._authorized_candidates(scoped)
+            latest_open = cls._latest_open_alerts(authorized, rules=rules)
+            now = timezone.now()
+            pending: list[tuple[Alert, AlertCandidate]] = []
+            seen: set[tuple[int | None, int, str]] = set()
+            for candidate in authorized:
+                channel_id = candidate.unit.assigned_resource_id
+                if channel_id is None:
+                    continue
+                if not budget.claim_delivery():
+                    break
+                key = candidate.dedupe_key
+                interval = rules.for_user(candidate.user.pk).min_alert_interval_minutes
+                latest = latest_open.get(key)
+                if key in seen or (
+                    latest is not None and latest >= now - timedelta(minutes=interval)
+                ):
+                    logger.debug("Similar alert already exists for %s", key)
+                    continue
+                seen.add(key)
+                pending.append(
+                    (
+                        Alert(
+                            channel_id=channel_id,
+                            user_id=candidate.user.pk,
+                            assignment=candidate.assignment,
+                            alert_type=candidate.alert_type,
+                            message=candidate.message,
+                            channel_data=candidate.snapshot,
+                        ),
+                        candidate,
+                    )
+                )
+            created = Alert.objects.bulk_create([alert for alert, _candidate in pending])
+            AlertEmailOutboxService.enqueue((alert, candidate.user) for alert, candidate in pending)
+            InventoryCounterService.refresh_channels(alert.channel_id for alert in created)
+            LiveFragmentService.alerts_changed(alert.channel_id for alert in created)
+
+        logger.info("Created %d alerts from %d candidates", len(created), len(candidates))
+        return created
+
+    @staticmethod
+    def _authorized_candidates(candidates: Sequence[AlertCandidate]) -> list[AlertCandidate]:
+        """Keep candidates whose recipient is still assigned, active, and in tenant scope."""
+        current = AlertFanoutService.current_recipient_pairs(
+            assignment_ids={candidate.assignment.pk for candidate in candidates},
+            user_ids={candidate.user.pk for candidate in candidates},
+        )
+        users = {candidate.user.pk: candidate.user for candidate in candidates}
+        in_scope = AlertFanoutService.units_in_recipient_scope(
+            unit_ids={candidate.unit.pk for candidate in candidates},
+            users=users.values(),
+        )
+        authorized: list[AlertCandidate] = []
+        for candidate in candidates:
+            triple = (candidate.assignment.pk, candidate.unit.pk, candidate.user.pk)
+            if triple in current and candidate.unit.pk in in_scope.get(candidate.user.pk, ()):
+                authorized.append(candidate)
+            else:
                 logger.warning(
-                    "Cannot dispatch alert %s: user %s has no email",
-                    alert.pk,
-                    current_user.pk,
+                    "Skipped alert after recipient assignment changed: unit=%s user=%s",
+                    candidate.unit.pk,
+                    candidate.user.pk,
                 )
-                return
-            if not email_service.send_alert_notification(alert, recipients=[recipient]):
-                alert.status = "failed"
-                alert.save(update_fields=["status"])
-        except Exception as exc:
-            logger.exception(
-                "Failed to send email for alert %s",
-                alert.pk,
-                exc_info=sanitized_exception_info(exc),
+        return authorized
+
+    @staticmethod
+    def _latest_open_alerts(
+        candidates: Sequence[AlertCandidate],
+        *,
+        rules: AlertRuleTable,
+    ) -> dict[tuple[int | None, int, str], datetime]:
+        """Return the newest open alert per dedupe key with one grouped query."""
+        if not candidates:
+            return {}
+        rows = (
+            Alert.objects.filter(
+                channel_id__in={candidate.unit.assigned_resource_id for candidate in candidates},
+                user_id__in={candidate.user.pk for candidate in candidates},
+                alert_type__in={candidate.alert_type for candidate in candidates},
+                status__in=["pending", "sent"],
+                created_at__gte=timezone.now() - timedelta(minutes=rules.max_interval_minutes),
             )
-            alert.status = "failed"
-            alert.save(update_fields=["status"])
+            .order_by()
+            .values("channel_id", "user_id", "alert_type")
+            .annotate(latest=Max("created_at"))
+        )
+        return {
+            (row["channel_id"], row["user_id"], row["alert_type"]): row["latest"] for row in rows
+        }
@@ -0,0 +1,315 @@
+"""Transactional alert email outbox and its batched, retrying drain."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Sequence
+from datetime import timedelta
+from typing import Any
+
+from django.core.mail import get_connection
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from pydantic import Field
+
+from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
+from micboard.services.monitoring.alert_fanout_service import AlertFanoutService
+from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+from micboard.services.notification.email_notification import email_service
+from micboard.services.notification.live_fragment_service import LiveFragmentService
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.services.shared.base_dto import PydanticBaseDTO
+from micboard.utils.dependencies import huey_is_configured
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+alert_email_queued = Signal()
+
+DEFAULT_ALERT_EMAIL_BATCH_SIZE = 50
+HARD_ALERT_EMAIL_BATCH_SIZE = 500
+DEFAULT_ALERT_EMAIL_MAX_ATTEMPTS = 5
+HARD_ALERT_EMAIL_MAX_ATTEMPTS = 20
+ALERT_EMAIL_RETRY_BASE_SECONDS = 60
+ALERT_EMAIL_RETRY_MAX_SECONDS = 3_600
+
+
+class AlertEmailDrainResult(PydanticBaseDTO):
+    """Bounded outcome of draining one outbox batch."""
+
+    limit: int = Field(ge=1, le=HARD_ALERT_EMAIL_BATCH_SIZE)
+    claimed: int = Field(default=0, ge=0, le=HARD_ALERT_EMAIL_BATCH_SIZE)
+    sent: int = Field(default=0, ge=0, le=HARD_ALERT_EMAIL_BATCH_SIZE)
+    retrying: int = Field(default=0, ge=0, le=HARD_ALERT_EMAIL_BATCH_SIZE)
+    failed: int = Field(default=0, ge=0, le=HARD_ALERT_EMAIL_BATCH_SIZE)
+    cancelled: int = Field(default=0, ge=0, le=HARD_ALERT_EMAIL_BATCH_SIZE)
+
+    @property
+    def backlogged(self) -> bool:
+        """Return whether a full batch was claimed, so more emails may be due."""
+        return self.claimed >= self.limit
+
+
+class AlertEmailOutboxService:
+    """Queue alert emails with their alerts and deliver them outside alert transactions."""
+
+    @classmethod
+    def enqueue(cls, deliveries: Iterable[tuple[Alert, Any]]) -> list[AlertEmailOutbox]:
+        """Queue emails for new alerts in the caller's transaction.
+
+        Delivery preferences and the recipient address are resolved now; recipient scope is
+        checked again when the drain claims the email.
+        """
+        entries = [
+            entry
+            for alert, user in deliveries
+            if (entry := cls._entry_for(alert=alert, user=user)) is not None
+        ]
+        if not entries:
+            return []
+        created = AlertEmailOutbox.objects.bulk_create(entries)
+        transaction.on_commit(cls._announce, robust=True)
+        return created
+
+    @classmethod
+    def drain(cls, *, limit: int | None = None) -> AlertEmailDrainResult:
+        """Deliver one batch of due emails over a single email backend connection."""
+        batch_size = min(max(limit or cls.batch_size(), 1), HARD_ALERT_EMAIL_BATCH_SIZE)
+        result = AlertEmailDrainResult(limit=batch_size)
+        entries = cls._claim(batch_size)
+        if not entries:
+            return result
+
+        deliverable = cls._authorized(entries)
+        cls._deliver(deliverable, max_attempts=cls.max_attempts())
+        cls._record(entries)
+
+        result.claimed = len(entries)
+        for entry in entries:
+            if entry.status == "sent":
+                result.sent += 1
+            elif entry.status == "failed":
+                result.failed += 1
+            elif entry.status == "cancelled":
+                result.cancelled += 1
+            else:
+                result.retrying += 1
+        logger.info(
+            "Alert email drain: %d sent, %d retrying, %d failed, %d cancelled",
+            result.sent,
+            result.retrying,
+            result.failed,
+            result.cancelled,
+        )
+        return result
+
+    @staticmethod
+    def batch_size() -> int:
+        """Return how many due emails one drain may claim."""
+        return micboard_settings.get_bounded_int(
+            "MICBOARD_ALERT_EMAIL_BATCH_SIZE",
+            default=DEFAULT_ALERT_EMAIL_BATCH_SIZE,
+            hard_limit=HARD_ALERT_EMAIL_BATCH_SIZE,
+        )
+
+    @staticmethod
+    def max_attempts() -> int:
+        """Return how many delivery attempts an email gets before it is marked failed."""
+        return micboard_settings.get_bounded_int(
+            "MICBOARD_ALERT_EMAIL_MAX_ATTEMPTS",
+            default=DEFAULT_ALERT_EMAIL_MAX_ATTEMPTS,
+            hard_limit=HARD_ALERT_EMAIL_MAX_ATTEMPTS,
+        )
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """Return the exponential backoff applied after a given attempt number."""
+        exponent = min(max(attempts, 1) - 1, 16)
+        seconds = ALERT_EMAIL_RETRY_BASE_SECONDS * 2**exponent
+        return timedelta(seconds=min(seconds, ALERT_EMAIL_RETRY_MAX_SECONDS))
+
+    @staticmethod
+    def _entry_for(*, alert: Alert, user: Any) -> AlertEmailOutbox | None:
+        """Apply the recipient's delivery method, quiet hours, and address override."""
+        preferences = getattr(user, "alert_preferences", None)
+        if preferences is not None:
+            if preferences.notification_method not in {"email", "both"}:
+                return None
+            if preferences.is_quiet_hours():
+                return None
+        recipient = getattr(preferences, "email_address", "") or getattr(user, "email", "")
+        if not recipient:
+            logger.warning(
+                "Cannot dispatch alert %s: user %s has no email",
+                alert.pk,
+                getattr(user, "pk", None),
+            )
+            return None
+        return AlertEmailOutbox(alert=alert, recipient=recipient)
+
+    @classmethod
+    def _announce(cls) -> None:
+        """Wake the task-layer drain, or drain inline when Huey is not configured."""
+        if not huey_is_configured():
+            try:
+                cls.drain()
+            except Exception as exc:
+                logger.exception(
+                    "Inline alert email drain failed",
+                    exc_info=sanitized_exception_info(exc),
+                )
+            return
+
+        for receiver, response in alert_email_queued.send_robust(sender=cls):
+            if isinstance(response, Exception):
+                logger.error(
+                    "Alert email drain dispatcher %r failed",
+                    receiver,
+                    exc_info=sanitized_exception_info(response),
+                )
+
+    @classmethod
+    def _claim(cls, batch_size: int) -> list[AlertEmailOutbox]:
+        """Lease due rows by pushing their next attempt out by the retry backoff.
+
+        A worker that dies mid-batch leaves each claimed email to be retried once its lease
+        expires, and concurrent drains skip rows another drain has locked.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            claimed_ids = list(
+                AlertEmailOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status="pending", next_attempt_at__lte=now)
+                .order_by("next_attempt_at", "pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            entries = list(
+                AlertEmailOutbox.objects.filter(pk__in=claimed_ids)
+                .select_related(
+                    "alert__channel__chassis",
+                    "alert__assignment__wireless_unit",
+                    "alert__user",
+                )
+                .order_by("next_attempt_at", "pk")
+            )
+            for entry in entries:
+                entry.attempts += 1
+                entry.next_attempt_at = now + cls.retry_delay(entry.attempts)
+            AlertEmailOutbox.objects.bulk_update(entries, ["attempts", "next_attempt_at"])
+        return entries
+
+    @staticmethod
+    def _authorized(entries: Sequence[AlertEmailOutbox]) -> list[AlertEmailOutbox]:
+        """Cancel emails for handled alerts or recipients no longer assigned and in scope."""
+        alerts = [entry.alert for entry in entries]
+        current = AlertFanoutService.current_recipient_pairs(
+            assignment_ids={alert.assignment_id for alert in alerts if alert.assignment_id},
+            user_ids={alert.user_id for alert in alerts},
+        )
+        unit_by_recipient = {
+            (assignment_id, user_id): unit_id for assignment_id, unit_id, user_id in current
+        }
+        in_scope = AlertFanoutService.units_in_recipient_scope(
+            unit_ids=set(unit_by_recipient.values()),
+            users={alert.user_id: alert.user for alert in alerts}.values(),
+        )
+
+        deliverable: list[AlertEmailOutbox] = []
+        for entry in entries:
+            alert = entry.alert
+            unit_id = (
+                unit_by_recipient.get((alert.assignment_id, alert.user_id))
+                if alert.assignment_id is not None
+                else None
+            )
+            if (
+                alert.status == "pending"
+                and unit_id is not None
+                and unit_id in in_scope.get(alert.user_id, ())
+            ):
+                deliverable.append(entry)
+                continue
+            logger.warning(
+                "Skipped alert email after recipient scope changed: alert=%s user=%s",
+                alert.pk,
+                alert.user_id,
+            )
+            entry.status = "cancelled"
+        return deliverable
+
+    @classmethod
+    def _deliver(cls, entries: Sequence[AlertEmailOutbox], *, max_attempts: int) -> None:
+        """Send each email on one open connection and record per-message outcomes."""
+        if not entries:
+            return
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as exc:
+            logger.exception(
+                "Could not open an email connection for %d alert emails",
+                len(entries),
+                exc_info=sanitized_exception_info(exc),
+            )
+            for entry in entries:
+                cls._record_failure(entry, error=type(exc).__name__, max_attempts=max_attempts)
+            return
+
+        try:
+            for entry in entries:
+                try:
+                    message = email_service.build_alert_message(
+                        entry.alert,
+                        [entry.recipient],
+                        connection=connection,
+                    )
+                    sent = connection.send_messages([message])
+                except Exception as exc:
+                    logger.exception(
+                        "Failed to send email for alert %s",
+                        entry.alert_id,
+                        exc_info=sanitized_exception_info(exc),
+                    )
+                    cls._record_failure(entry, error=type(exc).__name__, max_attempts=max_attempts)
+                    continue
+                if sent:
+                    entry.status = "sent"
+                    entry.sent_at = timezone.now()
+                    entry.last_error = ""
+                else:
+                    cls._record_failure(entry, error="NotSent", max_attempts=max_attempts)
+        finally:
+            try:
+                connection.close()
+            except Exception as exc:
+                logger.exception(
+                    "Could not close the alert email connection",
+                    exc_info=sanitized_exception_info(exc),
+                )
+
+    @staticmethod
+    def _record_failure(entry: AlertEmailOutbox, *, error: str, max_attempts: int) -> None:
+        """Keep the claimed backoff for a retry, or fail the email once attempts run out."""
+        entry.last_error = error[:100]
+        if entry.attempts >= max_attempts:
+            entry.status = "failed"
+
+    @staticmethod
+    def _record(entries: Sequence[AlertEmailOutbox]) -> None:
+        """Persist delivery states and mirror final outcomes onto their alerts."""
+        AlertEmailOutbox.objects.bulk_update(entries, ["status", "sent_at", "last_error"])
+        sent_alerts: list[Alert] = []
+        for entry in entries:
+            if entry.status == "sent":
+                entry.alert.sent_at = entry.sent_at
+                sent_alerts.append(entry.alert)
+        if sent_alerts:
+            Alert.objects.bulk_update(sent_alerts, ["sent_at"])
+        failed = [entry.alert for entry in entries if entry.status == "failed"]
+        if failed and Alert.objects.filter(
+            pk__in=[alert.pk for alert in failed], status="pending"
+        ).update(status="failed"):
+            InventoryCounterService.refresh_channels(alert.channel_id for alert in failed)
+            LiveFragmentService.alerts_changed(alert.channel_id for alert in failed)
@@ -0,0 +1,329 @@
+"""Batched, rule-compiled alert evaluation for one bounded wireless-unit page."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models import Case, IntegerField, Value, When
+
+from pydantic import Field
+
+from micboard.models.hardware.wireless_unit import WirelessUnit
+from micboard.models.monitoring.performer_assignment import PerformerAssignment
+from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
+from micboard.services.monitoring.alert_fanout_dtos import AlertFanoutBudget
+from micboard.services.monitoring.alert_fanout_service import AlertFanoutService
+from micboard.services.monitoring.alert_rules import (
+    AlertCandidate,
+    AlertRuleTable,
+    UnitAlertSignals,
+    unit_alert_snapshot,
+)
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.services.shared.base_dto import PydanticBaseDTO
+
+logger = logging.getLogger(__name__)
+
+ALERT_SCOPES = ("offline", "transmitter")
+DEFAULT_ALERT_EVALUATION_MAX_SECONDS_PER_1000_UNITS = 0.5
+
+
+@dataclass(slots=True)
+class AlertEvaluationInputs:
+    """Everything the in-memory planner needs, loaded once per page."""
+
+    assignments_by_unit: dict[int, list[PerformerAssignment]] = field(default_factory=dict)
+    recipients_by_assignment: dict[int, list[Any]] = field(default_factory=dict)
+    incomplete_unit_ids: set[int] = field(default_factory=set)
+    scope_by_user: dict[int, set[int]] = field(default_factory=dict)
+    rules: AlertRuleTable = field(default_factory=AlertRuleTable)
+
+
+@dataclass(slots=True)
+class AlertEvaluationPlan:
+    """Candidates for the accepted page prefix and the budget they will consume."""
+
+    evaluated_units: list[WirelessUnit] = field(default_factory=list)
+    candidates: list[AlertCandidate] = field(default_factory=list)
+    assignment_pages: list[int] = field(default_factory=list)
+    recipient_pages: list[int] = field(default_factory=list)
+    stopped_early: bool = False
+
+
+class AlertEvaluationOutcome(PydanticBaseDTO):
+    """Result of one batched evaluation pass."""
+
+    evaluated_units: list[WirelessUnit]
+    budget: AlertFanoutBudget
+    candidates: int = Field(ge=0)
+    alerts_created: int = Field(ge=0)
+    elapsed_seconds: float = Field(ge=0)
+
+    @property
+    def seconds_per_1000_units(self) -> float:
+        """Return the measured evaluation cost normalized to 1,000 units."""
+        if not self.evaluated_units:
+            return 0.0
+        return self.elapsed_seconds * 1000 / len(self.evaluated_units)
+
+
+class AlertEvaluationEngine:
+    """Evaluate a page of units against compiled rules with a constant query count.
+
+    Units that would need a partial assignment or recipient page, or more deliveries than
+    the budget has left, end the batch. The caller hands them to the per-unit checks,
+    whose rotating fanout cursors keep oversized assignments fair.
+    """
+
+    def __init__(
+        self,
+        *,
+        budget: AlertFanoutBudget,
+        scopes: Sequence[str] = ALERT_SCOPES,
+        unit_cursor: int = 0,
+    ) -> None:
+        """Bind the run budget, scope order, and page cursor used for ordering."""
+        self.budget = budget
+        self.scopes = tuple(scopes)
+        self.unit_cursor = unit_cursor
+
+    def evaluate(self, units: Sequence[WirelessUnit]) -> AlertEvaluationOutcome:
+        """Load inputs, plan candidates in memory, and persist them in one batch."""
+        started = time.perf_counter()
+        signals = {unit.pk: UnitAlertSignals.from_unit(unit) for unit in units}
+        inputs = self.load_inputs(units, signals=signals)
+        plan = self.plan(units, signals=signals, inputs=inputs)
+        for count in plan.assignment_pages:
+            self.budget.record_assignments(count, truncated=False)
+        for count in plan.recipient_pages:
+            self.budget.record_recipients(count, truncated=False)
+        created = AlertDeliveryService.create_alerts(
+            plan.candidates,
+            rules=inputs.rules,
+            budget=self.budget,
+        )
+        outcome = AlertEvaluationOutcome(
+            evaluated_units=plan.evaluated_units,
+            budget=self.budget,
+            candidates=len(plan.candidates),
+            alerts_created=len(created),
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        self._check_evaluation_cost(outcome)
+        return outcome
+
+    def load_inputs(
+        self,
+        units: Sequence[WirelessUnit],
+        *,
+        signals: dict[int, UnitAlertSignals],
+    ) -> AlertEvaluationInputs:
+        """Read assignments, recipients, preferences, and tenant scope for the whole page."""
+        flagged_ids = [
+            unit.pk
+            for unit in units
+            if signals[unit.pk].offline or signals[unit.pk].has_transmitter_condition
+        ]
+        inputs = AlertEvaluationInputs()
+        if not flagged_ids or self.budget.exhausted:
+            return inputs
+
+        assignment_limit = self.budget.remaining_assignments
+        assignments = list(
+            PerformerAssignment.objects.filter(
+                wireless_unit_id__in=flagged_ids,
+                is_active=True,
+                monitoring_group__is_active=True,
+            )
+            .select_related("performer", "monitoring_group")
+            .annotate(_alert_page_bucket=self._page_bucket())
+            .order_by("_alert_page_bucket", "wireless_unit_id", "pk")[: assignment_limit + 1]
+        )
+        if len(assignments) > assignment_limit:
+            inputs.incomplete_unit_ids.add(assignments[-1].wireless_unit_id)
+            assignments = assignments[:assignment_limit]
+        for assignment in assignments:
+            inputs.assignments_by_unit.setdefault(assignment.wireless_unit_id, []).append(
+                assignment
+            )
+        if not assignments:
+            return inputs
+
+        recipient_limit = self.budget.remaining_recipients
+        pairs = list(
+            PerformerAssignment.objects.filter(
+                pk__in=[assignment.pk for assignment in assignments],
+                monitoring_group__is_active=True,
+                monitoring_group__users__is_active=True,
+            )
+            .annotate(_alert_page_bucket=self._page_bucket())
+            .order_by("_alert_page_bucket", "wireless_unit_id", "pk", "monitoring_group__users__pk")
+            .values_list("wireless_unit_id", "pk", "monitoring_group__users__pk")[
+                : recipient_limit + 1
+            ]
+        )
+        if len(pairs) > recipient_limit:
+            inputs.incomplete_unit_ids.add(pairs[-1][0])
+            pairs = pairs[:recipient_limit]
+
+        users = list(
+            get_user_model()
+            ._default_manager.filter(pk__in={user_id for _, _, user_id in pairs})
+            .select_related("alert_preferences")
+        )
+        users_by_id = {user.pk: user for user in users}
+        for _unit_id, assignment_id, user_id in pairs:
+            user = users_by_id.get(user_id)
+            if user is not None:
+                inputs.recipients_by_assignment.setdefault(assignment_id, []).append(user)
+        inputs.rules = AlertRuleTable.compile(users)
+        inputs.scope_by_user = AlertFanoutService.units_in_recipient_scope(
+            unit_ids=flagged_ids,
+            users=users,
+        )
+        return inputs
+
+    def plan(
+        self,
+        units: Sequence[WirelessUnit],
+        *,
+        signals: dict[int, UnitAlertSignals],
+        inputs: AlertEvaluationInputs,
+    ) -> AlertEvaluationPlan:
+        """Apply compiled rules to every unit in page order without database access."""
+        plan = AlertEvaluationPlan()
+        remaining_assignments = self.budget.remaining_assignments
+        remaining_recipients = self.budget.remaining_recipients
+        remaining_deliveries = self.budget.remaining_deliveries
+
+        for unit in units:
+            if remaining_assignments <= 0 or remaining_recipients <= 0 or remaining_deliveries <= 0:
+                plan.stopped_early = True
+                break
+            unit_signals = signals[unit.pk]
+            assignment_pages: list[int] = []
+            recipient_pages: list[int] = []
+            candidates: list[AlertCandidate] = []
+            for scope in self.scopes:
+                assignments = self._scope_assignments(unit, scope, unit_signals, inputs)
+                if assignments is None:
+                    continue
+                assignment_pages.append(len(assignments))
+                recipient_pages.append(
+                    sum(
+                        len(inputs.recipients_by_assignment.get(assignment.pk, []))
+                        for assignment in assignments
+                    )
+                )
+                candidates.extend(
+                    self._scope_candidates(unit, scope, unit_signals, assignments, inputs)
+                )
+
+            needs_fallback = bool(assignment_pages) and unit.pk in inputs.incomplete_unit_ids
+            if (
+                needs_fallback
+                or sum(assignment_pages) > remaining_assignments
+                or sum(recipient_pages) > remaining_recipients
+                or len(candidates) > remaining_deliveries
+            ):
+                plan.stopped_early = True
+                break
+
+            remaining_assignments -= sum(assignment_pages)
+            remaining_recipients -= sum(recipient_pages)
+            remaining_deliveries -= len(candidates)
+            plan.assignment_pages.extend(assignment_pages)
+            plan.recipient_pages.extend(recipient_pages)
+            plan.candidates.extend(candidates)
+            plan.evaluated_units.append(unit)
+        return plan
+
+    @staticmethod
+    def _scope_assignments(
+        unit: WirelessUnit,
+        scope: str,
+        signals: UnitAlertSignals,
+        inputs: AlertEvaluationInputs,
+    ) -> list[PerformerAssignment] | None:
+        """Return the assignment page one scope would fan out to, or ``None`` if idle."""
+        if scope == "offline":
+            if not signals.offline:
+                return None
+            return [
+                assignment
+                for assignment in inputs.assignments_by_unit.get(unit.pk, [])
+                if assignment.alert_on_hardware_offline
+            ]
+        if not signals.has_transmitter_condition:
+            return None
+        return inputs.assignments_by_unit.get(unit.pk, [])
+
+    @staticmethod
+    def _scope_candidates(
+        unit: WirelessUnit,
+        scope: str,
+        signals: UnitAlertSignals,
+        assignments: list[PerformerAssignment],
+        inputs: AlertEvaluationInputs,
+    ) -> list[AlertCandidate]:
+        """Match one scope's recipients against their compiled rules."""
+        candidates: list[AlertCandidate] = []
+        snapshot: dict[str, Any] | None = None
+        for assignment in assignments:
+            for user in inputs.recipients_by_assignment.get(assignment.pk, []):
+                if unit.pk not in inputs.scope_by_user.get(user.pk, ()):
+                    continue
+                if scope == "offline":
+                    alerts = [("hardware_offline", f"Device offline: {unit.name}")]
+                else:
+                    alerts = inputs.rules.for_user(user.pk).transmitter_alerts(
+                        unit=unit,
+                        assignment=assignment,
+                        signals=signals,
+                    )
+                for alert_type, message in alerts:
+                    snapshot = snapshot or unit_alert_snapshot(unit)
+                    candidates.append(
+                        AlertCandidate(
+                            unit=unit,
+                            assignment=assignment,
+                            user=user,
+                            alert_type=alert_type,
+                            message=message,
+                            snapshot=snapshot,
+                        )
+                    )
+        return candidates
+
+    def _page_bucket(self) -> Case:
+        """Order rows like the unit page: after the cursor first, then wrapped rows."""
+        return Case(
+            When(wireless_unit_id__gt=self.unit_cursor, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+
+    @staticmethod
+    def _check_evaluation_cost(outcome: AlertEvaluationOutcome) -> None:
+        """Warn when evaluation exceeds the configured per-1,000-unit time budget."""
+        raw_limit = micboard_settings.get(
+            "MICBOARD_ALERT_EVALUATION_MAX_SECONDS_PER_1000_UNITS",
+            DEFAULT_ALERT_EVALUATION_MAX_SECONDS_PER_1000_UNITS,
+        )
+        try:
+            limit = float(raw_limit)
+        except (TypeError, ValueError):
+            limit = DEFAULT_ALERT_EVALUATION_MAX_SECONDS_PER_1000_UNITS
+        cost = outcome.seconds_per_1000_units
+        if cost > limit > 0:
+            logger.warning(
+                "Alert evaluation took %.3fs per 1,000 units (limit %.3fs) over %d units",
+                cost,
+                limit,
+                len(outcome.evaluated_units),
+            )
@@ -15,18 +15,6 @@ DEFAULT_ALERT_MAX_DELIVERIES = 250
 HARD_ALERT_MAX_DELIVERIES = 1_000
 
 
-def _bounded_setting(name: str, *, default: int, hard_limit: int) -> int:
-    """Return a positive integer setting clamped to its package hard limit."""
-    value = micboard_settings.get(name, default)
-    if isinstance(value, bool):
-        return default
-    try:
-        parsed = int(value)
-    except (TypeError, ValueError):
-        return default
-    return min(max(parsed, 1), hard_limit)
-
-
 class AlertFanoutBudget(PydanticBaseDTO):
     """Mutable counters enforcing one alert run's hard workload ceilings."""
 
@@ -44,17 +32,17 @@ class AlertFanoutBudget(PydanticBaseDTO):
     def from_settings(cls) -> AlertFanoutBudget:
         """Build a budget from host settings without permitting unbounded values."""
         return cls(
-            assignment_limit=_bounded_setting(
+            assignment_limit=micboard_settings.get_bounded_int(
                 "MICBOARD_POLL_ALERT_MAX_ASSIGNMENTS",
                 default=DEFAULT_ALERT_MAX_ASSIGNMENTS,
                 hard_limit=HARD_ALERT_MAX_ASSIGNMENTS,
             ),
-            recipient_limit=_bounded_setting(
+            recipient_limit=micboard_settings.get_bounded_int(
                 "MICBOARD_POLL_ALERT_MAX_RECIPIENTS",
                 default=DEFAULT_ALERT_MAX_RECIPIENTS,
                 hard_limit=HARD_ALERT_MAX_RECIPIENTS,
             ),
-            delivery_limit=_bounded_setting(
+            delivery_limit=micboard_settings.get_bounded_int(
                 "MICBOARD_POLL_ALERT_MAX_DELIVERIES",
                 default=DEFAULT_ALERT_MAX_DELIVERIES,
                 hard_limit=HARD_ALERT_MAX_DELIVERIES,
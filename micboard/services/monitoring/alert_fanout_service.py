@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Collection, Iterable
 from typing import Any, TypeVar, cast
 
 from django.contrib.auth import get_user_model
@@ -157,6 +158,51 @@ class AlertFanoutService:
         ).for_user(user=user)
         return tenant_units.filter(pk=unit.pk).exists()
 
+    @staticmethod
+    def units_in_recipient_scope(
+        *,
+        unit_ids: Collection[int],
+        users: Iterable[Any],
+    ) -> dict[int, set[int]]:
+        """Intersect many recipients with a unit page, one query per recipient at most."""
+        if not unit_ids:
+            return {}
+        eligible = [
+            user
+            for user in users
+            if getattr(user, "is_authenticated", False) and getattr(user, "is_active", False)
+        ]
+        if not (micboard_settings.msp_enabled or micboard_settings.multi_site_mode):
+            return {user.pk: set(unit_ids) for user in eligible}
+
+        scope: dict[int, set[int]] = {}
+        for user in eligible:
+            tenant_units: QuerySet[WirelessUnit] = TenantOptimizedQuerySet(
+                WirelessUnit,
+                using=WirelessUnit.objects.db,
+            ).for_user(user=user)
+            scope[user.pk] = set(tenant_units.filter(pk__in=unit_ids).values_list("pk", flat=True))
+        return scope
+
+    @staticmethod
+    def current_recipient_pairs(
+        *,
+        assignment_ids: Collection[int],
+        user_ids: Collection[int],
+    ) -> set[tuple[int, int, int]]:
+        """Return current ``(assignment, unit, user)`` fanout triples in one query."""
+        if not assignment_ids or not user_ids:
+            return set()
+        return set(
+            PerformerAssignment.objects.filter(
+                pk__in=assignment_ids,
+                is_active=True,
+                monitoring_group__is_active=True,
+                monitoring_group__users__pk__in=user_ids,
+                monitoring_group__users__is_active=True,
+            ).values_list("pk", "wireless_unit_id", "monitoring_group__users__pk")
+        )
+
     @classmethod
     def _rotating_page(
         cls,
@@ -0,0 +1,185 @@
+"""Compiled alert rules shared by per-unit checks and batched evaluation."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.utils import timezone
+
+from micboard.services.hardware.wireless_unit_service import get_battery_percentage
+
+if TYPE_CHECKING:  # pragma: no cover
+    from micboard.models.hardware.wireless_unit import WirelessUnit
+    from micboard.models.monitoring.performer_assignment import PerformerAssignment
+
+SIGNAL_LOSS_RF_LEVEL_DB = -80
+AUDIO_LOW_LEVEL_DB = -40
+DEFAULT_BATTERY_LOW_THRESHOLD = 20
+DEFAULT_BATTERY_CRITICAL_THRESHOLD = 10
+DEFAULT_MIN_ALERT_INTERVAL_MINUTES = 5
+
+
+@dataclass(frozen=True, slots=True)
+class UnitAlertSignals:
+    """Alert-relevant conditions derived once from a unit's current telemetry."""
+
+    battery_pct: int | None
+    signal_loss: bool
+    audio_low: bool
+    offline: bool
+
+    @classmethod
+    def from_unit(cls, unit: WirelessUnit) -> UnitAlertSignals:
+        """Derive every alert condition without touching the database."""
+        return cls(
+            battery_pct=get_battery_percentage(unit),
+            signal_loss=unit.rf_level is not None and unit.rf_level < SIGNAL_LOSS_RF_LEVEL_DB,
+            audio_low=unit.audio_level is not None and unit.audio_level < AUDIO_LOW_LEVEL_DB,
+            offline=unit.status != "online",
+        )
+
+    @property
+    def has_transmitter_condition(self) -> bool:
+        """Return whether transmitter fanout could produce any candidate."""
+        return self.battery_pct is not None or self.signal_loss or self.audio_low
+
+
+@dataclass(frozen=True, slots=True)
+class RecipientAlertRule:
+    """One recipient's thresholds and deduplication window."""
+
+    battery_low_threshold: int = DEFAULT_BATTERY_LOW_THRESHOLD
+    battery_critical_threshold: int = DEFAULT_BATTERY_CRITICAL_THRESHOLD
+    min_alert_interval_minutes: int = DEFAULT_MIN_ALERT_INTERVAL_MINUTES
+
+    @classmethod
+    def from_preferences(cls, preferences: Any | None) -> RecipientAlertRule:
+        """Compile a preference row, or package defaults when the user has none."""
+        if preferences is None:
+            return DEFAULT_ALERT_RULE
+        return cls(
+            battery_low_threshold=getattr(
+                preferences, "battery_low_threshold", DEFAULT_BATTERY_LOW_THRESHOLD
+            ),
+            battery_critical_threshold=getattr(
+                preferences, "battery_critical_threshold", DEFAULT_BATTERY_CRITICAL_THRESHOLD
+            ),
+            min_alert_interval_minutes=max(
+                0,
+                int(getattr(preferences, "min_alert_interval", DEFAULT_MIN_ALERT_INTERVAL_MINUTES)),
+            ),
+        )
+
+    def transmitter_alerts(
+        self,
+        *,
+        unit: WirelessUnit,
+        assignment: PerformerAssignment,
+        signals: UnitAlertSignals,
+    ) -> list[tuple[str, str]]:
+        """Build enabled transmitter alert candidates for one recipient."""
+        candidates: list[tuple[str, str]] = []
+        battery_pct = signals.battery_pct
+        if assignment.alert_on_battery_low and battery_pct is not None:
+            if battery_pct <= self.battery_critical_threshold:
+                candidates.append(
+                    (
+                        "battery_critical",
+                        f"Battery critically low: {battery_pct}% - {assignment.performer.name}",
+                    )
+                )
+            elif battery_pct <= self.battery_low_threshold:
+                candidates.append(
+                    (
+                        "battery_low",
+                        f"Battery low: {battery_pct}% - {assignment.performer.name}",
+                    )
+                )
+        if assignment.alert_on_signal_loss and signals.signal_loss:
+            candidates.append(("signal_loss", f"Signal loss detected: RF level {unit.rf_level}dB"))
+        if assignment.alert_on_audio_low and signals.audio_low:
+            candidates.append(("audio_low", f"Audio level too low: {unit.audio_level}dB"))
+        return candidates
+
+
+DEFAULT_ALERT_RULE = RecipientAlertRule()
+
+
+@dataclass(frozen=True, slots=True)
+class AlertCandidate:
+    """One alert a compiled rule wants to emit, pending revalidation and deduplication."""
+
+    unit: WirelessUnit
+    assignment: PerformerAssignment
+    user: Any
+    alert_type: str
+    message: str
+    snapshot: dict[str, Any]
+
+    @property
+    def dedupe_key(self) -> tuple[int | None, int, str]:
+        """Return the ``(channel, user, alert type)`` key open alerts are matched on."""
+        return self.unit.assigned_resource_id, self.user.pk, self.alert_type
+
+
+class AlertRuleTable:
+    """Per-run lookup of compiled recipient rules keyed by user primary key."""
+
+    __slots__ = ("_rules",)
+
+    def __init__(self, rules: dict[int, RecipientAlertRule] | None = None) -> None:
+        """Store already-compiled rules."""
+        self._rules = rules or {}
+
+    @classmethod
+    def compile(cls, users: Iterable[Any]) -> AlertRuleTable:
+        """Compile users loaded with ``select_related("alert_preferences")``."""
+        return cls(
+            {
+                user.pk: RecipientAlertRule.from_preferences(
+                    getattr(user, "alert_preferences", None)
+                )
+                for user in users
+            }
+        )
+
+    def for_user(self, user_id: int) -> RecipientAlertRule:
+        """Return a recipient's compiled rule or the package defaults."""
+        return self._rules.get(user_id, DEFAULT_ALERT_RULE)
+
+    @property
+    def max_interval_minutes(self) -> int:
+        """Return the widest deduplication window any compiled rule needs."""
+        return max(
+            (rule.min_alert_interval_minutes for rule in self._rules.values()),
+            default=DEFAULT_MIN_ALERT_INTERVAL_MINUTES,
+        )
+
+
+def unit_alert_snapshot(unit: WirelessUnit) -> dict[str, Any]:
+    """Return the unit state recorded on an alert for later context."""
+    snapshot: dict[str, Any] = {
+        "unit_name": unit.name,
+        "unit_slot": unit.slot,
+        "battery_percentage": get_battery_percentage(unit),
+        "audio_level": unit.audio_level,
+        "rf_level": unit.rf_level,
+        "status": unit.status,
+        "is_active": unit.status == "online",
+        "timestamp": timezone.now().isoformat(),
+    }
+
+    # Include channel info if available
+    if unit.assigned_resource:
+        channel = unit.assigned_resource
+        snapshot.update(
+            {
+                "channel_number": channel.channel_number,
+                "chassis_name": channel.chassis.name,
+                "chassis_ip": channel.chassis.ip,
+            }
+        )
+
+    return snapshot
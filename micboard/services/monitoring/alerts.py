@@ -17,10 +17,15 @@ from micboard.models.base_managers import TenantOptimizedQuerySet
 from micboard.models.hardware.wireless_unit import WirelessUnit
 from micboard.models.monitoring.alert import Alert
 from micboard.models.monitoring.performer_assignment import PerformerAssignment
-from micboard.services.hardware.wireless_unit_service import get_battery_percentage
 from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
 from micboard.services.monitoring.alert_fanout_dtos import AlertFanoutBudget
 from micboard.services.monitoring.alert_fanout_service import AlertFanoutService
+from micboard.services.monitoring.alert_rules import (
+    RecipientAlertRule,
+    UnitAlertSignals,
+    unit_alert_snapshot,
+)
+from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
 
 logger = logging.getLogger(__name__)
 
@@ -54,10 +59,8 @@ class AlertManager:
             unit: WirelessUnit instance to check
         """
         run_budget = budget or AlertFanoutBudget.from_settings()
-        battery_pct = get_battery_percentage(unit)
-        signal_loss = unit.rf_level is not None and unit.rf_level < -80
-        audio_low = unit.audio_level is not None and unit.audio_level < -40
-        if battery_pct is None and not signal_loss and not audio_low:
+        signals = UnitAlertSignals.from_unit(unit)
+        if not signals.has_transmitter_condition:
             return
 
         assignments = AlertFanoutService.assignments_for_unit(
@@ -78,9 +81,7 @@ class AlertManager:
                     unit=unit,
                     assignment=assignment,
                     user=user,
-                    battery_pct=battery_pct,
-                    signal_loss=signal_loss,
-                    audio_low=audio_low,
+                    signals=signals,
                 ):
                     AlertDeliveryService.create_alert(
                         unit=unit,
@@ -138,61 +139,15 @@ class AlertManager:
         unit: WirelessUnit,
         assignment: PerformerAssignment,
         user: Any,
-        battery_pct: int | None,
-        signal_loss: bool,
-        audio_low: bool,
+        signals: UnitAlertSignals,
     ) -> list[tuple[str, str]]:
         """Build enabled transmitter alert candidates for one bounded recipient."""
-        candidates: list[tuple[str, str]] = []
-        preferences = getattr(user, "alert_preferences", None)
-        if assignment.alert_on_battery_low and battery_pct is not None:
-            critical_threshold = getattr(preferences, "battery_critical_threshold", 10)
-            low_threshold = getattr(preferences, "battery_low_threshold", 20)
-            if battery_pct <= critical_threshold:
-                candidates.append(
-                    (
-                        "battery_critical",
-                        f"Battery critically low: {battery_pct}% - {assignment.performer.name}",
-                    )
-                )
-            elif battery_pct <= low_threshold:
-                candidates.append(
-                    (
-                        "battery_low",
-                        f"Battery low: {battery_pct}% - {assignment.performer.name}",
-                    )
-                )
-        if assignment.alert_on_signal_loss and signal_loss:
-            candidates.append(("signal_loss", f"Signal loss detected: RF level {unit.rf_level}dB"))
-        if assignment.alert_on_audio_low and audio_low:
-            candidates.append(("audio_low", f"Audio level too low: {unit.audio_level}dB"))
-        return candidates
+        rule = RecipientAlertRule.from_preferences(getattr(user, "alert_preferences", None))
+        return rule.transmitter_alerts(unit=unit, assignment=assignment, signals=signals)
 
     def _get_unit_snapshot(self, unit: WirelessUnit) -> dict[str, Any]:
         """Get a snapshot of unit state for alert context."""
-        snapshot = {
-            "unit_name": unit.name,
-            "unit_slot": unit.slot,
-            "battery_percentage": get_battery_percentage(unit),
-            "audio_level": unit.audio_level,
-            "rf_level": unit.rf_level,
-            "status": unit.status,
-            "is_active": unit.status == "online",
-            "timestamp": timezone.now().isoformat(),
-        }
-
-        # Include channel info if available
-        if unit.assigned_resource:
-            channel = unit.assigned_resource
-            snapshot.update(
-                {
-                    "channel_number": channel.channel_number,
-                    "chassis_name": channel.chassis.name,
-                    "chassis_ip": channel.chassis.ip,
-                }
-            )
-
-        return snapshot
+        return unit_alert_snapshot(unit)
 
 
 # Canonical alert manager instance.
@@ -243,5 +198,6 @@ def resolve_alert(alert_id: int, *, user: User | AnonymousUser) -> Alert:
     alert.status = "resolved"
     alert.resolved_at = timezone.now()
     alert.save(update_fields=["status", "resolved_at"])
+    InventoryCounterService.refresh_channels((alert.channel_id,))
     logger.info("Alert %s resolved by user %s", alert.id, getattr(user, "pk", None))
     return alert
@@ -0,0 +1,662 @@
+"""Maintain denormalized inventory counters for dashboards and admin summaries.
+
+``InventoryCounter`` rows hold chassis by status, active units, open alerts,
+and online chargers per location, then roll up to buildings, organizations,
+campuses, sites, and the whole deployment. Model lifecycle adapters and bulk
+service paths call ``refresh_locations`` inside the writing transaction; the
+refresh recounts only the touched locations, so a missed signal never
+compounds, and adds the change in their totals to each ancestor row with one
+``F()`` update. Moved or deleted buildings re-sum their ancestors instead.
+``reconcile`` compares every row against the hardware tables and repairs drift
+left by raw SQL or cascades that bypass the adapters.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Count, F, Q, QuerySet, Sum, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from micboard.models.hardware.charger import Charger
+from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.models.hardware.wireless_unit import WirelessUnit
+from micboard.models.locations.structure import Building, Location
+from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.inventory_counter import (
+    COUNTER_FIELDS,
+    DEVICE_STATUS_FIELDS,
+    InventoryCounter,
+)
+from micboard.models.monitoring.location_access import LocationAccessGrant
+from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.multitenancy.context import tenant_context_for_user
+
+UNPLACED_LOCATION_ID = 0
+DEPLOYMENT_SCOPE_ID = 0
+ACTIVE_UNIT_STATUSES = frozenset({"online", "degraded", "provisioning"})
+OPEN_ALERT_STATUSES = frozenset({"pending", "sent", "acknowledged"})
+
+Scope = InventoryCounter.Scope
+_PARENT_COLUMNS: dict[str, str] = {
+    Scope.ORGANIZATION: "organization_id",
+    Scope.CAMPUS: "campus_id",
+    Scope.SITE: "site_id",
+}
+# Lock order shared by the delta and re-sum paths, leaves first.
+_ROLLUP_ORDER: tuple[str, ...] = (Scope.BUILDING, *_PARENT_COLUMNS, Scope.DEPLOYMENT)
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryTotals:
+    """Inventory totals read from one counter row or a sum of rows."""
+
+    devices_by_status: Mapping[str, int] = field(default_factory=dict)
+    active_units: int = 0
+    open_alerts: int = 0
+    online_chargers: int = 0
+
+    @property
+    def devices(self) -> int:
+        """Return the number of chassis in every lifecycle status."""
+        return sum(self.devices_by_status.values())
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, int | None]) -> InventoryTotals:
+        return cls(
+            devices_by_status={
+                status: values.get(name) or 0 for status, name in DEVICE_STATUS_FIELDS.items()
+            },
+            active_units=values.get("active_units") or 0,
+            open_alerts=values.get("open_alerts") or 0,
+            online_chargers=values.get("online_chargers") or 0,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryReconciliation:
+    """Outcome of one drift reconciliation pass."""
+
+    checked: int = 0
+    corrected: int = 0
+
+
+class InventoryCounterService:
+    """Refresh, reconcile, and read the maintained inventory counters."""
+
+    @classmethod
+    def refresh_locations(
+        cls,
+        location_ids: Iterable[int | None],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount ``location_ids`` and their ancestors; ``None`` means unplaced chassis.
+
+        Returns the number of counter rows written or removed.
+        """
+        identifiers = {
+            UNPLACED_LOCATION_ID if location_id is None else location_id
+            for location_id in location_ids
+        }
+        if not identifiers:
+            return 0
+        with transaction.atomic(using=using):
+            _buildings, deltas, changed = cls._sync_locations(identifiers, using=using)
+            if not deltas:
+                return changed
+            return changed + cls._apply_deltas(deltas, using=using)
+
+    @classmethod
+    def refresh_buildings(
+        cls,
+        building_ids: Iterable[int | None],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount moved or deleted buildings, their locations, and unplaced chassis."""
+        identifiers = {building_id for building_id in building_ids if building_id is not None}
+        if not identifiers:
+            return 0
+        with transaction.atomic(using=using):
+            locations = {
+                UNPLACED_LOCATION_ID,
+                *Location.objects.using(using)
+                .filter(building_id__in=identifiers)
+                .values_list("pk", flat=True),
+                *InventoryCounter.objects.using(using)
+                .filter(scope=Scope.LOCATION, building_id__in=identifiers)
+                .values_list("scope_id", flat=True),
+            }
+            buildings, _deltas, changed = cls._sync_locations(locations, using=using)
+            return changed + cls._sync_rollups(buildings | identifiers, using=using)
+
+    @classmethod
+    def refresh_chassis(
+        cls,
+        chassis_ids: Iterable[int | None],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount the locations of ``chassis_ids``."""
+        identifiers = {chassis_id for chassis_id in chassis_ids if chassis_id is not None}
+        if not identifiers:
+            return 0
+        return cls.refresh_locations(
+            set(
+                WirelessChassis.objects.using(using)
+                .filter(pk__in=identifiers)
+                .values_list("location_id", flat=True)
+            ),
+            using=using,
+        )
+
+    @classmethod
+    def refresh_channels(
+        cls,
+        channel_ids: Iterable[int | None],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount the locations whose open alerts on ``channel_ids`` changed."""
+        identifiers = {channel_id for channel_id in channel_ids if channel_id is not None}
+        if not identifiers:
+            return 0
+        return cls.refresh_locations(
+            set(
+                RFChannel.objects.using(using)
+                .filter(pk__in=identifiers)
+                .values_list("chassis__location_id", flat=True)
+            ),
+            using=using,
+        )
+
+    @classmethod
+    def chassis_saved(
+        cls,
+        chassis: WirelessChassis,
+        *,
+        created: bool,
+        status_changed: bool,
+        old_location_id: int | None,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount after a chassis is created, changes status, or moves."""
+        if created:
+            return cls.refresh_locations([chassis.location_id], using=using)
+        if not status_changed and old_location_id == chassis.location_id:
+            return 0
+        return cls.refresh_locations([old_location_id, chassis.location_id], using=using)
+
+    @classmethod
+    def unit_saved(
+        cls,
+        unit: WirelessUnit,
+        *,
+        old_status: str | None,
+        old_chassis_id: int | None,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount when a unit enters or leaves the active count, or moves while active."""
+        was_active = old_status in ACTIVE_UNIT_STATUSES
+        is_active = unit.status in ACTIVE_UNIT_STATUSES
+        if was_active == is_active and (not is_active or old_chassis_id == unit.base_chassis_id):
+            return 0
+        return cls.refresh_chassis([old_chassis_id, unit.base_chassis_id], using=using)
+
+    @classmethod
+    def charger_saved(
+        cls,
+        charger: Charger,
+        *,
+        previous: Mapping[str, Any] | None,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> int:
+        """Recount when a charger enters or leaves the online count, or moves while online."""
+        previous = previous or {}
+        was_online = bool(previous.get("is_active")) and previous.get("status") == "online"
+        is_online = charger.is_active and charger.status == "online"
+        old_location_id = previous.get("location_id")
+        if was_online == is_online and (not is_online or old_location_id == charger.location_id):
+            return 0
+        return cls.refresh_locations(
+            {old_location_id, charger.location_id} - {None},
+            using=using,
+        )
+
+    @staticmethod
+    def locations_of_manufacturer(
+        manufacturer_id: int,
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> set[int | None]:
+        """Return locations holding hardware that deleting a manufacturer removes."""
+        chassis = WirelessChassis.objects.using(using).filter(
+            Q(manufacturer_id=manufacturer_id) | Q(field_units__manufacturer_id=manufacturer_id)
+        )
+        chargers = Charger.objects.using(using).filter(manufacturer_id=manufacturer_id)
+        return {
+            *chassis.values_list("location_id", flat=True).distinct(),
+            *chargers.values_list("location_id", flat=True).distinct(),
+        }
+
+    @classmethod
+    def reconcile(cls, *, using: str = DEFAULT_DB_ALIAS) -> InventoryReconciliation:
+        """Compare every counter with the hardware tables and repair drifted rows.
+
+        Drift is detected without locks; drifted scopes are then recounted
+        through the locked refresh path so concurrent writers are not undone.
+        """
+        expected = cls._expected_counters(using=using)
+        stored = {(row.scope, row.scope_id): row for row in InventoryCounter.objects.using(using)}
+        keys = expected.keys() | stored.keys()
+        drifted = {
+            key
+            for key in keys
+            if key not in expected
+            or key not in stored
+            or any(getattr(stored[key], name) != value for name, value in expected[key].items())
+        }
+        if not drifted:
+            return InventoryReconciliation(checked=len(keys))
+
+        drifted_ids: dict[str, set[int]] = defaultdict(set)
+        for scope, scope_id in drifted:
+            drifted_ids[scope].add(scope_id)
+        with transaction.atomic(using=using):
+            buildings: set[int] = set()
+            if drifted_ids[Scope.LOCATION]:
+                buildings, _deltas, _changed = cls._sync_locations(
+                    drifted_ids[Scope.LOCATION], using=using
+                )
+            parents, _changed = cls._sync_buildings(
+                buildings | drifted_ids[Scope.BUILDING], using=using
+            )
+            for scope in _PARENT_COLUMNS:
+                if ids := parents[scope] | drifted_ids[scope]:
+                    cls._sync_parents(scope, ids, using=using)
+            cls._sync_deployment(using=using)
+        return InventoryReconciliation(checked=len(keys), corrected=len(drifted))
+
+    @staticmethod
+    def totals(
+        scope: str,
+        scope_id: int,
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> InventoryTotals:
+        """Return the totals of one scope, or zeros when it holds no inventory."""
+        values = (
+            InventoryCounter.objects.using(using)
+            .filter(scope=scope, scope_id=scope_id)
+            .values(*COUNTER_FIELDS)
+            .first()
+        )
+        return InventoryTotals.from_values(values or {})
+
+    @classmethod
+    def totals_for_user(cls, user: Any) -> InventoryTotals:
+        """Return the totals of the inventory ``user`` may see.
+
+        Tenant and site boundaries read building or site rows; single-site
+        users without unrestricted access read the locations of their
+        monitoring grants.
+        """
+        context = tenant_context_for_user(user)
+        if not context.is_authenticated:
+            return InventoryTotals()
+        if context.unrestricted or context.msp_enabled or context.multi_site_mode:
+            if context.unrestricted and context.multi_site_mode:
+                return cls.totals(Scope.SITE, context.site_id)
+            building_ids = context.visible_buildings()
+            if building_ids is None:
+                return cls.totals(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID)
+            rows = InventoryCounter.objects.filter(scope=Scope.BUILDING, scope_id__in=building_ids)
+        else:
+            user_id = getattr(user, "pk", None)
+            if user_id is None:
+                return InventoryTotals()
+            grants = LocationAccessGrant.objects.filter(user_id=user_id)
+            rows = InventoryCounter.objects.filter(
+                scope=Scope.LOCATION,
+                scope_id__in=grants.values("location_id"),
+            )
+        return InventoryTotals.from_values(_unprefixed(rows.aggregate(**_sum_expressions())))
+
+    @classmethod
+    def _sync_rollups(cls, buildings: set[int], *, using: str) -> int:
+        parents, changed = cls._sync_buildings(buildings, using=using)
+        for scope, ids in parents.items():
+            if ids:
+                changed += cls._sync_parents(scope, ids, using=using)
+        return changed + cls._sync_deployment(using=using)
+
+    @classmethod
+    def _apply_deltas(
+        cls,
+        deltas: Mapping[int | None, Mapping[str, int]],
+        *,
+        using: str,
+    ) -> int:
+        """Add per-building changes to building, parent, and deployment rows.
+
+        ``None`` keys hold the unplaced location's change, which only the
+        deployment row includes.
+        """
+        parents = {
+            values.pop("pk"): values
+            for values in Building.objects.using(using)
+            .filter(pk__in={building_id for building_id in deltas if building_id is not None})
+            .values("pk", *_PARENT_COLUMNS.values())
+        }
+        targets: dict[tuple[str, int], dict[str, int]] = defaultdict(_zeros)
+        for building_id, delta in deltas.items():
+            _add_counts(targets[(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID)], delta)
+            if building_id is None:
+                continue
+            _add_counts(targets[(Scope.BUILDING, building_id)], delta)
+            for scope, column in _PARENT_COLUMNS.items():
+                if (parent_id := parents.get(building_id, {}).get(column)) is not None:
+                    _add_counts(targets[(scope, parent_id)], delta)
+
+        manager = InventoryCounter.objects.using(using)
+        manager.bulk_create(
+            [
+                InventoryCounter(
+                    scope=scope,
+                    scope_id=scope_id,
+                    **(parents.get(scope_id, {}) if scope == Scope.BUILDING else {}),
+                )
+                for scope, scope_id in targets
+            ],
+            ignore_conflicts=True,
+        )
+        now = timezone.now()
+        changed = 0
+        for scope, scope_id in sorted(
+            targets, key=lambda key: (_ROLLUP_ORDER.index(key[0]), key[1])
+        ):
+            delta = {name: value for name, value in targets[(scope, scope_id)].items() if value}
+            if not delta:
+                continue
+            # Clamped so a drifted row cannot go negative before ``reconcile`` repairs it.
+            changed += manager.filter(scope=scope, scope_id=scope_id).update(
+                updated_at=now,
+                **{name: Greatest(F(name) + value, Value(0)) for name, value in delta.items()},
+            )
+        return changed
+
+    @classmethod
+    def _sync_locations(
+        cls, ids: set[int], *, using: str
+    ) -> tuple[set[int], dict[int | None, dict[str, int]], int]:
+        """Recount location rows.
+
+        Returns their old and new buildings, the nonzero change in totals per
+        building (``None`` for unplaced inventory), and the rows changed.
+        """
+        buildings_by_location = dict(
+            Location.objects.using(using)
+            .filter(pk__in=ids - {UNPLACED_LOCATION_ID})
+            .values_list("pk", "building_id")
+        )
+        present = set(buildings_by_location) | (ids & {UNPLACED_LOCATION_ID})
+        rows = _lock_rows(Scope.LOCATION, ids, create=present, using=using)
+        measured = _measure_locations(present, using=using)
+        expected = {
+            location_id: {
+                **measured[location_id],
+                "building_id": buildings_by_location.get(location_id),
+            }
+            for location_id in present
+        }
+        buildings = {
+            building_id
+            for building_id in (
+                *(row.building_id for row in rows.values()),
+                *buildings_by_location.values(),
+            )
+            if building_id is not None
+        }
+        deltas: dict[int | None, dict[str, int]] = defaultdict(_zeros)
+        for row in rows.values():
+            _add_counts(
+                deltas[row.building_id], {name: -getattr(row, name) for name in COUNTER_FIELDS}
+            )
+        for values in expected.values():
+            _add_counts(deltas[values["building_id"]], values)
+        changed = _write_rows(rows, expected, using=using)
+        return (
+            buildings,
+            {building_id: delta for building_id, delta in deltas.items() if any(delta.values())},
+            changed,
+        )
+
+    @classmethod
+    def _sync_buildings(cls, ids: set[int], *, using: str) -> tuple[dict[str, set[int]], int]:
+        """Re-sum building rows; return their old and new parents and rows changed."""
+        parents: dict[str, set[int]] = {scope: set() for scope in _PARENT_COLUMNS}
+        if not ids:
+            return parents, 0
+        buildings: dict[int, dict[str, int | None]] = {}
+        for values in (
+            Building.objects.using(using).filter(pk__in=ids).values("pk", *_PARENT_COLUMNS.values())
+        ):
+            buildings[values.pop("pk")] = values
+        rows = _lock_rows(Scope.BUILDING, ids, create=set(buildings), using=using)
+        sums = _sum_rows(
+            InventoryCounter.objects.using(using).filter(
+                scope=Scope.LOCATION, building_id__in=list(buildings)
+            ),
+            "building_id",
+        )
+        expected = {
+            building_id: {**sums.get(building_id, _zeros()), **building_parents}
+            for building_id, building_parents in buildings.items()
+        }
+        for scope, column in _PARENT_COLUMNS.items():
+            parents[scope] = {
+                *(getattr(row, column) for row in rows.values()),
+                *(building_parents[column] for building_parents in buildings.values()),
+            } - {None}
+        return parents, _write_rows(rows, expected, using=using)
+
+    @classmethod
+    def _sync_parents(cls, scope: str, ids: set[int], *, using: str) -> int:
+        column = _PARENT_COLUMNS[scope]
+        rows = _lock_rows(scope, ids, create=ids, using=using)
+        expected = _sum_rows(
+            InventoryCounter.objects.using(using).filter(
+                scope=Scope.BUILDING, **{f"{column}__in": ids}
+            ),
+            column,
+        )
+        return _write_rows(rows, expected, using=using)
+
+    @classmethod
+    def _sync_deployment(cls, *, using: str) -> int:
+        rows = _lock_rows(
+            Scope.DEPLOYMENT,
+            {DEPLOYMENT_SCOPE_ID},
+            create={DEPLOYMENT_SCOPE_ID},
+            using=using,
+        )
+        counters = InventoryCounter.objects.using(using).filter(
+            Q(scope=Scope.BUILDING) | Q(scope=Scope.LOCATION, scope_id=UNPLACED_LOCATION_ID)
+        )
+        totals = _unprefixed(counters.aggregate(**_sum_expressions()))
+        expected = {DEPLOYMENT_SCOPE_ID: {name: totals[name] or 0 for name in COUNTER_FIELDS}}
+        return _write_rows(rows, expected, using=using)
+
+    @classmethod
+    def _expected_counters(cls, *, using: str) -> dict[tuple[str, int], dict[str, Any]]:
+        """Compute every counter row from the hardware tables in a few grouped queries."""
+        buildings_by_location = dict(Location.objects.using(using).values_list("pk", "building_id"))
+        measured = _measure_locations(None, using=using)
+        expected: dict[tuple[str, int], dict[str, Any]] = {}
+        for location_id in (*buildings_by_location, UNPLACED_LOCATION_ID):
+            expected[(Scope.LOCATION, location_id)] = {
+                **measured.get(location_id, _zeros()),
+                "building_id": buildings_by_location.get(location_id),
+            }
+
+        deployment = {
+            name: expected[(Scope.LOCATION, UNPLACED_LOCATION_ID)][name] for name in COUNTER_FIELDS
+        }
+        buildings: dict[int, dict[str, Any]] = {}
+        for values in Building.objects.using(using).values("pk", *_PARENT_COLUMNS.values()):
+            building_id = values.pop("pk")
+            buildings[building_id] = {**_zeros(), **values}
+        for (scope, _location_id), values in list(expected.items()):
+            if scope == Scope.LOCATION and values["building_id"] is not None:
+                _add_counts(buildings[values["building_id"]], values)
+        for building_id, values in buildings.items():
+            expected[(Scope.BUILDING, building_id)] = values
+            _add_counts(deployment, values)
+            for parent_scope, column in _PARENT_COLUMNS.items():
+                if values[column] is not None:
+                    _add_counts(
+                        expected.setdefault((parent_scope, values[column]), _zeros()), values
+                    )
+        expected[(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID)] = deployment
+        return expected
+
+
+def _zeros() -> dict[str, int]:
+    return dict.fromkeys(COUNTER_FIELDS, 0)
+
+
+def _add_counts(target: dict[str, Any], values: Mapping[str, Any]) -> None:
+    for name in COUNTER_FIELDS:
+        target[name] += values[name]
+
+
+def _sum_expressions() -> dict[str, Sum]:
+    return {f"total_{name}": Sum(name) for name in COUNTER_FIELDS}
+
+
+def _unprefixed(values: Mapping[str, Any]) -> dict[str, Any]:
+    return {name.removeprefix("total_"): value for name, value in values.items()}
+
+
+def _sum_rows(queryset: QuerySet[InventoryCounter], column: str) -> dict[int, dict[str, int]]:
+    """Sum counter rows grouped by a parent column."""
+    sums: dict[int, dict[str, int]] = {}
+    for values in queryset.values(column).annotate(**_sum_expressions()).order_by():
+        group = values.pop(column)
+        sums[group] = {name: value or 0 for name, value in _unprefixed(values).items()}
+    return sums
+
+
+def _measure_locations(ids: set[int] | None, *, using: str) -> dict[int, dict[str, int]]:
+    """Count inventory per location; ``None`` measures every location."""
+    if ids is not None and not ids:
+        return {}
+    measured: dict[int, dict[str, int]] = defaultdict(_zeros)
+    for location_id in ids or ():
+        measured[location_id] = _zeros()
+
+    def in_locations(path: str) -> Q:
+        if ids is None:
+            return Q()
+        condition = Q(**{f"{path}__in": ids - {UNPLACED_LOCATION_ID}})
+        if UNPLACED_LOCATION_ID in ids:
+            condition |= Q(**{f"{path}__isnull": True})
+        return condition
+
+    chassis = (
+        WirelessChassis.objects.using(using)
+        .filter(in_locations("location_id"))
+        .values_list("location_id", "status")
+        .annotate(total=Count("pk"))
+        .order_by()
+    )
+    for location_id, status, total in chassis:
+        if name := DEVICE_STATUS_FIELDS.get(status):
+            measured[location_id or UNPLACED_LOCATION_ID][name] += total
+
+    grouped: tuple[tuple[str, QuerySet[Any], str], ...] = (
+        (
+            "active_units",
+            WirelessUnit.objects.using(using).filter(status__in=ACTIVE_UNIT_STATUSES),
+            "base_chassis__location_id",
+        ),
+        (
+            "open_alerts",
+            Alert.objects.using(using).filter(status__in=OPEN_ALERT_STATUSES),
+            "channel__chassis__location_id",
+        ),
+        (
+            "online_chargers",
+            Charger.objects.using(using).filter(is_active=True, status="online"),
+            "location_id",
+        ),
+    )
+    for name, queryset, path in grouped:
+        counts = (
+            queryset.filter(in_locations(path))
+            .values_list(path)
+            .annotate(total=Count("pk"))
+            .order_by()
+        )
+        for location_id, total in counts:
+            measured[location_id or UNPLACED_LOCATION_ID][name] += total
+    return measured
+
+
+def _lock_rows(
+    scope: str,
+    ids: set[int],
+    *,
+    create: set[int],
+    using: str,
+) -> dict[int, InventoryCounter]:
+    """Create missing rows for ``create`` and lock every row of ``ids`` in id order."""
+    manager = InventoryCounter.objects.using(using)
+    if create:
+        manager.bulk_create(
+            [InventoryCounter(scope=scope, scope_id=scope_id) for scope_id in sorted(create)],
+            ignore_conflicts=True,
+        )
+    return {
+        row.scope_id: row
+        for row in manager.select_for_update()
+        .filter(scope=scope, scope_id__in=ids | create)
+        .order_by("scope_id")
+    }
+
+
+def _write_rows(
+    rows: dict[int, InventoryCounter],
+    expected: Mapping[int, Mapping[str, Any]],
+    *,
+    using: str,
+) -> int:
+    """Update rows that differ from ``expected`` and delete rows it no longer lists."""
+    changed: list[InventoryCounter] = []
+    stale: list[int] = []
+    fields: set[str] = {"updated_at"}
+    now = timezone.now()
+    for scope_id, row in rows.items():
+        values = expected.get(scope_id)
+        if values is None:
+            stale.append(row.pk)
+            continue
+        differing = {name for name, value in values.items() if getattr(row, name) != value}
+        if not differing:
+            continue
+        for name in differing:
+            setattr(row, name, values[name])
+        row.updated_at = now
+        fields |= differing
+        changed.append(row)
+    if changed:
+        InventoryCounter.objects.using(using).bulk_update(changed, sorted(fields))
+    if stale:
+        InventoryCounter.objects.using(using).filter(pk__in=stale).delete()
+    return len(changed) + len(stale)
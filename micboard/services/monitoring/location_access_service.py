@@ -0,0 +1,195 @@
+"""Maintain the materialized user-to-location access closure.
+
+``LocationAccessGrant`` rows hold every active location a user reaches through
+an active monitoring group, either assigned directly or through an
+``include_all_rooms`` building. Model lifecycle adapters refresh only the users
+a change can affect; ``rebuild`` recomputes every user for repair or upgrades.
+
+Bulk ``QuerySet.update()`` and raw SQL on groups, group locations, or locations
+send no model signals, so the closure is not refreshed. Follow them with
+``refresh_users`` for the affected users (``users_of_groups`` or
+``users_for_location`` find them) or with ``rebuild``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import batched
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Q
+
+from micboard.models.locations.structure import Location
+from micboard.models.monitoring.group import MonitoringGroup, MonitoringGroupLocation
+from micboard.models.monitoring.location_access import LocationAccessGrant
+
+MAX_REFRESH_USERS_PER_QUERY = 500
+
+_GroupMembership = MonitoringGroup.users.through
+
+
+@dataclass(frozen=True, slots=True)
+class LocationAccessRefresh:
+    """Rows written by one closure refresh."""
+
+    users: int = 0
+    created: int = 0
+    deleted: int = 0
+
+    def __add__(self, other: LocationAccessRefresh) -> LocationAccessRefresh:
+        return LocationAccessRefresh(
+            users=self.users + other.users,
+            created=self.created + other.created,
+            deleted=self.deleted + other.deleted,
+        )
+
+
+class LocationAccessService:
+    """Compute and apply the access closure for selected users."""
+
+    @classmethod
+    def refresh_users(
+        cls,
+        user_ids: Iterable[int | None],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> LocationAccessRefresh:
+        """Bring the stored grants of ``user_ids`` in line with their groups."""
+        identifiers = sorted({user_id for user_id in user_ids if user_id is not None})
+        result = LocationAccessRefresh()
+        for chunk in batched(identifiers, MAX_REFRESH_USERS_PER_QUERY, strict=False):
+            with transaction.atomic(using=using):
+                result += cls._refresh_chunk(set(chunk), using=using)
+        return result
+
+    @classmethod
+    def rebuild(cls, *, using: str = DEFAULT_DB_ALIAS) -> LocationAccessRefresh:
+        """Recompute the closure for every group member and current grant holder."""
+        members = _GroupMembership.objects.using(using).values_list("user_id", flat=True)
+        holders = LocationAccessGrant.objects.using(using).values_list("user_id", flat=True)
+        return cls.refresh_users({*members, *holders}, using=using)
+
+    @staticmethod
+    def users_of_groups(
+        group_ids: Iterable[int],
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> set[int]:
+        """Return the members of ``group_ids``, active or not."""
+        identifiers = list(group_ids)
+        if not identifiers:
+            return set()
+        return set(
+            _GroupMembership.objects.using(using)
+            .filter(monitoringgroup_id__in=identifiers)
+            .values_list("user_id", flat=True)
+        )
+
+    @classmethod
+    def users_for_location(
+        cls,
+        location: Location,
+        *,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> set[int]:
+        """Return users whose access to ``location`` may have changed."""
+        group_ids = (
+            MonitoringGroupLocation.objects.using(using)
+            .filter(
+                Q(location_id=location.pk)
+                | Q(location__building_id=location.building_id, include_all_rooms=True)
+            )
+            .values_list("monitoring_group_id", flat=True)
+        )
+        holders = (
+            LocationAccessGrant.objects.using(using)
+            .filter(location_id=location.pk)
+            .values_list("user_id", flat=True)
+        )
+        return cls.users_of_groups(set(group_ids), using=using) | set(holders)
+
+    @classmethod
+    def _refresh_chunk(cls, user_ids: set[int], *, using: str) -> LocationAccessRefresh:
+        desired = cls._desired_grants(user_ids, using=using)
+        existing = {
+            (user_id, location_id): (pk, building_id, room_id)
+            for pk, user_id, location_id, building_id, room_id in LocationAccessGrant.objects.using(
+                using
+            )
+            .filter(user_id__in=user_ids)
+            .values_list("pk", "user_id", "location_id", "building_id", "room_id")
+        }
+        stale = [
+            pk
+            for key, (pk, building_id, room_id) in existing.items()
+            if desired.get(key) != (building_id, room_id)
+        ]
+        missing = [
+            LocationAccessGrant(
+                user_id=user_id,
+                location_id=location_id,
+                building_id=building_id,
+                room_id=room_id,
+            )
+            for (user_id, location_id), (building_id, room_id) in desired.items()
+            if existing.get((user_id, location_id), (None,))[1:] != (building_id, room_id)
+        ]
+        deleted = 0
+        if stale:
+            deleted, _ = LocationAccessGrant.objects.using(using).filter(pk__in=stale).delete()
+        LocationAccessGrant.objects.using(using).bulk_create(missing)
+        return LocationAccessRefresh(users=len(user_ids), created=len(missing), deleted=deleted)
+
+    @staticmethod
+    def _desired_grants(
+        user_ids: set[int],
+        *,
+        using: str,
+    ) -> dict[tuple[int, int], tuple[int, int | None]]:
+        """Map (user, location) to the location's (building, room) for active access."""
+        users_by_group: dict[int, set[int]] = {}
+        memberships = (
+            _GroupMembership.objects.using(using)
+            .filter(user_id__in=user_ids, monitoringgroup__is_active=True)
+            .values_list("monitoringgroup_id", "user_id")
+        )
+        for group_id, user_id in memberships:
+            users_by_group.setdefault(group_id, set()).add(user_id)
+        if not users_by_group:
+            return {}
+
+        users_by_location: dict[int, set[int]] = {}
+        users_by_building: dict[int, set[int]] = {}
+        links = (
+            MonitoringGroupLocation.objects.using(using)
+            .filter(monitoring_group_id__in=users_by_group)
+            .values_list(
+                "monitoring_group_id",
+                "location_id",
+                "location__building_id",
+                "include_all_rooms",
+            )
+        )
+        for group_id, location_id, building_id, include_all_rooms in links:
+            members = users_by_group[group_id]
+            users_by_location.setdefault(location_id, set()).update(members)
+            if include_all_rooms:
+                users_by_building.setdefault(building_id, set()).update(members)
+        if not users_by_location:
+            return {}
+
+        locations = (
+            Location.objects.using(using)
+            .filter(is_active=True)
+            .filter(Q(pk__in=users_by_location) | Q(building_id__in=users_by_building))
+            .values_list("pk", "building_id", "room_id")
+        )
+        desired: dict[tuple[int, int], tuple[int, int | None]] = {}
+        for location_id, building_id, room_id in locations:
+            granted = users_by_location.get(location_id, set()) | users_by_building.get(
+                building_id, set()
+            )
+            for user_id in granted:
+                desired[(user_id, location_id)] = (building_id, room_id)
+        return desired
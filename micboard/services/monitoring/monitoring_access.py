@@ -15,7 +15,9 @@ from micboard.models.hardware.charger import Charger, ChargerSlot
 from micboard.models.hardware.display_wall import DisplayWall, WallSection
 from micboard.models.locations.structure import Building, Location, Room
 from micboard.models.monitoring.group import MonitoringGroup
+from micboard.models.monitoring.location_access import LocationAccessGrant
 from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.multitenancy.context import tenant_context_for_user
 from micboard.services.settings.settings_service import settings as micboard_settings
 from micboard.services.shared.access_policy import has_unrestricted_tenant_access
 
@@ -36,7 +38,7 @@ class MonitoringService:
         tenant_queryset: QuerySet = TenantOptimizedQuerySet(
             queryset.model,
             using=queryset.db,
-        ).for_user(user=user)
+        ).for_context(tenant_context_for_user(user))
         return queryset.filter(pk__in=tenant_queryset.values("pk"))
 
     @staticmethod
@@ -50,11 +52,9 @@ class MonitoringService:
         if not (micboard_settings.msp_enabled or micboard_settings.multi_site_mode):
             return groups
 
-        from micboard.models.base_managers import TenantOptimizedQuerySet
-
-        building_ids: QuerySet[Any] = (
-            TenantOptimizedQuerySet(Building).for_user(user=user).values("pk")
-        )
+        building_ids = tenant_context_for_user(user).visible_buildings()
+        if building_ids is None:
+            building_ids = Building.objects.values("pk")
         return groups.filter(
             Q(locations__building_id__in=building_ids)
             | Q(channels__chassis__location__building_id__in=building_ids)
@@ -65,44 +65,41 @@ class MonitoringService:
             )
         ).distinct()
 
+    @staticmethod
+    def _location_grants(user: Any) -> QuerySet[LocationAccessGrant]:
+        """Return the user's materialized location grants inside the tenant boundary."""
+        user_id = getattr(user, "pk", None)
+        if user_id is None:
+            return LocationAccessGrant.objects.none()
+        grants = LocationAccessGrant.objects.filter(user_id=user_id)
+        if micboard_settings.msp_enabled or micboard_settings.multi_site_mode:
+            building_ids = tenant_context_for_user(user).visible_buildings()
+            if building_ids is not None:
+                grants = grants.filter(building_id__in=building_ids)
+        return grants
+
     @staticmethod
     def get_accessible_locations(user: Any) -> QuerySet[Location]:
         """Get all locations a user has access to via monitoring groups."""
         if getattr(user, "is_superuser", False):
             visible_locations = Location.objects.filter(is_active=True)
-        else:
-            groups = MonitoringService.get_user_monitoring_groups(user)
-
-            # Locations explicitly assigned to groups
-            assigned_locations = Location.objects.filter(
-                monitoring_groups__in=groups,
-                is_active=True,
-            )
+            return MonitoringService._apply_tenant_scope(visible_locations, user=user)
 
-            # Buildings where group has 'include_all_rooms' access
-            all_room_buildings = groups.filter(
-                monitoringgrouplocation__include_all_rooms=True
-            ).values_list("monitoringgrouplocation__location__building", flat=True)
-
-            if all_room_buildings:
-                building_locations = Location.objects.filter(
-                    building_id__in=all_room_buildings,
-                    is_active=True,
-                )
-                visible_locations = (assigned_locations | building_locations).distinct()
-            else:
-                visible_locations = assigned_locations.distinct()
-
-        return MonitoringService._apply_tenant_scope(visible_locations, user=user)
+        # Grants are unique per (user, location), so no DISTINCT is needed.
+        grants = MonitoringService._location_grants(user)
+        return Location.objects.filter(pk__in=grants.values("location_id"))
 
     @staticmethod
     def get_accessible_buildings(user: Any) -> QuerySet[Building]:
         """Get buildings containing at least one location visible to the user."""
         if has_unrestricted_tenant_access(user):
             visible_buildings = Building.objects.all()
-        else:
+        elif getattr(user, "is_superuser", False):
             locations = MonitoringService.get_accessible_locations(user)
             visible_buildings = Building.objects.filter(locations__in=locations).distinct()
+        else:
+            grants = MonitoringService._location_grants(user)
+            return Building.objects.filter(pk__in=grants.values("building_id"))
         return MonitoringService._apply_tenant_scope(visible_buildings, user=user)
 
     @staticmethod
@@ -110,9 +107,12 @@ class MonitoringService:
         """Get rooms containing at least one location visible to the user."""
         if has_unrestricted_tenant_access(user):
             visible_rooms = Room.objects.all()
-        else:
+        elif getattr(user, "is_superuser", False):
             locations = MonitoringService.get_accessible_locations(user)
             visible_rooms = Room.objects.filter(locations__in=locations).distinct()
+        else:
+            grants = MonitoringService._location_grants(user).filter(room_id__isnull=False)
+            return Room.objects.filter(pk__in=grants.values("room_id"))
         return MonitoringService._apply_tenant_scope(visible_rooms, user=user)
 
     @staticmethod
@@ -127,8 +127,8 @@ class MonitoringService:
             explicit_channels = RFChannel.objects.filter(monitoring_groups__in=groups)
 
             # 2. Channels in accessible locations
-            locations = MonitoringService.get_accessible_locations(user)
-            location_channels = RFChannel.objects.filter(chassis__location__in=locations)
+            location_ids = MonitoringService._location_grants(user).values("location_id")
+            location_channels = RFChannel.objects.filter(chassis__location_id__in=location_ids)
 
             visible_channels = (explicit_channels | location_channels).distinct()
         return MonitoringService._apply_tenant_scope(visible_channels, user=user)
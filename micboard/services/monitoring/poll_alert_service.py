@@ -10,6 +10,10 @@ from django.core.cache import cache
 from pydantic import Field
 
 from micboard.models.hardware.wireless_unit import WirelessUnit
+from micboard.services.monitoring.alert_evaluation_engine import (
+    AlertEvaluationEngine,
+    AlertEvaluationOutcome,
+)
 from micboard.services.monitoring.alert_fanout_dtos import (
     HARD_ALERT_MAX_ASSIGNMENTS,
     HARD_ALERT_MAX_DELIVERIES,
@@ -29,6 +33,7 @@ logger = logging.getLogger(__name__)
 DEFAULT_POLL_ALERT_MAX_UNITS = 100
 HARD_POLL_ALERT_MAX_UNITS = 500
 POLL_ALERT_CURSOR_TIMEOUT_SECONDS = 7 * 24 * 60 * 60
+POLL_ALERT_ENGINES = frozenset({"batched", "per_unit"})
 
 
 class PollAlertScanResult(PydanticBaseDTO):
@@ -45,6 +50,8 @@ class PollAlertScanResult(PydanticBaseDTO):
     assignments_truncated: bool
     recipients_truncated: bool
     deliveries_truncated: bool
+    batched: int = Field(default=0, ge=0, le=HARD_POLL_ALERT_MAX_UNITS)
+    evaluation_seconds: float = Field(default=0.0, ge=0)
 
 
 class PollAlertService:
@@ -55,24 +62,12 @@ class PollAlertService:
         """Evaluate assigned units without allowing an unbounded post-poll scan."""
         limit = cls._scan_limit()
         cursor = cls._read_cursor(manufacturer.pk)
-        candidates = WirelessUnit.objects.filter(
-            manufacturer=manufacturer,
-            performer_assignments__is_active=True,
-            performer_assignments__monitoring_group__is_active=True,
-            performer_assignments__monitoring_group__users__is_active=True,
-        ).distinct()
-        after_cursor = list(candidates.filter(pk__gt=cursor).order_by("pk")[: limit + 1])
-        bounded_units = after_cursor[:limit]
-        truncated = len(after_cursor) > limit
-
-        if not truncated and cursor > 0:
-            remaining = limit - len(bounded_units)
-            wrapped = list(candidates.filter(pk__lte=cursor).order_by("pk")[: remaining + 1])
-            bounded_units.extend(wrapped[:remaining])
-            truncated = len(wrapped) > remaining
+        bounded_units, truncated = cls._bounded_page(manufacturer, cursor=cursor, limit=limit)
 
         failed = 0
         scanned = 0
+        batched = 0
+        evaluation_seconds = 0.0
         budget = AlertFanoutBudget.from_settings()
         transmitter_first = cls._read_scope_cursor(manufacturer.pk)
         checks = (
@@ -89,7 +84,27 @@ class PollAlertService:
         if bounded_units:
             cls._write_scope_cursor(manufacturer.pk, transmitter_first=not transmitter_first)
 
-        for unit in bounded_units:
+        remaining_units = bounded_units
+        if bounded_units and cls._engine() == "batched":
+            outcome = cls._evaluate_batch(
+                manufacturer,
+                bounded_units,
+                budget=budget,
+                transmitter_first=transmitter_first,
+                cursor=cursor,
+            )
+            if outcome is not None:
+                budget = outcome.budget
+                batched = len(outcome.evaluated_units)
+                scanned = batched
+                evaluation_seconds = outcome.elapsed_seconds
+                remaining_units = bounded_units[batched:]
+                if batched:
+                    cls._write_cursor(manufacturer.pk, bounded_units[batched - 1].pk)
+
+        for unit in remaining_units:
+            if budget.truncated or budget.exhausted:
+                break
             try:
                 for check in checks:
                     check(unit, budget=budget)
@@ -104,9 +119,6 @@ class PollAlertService:
                 scanned += 1
                 cls._write_cursor(manufacturer.pk, unit.pk)
 
-            if budget.truncated or budget.exhausted:
-                break
-
         units_truncated = truncated or scanned < len(bounded_units)
 
         if units_truncated:
@@ -128,7 +140,64 @@ class PollAlertService:
             assignments_truncated=budget.assignments_truncated,
             recipients_truncated=budget.recipients_truncated,
             deliveries_truncated=budget.deliveries_truncated,
+            batched=batched,
+            evaluation_seconds=evaluation_seconds,
+        )
+
+    @staticmethod
+    def _bounded_page(
+        manufacturer: Manufacturer,
+        *,
+        cursor: int,
+        limit: int,
+    ) -> tuple[list[WirelessUnit], bool]:
+        """Return the next circular page of alert-eligible units and whether more remain."""
+        candidates = (
+            WirelessUnit.objects.select_related("assigned_resource__chassis")
+            .filter(
+                manufacturer=manufacturer,
+                performer_assignments__is_active=True,
+                performer_assignments__monitoring_group__is_active=True,
+                performer_assignments__monitoring_group__users__is_active=True,
+            )
+            .distinct()
         )
+        after_cursor = list(candidates.filter(pk__gt=cursor).order_by("pk")[: limit + 1])
+        bounded_units = after_cursor[:limit]
+        truncated = len(after_cursor) > limit
+
+        if not truncated and cursor > 0:
+            remaining = limit - len(bounded_units)
+            wrapped = list(candidates.filter(pk__lte=cursor).order_by("pk")[: remaining + 1])
+            bounded_units.extend(wrapped[:remaining])
+            truncated = len(wrapped) > remaining
+        return bounded_units, truncated
+
+    @classmethod
+    def _evaluate_batch(
+        cls,
+        manufacturer: Manufacturer,
+        units: list[WirelessUnit],
+        *,
+        budget: AlertFanoutBudget,
+        transmitter_first: bool,
+        cursor: int,
+    ) -> AlertEvaluationOutcome | None:
+        """Run the batched engine on a budget copy so a failure leaves the page intact."""
+        scopes = ("transmitter", "offline") if transmitter_first else ("offline", "transmitter")
+        try:
+            return AlertEvaluationEngine(
+                budget=budget.model_copy(),
+                scopes=scopes,
+                unit_cursor=cursor,
+            ).evaluate(units)
+        except Exception as exc:
+            logger.exception(
+                "Batched alert evaluation failed for manufacturer %s; using per-unit checks",
+                manufacturer.pk,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return None
 
     @staticmethod
     def _cursor_key(manufacturer_id: int) -> str:
@@ -200,6 +269,12 @@ class PollAlertService:
                 exc_info=sanitized_exception_info(exc),
             )
 
+    @staticmethod
+    def _engine() -> str:
+        """Return the configured evaluation engine, defaulting to batched evaluation."""
+        engine = micboard_settings.get("MICBOARD_POLL_ALERT_ENGINE", "batched")
+        return engine if engine in POLL_ALERT_ENGINES else "batched"
+
     @staticmethod
     def _scan_limit() -> int:
         raw_limit = micboard_settings.get(
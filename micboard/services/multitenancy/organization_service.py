@@ -4,12 +4,13 @@ from typing import Any
 
 
 def get_device_count(organization: Any) -> int:
-    """Return the device count for an organization."""
-    from micboard.models.hardware.wireless_chassis import WirelessChassis
+    """Return the maintained chassis count for an organization."""
+    from micboard.models.monitoring.inventory_counter import InventoryCounter
+    from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
 
-    return WirelessChassis.objects.filter(
-        location__building__organization_id=organization.pk,
-    ).count()
+    return InventoryCounterService.totals(
+        InventoryCounter.Scope.ORGANIZATION, organization.pk
+    ).devices
 
 
 def set_created_by(obj: Any, user: Any) -> Any:
@@ -345,3 +345,20 @@ class BroadcastService:
             campus_id=scope[1] if scope else None,
             site_id=site_id,
         )
+
+    @classmethod
+    def broadcast_fragment_change(
+        cls,
+        *,
+        fragment: str,
+        scopes: Iterable[TenantScope] = (),
+        site_ids: Iterable[int] = (),
+    ) -> None:
+        """Tell screens in the owning tenants that a live fragment has new rows."""
+        event = {"type": "fragment_change", "fragment": fragment}
+        if micboard_settings.msp_enabled:
+            cls._send_for_scopes(event, scopes)
+        elif micboard_settings.multi_site_mode:
+            cls._send_for_sites(event, site_ids)
+        else:
+            cls._send_for_scope(event)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 import secrets
-from collections.abc import Iterator, Mapping, Sequence
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from itertools import islice
 from typing import TYPE_CHECKING, Any
 
@@ -14,6 +15,7 @@ from django.utils import timezone
 from pydantic import ValidationError
 
 from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.models.hardware.wireless_unit import WirelessUnit
 from micboard.services.notification.broadcast_service import BroadcastService
 from micboard.services.notification.device_broadcast_dtos import (
     MAX_DEVICE_BROADCAST_ROWS,
@@ -29,6 +31,22 @@ logger = logging.getLogger(__name__)
 
 DEVICE_BROADCAST_CURSOR_TIMEOUT_SECONDS = 7 * 24 * 60 * 60
 DEVICE_BROADCAST_FIELDS = ("id", "api_device_id", "name", "ip", "status", "model")
+# Unit columns pushed per slot, keyed by the field names the legacy channel view reads.
+# ``channel`` is the unit's slot on its chassis; the view maps it, with the receiver IP,
+# to the global tile slot it configured, so it is deliberately not sent as ``slot``.
+DEVICE_SLOT_FIELDS = {
+    "channel": "slot",
+    "name": "name",
+    "status": "status",
+    "battery": "battery",
+    "runtime": "battery_runtime",
+    "antenna": "antenna",
+    "tx_offset": "tx_offset",
+    "quality": "quality",
+    "frequency": "frequency",
+    "audio_level": "audio_level",
+    "rf_level": "rf_level",
+}
 
 
 class DeviceSnapshotBroadcastService:
@@ -64,11 +82,12 @@ class DeviceSnapshotBroadcastService:
         for chunk_index, (chunk, is_final) in enumerate(
             cls._iter_chunks(iter(bounded_rows), chunk_size=chunk_size)
         ):
+            slots = cls.slot_states(row["id"] for row in chunk)
             BroadcastService.broadcast_device_update(
                 manufacturer=manufacturer,
                 data={
                     "manufacturer_code": manufacturer.code,
-                    "receivers": [cls._serialize(row) for row in chunk],
+                    "receivers": [cls._serialize(row, slots.get(row["id"])) for row in chunk],
                     "timestamp": timestamp,
                     "snapshot_id": snapshot_id,
                     "chunk_index": chunk_index,
@@ -116,7 +135,25 @@ class DeviceSnapshotBroadcastService:
         return list(projection[: max_devices + 1]), state
 
     @staticmethod
-    def _serialize(row: Mapping[str, Any]) -> dict[str, Any]:
+    def slot_states(chassis_ids: Iterable[int]) -> dict[int, list[dict[str, Any]]]:
+        """Return each chassis' field units as per-slot states, in one query."""
+        states: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        rows = (
+            WirelessUnit.objects.filter(base_chassis_id__in=set(chassis_ids))
+            .order_by("base_chassis_id", "slot", "pk")
+            .values("base_chassis_id", *DEVICE_SLOT_FIELDS.values())
+        )
+        for row in rows:
+            states[row["base_chassis_id"]].append(
+                {key: row[column] for key, column in DEVICE_SLOT_FIELDS.items()}
+            )
+        return dict(states)
+
+    @staticmethod
+    def _serialize(
+        row: Mapping[str, Any],
+        tx: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
         return {
             "id": row["id"],
             "api_device_id": row["api_device_id"],
@@ -124,6 +161,7 @@ class DeviceSnapshotBroadcastService:
             "ip": str(row["ip"]) if row["ip"] else None,
             "status": row["status"],
             "model": row["model"],
+            "tx": tx or [],
         }
 
     @staticmethod
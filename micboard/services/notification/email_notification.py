@@ -17,6 +17,8 @@ from django.utils import timezone
 from micboard.utils.exception_logging import sanitized_exception_info
 
 if TYPE_CHECKING:  # pragma: no cover
+    from django.core.mail.backends.base import BaseEmailBackend
+
     from micboard.models.monitoring.alert import Alert
 
 logger = logging.getLogger(__name__)
@@ -50,29 +52,7 @@ class EmailService:
             return False
 
         try:
-            subject = f"Micboard Alert: {alert.get_alert_type_display()}"
-            context = {
-                "alert": alert,
-                "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
-                "timestamp": timezone.now(),
-            }
-
-            # Render HTML email
-            html_message = render_to_string("micboard/emails/alert_notification.html", context)
-            # Render plain text fallback
-            text_message = render_to_string("micboard/emails/alert_notification.txt", context)
-
-            email = EmailMessage(
-                subject=subject,
-                body=text_message,
-                from_email=self._get_from_email(),
-                to=recipients,
-                connection=self.connection,
-            )
-            # Set HTML alternative
-            email.content_subtype = "html"
-            email.body = html_message
-
+            email = self.build_alert_message(alert, recipients, connection=self.connection)
             sent = email.send()
             if sent:
                 logger.info(
@@ -91,6 +71,47 @@ class EmailService:
             )
             return False
 
+    def build_alert_message(
+        self,
+        alert: Alert,
+        recipients: list[str],
+        *,
+        connection: BaseEmailBackend | None = None,
+    ) -> EmailMessage:
+        """Render one alert email without sending it.
+
+        Args:
+            alert: Alert instance
+            recipients: List of email addresses
+            connection: Backend the message should be sent through
+
+        Returns:
+            EmailMessage: HTML message ready for ``send()`` or ``send_messages()``
+        """
+        subject = f"Micboard Alert: {alert.get_alert_type_display()}"
+        context = {
+            "alert": alert,
+            "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
+            "timestamp": timezone.now(),
+        }
+
+        # Render HTML email
+        html_message = render_to_string("micboard/emails/alert_notification.html", context)
+        # Render plain text fallback
+        text_message = render_to_string("micboard/emails/alert_notification.txt", context)
+
+        email = EmailMessage(
+            subject=subject,
+            body=text_message,
+            from_email=self._get_from_email(),
+            to=recipients,
+            connection=connection,
+        )
+        # Set HTML alternative
+        email.content_subtype = "html"
+        email.body = html_message
+        return email
+
     def _get_default_recipients(self) -> list[str]:
         """Get default email recipients from settings."""
         from micboard.services.settings.settings_service import settings as micboard_settings
@@ -0,0 +1,110 @@
+"""Change notices that let live HTMX fragments refresh only when their rows changed."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from functools import partial
+
+from django.db import models, transaction
+
+from micboard.models.hardware.charger import Charger
+from micboard.models.hardware.wireless_unit import WirelessUnit
+from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.services.notification.broadcast_service import BroadcastService
+from micboard.services.notification.realtime_routing_service import TenantScope
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+ALERTS_FRAGMENT = "alerts"
+ASSIGNMENTS_FRAGMENT = "assignments"
+CHARGERS_FRAGMENT = "chargers"
+
+# Each fragment is routed through the model that owns its rows and that model's
+# path to the tenant building.
+_FRAGMENT_OWNERS: dict[str, tuple[type[models.Model], str]] = {
+    ALERTS_FRAGMENT: (RFChannel, "chassis__location__building"),
+    ASSIGNMENTS_FRAGMENT: (WirelessUnit, "base_chassis__location__building"),
+    CHARGERS_FRAGMENT: (Charger, "location__building"),
+}
+
+
+class LiveFragmentService:
+    """Announce alert, assignment, and charger slot changes to their tenant's screens.
+
+    Notices carry only the fragment name; each screen refetches its own scoped
+    fragment. Notices are sent after commit so a rolled-back write never refreshes.
+    """
+
+    @classmethod
+    def alerts_changed(cls, channel_ids: Iterable[int | None]) -> None:
+        """Announce changed alerts by the RF channels they were raised on."""
+        cls._announce_on_commit(ALERTS_FRAGMENT, channel_ids)
+
+    @classmethod
+    def assignments_changed(cls, wireless_unit_ids: Iterable[int | None]) -> None:
+        """Announce changed performer assignments by their wireless units."""
+        cls._announce_on_commit(ASSIGNMENTS_FRAGMENT, wireless_unit_ids)
+
+    @classmethod
+    def chargers_changed(cls, charger_ids: Iterable[int | None]) -> None:
+        """Announce changed charger slots by their chargers."""
+        cls._announce_on_commit(CHARGERS_FRAGMENT, charger_ids)
+
+    @classmethod
+    def announce(cls, fragment: str, owner_ids: frozenset[int]) -> None:
+        """Send one change notice for a fragment to every route owning the rows."""
+        if not (micboard_settings.msp_enabled or micboard_settings.multi_site_mode):
+            BroadcastService.broadcast_fragment_change(fragment=fragment)
+            return
+        scopes, site_ids = cls._routes(fragment, owner_ids)
+        BroadcastService.broadcast_fragment_change(
+            fragment=fragment,
+            scopes=scopes,
+            site_ids=site_ids,
+        )
+
+    @classmethod
+    def _announce_on_commit(cls, fragment: str, owner_ids: Iterable[int | None]) -> None:
+        identifiers = frozenset(owner_id for owner_id in owner_ids if owner_id is not None)
+        if identifiers:
+            transaction.on_commit(partial(cls.announce, fragment, identifiers), robust=True)
+
+    @staticmethod
+    def _routes(
+        fragment: str,
+        owner_ids: frozenset[int],
+    ) -> tuple[tuple[TenantScope, ...], tuple[int, ...]]:
+        """Resolve owner rows to tenant scopes and Django Sites in one query."""
+        model, building = _FRAGMENT_OWNERS[fragment]
+        try:
+            rows = (
+                model._default_manager.filter(pk__in=owner_ids)
+                .values_list(
+                    f"{building}__organization_id",
+                    f"{building}__campus_id",
+                    f"{building}__site_id",
+                )
+                .distinct()
+            )
+            routes = list(rows)
+        except Exception as exc:
+            logger.exception(
+                "Failed to resolve live fragment routes: fragment=%s",
+                fragment,
+                exc_info=sanitized_exception_info(exc),
+            )
+            return (), ()
+        scopes = tuple(
+            dict.fromkeys(
+                (organization_id, campus_id)
+                for organization_id, campus_id, _site_id in routes
+                if organization_id is not None
+            )
+        )
+        site_ids = tuple(
+            dict.fromkeys(site_id for _org, _campus, site_id in routes if site_id is not None)
+        )
+        return scopes, site_ids
@@ -9,6 +9,9 @@ from asgiref.sync import sync_to_async
 
 from micboard.models.hardware.wireless_chassis import WirelessChassis
 from micboard.services.notification.broadcast_service import BroadcastService
+from micboard.services.notification.device_broadcast_service import (
+    DeviceSnapshotBroadcastService,
+)
 from micboard.services.realtime.subscription_supervisor import (
     RealtimeSubscriptionSupervisor,
 )
@@ -159,13 +162,24 @@ class RealtimeSubscriptionLifecycleService:
             manufacturer=manufacturer,
             api_device_id=api_device_id,
         )
+        slots = DeviceSnapshotBroadcastService.slot_states((chassis.id,))
         BroadcastService.broadcast_device_update(
             manufacturer=manufacturer,
-            data={"receivers": [RealtimeSubscriptionLifecycleService._project_chassis(chassis)]},
+            data={
+                "receivers": [
+                    RealtimeSubscriptionLifecycleService._project_chassis(
+                        chassis,
+                        slots.get(chassis.id, []),
+                    )
+                ]
+            },
         )
 
     @staticmethod
-    def _project_chassis(chassis: WirelessChassis) -> dict[str, Any]:
+    def _project_chassis(
+        chassis: WirelessChassis,
+        tx: list[dict[str, Any]],
+    ) -> dict[str, Any]:
         """Return the stable primitive receiver projection used by realtime broadcasts."""
         return {
             "id": chassis.id,
@@ -174,4 +188,5 @@ class RealtimeSubscriptionLifecycleService:
             "ip": str(chassis.ip) if chassis.ip else None,
             "status": chassis.status,
             "model": chassis.model,
+            "tx": tx,
         }
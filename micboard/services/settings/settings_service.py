@@ -10,7 +10,7 @@ from typing import Any
 
 from micboard.services.settings.registry import SettingsRegistry
 from micboard.settings.defaults import DEFAULT_CONFIG
-from micboard.settings.deployment_controls import deployment_controls
+from micboard.settings.deployment_controls import bounded_int, deployment_controls
 
 _NOT_FOUND = object()
 
@@ -106,6 +106,16 @@ class SettingsService:
 
         return default
 
+    def get_bounded_int(self, key: str, *, default: int, hard_limit: int, minimum: int = 1) -> int:
+        """Resolve an integer setting clamped between *minimum* and its package hard limit.
+
+        Package hard limits keep host configuration from requesting unbounded work;
+        booleans and unparsable values fall back to *default*.
+        """
+        return bounded_int(
+            self.get(key, default), default=default, hard_limit=hard_limit, minimum=minimum
+        )
+
     def get_config_dict(self) -> dict[str, Any]:
         """Return ``MICBOARD_CONFIG`` merged with package defaults."""
         micboard_config = deployment_controls.get("MICBOARD_CONFIG", {})
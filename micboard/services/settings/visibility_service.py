@@ -8,9 +8,9 @@ from django.apps import apps
 from django.conf import settings as django_settings
 from django.db.models import F, Q
 
+from micboard.multitenancy.context import TENANT_ADMIN_ROLES
 from micboard.services.settings.dtos import SettingsVisibilityScope
 from micboard.services.settings.settings_service import settings as micboard_settings
-from micboard.services.shared.access_policy import TENANT_ADMIN_ROLES
 from micboard.settings.scope_policy import (
     resolve_scope,
 )
@@ -10,10 +10,9 @@ from django.db import models
 from django.db.models import Exists, F, OuterRef, Q
 
 from micboard.models.base_managers import TenantOptimizedQuerySet
+from micboard.multitenancy.context import TENANT_ADMIN_ROLES, tenant_context_for_user
 from micboard.services.settings.settings_service import settings as micboard_settings
 
-TENANT_ADMIN_ROLES = frozenset({"admin", "owner"})
-
 # Explicit host-wide administration surfaces. These models do not carry a
 # tenant key, so only a platform superuser may mutate them in tenant-aware
 # deployments. Every new entry requires an ownership review.
@@ -68,12 +67,13 @@ class TenantRoleAccessService:
         if not micboard_settings.msp_enabled or not apps.is_installed("micboard.multitenancy"):
             return []
 
+        user_database = getattr(getattr(user, "_state", None), "db", None)
+        if using is None or using == user_database:
+            return tenant_context_for_user(user).management_scopes(cls.management_roles)
+
         from micboard.multitenancy.models import OrganizationMembership
 
-        database = using or getattr(getattr(user, "_state", None), "db", None)
-        membership_manager = OrganizationMembership._default_manager
-        if database is not None:
-            membership_manager = membership_manager.db_manager(database)
+        membership_manager = OrganizationMembership._default_manager.db_manager(using)
         memberships = membership_manager.filter(
             Q(campus__isnull=True)
             | Q(
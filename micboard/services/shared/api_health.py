@@ -31,6 +31,8 @@ _MANUFACTURER_STATUSES = frozenset(
     {"healthy", "unhealthy", "degraded", "offline", "error", "unknown"}
 )
 _FAILURE_STATUSES = frozenset({"unhealthy", "degraded", "offline", "error"})
+_SNAPSHOT_SOURCES = frozenset({"probe", "traffic"})
+_BREAKER_STATES = frozenset({"closed", "open", "half-open"})
 
 
 def _normalize_status(value: object) -> ManufacturerHealthStatus:
@@ -42,20 +44,41 @@ def _normalize_status(value: object) -> ManufacturerHealthStatus:
     return cast(ManufacturerHealthStatus, normalized)
 
 
+def _non_negative_number(value: object, *, maximum: float = float("inf")) -> float | None:
+    if (
+        isinstance(value, int | float)
+        and not isinstance(value, bool)
+        and isfinite(value)
+        and 0 <= value <= maximum
+    ):
+        return value
+    return None
+
+
+def _traffic_fields(value: Mapping[Any, Any]) -> dict[str, Any]:
+    """Return the validated rolling-window fields of a traffic snapshot."""
+    requests = value.get("requests")
+    source = value.get("source")
+    breaker_state = value.get("breaker_state")
+    return {
+        "source": source if isinstance(source, str) and source in _SNAPSHOT_SOURCES else None,
+        "requests": requests
+        if isinstance(requests, int) and not isinstance(requests, bool) and requests >= 0
+        else None,
+        "error_rate": _non_negative_number(value.get("error_rate"), maximum=1),
+        "p95_response_time": _non_negative_number(value.get("p95_response_time")),
+        "breaker_state": breaker_state
+        if isinstance(breaker_state, str) and breaker_state in _BREAKER_STATES
+        else None,
+    }
+
+
 def sanitize_public_api_health_snapshot(value: object) -> PublicAPIHealthSnapshot:
     """Project arbitrary producer data onto bounded, secret-safe public fields."""
     if not isinstance(value, Mapping):
         return PublicAPIHealthSnapshot(status="unknown")
 
-    raw_response_time = value.get("response_time")
-    response_time = (
-        raw_response_time
-        if isinstance(raw_response_time, int | float)
-        and not isinstance(raw_response_time, bool)
-        and isfinite(raw_response_time)
-        and raw_response_time >= 0
-        else None
-    )
+    response_time = _non_negative_number(value.get("response_time"))
     raw_status = value.get("status")
     redacted = redact_secrets(
         {
@@ -72,6 +95,7 @@ def sanitize_public_api_health_snapshot(value: object) -> PublicAPIHealthSnapsho
         status=status,
         response_time=response_time,
         error=error,
+        **_traffic_fields(value),
     )
 
 
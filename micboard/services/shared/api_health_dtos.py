@@ -16,6 +16,8 @@ ManufacturerHealthStatus = Literal[
     "error",
     "unknown",
 ]
+HealthSnapshotSource = Literal["probe", "traffic"]
+CircuitBreakerState = Literal["closed", "open", "half-open"]
 AggregateHealthStatus = Literal["healthy", "unhealthy", "partial", "unknown", "unconfigured"]
 
 PUBLIC_API_HEALTH_ERROR = "API health check failed; details redacted."
@@ -28,6 +30,11 @@ class PublicAPIHealthSnapshot(PydanticBaseDTO):
     status: ManufacturerHealthStatus
     response_time: float | None = Field(default=None, ge=0)
     error: str | None = None
+    source: HealthSnapshotSource | None = None
+    requests: int | None = Field(default=None, ge=0)
+    error_rate: float | None = Field(default=None, ge=0, le=1)
+    p95_response_time: float | None = Field(default=None, ge=0)
+    breaker_state: CircuitBreakerState | None = None
 
     @field_validator("error", mode="before")
     @classmethod
@@ -0,0 +1,174 @@
+"""Passive manufacturer API health derived from real client traffic.
+
+Every vendor request made through ``BaseHTTPClient`` reports its outcome,
+latency, and circuit-breaker state here. Outcomes are kept in a per-process
+rolling window per manufacturer code. At most once every
+``MICBOARD_API_HEALTH_PUBLISH_SECONDS`` the window is summarized into a public
+snapshot (error rate, p50/p95 latency, breaker state) and written to the cache
+read by ``get_api_health``. Publishing touches only the cache, so traffic from
+realtime subscription setup running inside an event loop is recorded safely.
+
+The scheduled ``check_manufacturer_api_health`` task persists and broadcasts a
+traffic snapshot when one is fresh and only probes the vendor API when no
+organic traffic was seen within ``MICBOARD_API_HEALTH_WINDOW_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from django.core.cache import cache
+
+from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+API_TRAFFIC_HEALTH_CACHE_PREFIX = "micboard:api-health:traffic:v1:"
+DEFAULT_API_HEALTH_WINDOW_SECONDS = 300
+HARD_API_HEALTH_WINDOW_SECONDS = 3_600
+DEFAULT_API_HEALTH_PUBLISH_SECONDS = 30
+HARD_API_HEALTH_PUBLISH_SECONDS = 600
+MAX_WINDOW_SAMPLES = 2_048
+DEGRADED_ERROR_RATE = 0.05
+UNHEALTHY_ERROR_RATE = 0.5
+
+
+def window_seconds() -> int:
+    """Return how long observed traffic counts toward a manufacturer's health."""
+    return micboard_settings.get_bounded_int(
+        "MICBOARD_API_HEALTH_WINDOW_SECONDS",
+        default=DEFAULT_API_HEALTH_WINDOW_SECONDS,
+        hard_limit=HARD_API_HEALTH_WINDOW_SECONDS,
+    )
+
+
+def _publish_seconds() -> int:
+    return micboard_settings.get_bounded_int(
+        "MICBOARD_API_HEALTH_PUBLISH_SECONDS",
+        default=DEFAULT_API_HEALTH_PUBLISH_SECONDS,
+        hard_limit=HARD_API_HEALTH_PUBLISH_SECONDS,
+    )
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class _TrafficWindow:
+    """Recent request outcomes for one manufacturer code."""
+
+    samples: deque[tuple[float, float | None, bool]] = field(
+        default_factory=lambda: deque(maxlen=MAX_WINDOW_SAMPLES)
+    )
+    breaker_state: str = "closed"
+    last_publish: float = -math.inf
+
+    def prune(self, now: float, horizon: int) -> None:
+        while self.samples and now - self.samples[0][0] > horizon:
+            self.samples.popleft()
+
+    def snapshot(self) -> dict[str, Any]:
+        requests = len(self.samples)
+        failures = sum(not ok for _at, _latency, ok in self.samples)
+        latencies = sorted(
+            latency for _at, latency, ok in self.samples if ok and latency is not None
+        )
+        error_rate = failures / requests if requests else 0.0
+        if self.breaker_state == "open":
+            status = "offline"
+        elif error_rate >= UNHEALTHY_ERROR_RATE:
+            status = "unhealthy"
+        elif error_rate >= DEGRADED_ERROR_RATE or self.breaker_state == "half-open":
+            status = "degraded"
+        else:
+            status = "healthy"
+        return {
+            "status": status,
+            "source": "traffic",
+            "requests": requests,
+            "error_rate": round(error_rate, 4),
+            "response_time": _percentile(latencies, 0.5) if latencies else None,
+            "p95_response_time": _percentile(latencies, 0.95) if latencies else None,
+            "breaker_state": self.breaker_state,
+        }
+
+
+class APITrafficHealth:
+    """Process-wide rolling windows of manufacturer API request outcomes."""
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _windows: ClassVar[dict[str, _TrafficWindow]] = {}
+
+    @classmethod
+    def observe(
+        cls,
+        code: str,
+        *,
+        ok: bool,
+        latency: float | None,
+        breaker_state: str,
+    ) -> None:
+        """Record one request attempt and publish the window when it is due.
+
+        ``latency`` is in seconds. Failures publishing to the cache are logged
+        and never raised into the request that produced the observation.
+        """
+        now = time.monotonic()
+        horizon = window_seconds()
+        with cls._lock:
+            window = cls._windows.setdefault(code, _TrafficWindow())
+            window.samples.append((now, latency, ok))
+            window.breaker_state = breaker_state
+            window.prune(now, horizon)
+            if now - window.last_publish < _publish_seconds():
+                return
+            window.last_publish = now
+            snapshot = window.snapshot()
+        try:
+            cls._publish(code, snapshot, timeout=horizon)
+        except Exception as exc:
+            logger.warning(
+                "Publishing API traffic health failed for %s",
+                code,
+                exc_info=sanitized_exception_info(exc),
+            )
+
+    @staticmethod
+    def recent_snapshot(code: str) -> dict[str, Any] | None:
+        """Return the last traffic snapshot published by any process, if still fresh."""
+        snapshot = cache.get(f"{API_TRAFFIC_HEALTH_CACHE_PREFIX}{code}")
+        return snapshot if isinstance(snapshot, dict) else None
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget every window held by this process."""
+        with cls._lock:
+            cls._windows.clear()
+
+    @staticmethod
+    def _publish(code: str, snapshot: dict[str, Any], *, timeout: int) -> None:
+        from micboard.services.shared.api_health import (
+            API_HEALTH_AGGREGATE_CACHE_KEY,
+            API_HEALTH_SNAPSHOT_CACHE_PREFIX,
+            sanitize_public_api_health_snapshot,
+        )
+
+        public = sanitize_public_api_health_snapshot(snapshot).model_dump(exclude_none=True)
+        cache.set_many(
+            {
+                f"{API_TRAFFIC_HEALTH_CACHE_PREFIX}{code}": public,
+                f"{API_HEALTH_SNAPSHOT_CACHE_PREFIX}{code}": public,
+            },
+            timeout=timeout,
+        )
+        cache.delete(API_HEALTH_AGGREGATE_CACHE_KEY)
@@ -1,53 +1,216 @@
-"""Rate limiting service logic for micboard."""
+"""Rate limiting service logic for micboard.
+
+Limits use a sliding-window counter: each key keeps one atomic counter per
+fixed window, and the previous window's count is weighted by how much of it
+still overlaps the sliding window. A check costs one ``incr`` and one ``get``
+regardless of the limit, and concurrent requests cannot all read a stale count
+because the increment itself is atomic in Redis, Memcached, and the local
+memory cache. When no cache is configured (the dummy backend), or the cache
+is unavailable, the same algorithm runs against an in-process store instead.
+"""
 
 from __future__ import annotations
 
 import logging
+import math
+import threading
 import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 
-from django.core.cache import cache
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
 from django.http import HttpRequest
 
 logger = logging.getLogger(__name__)
 
+_LOCAL_MAX_KEYS = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitQuota:
+    """One limit to enforce: ``max_requests`` per window plus a ``burst`` allowance."""
+
+    key: str
+    max_requests: int
+    burst: int = 0
+
+    @property
+    def limit(self) -> int:
+        return self.max_requests + max(self.burst, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """Outcome of one rate-limit check across the caller's and any shared quotas."""
+
+    allowed: bool
+    retry_after: int | None = None
+    estimated_requests: float = 0.0
+    limit: int = 0
+    key: str = ""
+
+
+class _LocalCounterStore:
+    """In-process window counters for deployments without a shared cache."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, tuple[int, float]] = {}
+
+    def incr(self, key: str, delta: int, expires_at: float, now: float) -> int:
+        with self._lock:
+            count, expiry = self._counts.get(key, (0, 0.0))
+            if expiry <= now:
+                count = 0
+                if len(self._counts) >= _LOCAL_MAX_KEYS:
+                    self._prune(now)
+            count = max(count + delta, 0)
+            self._counts[key] = (count, expires_at)
+            return count
+
+    def get(self, key: str, now: float) -> int:
+        with self._lock:
+            count, expiry = self._counts.get(key, (0, 0.0))
+            return count if expiry > now else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def _prune(self, now: float) -> None:
+        expired = [key for key, (_count, expiry) in self._counts.items() if expiry <= now]
+        for key in expired:
+            del self._counts[key]
+        if len(self._counts) >= _LOCAL_MAX_KEYS:
+            # Still full of live windows: forget the soonest-expiring half.
+            by_expiry = sorted(self._counts, key=lambda key: self._counts[key][1])
+            for key in by_expiry[: len(by_expiry) // 2]:
+                del self._counts[key]
+
+
+local_counters = _LocalCounterStore()
+
+
+def _uses_shared_cache() -> bool:
+    # ``cache`` is a proxy, so inspect the configured backend itself.
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], DummyCache)
+
+
+def _cache_incr(key: str, delta: int, timeout: int) -> int:
+    if delta < 0:
+        return cache.decr(key, -delta)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # First hit in this window; ``add`` keeps a racing creator's count.
+        cache.add(key, 0, timeout=timeout)
+        return cache.incr(key, delta)
+
+
+def _counter_key(quota: RateLimitQuota, window_seconds: int, window_index: int) -> str:
+    # Window indexes of different window lengths overlap, so keep their counters apart.
+    return f"{quota.key}:{window_seconds}:{window_index}"
+
+
+def _window_counts(
+    quota: RateLimitQuota,
+    window_seconds: int,
+    now: float,
+    *,
+    shared: bool,
+) -> tuple[int, int]:
+    """Count this request in the current window and read the previous window."""
+    window_index = int(now // window_seconds)
+    current_key = _counter_key(quota, window_seconds, window_index)
+    previous_key = _counter_key(quota, window_seconds, window_index - 1)
+    if shared:
+        try:
+            current = _cache_incr(current_key, 1, timeout=2 * window_seconds + 1)
+            previous = int(cache.get(previous_key) or 0)
+        except Exception:
+            logger.debug("Rate limit cache unavailable, using local counters: %s", quota.key)
+        else:
+            return current, previous
+    expires_at = (window_index + 2) * window_seconds
+    current = local_counters.incr(current_key, 1, expires_at, now)
+    return current, local_counters.get(previous_key, now)
+
+
+def _release(quota: RateLimitQuota, window_seconds: int, now: float, *, shared: bool) -> None:
+    """Return an uncounted request's slot after another quota rejected it."""
+    current_key = _counter_key(quota, window_seconds, int(now // window_seconds))
+    if shared:
+        try:
+            _cache_incr(current_key, -1, timeout=2 * window_seconds + 1)
+        except Exception:
+            logger.debug("Rate limit cache release failed: %s", quota.key)
+        else:
+            return
+    local_counters.incr(current_key, -1, (int(now // window_seconds) + 2) * window_seconds, now)
+
+
+def _retry_after(previous: int, current: int, limit: int, now: float, window_seconds: int) -> int:
+    """Seconds until the next request fits, given counts excluding the rejected one."""
+    elapsed = now % window_seconds
+    if current + 1 > limit or previous <= 0:
+        return max(1, math.ceil(window_seconds - elapsed))
+    # The previous window's weight must decay until the estimate leaves room.
+    needed_fraction = 1 - (limit - current - 1) / previous
+    return max(1, math.ceil(needed_fraction * window_seconds - elapsed))
+
 
 def check_rate_limit(
     cache_key: str,
     max_requests: int,
     window_seconds: int,
-) -> tuple[bool, int | None, list[float]]:
-    """Check and update rate limit for a given cache key."""
+    *,
+    burst: int = 0,
+    shared_quotas: Sequence[RateLimitQuota] = (),
+) -> RateLimitDecision:
+    """Count one request against ``cache_key`` and any shared quotas.
+
+    The request is allowed only if every quota has room. A rejected request is
+    released from the counters, so it does not consume anyone's quota.
+    ``shared_quotas`` lets many callers draw on one budget, for example a
+    tenant-wide limit on top of each user's own limit.
+    """
     now = time.time()
-    window_key = f"{cache_key}_window"
-    try:
-        request_times = cache.get(window_key, [])
-    except Exception:
-        logger.debug("Cache read failed, allowing request: %s", cache_key)
-        request_times = []
-
-    # Remove timestamps outside the current window
-    request_times = [t for t in request_times if now - t < window_seconds]
-
-    # Check if rate limit exceeded
-    if len(request_times) >= max_requests:
-        oldest_request = min(request_times)
-        retry_after = int(window_seconds - (now - oldest_request)) + 1
+    shared = _uses_shared_cache()
+    quotas = [RateLimitQuota(cache_key, max_requests, burst), *shared_quotas]
+    counted: list[RateLimitQuota] = []
+    decision = RateLimitDecision(allowed=True, limit=quotas[0].limit, key=cache_key)
+    for quota in quotas:
+        current, previous = _window_counts(quota, window_seconds, now, shared=shared)
+        counted.append(quota)
+        weight = 1 - (now % window_seconds) / window_seconds
+        estimate = previous * weight + current
+        if estimate <= quota.limit:
+            if quota.key == cache_key:
+                decision = RateLimitDecision(
+                    allowed=True,
+                    estimated_requests=estimate,
+                    limit=quota.limit,
+                    key=cache_key,
+                )
+            continue
+        for counted_quota in counted:
+            _release(counted_quota, window_seconds, now, shared=shared)
         logger.warning(
-            "Rate limit exceeded for %s: %d/%d requests in %ds window",
-            cache_key,
-            len(request_times),
-            max_requests,
+            "Rate limit exceeded for %s: %.1f/%d requests in %ds window",
+            quota.key,
+            estimate,
+            quota.limit,
             window_seconds,
         )
-        return False, retry_after, request_times
-
-    # Add current request timestamp
-    request_times.append(now)
-    try:
-        cache.set(window_key, request_times, timeout=window_seconds + 1)
-    except Exception:
-        logger.debug("Cache write failed, but allowing request: %s", cache_key)
-    return True, None, request_times
+        return RateLimitDecision(
+            allowed=False,
+            retry_after=_retry_after(previous, current - 1, quota.limit, now, window_seconds),
+            estimated_requests=estimate - 1,
+            limit=quota.limit,
+            key=quota.key,
+        )
+    return decision
 
 
 def get_client_ip(request: HttpRequest) -> str:
@@ -67,3 +230,12 @@ def get_user_cache_key(request: HttpRequest, view_func_name: str) -> str:
         return f"rate_limit_user_{request.user.id}"
     ip = get_client_ip(request)
     return f"rate_limit_anon_{view_func_name}_{ip}"
+
+
+def get_tenant_cache_key(request: HttpRequest, view_func_name: str) -> str | None:
+    """Return the organization's shared quota key for one view, if any."""
+    # ``TenantMiddleware`` attaches a lazy organization that may resolve to None.
+    organization_id = getattr(getattr(request, "organization", None), "pk", None)
+    if organization_id is None:
+        return None
+    return f"rate_limit_tenant_{view_func_name}_{organization_id}"
@@ -7,6 +7,20 @@ from typing import Any
 from django.conf import settings as django_settings
 
 
+def bounded_int(value: Any, *, default: int, hard_limit: int, minimum: int = 1) -> int:
+    """Parse an integer setting value clamped between *minimum* and its package hard limit.
+
+    Booleans and values that do not parse as integers fall back to *default*.
+    """
+    if isinstance(value, bool):
+        return default
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return min(max(parsed, minimum), hard_limit)
+
+
 class DeploymentControls:
     """Read immutable process and tenancy controls from Django host settings."""
 
@@ -15,6 +29,13 @@ class DeploymentControls:
         """Return one host-owned value without consulting database configuration."""
         return getattr(django_settings, key, default)
 
+    @classmethod
+    def get_bounded_int(cls, key: str, *, default: int, hard_limit: int, minimum: int = 1) -> int:
+        """Return one host-owned integer clamped by :func:`bounded_int`."""
+        return bounded_int(
+            cls.get(key, default), default=default, hard_limit=hard_limit, minimum=minimum
+        )
+
     @property
     def multi_site_mode(self) -> bool:
         """Whether Django Site isolation is enabled."""
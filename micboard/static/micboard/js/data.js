@@ -23,24 +23,86 @@ export function postJSON(url, data, callback) {
     .catch(error => console.error('Error:', error));
 }
 
+// Pushes carry live state; HTTP polling runs until the first push arrives and
+// again whenever the socket is down.
+const FALLBACK_POLL_MS = 15000;
+const RECONNECT_BASE_MS = 1000;
+const RECONNECT_MAX_MS = 30000;
+const AUTH_CLOSE_CODES = [4401, 4403];
+
+let reconnectAttempts = 0;
+let reconnectTimer = null;
+let fallbackTimer = null;
+
+function applySnapshot(data) {
+  data.receivers.forEach((rx) => {
+    (rx.tx || []).forEach(updateSlot);
+  });
+  if (data.config) {
+    micboard.config = data.config;
+  }
+}
+
+// Pushed units carry their receiver channel, not the global slot the tiles are
+// numbered by; the configured slot list maps (receiver IP, channel) to a tile.
+function configuredSlot(rx, channel) {
+  const slots = (micboard.config && micboard.config.slots) || [];
+  const match = slots.find(e => e.ip === rx.ip && e.channel === channel);
+  return match ? match.slot : null;
+}
+
+function applyDeviceUpdate(data) {
+  data.receivers.forEach((rx) => {
+    (rx.tx || []).forEach((tx) => {
+      const slot = configuredSlot(rx, tx.channel);
+      if (slot !== null) {
+        updateSlot(Object.assign({}, tx, { slot }));
+      }
+    });
+  });
+}
+
 function JsonUpdate() {
   fetch(dataURL)
     .then(response => response.json())
-    .then((data) => {
-      if (micboard.connectionStatus === 'DISCONNECTED') {
-        window.location.reload();
-      }
-      data.receivers.forEach((rx) => {
-        rx.tx.forEach(updateSlot);
-      });
-      micboard.connectionStatus = 'CONNECTED';
-      micboard.config = data.config;
-    }).catch((error) => {
+    .then(applySnapshot)
+    .catch((error) => {
       console.log(error);
-      micboard.connectionStatus = 'DISCONNECTED';
+      ActivateMessageBoard();
     });
 }
 
+function startFallbackPolling() {
+  if (fallbackTimer === null) {
+    fallbackTimer = setInterval(JsonUpdate, FALLBACK_POLL_MS);
+  }
+}
+
+function stopFallbackPolling() {
+  if (fallbackTimer !== null) {
+    clearInterval(fallbackTimer);
+    fallbackTimer = null;
+  }
+}
+
+// Jitter keeps a restarted server from being hit by every screen at once.
+function reconnectDelay() {
+  const ceiling = Math.min(RECONNECT_MAX_MS, RECONNECT_BASE_MS * (2 ** reconnectAttempts));
+  return (ceiling / 2) + (Math.random() * ceiling / 2);
+}
+
+function scheduleReconnect() {
+  if (reconnectTimer !== null) {
+    return;
+  }
+  const delay = reconnectDelay();
+  reconnectAttempts += 1;
+  reconnectTimer = setTimeout(() => {
+    reconnectTimer = null;
+    wsConnect();
+  }, delay);
+}
+
 
 function updateGroup(data) {
   console.log('dgroup: ' + data.group + ' mgroup: ' + micboard.group);
@@ -52,8 +114,33 @@ function updateGroup(data) {
   updateNavLinks();
 }
 
+// device_update receivers carry their slots in `tx`, the same shape as the snapshot.
+function applyPush(data) {
+  let live = false;
+  if (data.type === 'device_update' && data.data && Array.isArray(data.data.receivers)) {
+    applyDeviceUpdate(data.data);
+    live = true;
+  }
+  if (data['chart-update']) {
+    data['chart-update'].forEach(updateChart);
+    live = true;
+  }
+  if (data['data-update']) {
+    data['data-update'].forEach(updateSlot);
+    live = true;
+  }
+  if (data['group-update']) {
+    data['group-update'].forEach(updateGroup);
+    updateNavLinks();
+  }
+  if (live) {
+    stopFallbackPolling();
+  }
+}
+
 export function initLiveData() {
-  setInterval(JsonUpdate, 1000);
+  JsonUpdate();
+  startFallbackPolling();
   wsConnect();
 }
 
@@ -71,27 +158,34 @@ function wsConnect() {
 
   micboard.socket = new WebSocket(newUri);
 
-  micboard.socket.onmessage = (msg) => {
-    const data = JSON.parse(msg.data);
-
-    if (data['chart-update']) {
-      data['chart-update'].forEach(updateChart);
-    }
-    if (data['data-update']) {
-      data['data-update'].forEach(updateSlot);
+  micboard.socket.onopen = () => {
+    reconnectAttempts = 0;
+    if (micboard.connectionStatus === 'DISCONNECTED') {
+      window.location.reload();
+      return;
     }
+    // Polling keeps the view current until the reopened socket delivers a push.
+    micboard.connectionStatus = 'CONNECTED';
+  };
 
-    if (data['group-update']) {
-      data['group-update'].forEach(updateGroup);
-      updateNavLinks();
-    }
+  micboard.socket.onmessage = (msg) => {
+    applyPush(JSON.parse(msg.data));
   };
 
-  micboard.socket.onclose = () => {
-    ActivateMessageBoard();
+  micboard.socket.onclose = (event) => {
+    if (AUTH_CLOSE_CODES.includes(event.code)) {
+      stopFallbackPolling();
+      ActivateMessageBoard();
+      return;
+    }
+    if (micboard.connectionStatus !== 'DISCONNECTED') {
+      micboard.connectionStatus = 'DEGRADED';
+    }
+    startFallbackPolling();
+    scheduleReconnect();
   };
 
   micboard.socket.onerror = () => {
-    ActivateMessageBoard();
+    // The browser always follows an error with close, which owns recovery.
   };
 }
@@ -0,0 +1,95 @@
+'use strict';
+
+// Refetch HTMX fragments marked with data-live-fragment when the server announces
+// that their rows changed. While the socket is down, the fragments' own hx-trigger
+// polling resumes because window.micboardLive is false.
+(function liveFragments() {
+  const CHANGE_EVENT = 'live-fragment-changed';
+  const REFRESH_DEBOUNCE_MS = 250;
+  const RECONNECT_BASE_MS = 1000;
+  const RECONNECT_MAX_MS = 30000;
+  const AUTH_CLOSE_CODES = [4401, 4403];
+
+  const pending = new Set();
+  let flushTimer = null;
+  let reconnectAttempts = 0;
+
+  window.micboardLive = false;
+
+  function fragmentElements(name) {
+    if (name === undefined) {
+      return document.querySelectorAll('[data-live-fragment]');
+    }
+    return document.querySelectorAll('[data-live-fragment="' + CSS.escape(name) + '"]');
+  }
+
+  function refresh(elements) {
+    elements.forEach((element) => {
+      htmx.trigger(element, CHANGE_EVENT);
+    });
+  }
+
+  // Bursts of writes, such as a polling cycle raising several alerts, cost one refetch.
+  function scheduleRefresh(name) {
+    pending.add(name);
+    if (flushTimer !== null) {
+      return;
+    }
+    flushTimer = setTimeout(() => {
+      flushTimer = null;
+      pending.forEach((fragment) => {
+        refresh(fragmentElements(fragment));
+      });
+      pending.clear();
+    }, REFRESH_DEBOUNCE_MS);
+  }
+
+  function reconnectDelay() {
+    const ceiling = Math.min(RECONNECT_MAX_MS, RECONNECT_BASE_MS * (2 ** reconnectAttempts));
+    return (ceiling / 2) + (Math.random() * ceiling / 2);
+  }
+
+  function connect() {
+    const scheme = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    const path = window.MICBOARD_LIVE_SOCKET_PATH || '/ws';
+    const socket = new WebSocket(scheme + '//' + window.location.host + path);
+
+    socket.onopen = () => {
+      const recovering = reconnectAttempts > 0;
+      reconnectAttempts = 0;
+      window.micboardLive = true;
+      if (recovering) {
+        // Notices sent while the socket was down are gone; refetch once.
+        refresh(fragmentElements());
+      }
+    };
+
+    socket.onmessage = (message) => {
+      let data;
+      try {
+        data = JSON.parse(message.data);
+      } catch (error) {
+        return;
+      }
+      if (data.type === 'fragment_change' && typeof data.fragment === 'string') {
+        scheduleRefresh(data.fragment);
+      }
+    };
+
+    socket.onclose = (event) => {
+      window.micboardLive = false;
+      if (AUTH_CLOSE_CODES.includes(event.code)) {
+        return;
+      }
+      const delay = reconnectDelay();
+      reconnectAttempts += 1;
+      setTimeout(connect, delay);
+    };
+  }
+
+  document.addEventListener('DOMContentLoaded', () => {
+    if (fragmentElements().length && 'WebSocket' in window) {
+      connect();
+    }
+  });
+}());
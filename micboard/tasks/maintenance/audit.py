@@ -0,0 +1,32 @@
+"""Operational log retention task for the micboard app."""
+
+from __future__ import annotations
+
+import logging
+
+from micboard.services.maintenance.audit import AuditService
+from micboard.services.maintenance.audit_log_buffer import AuditLogBuffer
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+
+def prune_operational_logs() -> dict[str, int] | None:
+    """Flush buffered log rows, then prune expired sync and API-health logs.
+
+    Schedule this periodically; each run deletes a bounded number of chunks and
+    leaves any remaining backlog for the next run.
+    """
+    try:
+        flushed = AuditLogBuffer.flush()
+        return {
+            "flushed": flushed,
+            "service_sync_logs": AuditService.prune_service_sync_logs(),
+            "api_health_logs": AuditService.prune_api_health_logs(),
+        }
+    except Exception as exc:
+        logger.exception(
+            "Error pruning operational logs",
+            exc_info=sanitized_exception_info(exc),
+        )
+        return None
@@ -0,0 +1,29 @@
+"""Inventory counter reconciliation task for the micboard app."""
+
+from __future__ import annotations
+
+import logging
+
+from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_inventory_counters() -> dict[str, int] | None:
+    """Repair inventory counters that drifted from the hardware tables.
+
+    Schedule this periodically; counters normally stay exact, so a run only
+    writes rows changed by raw SQL, fixtures, or cascades that skip signals.
+    """
+    try:
+        result = InventoryCounterService.reconcile()
+    except Exception as exc:
+        logger.exception(
+            "Error reconciling inventory counters",
+            exc_info=sanitized_exception_info(exc),
+        )
+        return None
+    if result.corrected:
+        logger.warning("Corrected %d drifted inventory counter rows", result.corrected)
+    return {"checked": result.checked, "corrected": result.corrected}
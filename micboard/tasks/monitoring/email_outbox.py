@@ -0,0 +1,91 @@
+"""Alert email outbox drain task for the micboard app."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from django.core.cache import cache
+from django.dispatch import receiver
+
+from micboard.services.monitoring.alert_email_outbox_service import (
+    AlertEmailOutboxService,
+    alert_email_queued,
+)
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+ALERT_EMAIL_DRAIN_DISPATCH_KEY = "micboard:alert-email-drain:v1"
+ALERT_EMAIL_DRAIN_COALESCE_SECONDS = 30
+
+
+def drain_alert_email_outbox() -> dict[str, int] | None:
+    """Deliver one batch of queued alert emails and requeue while a backlog remains."""
+    # Release the dispatch claim first so emails queued during this drain wake another one.
+    _release_drain_dispatch()
+    try:
+        result = AlertEmailOutboxService.drain()
+    except Exception as exc:
+        logger.exception(
+            "Error draining the alert email outbox",
+            exc_info=sanitized_exception_info(exc),
+        )
+        return None
+    if result.backlogged:
+        dispatch_alert_email_drain()
+    return result.model_dump()
+
+
+def dispatch_alert_email_drain() -> None:
+    """Enqueue one outbox drain, coalescing bursts of queued alert emails."""
+    from micboard.utils.dependencies import enqueue_huey_task, huey_is_configured
+
+    if not huey_is_configured():
+        logger.debug("Native Huey is unavailable or unconfigured; skipping alert email drain")
+        return
+    if not _claim_drain_dispatch():
+        return
+
+    try:
+        enqueue_huey_task(drain_alert_email_outbox)
+    except Exception as exc:
+        _release_drain_dispatch()
+        logger.exception(
+            "Failed to enqueue the alert email outbox drain",
+            exc_info=sanitized_exception_info(exc),
+        )
+
+
+@receiver(alert_email_queued, dispatch_uid="micboard.dispatch_alert_email_drain")
+def _dispatch_queued_alert_email(sender: object, **kwargs: Any) -> None:
+    """Bridge service-layer outbox events to the drain task."""
+    del sender, kwargs
+    dispatch_alert_email_drain()
+
+
+def _claim_drain_dispatch() -> bool:
+    """Claim the pending-drain slot, failing open when cache is unavailable."""
+    try:
+        return bool(
+            cache.add(
+                ALERT_EMAIL_DRAIN_DISPATCH_KEY, True, timeout=ALERT_EMAIL_DRAIN_COALESCE_SECONDS
+            )
+        )
+    except Exception as exc:
+        logger.exception(
+            "Alert email drain cache unavailable; proceeding without coalescing",
+            exc_info=sanitized_exception_info(exc),
+        )
+        return True
+
+
+def _release_drain_dispatch() -> None:
+    """Release the pending-drain slot so later emails are not left waiting."""
+    try:
+        cache.delete(ALERT_EMAIL_DRAIN_DISPATCH_KEY)
+    except Exception as exc:
+        logger.exception(
+            "Alert email drain cache claim could not be released",
+            exc_info=sanitized_exception_info(exc),
+        )
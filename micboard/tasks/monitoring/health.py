@@ -10,6 +10,7 @@ from django.core.cache import cache
 from micboard.models.discovery.manufacturer import Manufacturer
 from micboard.models.telemetry.health import APIHealthLog
 from micboard.services.common.base.plugin import get_manufacturer_plugin
+from micboard.services.maintenance.audit_log_buffer import AuditLogBuffer
 from micboard.services.notification.broadcast_service import BroadcastService
 from micboard.services.realtime.health_dtos import RealtimeConnectionHealthResult
 from micboard.services.realtime.health_service import RealtimeConnectionHealthService
@@ -18,6 +19,7 @@ from micboard.services.shared.api_health import (
     API_HEALTH_SNAPSHOT_CACHE_PREFIX,
     sanitize_public_api_health_snapshot,
 )
+from micboard.services.shared.api_traffic_health import APITrafficHealth
 from micboard.utils.exception_logging import sanitized_exception_info
 
 logger = logging.getLogger(__name__)
@@ -42,12 +44,14 @@ def _publish_manufacturer_api_health(manufacturer: Manufacturer, health_data: ob
     """Persist and emit one bounded, secret-safe manufacturer health snapshot."""
     snapshot = sanitize_public_api_health_snapshot(health_data)
     snapshot_data = snapshot.model_dump(exclude_none=True)
-    APIHealthLog.objects.create(
-        manufacturer=manufacturer,
-        status=snapshot.status,
-        response_time=snapshot.response_time,
-        error_message=snapshot.error or "",
-        details=snapshot_data,
+    AuditLogBuffer.add(
+        APIHealthLog(
+            manufacturer=manufacturer,
+            status=snapshot.status,
+            response_time=snapshot.response_time,
+            error_message=snapshot.error or "",
+            details=snapshot_data,
+        )
     )
     cache.set(
         f"{API_HEALTH_SNAPSHOT_CACHE_PREFIX}{manufacturer.code}",
@@ -60,7 +64,11 @@ def _publish_manufacturer_api_health(manufacturer: Manufacturer, health_data: ob
 
 
 def check_manufacturer_api_health(manufacturer_id: int) -> None:
-    """Task to check a specific manufacturer's API health."""
+    """Task to check a specific manufacturer's API health.
+
+    Health observed from recent polling and subscription traffic is published
+    as-is; the vendor API is only probed when no organic traffic was seen.
+    """
     try:
         manufacturer = Manufacturer.objects.get(pk=manufacturer_id, is_active=True)
     except Manufacturer.DoesNotExist:
@@ -78,9 +86,11 @@ def check_manufacturer_api_health(manufacturer_id: int) -> None:
         return
 
     try:
-        plugin_class = get_manufacturer_plugin(manufacturer.code)
-        plugin = plugin_class(manufacturer)
-        health_status: object = plugin.get_client().check_health()
+        health_status: object = APITrafficHealth.recent_snapshot(manufacturer.code)
+        if health_status is None:
+            plugin_class = get_manufacturer_plugin(manufacturer.code)
+            plugin = plugin_class(manufacturer)
+            health_status = plugin.get_client().check_health()
     except Exception as exc:
         logger.exception(
             "Error checking API health for manufacturer ID %s",
@@ -100,6 +100,11 @@ def poll_manufacturer_devices(
 
         alert_scan = PollAlertService.evaluate_manufacturer(manufacturer)
 
+        from micboard.tasks.monitoring.email_outbox import dispatch_alert_email_drain
+
+        # Each poll also wakes the drain, so emails waiting out a retry backoff are resent.
+        dispatch_alert_email_drain()
+
         logger.info(
             "Polling task complete for %s: %d devices created/updated, %d transmitters",
             manufacturer.name,
@@ -27,6 +27,7 @@ from micboard.views.dashboard import (
     rooms_in_building_view,
     single_building_view,
 )
+from micboard.views.exports import export_view
 from micboard.views.kiosk import (
     DisplayWallDetailView,
     DisplayWallListView,
@@ -71,6 +72,7 @@ urlpatterns = [
     path("alerts/<int:alert_id>/resolve/", resolve_alert_view, name="resolve_alert"),
     path("chargers/", ChargerDashboardView.as_view(), name="charger_dashboard"),
     path("chargers/grid/", ChargerGridView.as_view(), name="charger_grid"),
+    path("exports/<str:dataset>/", export_view, name="export"),
     # Dashboard views
     path("buildings/", all_buildings_view, name="all_buildings_view"),
     path(
@@ -72,17 +72,29 @@ def huey_is_configured() -> bool:
 
 @cache
 def register_huey_task(func: Callable[..., Any]) -> Any:
-    """Register a database task that is enqueued after transaction commit."""
+    """Register a database task that is enqueued after transaction commit.
+
+    The task runs in its priority lane; see ``micboard.utils.task_lanes``.
+    """
     if not huey_is_configured():
         raise RuntimeError(
             "Native Huey is not configured; add huey.contrib.djhuey and settings.HUEY"
         )
 
-    from huey.contrib.djhuey import on_commit_task
+    from huey.contrib.djhuey import HUEY, on_commit_task
+
+    from micboard.utils.task_lanes import lane_budget, lane_entrypoint, task_route
 
-    return on_commit_task()(func)
+    priority = lane_budget(task_route(func).lane).priority
+    return on_commit_task(priority=priority)(lane_entrypoint(func, immediate=HUEY.immediate))
 
 
 def enqueue_huey_task(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-    """Enqueue a registered callable on the native Huey queue."""
-    return register_huey_task(func)(*args, **kwargs)
+    """Enqueue a registered callable on the native Huey queue.
+
+    Returns ``None`` instead of a result handle when ``func`` is a singleton
+    task and an identical call is already pending.
+    """
+    from micboard.utils.task_lanes import dispatch_task
+
+    return dispatch_task(register_huey_task(func), func, args, kwargs)
@@ -0,0 +1,139 @@
+"""Pluggable JSON encoding for realtime, API, and kiosk hot paths.
+
+``MICBOARD_JSON_BACKEND`` selects the codec: ``"orjson"``, ``"msgspec"``,
+``"stdlib"``, or ``"auto"`` (default), which picks the first installed of
+orjson and msgspec and otherwise falls back to the standard library. A named
+backend that is not installed also falls back to the standard library.
+
+Every backend writes compact UTF-8 JSON. Datetimes, dates, times, and UUIDs
+are encoded natively. Decimals are encoded as strings. Anything else goes
+through ``DjangoJSONEncoder.default`` (durations, lazy translations), and types
+it rejects raise ``TypeError`` exactly as ``json.dumps`` would. Callers with
+their own encoder semantics pass its ``default`` to ``codec_for``. orjson and
+msgspec keep microseconds in datetimes where ``DjangoJSONEncoder`` truncates
+to milliseconds.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+from micboard.settings.deployment_controls import deployment_controls
+from micboard.utils.dependencies import is_installed
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("orjson", "msgspec", "stdlib")
+_default: Callable[[Any], Any] = DjangoJSONEncoder().default
+
+
+@dataclass(frozen=True, slots=True)
+class JSONCodec:
+    """One backend's encode and decode functions."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes | str], Any]
+
+
+def _stdlib_codec(default: Callable[[Any], Any]) -> JSONCodec:
+    encoder = json.JSONEncoder(default=default, ensure_ascii=False, separators=(",", ":"))
+    return JSONCodec(
+        name="stdlib",
+        dumps=lambda value: encoder.encode(value).encode(),
+        loads=json.loads,
+    )
+
+
+def _orjson_codec(default: Callable[[Any], Any]) -> JSONCodec:
+    import orjson
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    return JSONCodec(
+        name="orjson",
+        dumps=lambda value: orjson.dumps(value, default=default, option=options),
+        loads=orjson.loads,
+    )
+
+
+def _msgspec_codec(default: Callable[[Any], Any]) -> JSONCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder(enc_hook=default, decimal_format="string")
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return JSONCodec(name="msgspec", dumps=encoder.encode, loads=loads)
+
+
+_FACTORIES: dict[str, Callable[[Callable[[Any], Any]], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "stdlib": _stdlib_codec,
+}
+
+
+@cache
+def codec_for(backend: str, default: Callable[[Any], Any] = _default) -> JSONCodec:
+    """Return the codec for a backend name, falling back to the standard library.
+
+    ``default`` encodes values the backend has no native representation for.
+    """
+    if backend == "auto":
+        backend = next(
+            (name for name in JSON_BACKENDS if name == "stdlib" or is_installed(name)),
+            "stdlib",
+        )
+    if backend not in _FACTORIES:
+        logger.warning("Unknown MICBOARD_JSON_BACKEND %r; using stdlib", backend)
+        backend = "stdlib"
+    elif backend != "stdlib" and not is_installed(backend):
+        logger.warning("MICBOARD_JSON_BACKEND %r is not installed; using stdlib", backend)
+        backend = "stdlib"
+    return _FACTORIES[backend](default)
+
+
+def active_codec(default: Callable[[Any], Any] = _default) -> JSONCodec:
+    """Return the codec selected by ``MICBOARD_JSON_BACKEND``."""
+    backend = deployment_controls.get("MICBOARD_JSON_BACKEND", "auto")
+    return codec_for(backend if isinstance(backend, str) else "auto", default)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON bytes."""
+    return active_codec().dumps(value)
+
+
+def dumps_text(value: Any) -> str:
+    """Encode ``value`` as a compact JSON string."""
+    return active_codec().dumps(value).decode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or text, raising ``ValueError`` for malformed input."""
+    return active_codec().loads(data)
+
+
+class FastJsonResponse(HttpResponse):
+    """``JsonResponse`` encoded with the active codec."""
+
+    def __init__(self, data: Any, *, safe: bool = True, **kwargs: Any) -> None:
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the safe parameter to False."
+            )
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
@@ -0,0 +1,416 @@
+"""Priority lanes, worker budgets, and singleton dispatch for native Huey tasks.
+
+Every registered task belongs to one lane. A lane sets the Huey priority of
+its messages, so storages that honour priority (``PriorityRedisHuey``,
+``SqliteHuey``, ``MemoryHuey``) dequeue realtime and polling work ahead of
+discovery and maintenance. A lane also caps how many consumer workers may run
+its tasks at once: a task that finds every slot of its lane busy is retried
+shortly instead of occupying another worker.
+
+Singleton tasks collapse duplicate enqueues of the same call into one pending
+message. The pending claim is released when the task starts, so a call made
+while it runs queues exactly one follow-up execution. Inside a transaction the
+shared claim is taken only when the transaction commits, so a rollback leaves
+no claim behind.
+
+Queue depth, starts, and enqueue-to-start wait are recorded per lane in the
+default cache; ``lane_snapshot`` reads them back. Cache failures fail open:
+tasks still run, only without deduplication, budgets, or statistics.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import secrets
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import wraps
+from typing import Any, Final
+
+from django.core.cache import cache
+from django.db import transaction
+
+from micboard.settings.deployment_controls import deployment_controls
+from micboard.utils.exception_logging import sanitized_exception_info
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_KWARG: Final = "_micboard_dispatch"
+SINGLETON_PENDING_SECONDS = 5 * 60
+LANE_SLOT_SECONDS = 15 * 60
+LANE_BUSY_RETRY_SECONDS = 5
+LANE_STATS_WINDOW_SECONDS = 60 * 60
+LANE_DEPTH_SECONDS = 24 * 60 * 60
+_KEY_PREFIX: Final = "micboard:task-lane:v1"
+
+# Commit-time claim callbacks of singleton calls dispatched in open transactions.
+_transaction_claims = threading.local()
+
+
+class TaskLane(StrEnum):
+    """Named priority lanes for micboard background work."""
+
+    REALTIME = "realtime"
+    POLLING = "polling"
+    ALERTS = "alerts"
+    DISCOVERY = "discovery"
+    MAINTENANCE = "maintenance"
+
+
+@dataclass(frozen=True, slots=True)
+class LaneBudget:
+    """Huey priority and concurrent worker allowance for one lane."""
+
+    priority: int
+    workers: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRoute:
+    """Lane assignment and duplicate-collapsing policy for one task."""
+
+    lane: TaskLane
+    singleton: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class LaneStatus:
+    """Backpressure observed on one lane during the current statistics window."""
+
+    lane: TaskLane
+    depth: int
+    enqueued: int
+    started: int
+    average_wait_seconds: float | None
+    last_wait_seconds: float | None
+
+
+DEFAULT_LANE_BUDGETS: Final[Mapping[TaskLane, LaneBudget]] = {
+    TaskLane.REALTIME: LaneBudget(priority=40, workers=4),
+    TaskLane.POLLING: LaneBudget(priority=30, workers=4),
+    TaskLane.ALERTS: LaneBudget(priority=20, workers=2),
+    TaskLane.DISCOVERY: LaneBudget(priority=10, workers=1),
+    TaskLane.MAINTENANCE: LaneBudget(priority=0, workers=1),
+}
+
+# Tasks that coalesce their own dispatch (alert drain, manufacturer discovery)
+# are not singletons here; a second claim would only shadow theirs.
+TASK_ROUTES: Final[Mapping[str, TaskRoute]] = {
+    "micboard.tasks.monitoring.sse.start_sse_subscriptions": TaskRoute(
+        TaskLane.REALTIME, singleton=True
+    ),
+    "micboard.tasks.monitoring.websocket.start_shure_websocket_subscriptions": TaskRoute(
+        TaskLane.REALTIME, singleton=True
+    ),
+    "micboard.tasks.sync.polling.poll_manufacturer_devices": TaskRoute(
+        TaskLane.POLLING, singleton=True
+    ),
+    "micboard.tasks.sync.polling.poll_api_server_device": TaskRoute(
+        TaskLane.POLLING, singleton=True
+    ),
+    "micboard.tasks.sync.polling.refresh_selected_chassis": TaskRoute(TaskLane.POLLING),
+    "micboard.tasks.monitoring.email_outbox.drain_alert_email_outbox": TaskRoute(TaskLane.ALERTS),
+    "micboard.tasks.sync.discovery.run_manufacturer_discovery_task": TaskRoute(TaskLane.DISCOVERY),
+    "micboard.tasks.sync.discovery.run_discovery_sync_task": TaskRoute(
+        TaskLane.DISCOVERY, singleton=True
+    ),
+    "micboard.tasks.sync.discovery.cache_all_discovery_candidates": TaskRoute(
+        TaskLane.DISCOVERY, singleton=True
+    ),
+    "micboard.tasks.maintenance.audit.prune_operational_logs": TaskRoute(
+        TaskLane.MAINTENANCE, singleton=True
+    ),
+    "micboard.tasks.maintenance.charger.poll_charger_data": TaskRoute(
+        TaskLane.MAINTENANCE, singleton=True
+    ),
+    "micboard.tasks.maintenance.inventory.reconcile_inventory_counters": TaskRoute(
+        TaskLane.MAINTENANCE, singleton=True
+    ),
+    "micboard.tasks.monitoring.health.check_manufacturer_api_health": TaskRoute(
+        TaskLane.MAINTENANCE, singleton=True
+    ),
+    "micboard.tasks.monitoring.health.check_realtime_connection_health": TaskRoute(
+        TaskLane.MAINTENANCE, singleton=True
+    ),
+    "micboard.tasks.monitoring.health.check_selected_api_server_connections": TaskRoute(
+        TaskLane.MAINTENANCE
+    ),
+}
+DEFAULT_TASK_ROUTE: Final = TaskRoute(TaskLane.MAINTENANCE)
+
+
+def task_route(func: Callable[..., Any]) -> TaskRoute:
+    """Return the lane route of ``func``; unlisted callables use the maintenance lane."""
+    return TASK_ROUTES.get(f"{func.__module__}.{func.__qualname__}", DEFAULT_TASK_ROUTE)
+
+
+def lane_budget(lane: TaskLane) -> LaneBudget:
+    """Return ``lane``'s budget with any ``MICBOARD_TASK_LANES`` host overrides."""
+    default = DEFAULT_LANE_BUDGETS[lane]
+    overrides = deployment_controls.get("MICBOARD_TASK_LANES", None) or {}
+    override = overrides.get(lane.value, {}) if isinstance(overrides, Mapping) else {}
+    if not isinstance(override, Mapping):
+        return default
+    priority = override.get("priority", default.priority)
+    workers = override.get("workers", default.workers)
+    if isinstance(priority, bool) or not isinstance(priority, int):
+        priority = default.priority
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        workers = default.workers
+    return LaneBudget(priority=priority, workers=workers)
+
+
+def dispatch_task(
+    task: Callable[..., Any],
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Enqueue ``task`` for ``func`` through its lane, collapsing pending duplicates.
+
+    Returns the Huey result handle, or ``None`` when an identical singleton call
+    is already pending.
+    """
+    route = task_route(func)
+    pending_key = _singleton_key(func, args, kwargs) if route.singleton else None
+    in_transaction = transaction.get_connection().in_atomic_block
+    if pending_key is not None and not (
+        _claim_on_commit(pending_key) if in_transaction else _claim_pending(pending_key)
+    ):
+        logger.debug("Collapsed duplicate %s enqueue into the pending execution", func.__name__)
+        return None
+
+    dispatch = {"lane": route.lane.value, "enqueued_at": time.time(), "pending_key": pending_key}
+    # Huey enqueues after commit; count the message at the same point, ahead of
+    # immediate-mode execution.
+    transaction.on_commit(lambda: _record_enqueued(route.lane))
+    try:
+        return task(*args, **kwargs, **{DISPATCH_KWARG: dispatch})
+    except Exception:
+        if pending_key is not None:
+            if in_transaction:
+                _pending_claims().pop(pending_key, None)
+            else:
+                _release_pending(pending_key)
+        raise
+
+
+def lane_entrypoint(func: Callable[..., Any], *, immediate: bool) -> Callable[..., Any]:
+    """Wrap ``func`` so each execution records its wait and holds a lane slot.
+
+    In Huey's immediate mode tasks run inline in the enqueuing process, so
+    there are no consumer workers to budget and slots are not taken.
+    """
+    route = task_route(func)
+
+    @wraps(func)
+    def run_in_lane(*args: Any, **kwargs: Any) -> Any:
+        from huey.exceptions import RetryTask
+
+        dispatch = kwargs.pop(DISPATCH_KWARG, None) or {}
+        pending_key = dispatch.get("pending_key")
+        if pending_key:
+            _release_pending(pending_key)
+        enqueued_at = dispatch.get("enqueued_at")
+        _record_started(
+            route.lane,
+            waited=time.time() - enqueued_at if isinstance(enqueued_at, int | float) else None,
+            queued=bool(dispatch),
+        )
+
+        slot = None if immediate else _acquire_slot(route.lane)
+        if slot is _LANE_BUSY:
+            if pending_key and not _claim_pending(pending_key):
+                logger.debug("Lane %s busy; a newer %s call is pending", route.lane, func.__name__)
+                return None
+            # Huey re-enqueues the original message, dispatch metadata included.
+            _record_enqueued(route.lane)
+            raise RetryTask(delay=LANE_BUSY_RETRY_SECONDS)
+        try:
+            return func(*args, **kwargs)
+        except RetryTask:
+            _record_enqueued(route.lane)
+            raise
+        finally:
+            if slot is not None:
+                _release_slot(slot)
+
+    return run_in_lane
+
+
+def lane_snapshot() -> list[LaneStatus]:
+    """Return depth and enqueue-to-start wait for every lane in the current window."""
+    window = _stats_window()
+    statuses = []
+    for lane in TaskLane:
+        keys = {
+            "depth": _depth_key(lane),
+            "enqueued": _stats_key(lane, "enqueued", window),
+            "started": _stats_key(lane, "started", window),
+            "waited": _stats_key(lane, "wait-ms", window),
+            "timed": _stats_key(lane, "timed", window),
+            "last": _stats_key(lane, "last-wait-ms", window),
+        }
+        try:
+            values = cache.get_many(list(keys.values()))
+        except Exception as exc:
+            logger.exception(
+                "Task lane statistics are unavailable",
+                exc_info=sanitized_exception_info(exc),
+            )
+            values = {}
+        counts = {name: int(values.get(key) or 0) for name, key in keys.items()}
+        last = values.get(keys["last"])
+        statuses.append(
+            LaneStatus(
+                lane=lane,
+                depth=max(counts["depth"], 0),
+                enqueued=counts["enqueued"],
+                started=counts["started"],
+                average_wait_seconds=(
+                    counts["waited"] / counts["timed"] / 1000 if counts["timed"] else None
+                ),
+                last_wait_seconds=int(last) / 1000 if last is not None else None,
+            )
+        )
+    return statuses
+
+
+_LANE_BUSY: Final = object()
+
+
+def _singleton_key(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    call = json.dumps([args, kwargs], sort_keys=True, default=str)
+    digest = hashlib.sha256(call.encode()).hexdigest()[:32]
+    return f"{_KEY_PREFIX}:pending:{func.__module__}.{func.__qualname__}:{digest}"
+
+
+def _claim_pending(key: str) -> bool:
+    try:
+        return bool(cache.add(key, True, timeout=SINGLETON_PENDING_SECONDS))
+    except Exception as exc:
+        logger.exception(
+            "Task singleton cache unavailable; enqueueing without deduplication",
+            exc_info=sanitized_exception_info(exc),
+        )
+        return True
+
+
+def _claim_on_commit(key: str) -> bool:
+    """Schedule the shared claim of ``key`` for commit; ``False`` if already scheduled.
+
+    Huey enqueues after commit, so claiming at the same point keeps a rolled-back
+    dispatch from blocking identical calls until the claim expires. A claim lost
+    at commit to another process's identical call still enqueues this one.
+    """
+    connection = transaction.get_connection()
+    claims = _pending_claims()
+    scheduled = claims.get(key)
+    # Rolling back a transaction or savepoint discards its commit callbacks.
+    if scheduled is not None and any(entry[1] is scheduled for entry in connection.run_on_commit):
+        return False
+
+    def claim() -> None:
+        if claims.get(key) is claim:
+            del claims[key]
+            _claim_pending(key)
+
+    claims[key] = claim
+    transaction.on_commit(claim)
+    return True
+
+
+def _pending_claims() -> dict[str, Callable[[], None]]:
+    claims = getattr(_transaction_claims, "claims", None)
+    if claims is None:
+        claims = _transaction_claims.claims = {}
+    return claims
+
+
+def _release_pending(key: str) -> None:
+    try:
+        cache.delete(key)
+    except Exception as exc:
+        logger.exception(
+            "Task singleton claim could not be released",
+            exc_info=sanitized_exception_info(exc),
+        )
+
+
+def _acquire_slot(lane: TaskLane) -> str | object | None:
+    """Take a free worker slot of ``lane``; ``None`` means run unbudgeted."""
+    token = secrets.token_hex(8)
+    try:
+        for index in range(lane_budget(lane).workers):
+            key = f"{_KEY_PREFIX}:slot:{lane.value}:{index}"
+            if cache.add(key, token, timeout=LANE_SLOT_SECONDS):
+                return key
+    except Exception as exc:
+        logger.exception(
+            "Task lane slots are unavailable; running %s work without a budget",
+            lane.value,
+            exc_info=sanitized_exception_info(exc),
+        )
+        return None
+    return _LANE_BUSY
+
+
+def _release_slot(key: object) -> None:
+    try:
+        cache.delete(key)
+    except Exception as exc:
+        logger.exception(
+            "Task lane slot could not be released",
+            exc_info=sanitized_exception_info(exc),
+        )
+
+
+def _record_enqueued(lane: TaskLane) -> None:
+    window = _stats_window()
+    try:
+        _incr(_depth_key(lane), 1, timeout=LANE_DEPTH_SECONDS)
+        _incr(_stats_key(lane, "enqueued", window), 1, timeout=2 * LANE_STATS_WINDOW_SECONDS)
+    except Exception:
+        logger.debug("Task lane enqueue statistics unavailable for %s", lane.value)
+
+
+def _record_started(lane: TaskLane, *, waited: float | None, queued: bool) -> None:
+    window = _stats_window()
+    timeout = 2 * LANE_STATS_WINDOW_SECONDS
+    try:
+        if queued:
+            _incr(_depth_key(lane), -1, timeout=LANE_DEPTH_SECONDS)
+        _incr(_stats_key(lane, "started", window), 1, timeout=timeout)
+        if waited is not None:
+            wait_ms = max(round(waited * 1000), 0)
+            _incr(_stats_key(lane, "wait-ms", window), wait_ms, timeout=timeout)
+            _incr(_stats_key(lane, "timed", window), 1, timeout=timeout)
+            cache.set(_stats_key(lane, "last-wait-ms", window), wait_ms, timeout=timeout)
+    except Exception:
+        logger.debug("Task lane start statistics unavailable for %s", lane.value)
+
+
+def _incr(key: str, delta: int, *, timeout: int) -> int:
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # First write to this key; ``add`` keeps a racing creator's count.
+        cache.add(key, 0, timeout=timeout)
+        return cache.incr(key, delta)
+
+
+def _stats_window() -> int:
+    return int(time.time() // LANE_STATS_WINDOW_SECONDS)
+
+
+def _depth_key(lane: TaskLane) -> str:
+    return f"{_KEY_PREFIX}:depth:{lane.value}"
+
+
+def _stats_key(lane: TaskLane, name: str, window: int) -> str:
+    return f"{_KEY_PREFIX}:{name}:{lane.value}:{window}"
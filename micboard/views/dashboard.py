@@ -10,6 +10,7 @@ from micboard.models.monitoring.performer import Performer
 from micboard.models.monitoring.performer_assignment import PerformerAssignment
 from micboard.services.hardware.receiver_browse_dtos import ReceiverBrowseCriteria
 from micboard.services.hardware.receiver_browse_service import ReceiverBrowseService
+from micboard.services.monitoring.inventory_counter_service import InventoryCounterService
 from micboard.services.monitoring.monitoring_access import MonitoringService
 
 
@@ -31,11 +32,12 @@ def _render_receiver_browse(
 @require_http_methods(["GET"])
 def index(request: HttpRequest) -> HttpResponse:
     """Main dashboard view."""
-    # Filter receivers based on user permissions
-    user_receivers = WirelessChassis.objects.for_user(user=request.user)
+    # Summary tiles read maintained counters instead of counting hardware rows.
+    inventory = InventoryCounterService.totals_for_user(request.user)
 
     context = {
-        "device_count": user_receivers.count(),
+        "device_count": inventory.devices,
+        "inventory": inventory,
         "group_count": MonitoringService.get_user_monitoring_groups(request.user).count(),
     }
     return render(request, "micboard/index.html", context)
@@ -0,0 +1,38 @@
+"""Streaming export downloads for inventory, alerts and telemetry."""
+
+from __future__ import annotations
+
+from django.contrib.auth.decorators import login_required
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase
+from django.views.decorators.http import require_http_methods
+
+from micboard.services.exports.export_stream_service import (
+    EXPORT_CONTENT_TYPES,
+    EXPORT_DATASETS,
+    ExportStreamService,
+)
+
+
+@login_required
+@require_http_methods(["GET"])
+def export_view(request: HttpRequest, dataset: str) -> HttpResponseBase:
+    """Stream one tenant-scoped dataset as NDJSON (default) or CSV."""
+    if dataset not in EXPORT_DATASETS:
+        raise Http404("Unknown export")
+    export_format = request.GET.get("format", "ndjson")
+    if export_format not in EXPORT_CONTENT_TYPES:
+        return HttpResponseBadRequest("Unsupported export format")
+
+    response = StreamingHttpResponse(
+        ExportStreamService.stream(user=request.user, dataset=dataset, export_format=export_format),
+        content_type=EXPORT_CONTENT_TYPES[export_format],
+    )
+    response["Content-Disposition"] = f'attachment; filename="micboard-{dataset}.{export_format}"'
+    response["Cache-Control"] = "no-store"
+    return response
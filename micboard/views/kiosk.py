@@ -6,7 +6,7 @@ from typing import Any
 
 from django.contrib.auth.decorators import login_required
 from django.db.models import QuerySet
-from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils.decorators import method_decorator
 from django.views import View
@@ -17,6 +17,7 @@ from micboard.services.kiosk.dtos import DisplayWallSnapshot
 from micboard.services.kiosk.health_service import KioskHealthService
 from micboard.services.kiosk.services import KioskService
 from micboard.services.monitoring.monitoring_access import MonitoringService
+from micboard.utils.json_codec import FastJsonResponse
 
 
 @method_decorator(login_required, name="dispatch")
@@ -42,11 +43,11 @@ class KioskAuthView(View):
             {"snapshot": snapshot, "kiosk": True},
         )
 
-    def post(self, request: HttpRequest, kiosk_id: str) -> JsonResponse:
+    def post(self, request: HttpRequest, kiosk_id: str) -> FastJsonResponse:
         """Heartbeat update from kiosk."""
         if KioskService.record_heartbeat(kiosk_id, user=request.user):
-            return JsonResponse({"status": "ok", "message": "Heartbeat received"})
-        return JsonResponse({"status": "error", "message": "Kiosk not found"}, status=404)
+            return FastJsonResponse({"status": "ok", "message": "Heartbeat received"})
+        return FastJsonResponse({"status": "error", "message": "Kiosk not found"}, status=404)
 
 
 @method_decorator(login_required, name="dispatch")
@@ -137,7 +138,7 @@ def _serialize_kiosk_data(snapshot: DisplayWallSnapshot) -> dict[str, Any]:
 class KioskDataView(View):
     """JSON snapshot endpoint for programmatic display consumers."""
 
-    def get(self, request: HttpRequest, wall_id: int) -> JsonResponse:
+    def get(self, request: HttpRequest, wall_id: int) -> FastJsonResponse:
         """Get current display data for a wall.
 
         Args:
@@ -149,8 +150,8 @@ class KioskDataView(View):
         """
         snapshot = KioskService.get_wall_snapshot(wall_id, user=request.user)
         if snapshot is None:
-            return JsonResponse({"error": "Wall not found"}, status=404)
-        return JsonResponse({"status": "ok", **_serialize_kiosk_data(snapshot)})
+            return FastJsonResponse({"error": "Wall not found"}, status=404)
+        return FastJsonResponse({"status": "ok", **_serialize_kiosk_data(snapshot)})
 
 
 @method_decorator(login_required, name="dispatch")
@@ -173,7 +174,7 @@ class KioskContentView(View):
 class KioskHealthView(View):
     """JSON API endpoint for kiosk health status."""
 
-    def get(self, request: HttpRequest, wall_id: int) -> JsonResponse:
+    def get(self, request: HttpRequest, wall_id: int) -> FastJsonResponse:
         """Get health status for all chargers in wall sections.
 
         Args:
@@ -185,5 +186,5 @@ class KioskHealthView(View):
         """
         health = KioskHealthService.get_wall_health(wall_id=wall_id, user=request.user)
         if health is None:
-            return JsonResponse({"error": "Wall not found"}, status=404)
-        return JsonResponse({"status": "ok", **health.model_dump(mode="json")})
+            return FastJsonResponse({"error": "Wall not found"}, status=404)
+        return FastJsonResponse({"status": "ok", **health.model_dump(mode="json")})
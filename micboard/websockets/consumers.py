@@ -5,7 +5,6 @@ This module provides WebSocket consumers for broadcasting device updates to conn
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
@@ -20,6 +19,7 @@ from micboard.services.notification.realtime_routing_service import (
     site_updates_group,
 )
 from micboard.services.settings.settings_service import settings as micboard_settings
+from micboard.utils import json_codec
 from micboard.utils.dependencies import HAS_CHANNELS
 
 if HAS_CHANNELS:
@@ -150,7 +150,7 @@ class MicboardConsumer(AsyncWebsocketConsumer):
     async def _send_authorized(self, payload: dict[str, Any]) -> None:
         """Revalidate access immediately before forwarding one event."""
         if await self._can_forward_event():
-            await self.send(text_data=json.dumps(payload))
+            await self.send(text_data=json_codec.dumps_text(payload))
 
     async def connect(self) -> None:
         """Handle WebSocket connection."""
@@ -239,8 +239,8 @@ class MicboardConsumer(AsyncWebsocketConsumer):
             return
 
         try:
-            data = json.loads(text_data)
-        except json.JSONDecodeError:
+            data = json_codec.loads(text_data)
+        except ValueError:
             logger.warning(
                 "Rejected malformed WebSocket JSON: channel=%s bytes=%d",
                 self.channel_name,
@@ -279,3 +279,7 @@ class MicboardConsumer(AsyncWebsocketConsumer):
     async def device_status_update(self, event: dict[str, Any]) -> None:
         """Forward a persisted hardware status update."""
         await self._forward_event(event)
+
+    async def fragment_change(self, event: dict[str, Any]) -> None:
+        """Forward a notice that a live HTMX fragment should refetch."""
+        await self._forward_event(event)
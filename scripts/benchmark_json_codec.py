@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# ruff: noqa: T201
+"""Compare the installed JSON codecs against ``DjangoJSONEncoder`` on realtime snapshots."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SIZES = (100, 1_000, 5_000)
+
+
+def device_update_snapshot(receivers: int) -> dict[str, Any]:
+    """Return a ``device_update`` payload shaped like one broadcast chunk."""
+    started = datetime(2026, 1, 1, 12, tzinfo=UTC)
+    return {
+        "type": "device_update",
+        "manufacturer_code": "shure",
+        "timestamp": started.isoformat(),
+        "snapshot_id": "c0ffee-snapshot",
+        "chunk_index": 0,
+        "is_final_chunk": True,
+        "inventory_complete": True,
+        "next_cursor": None,
+        "receivers": [
+            {
+                "id": index,
+                "api_device_id": f"rx-{index:05d}",
+                "name": f"Receiver {index}",
+                "ip": f"10.{index // 65_536}.{index // 256 % 256}.{index % 256}",
+                "status": "online",
+                "model": "ULXD4Q",
+                "last_seen": started + timedelta(seconds=index),
+                "tx": [
+                    {
+                        "slot": slot,
+                        "name": f"Vox {slot}",
+                        "status": "online",
+                        "battery": 5 - slot % 5,
+                        "runtime": f"0{slot}:30",
+                        "antenna": "AB",
+                        "tx_offset": 0,
+                        "quality": 80 - slot,
+                        "frequency": f"572.{125 + slot * 25:03d}",
+                        "audio_level": -18 - slot,
+                        "rf_level": -58 - slot,
+                    }
+                    for slot in range(1, 5)
+                ],
+            }
+            for index in range(receivers)
+        ],
+    }
+
+
+def main() -> int:
+    """Print per-encode timings for every available backend at each snapshot size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    import django
+
+    django.setup()
+
+    from django.core.serializers.json import DjangoJSONEncoder
+
+    from micboard.utils.dependencies import is_installed
+    from micboard.utils.json_codec import JSON_BACKENDS, codec_for
+
+    encoders = {"django": lambda value: json.dumps(value, cls=DjangoJSONEncoder).encode()}
+    for name in JSON_BACKENDS:
+        if name == "stdlib" or is_installed(name):
+            encoders[name] = codec_for(name).dumps
+
+    print(f"{'receivers':>9}  {'backend':<8} {'bytes':>10} {'ms/encode':>10} {'speedup':>8}")
+    for size in args.sizes:
+        payload = device_update_snapshot(size)
+        baseline = None
+        for name, encode in encoders.items():
+            loops = max(1, 20_000 // size)
+            best = min(timeit.repeat(partial(encode, payload), number=loops, repeat=args.repeat))
+            per_call = best / loops
+            baseline = baseline or per_call
+            print(
+                f"{size:>9}  {name:<8} {len(encode(payload)):>10} "
+                f"{per_call * 1_000:>10.3f} {baseline / per_call:>7.2f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# ruff: noqa: T201
+"""Measure per-device decode cost of vendor payloads on the sync and realtime paths."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def shure_device(index: int, *, channels: int) -> dict[str, Any]:
+    """Return one flattened Shure System API device with populated channels."""
+    return {
+        "id": f"ulxd4q-{index:05d}",
+        "ipAddress": f"10.{index // 65_536}.{index // 256 % 256}.{index % 256}",
+        "type": "ULXD",
+        "model": "ULXD4Q",
+        "name": f"Rack {index}",
+        "firmwareVersion": "2.7.6.0",
+        "serialNumber": f"3JA{index:07d}",
+        "macAddress": f"00-0E-DD-{index // 65_536 % 256:02X}-{index // 256 % 256:02X}-"
+        f"{index % 256:02X}",
+        "hardwareIdentity": {"deviceId": f"ulxd4q-{index:05d}"},
+        "channels": [
+            {
+                "channelNumber": slot,
+                "transmitter": {
+                    "batteryBars": 4,
+                    "batteryCharge": 88,
+                    "batteryRuntimeMinutes": 300 - slot,
+                    "audioLevel": -18,
+                    "rfLevel": -62,
+                    "frequency": f"470.{slot:03d}",
+                    "antenna": "AB",
+                    "deviceName": f"Vox {slot}",
+                    "rfAntennaA": -61,
+                    "rfAntennaB": -64,
+                },
+            }
+            for slot in range(1, channels + 1)
+        ],
+    }
+
+
+def main() -> int:
+    """Print microseconds per device for each decode path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1_000)
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    import django
+
+    django.setup()
+
+    from micboard.integrations.shure.transformers import ShureDataTransformer
+    from micboard.services.common.base.wireless_payloads import DevicePayload
+    from micboard.services.core.hardware import NormalizedHardware
+    from micboard.utils import json_codec
+
+    devices = [shure_device(index, channels=args.channels) for index in range(args.devices)]
+    documents = [json.dumps(device).encode() for device in devices]
+
+    def sync_via_transform() -> None:
+        for document in documents:
+            NormalizedHardware.from_api(
+                ShureDataTransformer.transform_device_data(json.loads(document))
+            )
+
+    def sync_via_typed_payload() -> None:
+        for document in documents:
+            ShureDataTransformer.normalize_device_data(json_codec.loads(document))
+
+    def realtime_transform() -> None:
+        for document in documents:
+            ShureDataTransformer.transform_device_data(json_codec.loads(document))
+
+    def decode_only() -> None:
+        for document in documents:
+            DevicePayload.from_json(document)
+
+    paths = {
+        "sync: json + transform + from_api": sync_via_transform,
+        "sync: codec + typed normalize": sync_via_typed_payload,
+        "realtime: codec + transform": realtime_transform,
+        "decode: bytes to DevicePayload": decode_only,
+    }
+    print(
+        f"{args.devices} devices x {args.channels} channels, "
+        f"JSON codec {json_codec.active_codec().name}"
+    )
+    for label, run in paths.items():
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{label:<38} {best / args.devices * 1_000_000:>8.1f} us/device")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+"""Request-level operational log changelist paging coverage."""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from micboard.admin.activity_logs import ActivityLogAdmin
+from micboard.admin.performance import EstimatedCountPaginator
+from micboard.models.audit.activity_log import ActivityLog
+from tests.factories.audit import ActivityLogFactory, ServiceSyncLogFactory
+from tests.factories.base import UserFactory
+
+pytestmark = [pytest.mark.django_db, pytest.mark.e2e]
+
+
+@pytest.fixture
+def log_admin_client() -> Client:
+    superuser = UserFactory(username="log-admin", is_staff=True, is_superuser=True)
+    client = Client()
+    client.force_login(superuser)
+    return client
+
+
+def _activity_at(age: timedelta) -> ActivityLog:
+    activity = ActivityLogFactory()
+    ActivityLog.objects.filter(pk=activity.pk).update(created_at=timezone.now() - age)
+    return activity
+
+
+def test_activity_changelist_defaults_to_recent_window_and_pages_by_cursor(
+    log_admin_client, monkeypatch
+) -> None:
+    """Older pages continue from the last row instead of offsetting the table."""
+    monkeypatch.setattr(ActivityLogAdmin, "list_per_page", 2)
+    recent = [_activity_at(timedelta(hours=hours)) for hours in range(5)]
+    archived = _activity_at(timedelta(days=60))
+    url = reverse("admin:micboard_activitylog_changelist")
+
+    first = log_admin_client.get(url)
+    cursor_url = first.context["cl"].keyset_next_url
+    second = log_admin_client.get(url + cursor_url)
+    everything = log_admin_client.get(url, {"period": "all"})
+
+    assert [row.pk for row in first.context["cl"].result_list] == [recent[0].pk, recent[1].pk]
+    assert first.context["cl"].result_count == 5
+    assert cursor_url == f"?after={recent[1].pk}"
+    assert second.status_code == 200
+    assert [row.pk for row in second.context["cl"].result_list] == [recent[2].pk, recent[3].pk]
+    assert second.context["cl"].keyset_next_url == f"?after={recent[3].pk}"
+    assert "Older entries" in second.content.decode()
+    assert everything.context["cl"].result_count == 6
+    assert archived.pk not in {row.pk for row in first.context["cl"].result_list}
+
+
+def test_sync_changelist_cursor_keeps_active_filters(log_admin_client, monkeypatch) -> None:
+    """A cursor walks the filtered history and rejects unknown rows."""
+    monkeypatch.setattr("micboard.admin.activity_logs.ServiceSyncLogAdmin.list_per_page", 1)
+    now = timezone.now()
+    failed = [
+        ServiceSyncLogFactory(status="failed", started_at=now - timedelta(minutes=minutes))
+        for minutes in range(3)
+    ]
+    ServiceSyncLogFactory(status="success", started_at=now - timedelta(seconds=30))
+    url = reverse("admin:micboard_servicesynclog_changelist")
+
+    response = log_admin_client.get(url, {"status__exact": "failed", "after": failed[0].pk})
+    missing = log_admin_client.get(url, {"after": 0})
+
+    assert [row.pk for row in response.context["cl"].result_list] == [failed[1].pk]
+    assert response.context["cl"].keyset_next_url == f"?after={failed[1].pk}&status__exact=failed"
+    assert missing.status_code == 302
+
+
+def test_estimated_paginator_counts_exactly_below_the_bound(monkeypatch) -> None:
+    """Small result sets never consult planner statistics."""
+    activities = ActivityLogFactory.create_batch(3)
+    monkeypatch.setattr(connection, "vendor", "postgresql")
+    monkeypatch.setattr(EstimatedCountPaginator, "exact_count_limit", 2)
+    monkeypatch.setattr("micboard.admin.performance.estimated_row_count", lambda queryset: 40_000)
+
+    small = EstimatedCountPaginator(ActivityLog.objects.exclude(pk=activities[0].pk), 10)
+    large = EstimatedCountPaginator(ActivityLog.objects.all(), 10)
+
+    assert small.count == 2
+    assert large.count == 40_000
+
+
+def test_estimated_paginator_counts_once_without_planner_statistics(
+    django_assert_num_queries, monkeypatch
+) -> None:
+    """Backends without planner estimates skip the bounded count."""
+    ActivityLogFactory.create_batch(3)
+    monkeypatch.setattr(EstimatedCountPaginator, "exact_count_limit", 2)
+
+    with django_assert_num_queries(1):
+        assert EstimatedCountPaginator(ActivityLog.objects.all(), 10).count == 3
@@ -8,6 +8,7 @@ import factory
 
 from micboard.models.audit.activity_log import ActivityLog, ServiceSyncLog
 from micboard.models.audit.configuration_log import ConfigurationAuditLog
+from micboard.models.audit.retention import AuditLogDailySummary
 from tests.factories.base import ProjectModelFactory
 from tests.factories.registry import register_factory
 
@@ -44,3 +45,17 @@ class ConfigurationAuditLogFactory(ProjectModelFactory):
 
     configuration = factory.SubFactory("tests.factories.discovery.ManufacturerConfigurationFactory")
     action = ConfigurationAuditLog.Action.CREATE
+
+
+@register_factory("micboard.AuditLogDailySummary")
+class AuditLogDailySummaryFactory(ProjectModelFactory):
+    """Create a daily rollup of pruned API-health rows."""
+
+    class Meta:
+        model = AuditLogDailySummary
+
+    kind = AuditLogDailySummary.Kind.API_HEALTH
+    manufacturer = factory.SubFactory("tests.factories.discovery.ManufacturerFactory")
+    day = factory.LazyFunction(timezone.localdate)
+    row_count = 1
+    status_counts = factory.LazyFunction(lambda: {"healthy": 1})
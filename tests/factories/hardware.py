@@ -6,6 +6,7 @@ import factory
 
 from micboard.models.hardware.charger import Charger, ChargerSlot
 from micboard.models.hardware.display_wall import DisplayWall, WallSection
+from micboard.models.hardware.identity_lock import DeviceIdentityLock
 from micboard.models.hardware.wireless_chassis import WirelessChassis
 from micboard.models.hardware.wireless_unit import WirelessUnit
 from micboard.models.integrations import Accessory, ManufacturerAPIServer
@@ -65,6 +66,16 @@ class WallSectionFactory(ProjectModelFactory):
     name = factory.Sequence(lambda number: f"Section {number}")
 
 
+@register_factory("micboard.DeviceIdentityLock")
+class DeviceIdentityLockFactory(ProjectModelFactory):
+    """Create one identity lock bucket row."""
+
+    class Meta:
+        model = DeviceIdentityLock
+
+    bucket = factory.Sequence(lambda number: number)
+
+
 @register_factory("micboard.WirelessChassis")
 class WirelessChassisFactory(ProjectModelFactory):
     """Create a neutral chassis without provisioning RF channels."""
@@ -5,7 +5,10 @@ from __future__ import annotations
 import factory
 
 from micboard.models.monitoring.alert import Alert, UserAlertPreference
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
 from micboard.models.monitoring.group import MonitoringGroup, MonitoringGroupLocation
+from micboard.models.monitoring.inventory_counter import InventoryCounter
+from micboard.models.monitoring.location_access import LocationAccessGrant
 from micboard.models.monitoring.performer import Performer
 from micboard.models.monitoring.performer_assignment import PerformerAssignment
 
@@ -45,6 +48,30 @@ class MonitoringGroupLocationFactory(ProjectModelFactory):
     location = factory.SubFactory("tests.factories.locations.LocationFactory")
 
 
+@register_factory("micboard.InventoryCounter")
+class InventoryCounterFactory(ProjectModelFactory):
+    """Create one building counter row without touching the hardware tables."""
+
+    class Meta:
+        model = InventoryCounter
+
+    scope = InventoryCounter.Scope.BUILDING
+    scope_id = factory.Sequence(lambda number: number + 1)
+
+
+@register_factory("micboard.LocationAccessGrant")
+class LocationAccessGrantFactory(ProjectModelFactory):
+    """Create one materialized location grant consistent with its location."""
+
+    class Meta:
+        model = LocationAccessGrant
+
+    user = factory.SubFactory("tests.factories.base.UserFactory")
+    location = factory.SubFactory("tests.factories.locations.LocationFactory")
+    building = factory.SelfAttribute("location.building")
+    room = factory.SelfAttribute("location.room")
+
+
 @register_factory("micboard.PerformerAssignment")
 class PerformerAssignmentFactory(ProjectModelFactory):
     """Create a performer, unit, and monitoring-group assignment graph."""
@@ -79,3 +106,14 @@ class AlertFactory(ProjectModelFactory):
     user = factory.SubFactory("tests.factories.base.UserFactory")
     alert_type = "battery_low"
     message = factory.Sequence(lambda number: f"Factory alert {number}")
+
+
+@register_factory("micboard.AlertEmailOutbox")
+class AlertEmailOutboxFactory(ProjectModelFactory):
+    """Queue a pending email for a factory alert."""
+
+    class Meta:
+        model = AlertEmailOutbox
+
+    alert = factory.SubFactory("tests.factories.monitoring.AlertFactory")
+    recipient = factory.Sequence(lambda number: f"alert-recipient-{number}@example.test")
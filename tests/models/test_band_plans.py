@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -124,21 +124,56 @@ def _detection_registry() -> dict[str, dict[str, dict]]:
     }
 
 
-def test_detection_helpers_cover_match_and_no_match_strategies() -> None:
-    """Code, frequency, and partial-key helpers each remain independently usable."""
-    plans = _detection_registry()["vendor"]
+def test_detection_indexes_cover_match_and_no_match_strategies() -> None:
+    """Code, frequency, and partial-key indexes each remain independently usable."""
+    index = band_plans._BandPlanIndex.build(_detection_registry()["vendor"])
 
-    assert band_plans._find_plan_by_code(plans, "G50 extra") == "G50"
-    assert band_plans._find_plan_by_code(plans, "---") is None
-    assert band_plans._find_plan_by_code(plans, "missing") is None
-    assert band_plans._find_plan_by_code(plans, "nameless") is None
+    assert index.by_code("G50 extra") == "G50"
+    assert index.by_code("---") is None
+    assert index.by_code("missing") is None
+    assert index.by_code("nameless") is None
 
-    assert band_plans._find_plan_by_frequency_range(plans, "470-534 MHz") == "Range Plan"
-    assert band_plans._find_plan_by_frequency_range(plans, "no range") is None
-    assert band_plans._find_plan_by_frequency_range(plans, "700-800 MHz") is None
+    assert index.by_frequency_range("470-534 MHz") == "Range Plan"
+    assert index.by_frequency_range("no range") is None
+    assert index.by_frequency_range("700-800 MHz") is None
 
-    assert band_plans._find_plan_by_partial_key(plans, "Foo Bar extended") == "Foo Bar"
-    assert band_plans._find_plan_by_partial_key(plans, "unrelated") is None
+    assert index.by_partial_key("Foo Bar extended") == "Foo Bar"
+    assert index.by_partial_key("ange") == "Range Plan"
+    assert index.by_partial_key("unrelated") is None
+
+
+def test_partial_key_index_keeps_the_first_registry_match() -> None:
+    """Contained and containing keys resolve in fixture order, like a linear scan."""
+    index = band_plans._BandPlanIndex.build(
+        {"ab": {"name": "First"}, "b": {"name": "Second"}, "xb_c": {"name": "Third"}}
+    )
+
+    assert index.by_partial_key("b") == "First"
+    assert index.by_partial_key("zb") == "Second"
+    assert index.by_partial_key("x") == "Third"
+
+
+def test_catalog_loads_lazily_once_and_memoizes_detection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The fixture is parsed on first lookup and repeat detections skip the indexes."""
+    loader = Mock(return_value=_detection_registry())
+    monkeypatch.setattr(band_plans, "_load_band_plans", loader)
+    monkeypatch.setattr(band_plans.BandPlanCatalog, "_current", None)
+    monkeypatch.delitem(vars(band_plans), "BAND_PLAN_SPECIFICATIONS", raising=False)
+    loader.assert_not_called()
+
+    with patch.object(
+        band_plans._BandPlanIndex, "detect", autospec=True, side_effect=lambda _, value: value
+    ) as detect:
+        for _ in range(3):
+            band_plans.detect_band_plan_from_api_string(api_band_value="G50", manufacturer="vendor")
+        band_plans.get_band_plan_from_model_code(manufacturer="vendor", model="ULXD4Q-G50")
+        band_plans.get_band_plan_from_model_code(manufacturer="vendor", model="ULXD4Q-G50")
+
+    loader.assert_called_once_with()
+    assert detect.call_count == 2
+    assert _detection_registry() == band_plans.BAND_PLAN_SPECIFICATIONS
 
 
 @pytest.mark.parametrize(
@@ -215,3 +250,31 @@ def test_model_code_detection_finds_embedded_band_hint(
         )
         == expected
     )
+
+
+def test_partial_key_index_stays_linear_in_key_length() -> None:
+    """Long keys add one prefix entry per character, not every substring."""
+    key = "x" * 200 + "_tail"
+    index = band_plans._BandPlanIndex.build({"short": {"name": "Short"}, key: {"name": "Long"}})
+
+    assert len(index.by_prefix) <= len("short") + len(key)
+    assert index.by_partial_key("xxx_ta") == "Long"
+    assert index.by_partial_key("very short plan") == "Short"
+    assert index.by_partial_key("t\0x") is None
+
+
+def test_detection_memo_evicts_least_recently_used_answers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A full memo drops its oldest untouched entry instead of ignoring new values."""
+    monkeypatch.setattr(band_plans, "_MEMO_LIMIT", 2)
+    catalog = band_plans.BandPlanCatalog.build(_detection_registry())
+
+    catalog.detect("vendor", "G50")
+    catalog.detect("vendor", "Foo Bar extended")
+    catalog.detect("vendor", "G50")
+    catalog.detect("vendor", "unrelated")
+
+    assert len(catalog._detected) == 2
+    assert catalog._detected.get(("vendor", "G50")) == (True, "G50")
+    assert catalog._detected.get(("vendor", "Foo Bar extended")) == (False, None)
@@ -167,6 +167,40 @@ def test_repeated_poll_reaches_station_behind_ordinary_inventory_prefix() -> Non
     plugin.get_device_channels.assert_called_once_with("charger-1")
 
 
+@override_settings(MICBOARD_CHARGER_MAX_DEVICES=2)
+def test_continuation_pages_iterate_the_cached_inventory_version() -> None:
+    """One inventory read serves a whole cycle; vendor changes land in the next cycle."""
+    manufacturer = _manufacturer()
+    inventory_key = ChargerPollingCacheAdapter.inventory_key(manufacturer)
+    backend, values = _cache_backend()
+    inventory = [
+        {"api_device_id": "charger-1", "model": "SBC250", "name": "Stage Left"},
+        {"api_device_id": "receiver-1", "model": "AD4Q", "untracked": "x" * 1_000},
+        {"api_device_id": "charger-2", "model": "SBC850"},
+    ]
+    plugin = _plugin(inventory)
+
+    with _plugin_patch(plugin), patch("micboard.services.chargers.polling_cache.cache", backend):
+        ChargerPollingService.poll(manufacturer)
+
+        snapshot = values[inventory_key]
+        assert isinstance(snapshot, dict)
+        assert snapshot["version"] == _inventory_fingerprint(inventory)
+        assert snapshot["items"][1] == {"api_device_id": "receiver-1", "model": "AD4Q"}
+
+        plugin.get_devices.return_value = [{"api_device_id": "charger-3", "model": "SBC250"}]
+        completed = ChargerPollingService.poll(manufacturer)
+
+        assert completed.scanned_count == 1
+        assert _snapshot_ids(values["charger_data_shure"]) == ["charger-1", "charger-2"]
+        assert plugin.get_devices.call_count == 1
+
+        ChargerPollingService.poll(manufacturer)
+
+    assert plugin.get_devices.call_count == 2
+    assert _snapshot_ids(values["charger_data_shure"]) == ["charger-3"]
+
+
 @override_settings(MICBOARD_CHARGER_MAX_DEVICES=2)
 def test_channel_failure_in_any_page_preserves_last_complete_snapshot() -> None:
     """A failed station subrequest makes the entire paginated cycle non-publishable."""
@@ -181,7 +215,13 @@ def test_channel_failure_in_any_page_preserves_last_complete_snapshot() -> None:
         {"api_device_id": "charger-tail", "model": "SBC250"},
     ]
     plugin = _plugin(inventory)
-    plugin.get_device_channels.side_effect = [RuntimeError("private channel failure"), [], []]
+
+    def channels(device_id: str) -> list[dict[str, object]]:
+        if device_id == "charger-failed":
+            raise RuntimeError("private channel failure")
+        return []
+
+    plugin.get_device_channels.side_effect = channels
 
     with _plugin_patch(plugin), patch("micboard.services.chargers.polling_cache.cache", backend):
         first = ChargerPollingService.poll(manufacturer)
@@ -225,6 +265,7 @@ def test_cursor_accumulates_in_inventory_order_and_deduplicates_across_pages() -
 
 @override_settings(MICBOARD_CHARGER_MAX_DEVICES=2)
 def test_changed_inventory_size_restarts_cycle_without_stale_stations() -> None:
+    """Without its cached inventory version, a cursor only resumes an unchanged inventory."""
     manufacturer = _manufacturer()
     public_key = "charger_data_shure"
     previous_snapshot = [{"id": "previous-complete-snapshot"}]
@@ -240,6 +281,7 @@ def test_changed_inventory_size_restarts_cycle_without_stale_stations() -> None:
 
     with _plugin_patch(plugin), patch("micboard.services.chargers.polling_cache.cache", backend):
         ChargerPollingService.poll(manufacturer)
+        values.pop(ChargerPollingCacheAdapter.inventory_key(manufacturer))
         plugin.get_devices.return_value = [
             {"api_device_id": "replacement-charger", "model": "SBC250"},
             {"api_device_id": "receiver", "model": "AD4Q"},
@@ -266,6 +308,7 @@ def test_changed_inventory_size_restarts_cycle_without_stale_stations() -> None:
 
 @override_settings(MICBOARD_CHARGER_MAX_DEVICES=2)
 def test_same_length_inventory_reorder_restarts_without_hybrid_station_order() -> None:
+    """An evicted inventory version falls back to fingerprint checks on the live inventory."""
     manufacturer = _manufacturer()
     backend, values = _cache_backend()
     plugin = _plugin(
@@ -278,6 +321,7 @@ def test_same_length_inventory_reorder_restarts_without_hybrid_station_order() -
 
     with _plugin_patch(plugin), patch("micboard.services.chargers.polling_cache.cache", backend):
         ChargerPollingService.poll(manufacturer)
+        values.pop(ChargerPollingCacheAdapter.inventory_key(manufacturer))
         plugin.get_devices.return_value = [
             {"api_device_id": "charger-c", "model": "SBC250"},
             {"api_device_id": "charger-b", "model": "SBC250"},
@@ -294,17 +338,18 @@ def test_same_length_inventory_reorder_restarts_without_hybrid_station_order() -
         "charger-b",
         "charger-a",
     ]
-    assert plugin.get_device_channels.call_args_list == [
+    assert sorted(plugin.get_device_channels.call_args_list) == [
+        call("charger-a"),
         call("charger-a"),
         call("charger-b"),
-        call("charger-c"),
         call("charger-b"),
-        call("charger-a"),
+        call("charger-c"),
     ]
 
 
 @override_settings(MICBOARD_CHARGER_MAX_DEVICES=2)
 def test_same_length_identity_change_discards_stale_accumulated_station() -> None:
+    """An evicted inventory version cannot resume across a live identity change."""
     manufacturer = _manufacturer()
     backend, values = _cache_backend()
     plugin = _plugin(
@@ -317,6 +362,7 @@ def test_same_length_identity_change_discards_stale_accumulated_station() -> Non
 
     with _plugin_patch(plugin), patch("micboard.services.chargers.polling_cache.cache", backend):
         ChargerPollingService.poll(manufacturer)
+        values.pop(ChargerPollingCacheAdapter.inventory_key(manufacturer))
         plugin.get_devices.return_value = [
             {"api_device_id": "replacement-charger", "model": "SBC250"},
             {"api_device_id": "receiver", "model": "AD4Q"},
@@ -434,7 +480,8 @@ def test_partial_poll_contains_cursor_read_and_write_failures(caplog) -> None:
     assert result.scanned_count == 2
     assert result.cached_count == 0
     assert secret not in caplog.text
-    backend.set.assert_called_once()
+    # The inventory snapshot and the cursor are each attempted once.
+    assert backend.set.call_count == 2
     backend.delete.assert_not_called()
 
 
@@ -550,11 +597,11 @@ def test_station_cap_retains_same_exact_vendor_order_prefix_across_cycles() -> N
         "charger-0",
         "charger-1",
     ]
-    assert plugin.get_device_channels.call_args_list == [
+    assert sorted(plugin.get_device_channels.call_args_list) == [
         call("charger-0"),
-        call("charger-1"),
         call("charger-0"),
         call("charger-1"),
+        call("charger-1"),
     ]
 
 
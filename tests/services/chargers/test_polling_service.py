@@ -28,8 +28,8 @@ def test_poll_maps_supported_stations_and_checks_health_once() -> None:
         {"api_device_id": "receiver-1", "model": "AD4Q"},
         {"api_device_id": 99, "model": "SBC850"},
     ]
-    plugin.get_device_channels.side_effect = [
-        [
+    channels = {
+        "station-1": [
             {
                 "channel": 2,
                 "tx": {
@@ -40,8 +40,9 @@ def test_poll_maps_supported_stations_and_checks_health_once() -> None:
             },
             {"channel": 3, "tx": None},
         ],
-        [],
-    ]
+        "station-2": [],
+    }
+    plugin.get_device_channels.side_effect = channels.__getitem__
     plugin.get_client.return_value.is_healthy.return_value = True
 
     with (
@@ -53,7 +54,11 @@ def test_poll_maps_supported_stations_and_checks_health_once() -> None:
     ):
         result = ChargerPollingService.poll(_manufacturer())
 
-    assert plugin.get_device_channels.call_args_list == [call("station-1"), call("station-2")]
+    # Station requests run concurrently; the snapshot keeps inventory order regardless.
+    assert sorted(plugin.get_device_channels.call_args_list) == [
+        call("station-1"),
+        call("station-2"),
+    ]
     plugin.get_client.return_value.is_healthy.assert_called_once_with()
     assert result.scanned_count == 4
     assert result.cached_count == 2
@@ -176,7 +181,10 @@ def test_poll_deduplicates_station_ids_before_channel_requests() -> None:
     ):
         result = ChargerPollingService.poll(_manufacturer())
 
-    assert plugin.get_device_channels.call_args_list == [call("station-1"), call("station-2")]
+    assert sorted(plugin.get_device_channels.call_args_list) == [
+        call("station-1"),
+        call("station-2"),
+    ]
     assert result.scanned_count == 3
     assert result.cached_count == 2
 
@@ -0,0 +1,154 @@
+"""Incremental charger slot persistence and bounded station request contracts."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from micboard.models.hardware.charger import ChargerSlot
+from micboard.services.chargers.polling_cache import ChargerPollingCacheAdapter
+from micboard.services.chargers.polling_service import ChargerPollingService
+from tests.factories.hardware import ChargerFactory, ChargerSlotFactory
+
+
+def _plugin(inventory: list[dict[str, object]], channels: dict[str, list[dict]]) -> Mock:
+    plugin = Mock()
+    plugin.get_devices.return_value = inventory
+    plugin.get_device_channels.side_effect = lambda device_id: channels[device_id]
+    plugin.get_client.return_value.is_healthy.return_value = True
+    return plugin
+
+
+def _poll(manufacturer, plugin: Mock):
+    with patch(
+        "micboard.services.chargers.polling_service.get_manufacturer_plugin",
+        return_value=Mock(return_value=plugin),
+    ):
+        return ChargerPollingService.poll(manufacturer)
+
+
+def _slot(number: int, battery: int, *, charging: bool = True) -> dict[str, object]:
+    return {
+        "channel": number,
+        "tx": {"name": f"Mic {number}", "battery_percentage": battery, "charging_status": charging},
+    }
+
+
+@pytest.fixture
+def charger(db):
+    charger = ChargerFactory(ip="192.0.2.10", serial_number="SBC-0001")
+    ChargerSlotFactory(charger=charger, slot_number=1, occupied=False)
+    ChargerSlotFactory(charger=charger, slot_number=3, occupied=True, battery_percent=40)
+    cache.delete(ChargerPollingCacheAdapter.station_digest_key(charger.manufacturer))
+    return charger
+
+
+@pytest.mark.django_db
+def test_changed_station_payloads_are_written_in_bulk(charger) -> None:
+    """Reported slots are created or updated together and vacated slots are emptied."""
+    inventory = [
+        {"api_device_id": "station-1", "model": "SBC250", "ip": "192.0.2.10"},
+        {"api_device_id": "station-2", "model": "SBC250", "serial": "unknown-serial"},
+    ]
+    channels = {"station-1": [_slot(1, 80), _slot(2, 55, charging=False)], "station-2": []}
+
+    result = _poll(charger.manufacturer, _plugin(inventory, channels))
+
+    # Both payloads are new; only the station matching a persisted charger has slot rows.
+    assert result.stations_changed == 2
+    assert not ChargerSlot.objects.exclude(charger=charger).exists()
+    slots = {slot.slot_number: slot for slot in ChargerSlot.objects.filter(charger=charger)}
+    assert (slots[1].occupied, slots[1].battery_percent, slots[1].device_status) == (
+        True,
+        80,
+        "charging",
+    )
+    assert (slots[2].occupied, slots[2].battery_percent, slots[2].device_status) == (
+        True,
+        55,
+        "docked",
+    )
+    assert (slots[3].occupied, slots[3].battery_percent) == (False, None)
+
+
+@pytest.mark.django_db
+def test_unchanged_station_payloads_skip_the_database(charger) -> None:
+    """A repeated payload is recognized from its digest without reading charger rows."""
+    inventory = [{"api_device_id": "station-1", "model": "SBC250", "serial": "SBC-0001"}]
+    channels = {"station-1": [_slot(1, 80)]}
+    _poll(charger.manufacturer, _plugin(inventory, channels))
+
+    with CaptureQueriesContext(connection) as queries:
+        repeated = _poll(charger.manufacturer, _plugin(inventory, channels))
+
+    assert repeated.stations_changed == 0
+    assert len(queries) == 0
+
+    channels["station-1"] = [_slot(1, 75)]
+    changed = _poll(charger.manufacturer, _plugin(inventory, channels))
+
+    assert changed.stations_changed == 1
+    assert ChargerSlot.objects.get(charger=charger, slot_number=1).battery_percent == 75
+
+
+@pytest.mark.django_db
+def test_slot_write_failure_is_retried_on_the_next_poll(charger, caplog) -> None:
+    """A failed write records no digest, so the same payload is written once storage recovers."""
+    secret = "database-password=secret"
+    inventory = [{"api_device_id": "station-1", "model": "SBC250", "ip": "192.0.2.10"}]
+    channels = {"station-1": [_slot(1, 90)]}
+
+    with patch.object(ChargerSlot.objects, "bulk_update", side_effect=RuntimeError(secret)):
+        failed = _poll(charger.manufacturer, _plugin(inventory, channels))
+    recovered = _poll(charger.manufacturer, _plugin(inventory, channels))
+
+    assert (failed.stations_changed, recovered.stations_changed) == (0, 1)
+    assert ChargerSlot.objects.get(charger=charger, slot_number=1).battery_percent == 90
+    assert secret not in caplog.text
+
+
+@override_settings(MICBOARD_CHARGER_SLOT_CONCURRENCY=2)
+def test_station_requests_are_concurrent_but_bounded() -> None:
+    """Slot reads overlap up to the configured bound and keep inventory order."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def channels(device_id: str) -> list[dict[str, object]]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return [_slot(int(device_id.rsplit("-", 1)[1]), 50)]
+
+    plugin = Mock()
+    plugin.get_devices.return_value = [
+        {"api_device_id": f"station-{index}", "model": "SBC250"} for index in range(6)
+    ]
+    plugin.get_device_channels.side_effect = channels
+    plugin.get_client.return_value.is_healthy.return_value = True
+
+    with (
+        patch(
+            "micboard.services.chargers.polling_service.get_manufacturer_plugin",
+            return_value=Mock(return_value=plugin),
+        ),
+        patch("micboard.services.chargers.polling_cache.cache.set") as cache_set,
+    ):
+        result = ChargerPollingService.poll(Mock(pk=7, code="shure"))
+
+    assert result.cached_count == 6
+    assert peak == 2
+    published = cache_set.call_args.args[1]
+    assert [station["id"] for station in published] == [f"station-{index}" for index in range(6)]
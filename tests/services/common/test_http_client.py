@@ -410,3 +410,23 @@ def test_context_manager_closes_transport(transport_client) -> None:
     with transport_client as entered:
         assert entered is transport_client
     transport_client.client.close.assert_called_once_with()
+
+
+def test_requests_feed_passive_health_but_health_probes_do_not(
+    monkeypatch, transport_client
+) -> None:
+    observe = Mock()
+    monkeypatch.setattr(client_module.APITrafficHealth, "observe", observe)
+    transport_client._send_bounded_request = Mock(
+        side_effect=[_response(200, content=b"{}"), _response(500), _response(200)]
+    )
+
+    assert transport_client._make_request("GET", "/resource") == {}
+    with pytest.raises(DummyAPIError):
+        transport_client._make_request("GET", "/resource")
+    transport_client.check_health()
+
+    assert [entry.kwargs["ok"] for entry in observe.call_args_list] == [True, False]
+    assert {entry.args for entry in observe.call_args_list} == {("test",)}
+    assert observe.call_args.kwargs["breaker_state"] == "closed"
+    assert observe.call_args.kwargs["latency"] >= 0
@@ -0,0 +1,208 @@
+"""Typed vendor payload decoders against real Shure and Sennheiser payload shapes."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import fields
+
+import pytest
+
+from micboard.integrations.sennheiser.transformers import SennheiserDataTransformer
+from micboard.integrations.shure.device_client import ShureDeviceClient
+from micboard.integrations.shure.plugin import ShurePlugin
+from micboard.integrations.shure.transformers import ShureDataTransformer
+from micboard.services.common.base import wireless_payloads
+from micboard.services.common.base.wireless_payloads import (
+    ChannelPayload,
+    DevicePayload,
+    TransmitterPayload,
+)
+from micboard.services.core.hardware import NormalizedHardware
+from micboard.services.manufacturer.sync import ManufacturerSyncService
+from tests.vendor_test_helpers import disable_rate_limit_waits, vendor_api
+
+SHURE_DEVICE_NODE = {
+    "hardwareIdentity": {"deviceId": "ulxd4q-0001", "serialNumber": "3JA1234567"},
+    "communicationProtocol": {"address": "192.0.2.21", "protocol": "ACN"},
+    "softwareIdentity": {"model": "ULXD4Q", "firmwareVersion": "2.7.6.0"},
+    "type": "ULXD",
+    "name": " Stage Left Rack ",
+    "macAddress": "00-0E-DD-AA-BB-CC",
+    "frequencyBand": "G50",
+    "channels": [
+        {
+            "channelNumber": 1,
+            "transmitter": {
+                "batteryBars": 4,
+                "batteryCharge": 88,
+                "batteryRuntimeMinutes": 312,
+                "batteryType": "LION",
+                "audioLevel": -18,
+                "rfLevel": -62,
+                "frequency": "470.125",
+                "antenna": "AB",
+                "deviceName": "Vox 1",
+                "isMuted": False,
+                "txPower": "10mW",
+                "rfAntennaA": -61,
+                "rfAntennaB": -64,
+            },
+        },
+        {"channelNumber": 2, "transmitter": {}},
+    ],
+}
+SENNHEISER_SSC_DEVICE = {
+    "id": "ewdx-em4-77",
+    "ip_address": "198.51.100.40",
+    "type": "EW-D",
+    "model_name": "EW-DX EM 4",
+    "firmware_version": "3.1.0",
+    "serial_number": "1234567890",
+    "mac_address": "00:1b:66:01:02:03",
+    "frequency_band": "Q1-9",
+    "channels": [
+        {
+            "channel": 1,
+            "tx": {
+                "battery_bars": 3,
+                "battery_runtime_minutes": 95,
+                "audio_level": -22,
+                "rf_level": -70,
+                "frequency": 550.2,
+                "name": "Lectern",
+                "slot": None,
+            },
+        }
+    ],
+}
+
+
+@pytest.fixture
+def shure_device(monkeypatch) -> dict:
+    """One device exactly as ``ShureDeviceClient`` hands it to the transformer."""
+    disable_rate_limit_waits(monkeypatch)
+    client = ShureDeviceClient(vendor_api({"edges": [{"node": SHURE_DEVICE_NODE}]}))
+    (device,) = client.get_devices()
+    return device
+
+
+@pytest.mark.parametrize(
+    ("struct", "schema"),
+    [
+        (TransmitterPayload, wireless_payloads._TRANSMITTER_SCHEMA),
+        (ChannelPayload, wireless_payloads._CHANNEL_SCHEMA),
+        (DevicePayload, wireless_payloads._DEVICE_SCHEMA),
+    ],
+)
+def test_struct_fields_follow_their_schema(struct, schema) -> None:
+    assert [field.name for field in fields(struct)] == [entry[0] for entry in schema]
+    assert "__slots__" in vars(struct)
+
+
+def test_shure_payload_decodes_into_the_transformed_format(shure_device) -> None:
+    result = ShureDataTransformer.transform_device_data(shure_device)
+
+    assert result is not None
+    assert {key: result[key] for key in ("api_device_id", "ip", "type", "name", "firmware")} == {
+        "api_device_id": "ulxd4q-0001",
+        "ip": "192.0.2.21",
+        "type": "ulxd",
+        "name": " Stage Left Rack ",
+        "firmware": "2.7.6.0",
+    }
+    assert result["serial"] == "3JA1234567"
+    assert result["info"]["raw_model"] == ""
+    assert [channel["channel"] for channel in result["channels"]] == [1]
+    transmitter = result["channels"][0]["tx"]
+    assert transmitter["runtime"] == "05:12"
+    assert transmitter["slot"] == 1
+    assert transmitter["quality"] == 255
+    assert transmitter["extra"]["antenna_metrics"] == {"a": -61, "b": -64}
+
+
+def test_present_aliases_win_even_when_null_and_truthy_fields_skip_empties() -> None:
+    device = DevicePayload.from_mapping(
+        {"id": "rx", "ip": "", "ipAddress": "192.0.2.5", "serial_number": None, "serialNumber": "S"}
+    )
+    transmitter = TransmitterPayload.from_mapping({"slot": None, "batteryBars": 2}, 4)
+
+    assert device.ip == "192.0.2.5"
+    assert device.serial is None
+    assert transmitter.slot is None
+    assert transmitter.battery_bars == 2
+    assert TransmitterPayload.from_mapping({}, 4).slot == 4
+
+
+@pytest.mark.parametrize(
+    ("transformer", "payload"),
+    [
+        (ShureDataTransformer, "shure"),
+        (SennheiserDataTransformer, SENNHEISER_SSC_DEVICE),
+        (ShureDataTransformer, {"id": "rx", "ipAddress": "192.0.2.9", "type": "AD"}),
+        (SennheiserDataTransformer, {"id": "rx"}),
+    ],
+)
+def test_typed_normalization_matches_the_transformed_dict_path(
+    transformer, payload, shure_device
+) -> None:
+    raw = shure_device if payload == "shure" else payload
+    transformed = transformer.transform_device_data(raw)
+    expected = NormalizedHardware.from_api(transformed) if transformed else None
+
+    assert transformer.normalize_device_data(raw) == expected
+    decoded = DevicePayload.from_json(json.dumps(raw).encode())
+    fallback = transformer._identify(decoded)["model"]
+    assert decoded.normalized_hardware(fallback_name=fallback) == expected
+
+
+@pytest.mark.parametrize(
+    ("transformer", "payload"),
+    [
+        (ShureDataTransformer, "shure"),
+        (
+            SennheiserDataTransformer,
+            {
+                **SENNHEISER_SSC_DEVICE,
+                "name": "  Lectern Rack ",
+                "serial_number": " 1234567890 ",
+                "mac_address": "00-1B-66-01-02-03",
+            },
+        ),
+    ],
+)
+def test_constructed_hardware_is_the_validated_from_api_model(
+    transformer, payload, shure_device
+) -> None:
+    raw = shure_device if payload == "shure" else payload
+    expected = NormalizedHardware.from_api(transformer.transform_device_data(raw))
+    decoded = DevicePayload.from_json(json.dumps(raw).encode())
+
+    constructed = decoded.normalized_hardware(fallback_name=transformer._identify(decoded)["model"])
+
+    assert expected is not None
+    assert constructed is not None
+    assert constructed.model_dump() == expected.model_dump()
+    assert NormalizedHardware.model_validate(constructed.model_dump()) == constructed
+    for name in NormalizedHardware.model_fields:
+        assert type(getattr(constructed, name)) is type(getattr(expected, name)), name
+
+
+def test_normalization_never_decodes_channels() -> None:
+    device = {"id": "rx", "ip": "192.0.2.7", "channels": [object()]}
+
+    assert ShureDataTransformer.transform_device_data(device) is None
+    normalized = ShureDataTransformer.normalize_device_data(device)
+    assert normalized is not None
+    assert normalized.name == "Unknown"
+
+
+def test_sync_normalizes_through_the_plugin_hook(shure_device) -> None:
+    plugin = ShurePlugin(None)
+
+    (normalized,) = ManufacturerSyncService._normalize_devices([shure_device, {}], plugin)
+
+    assert normalized.api_device_id == "ulxd4q-0001"
+    assert normalized.mac_address == "00:0e:dd:aa:bb:cc"
+    assert normalized.name == "Stage Left Rack"
+    with pytest.raises(ValueError):
+        DevicePayload.from_json(b"[1, 2]")
@@ -174,10 +174,11 @@ def test_channel_sync_binds_all_reads_and_writes_to_database_alias() -> None:
         call(chassis_id=17),
         call(chassis_id=17, channel_number=3),
     ]
-    alias_channels.create.assert_called_once_with(
-        chassis_id=17,
-        channel_number=2,
-        link_direction="receive",
+    ((created,),) = (call.args[0] for call in alias_channels.bulk_create.call_args_list)
+    assert (created.chassis_id, created.channel_number, created.link_direction) == (
+        17,
+        2,
+        "receive",
     )
     excess_channel.delete.assert_called_once_with()
 
@@ -202,8 +203,9 @@ def test_channel_sync_derives_link_direction_from_chassis_role(
     ):
         assert HardwareSyncService.ensure_channel_count(chassis=chassis) == (1, 0)
 
-    alias_channels.create.assert_called_once_with(
-        chassis_id=17,
-        channel_number=1,
-        link_direction=expected_direction,
+    ((created,),) = (call.args[0] for call in alias_channels.bulk_create.call_args_list)
+    assert (created.chassis_id, created.channel_number, created.link_direction) == (
+        17,
+        1,
+        expected_direction,
     )
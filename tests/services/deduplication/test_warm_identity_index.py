@@ -0,0 +1,169 @@
+"""Warm per-process identity index: seeding, version stamps, pending rows, and ceiling."""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+
+import pytest
+
+from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.services.deduplication.identity_index import DeviceIdentityIndex
+from micboard.services.deduplication.identity_mutation_lock import DeviceIdentity
+from micboard.services.deduplication.warm_identity_index import WarmDeviceIdentityIndex
+from tests.factories.discovery import ManufacturerFactory
+from tests.factories.hardware import WirelessChassisFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index(settings) -> None:
+    settings.MICBOARD_DEVICE_IDENTITY_INDEX_ALLOW_LOCAL_CACHE = True
+    cache.clear()
+    WarmDeviceIdentityIndex.reset()
+    yield
+    WarmDeviceIdentityIndex.reset()
+    cache.clear()
+
+
+def _lookup(manufacturer_id: int, **keys: set[str]) -> set[int] | None:
+    values = {"serials": set(), "macs": set(), "ips": set(), "api_ids": set(), **keys}
+    records = WarmDeviceIdentityIndex.lookup(manufacturer_id=manufacturer_id, **values)
+    return None if records is None else {record.pk for record in records}
+
+
+def test_steady_state_polls_resolve_identities_without_identity_queries(
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+) -> None:
+    manufacturer = ManufacturerFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        chassis = WirelessChassisFactory(
+            manufacturer=manufacturer,
+            api_device_id="rx-1",
+            serial_number="SN-1",
+            ip="192.0.2.10",
+            mac_address="02-00-00-00-00-0A",
+        )
+    identity = DeviceIdentity(
+        ip="192.0.2.10",
+        api_device_id="rx-1",
+        serial_number="SN-1",
+        mac_address="02:00:00:00:00:0a",
+    )
+
+    with django_assert_num_queries(1):
+        assert _lookup(manufacturer.pk, serials={"SN-1"}) == {chassis.pk}
+    with django_assert_num_queries(0):
+        stored = DeviceIdentityIndex.stored_identities([identity], manufacturer=manufacturer)
+    assert [record.pk for record in stored] == [chassis.pk]
+    with django_assert_num_queries(1):
+        index = DeviceIdentityIndex.build([identity], manufacturer=manufacturer)
+    assert index.serial("SN-1") == chassis
+    assert index.mac("02:00:00:00:00:0A") == chassis
+    assert index.api_id(manufacturer.pk, "rx-1") == chassis
+    with django_assert_num_queries(0):
+        assert _lookup(manufacturer.pk, api_ids={"rx-2"}) == set()
+
+
+def test_saves_deletes_and_bulk_writes_refetch_only_stamped_rows(
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+) -> None:
+    manufacturer = ManufacturerFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        moving = WirelessChassisFactory(manufacturer=manufacturer, ip="192.0.2.10")
+        removed = WirelessChassisFactory(manufacturer=manufacturer, ip="192.0.2.11")
+    assert _lookup(manufacturer.pk, ips={"192.0.2.10", "192.0.2.11"}) == {moving.pk, removed.pk}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        moving.ip = "192.0.2.20"
+        moving.save()
+        removed.delete()
+    with django_assert_num_queries(1):
+        assert _lookup(manufacturer.pk, ips={"192.0.2.10", "192.0.2.11"}) == set()
+    assert _lookup(manufacturer.pk, ips={"192.0.2.20"}) == {moving.pk}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        WirelessChassis.objects.filter(pk=moving.pk).update(serial_number="SN-BULK")
+        (created,) = WirelessChassis.objects.bulk_create(
+            [
+                WirelessChassis(
+                    manufacturer=manufacturer,
+                    api_device_id="bulk",
+                    ip="192.0.2.30",
+                    role="receiver",
+                )
+            ]
+        )
+    assert _lookup(manufacturer.pk, serials={"SN-BULK"}, api_ids={"bulk"}) == {
+        moving.pk,
+        created.pk,
+    }
+
+    moving.refresh_from_db()
+    with django_capture_on_commit_callbacks(execute=True):
+        moving.status = "offline"
+        moving.save()
+    with django_assert_num_queries(0):
+        assert _lookup(manufacturer.pk, ips={"192.0.2.20"}) == {moving.pk}
+
+
+def test_pending_rows_are_read_per_lookup_and_rollbacks_never_leak() -> None:
+    manufacturer = ManufacturerFactory()
+    assert _lookup(manufacturer.pk, api_ids={"rx-1"}) == set()
+
+    chassis = WirelessChassisFactory(manufacturer=manufacturer, api_device_id="rx-1")
+    assert _lookup(manufacturer.pk, api_ids={"rx-1"}) == {chassis.pk}
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        WirelessChassisFactory(manufacturer=manufacturer, api_device_id="rx-2")
+        assert _lookup(manufacturer.pk, api_ids={"rx-2"}) != set()
+        raise RuntimeError("roll back")
+
+    assert _lookup(manufacturer.pk, api_ids={"rx-2"}) == set()
+
+
+def test_lost_version_stamps_reseed_the_index(django_capture_on_commit_callbacks) -> None:
+    manufacturer = ManufacturerFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        chassis = WirelessChassisFactory(manufacturer=manufacturer, serial_number="SN-1")
+    assert _lookup(manufacturer.pk, serials={"SN-1"}) == {chassis.pk}
+
+    cache.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        chassis.serial_number = "SN-2"
+        chassis.save()
+
+    assert _lookup(manufacturer.pk, serials={"SN-1", "SN-2"}) == {chassis.pk}
+    assert _lookup(manufacturer.pk, serials={"SN-1"}) == set()
+
+
+def test_local_memory_caches_keep_the_index_cold_unless_allowed(settings) -> None:
+    manufacturer = ManufacturerFactory()
+    settings.MICBOARD_DEVICE_IDENTITY_INDEX_ALLOW_LOCAL_CACHE = False
+
+    assert _lookup(manufacturer.pk, api_ids={"rx-1"}) is None
+
+
+@override_settings(MICBOARD_DEVICE_IDENTITY_INDEX_MAX_CHASSIS=2)
+def test_inventory_over_the_memory_ceiling_falls_back_to_identity_queries(
+    django_capture_on_commit_callbacks,
+) -> None:
+    manufacturer = ManufacturerFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        first, _second = WirelessChassisFactory.create_batch(2, manufacturer=manufacturer)
+    assert _lookup(manufacturer.pk, api_ids={first.api_device_id}) == {first.pk}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        third = WirelessChassisFactory(manufacturer=manufacturer)
+
+    assert _lookup(manufacturer.pk, api_ids={third.api_device_id}) is None
+    assert WarmDeviceIdentityIndex._stores["default"].records == {}
+    index = DeviceIdentityIndex.build(
+        [DeviceIdentity(ip=third.ip, api_device_id=third.api_device_id)],
+        manufacturer=manufacturer,
+    )
+    assert index.api_id(manufacturer.pk, third.api_device_id) == third
@@ -32,6 +32,15 @@ def _new_chassis(**overrides: object) -> SimpleNamespace:
     return SimpleNamespace(**values)
 
 
+_IDENTITY: dict[str, object] = {
+    "manufacturer_id": 1,
+    "api_device_id": "rx-1",
+    "ip": "192.0.2.10",
+    "serial_number": "SN-1",
+    "mac_address": None,
+}
+
+
 @pytest.mark.parametrize(
     ("minimum", "maximum", "expected"),
     [(None, None, False), (470.0, None, False), (534.0, 470.0, False), (470.0, 534.0, True)],
@@ -157,7 +166,11 @@ def test_new_chassis_lifecycle_derives_operational_fields(
     context = lifecycle_service.prepare_chassis_for_save(chassis)
 
     assert chassis.is_online is expected_online
-    assert context == ChassisSaveContext(created=True, update_fields=expected_fields)
+    assert context == ChassisSaveContext(
+        created=True,
+        identity_changed=True,
+        update_fields=expected_fields,
+    )
 
 
 def test_existing_chassis_rejects_an_invalid_transition() -> None:
@@ -167,6 +180,7 @@ def test_existing_chassis_rejects_an_invalid_transition() -> None:
         is_online=True,
         last_online_at=timezone.now(),
         total_uptime_minutes=0,
+        **_IDENTITY,
     )
     manager = Mock()
     manager.using.return_value.only.return_value.get.return_value = previous
@@ -180,6 +194,7 @@ def test_existing_chassis_rejects_an_invalid_transition() -> None:
     chassis.status = "retired"
     chassis.manufacturer = None
     chassis.model = ""
+    vars(chassis).update(_IDENTITY)
 
     with pytest.raises(ValueError, match="Invalid status transition"):
         lifecycle_service.prepare_chassis_for_save(chassis, using="inventory")
@@ -194,6 +209,8 @@ def test_existing_chassis_records_uptime_when_leaving_operational_state() -> Non
         is_online=True,
         last_online_at=now - timedelta(minutes=12),
         total_uptime_minutes=8,
+        location_id=None,
+        **_IDENTITY,
     )
     manager = Mock()
     manager.using.return_value.only.return_value.get.return_value = previous
@@ -204,10 +221,12 @@ def test_existing_chassis_records_uptime_when_leaving_operational_state() -> Non
     chassis = Chassis()
     chassis._state = SimpleNamespace(adding=False)
     chassis.pk = 18
+    chassis.location_id = None
     chassis.status = "offline"
     chassis.is_online = True
     chassis.manufacturer = None
     chassis.model = ""
+    vars(chassis).update(_IDENTITY)
     with patch.object(lifecycle_service.timezone, "now", return_value=now):
         context = lifecycle_service.prepare_chassis_for_save(chassis)
 
@@ -229,6 +248,8 @@ def test_existing_chassis_same_status_has_no_lifecycle_mutation() -> None:
         is_online=False,
         last_online_at=None,
         total_uptime_minutes=4,
+        location_id=3,
+        **_IDENTITY,
     )
     manager = Mock()
     manager.using.return_value.only.return_value.get.return_value = previous
@@ -239,14 +260,18 @@ def test_existing_chassis_same_status_has_no_lifecycle_mutation() -> None:
     chassis = Chassis()
     chassis._state = SimpleNamespace(adding=False)
     chassis.pk = 19
+    chassis.location_id = 5
     chassis.status = "offline"
     chassis.manufacturer = None
     chassis.model = ""
+    vars(chassis).update(_IDENTITY)
 
     context = lifecycle_service.prepare_chassis_for_save(chassis)
 
     assert context.status_changed is False
     assert context.update_fields == set()
+    assert (context.old_location_id, context.location_changed) == (3, True)
+    assert context.identity_changed is False
 
 
 def test_existing_chassis_records_online_timestamp_on_recovery() -> None:
@@ -257,6 +282,8 @@ def test_existing_chassis_records_online_timestamp_on_recovery() -> None:
         is_online=False,
         last_online_at=None,
         total_uptime_minutes=4,
+        location_id=3,
+        **_IDENTITY,
     )
     manager = Mock()
     manager.using.return_value.only.return_value.get.return_value = previous
@@ -267,15 +294,19 @@ def test_existing_chassis_records_online_timestamp_on_recovery() -> None:
     chassis = Chassis()
     chassis._state = SimpleNamespace(adding=False)
     chassis.pk = 20
+    chassis.location_id = 3
     chassis.status = "online"
     chassis.manufacturer = None
     chassis.model = ""
+    vars(chassis).update(_IDENTITY)
+    chassis.ip = "192.0.2.11"
     with patch.object(lifecycle_service.timezone, "now", return_value=now):
         context = lifecycle_service.prepare_chassis_for_save(chassis)
 
     assert chassis.is_online is True
     assert chassis.last_online_at == now
     assert context.update_fields == {"is_online", "last_online_at"}
+    assert context.identity_changed is True
 
 
 def test_chassis_specs_parse_named_band_plan_and_derive_missing_role() -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 from django.contrib.auth.models import Permission
@@ -16,6 +17,9 @@ from micboard.services.hardware.chassis_refresh_service import (
     MAX_CHASSIS_REFRESH_BATCH,
     ChassisRefreshService,
 )
+from micboard.services.hardware.wireless_chassis_persistence_service import (
+    WirelessChassisPersistenceService,
+)
 from micboard.services.manufacturer.plugin_registry import PluginRegistry
 from tests.factories.base import UserFactory
 from tests.factories.hardware import WirelessChassisFactory
@@ -194,6 +198,91 @@ def test_refresh_preserves_lifecycle_contract_without_missing_firmware(
     assert chassis.status == ("online" if initial_status == "discovered" else "retired")
 
 
+class _BulkPlugin(_Plugin):
+    instances: list[_BulkPlugin] = []
+    bulk_requests: list[list[str]] = []
+
+    def __init__(self, manufacturer: Any) -> None:
+        super().__init__(manufacturer)
+        self.instances.append(self)
+
+    def get_devices_by_ids(self, device_ids: list[str]) -> dict[str, dict[str, str]]:
+        self.bulk_requests.append(device_ids)
+        return {device_id: {"id": device_id} for device_id in device_ids[1:]}
+
+
+def test_refresh_groups_by_manufacturer_and_prefers_bulk_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each manufacturer group shares one plugin; bulk reads replace per-device calls."""
+    first = WirelessChassisFactory(status="offline")
+    siblings = [
+        WirelessChassisFactory(manufacturer=first.manufacturer, status="offline") for _ in range(2)
+    ]
+    lone = WirelessChassisFactory(status="offline")
+    monkeypatch.setattr(PluginRegistry, "get_plugin_class", staticmethod(lambda _code: _BulkPlugin))
+    _BulkPlugin.instances = []
+    _BulkPlugin.bulk_requests = []
+    _Plugin.requested_ids = []
+
+    result = ChassisRefreshService.refresh(queryset=WirelessChassis.objects.all())
+
+    assert [plugin.manufacturer for plugin in _BulkPlugin.instances] == [
+        first.manufacturer,
+        lone.manufacturer,
+    ]
+    assert _BulkPlugin.bulk_requests == [
+        [first.api_device_id, *(chassis.api_device_id for chassis in siblings)]
+    ]
+    assert _Plugin.requested_ids == [lone.api_device_id]
+    assert result.synced_count == 3
+    assert result.failed_chassis_ids == [first.pk]
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(MICBOARD_CHASSIS_REFRESH_CONCURRENCY=3)
+def test_refresh_fetches_concurrently_and_isolates_failed_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Device reads overlap outside transactions; one failed write keeps its siblings."""
+    manufacturer = WirelessChassisFactory(status="offline").manufacturer
+    selected = [
+        WirelessChassisFactory(manufacturer=manufacturer, status="offline") for _ in range(3)
+    ]
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _ConcurrentPlugin(_Plugin):
+        def get_device(self, device_id: str) -> dict[str, str] | None:
+            barrier.wait()
+            return super().get_device(device_id)
+
+    original_update = WirelessChassisPersistenceService.update
+
+    def update(*, chassis: WirelessChassis, **kwargs: Any) -> Any:
+        if chassis.pk == selected[1].pk:
+            raise RuntimeError("write failed")
+        return original_update(chassis=chassis, **kwargs)
+
+    monkeypatch.setattr(
+        PluginRegistry, "get_plugin_class", staticmethod(lambda _code: _ConcurrentPlugin)
+    )
+    monkeypatch.setattr(WirelessChassisPersistenceService, "update", staticmethod(update))
+    _Plugin.observed_atomic_blocks = []
+
+    result = ChassisRefreshService.refresh(
+        queryset=WirelessChassis.objects.filter(pk__in=[chassis.pk for chassis in selected])
+    )
+
+    assert _Plugin.observed_atomic_blocks == [False, False, False]
+    assert result.synced_count == 2
+    assert result.failed_chassis_ids == [selected[1].pk]
+    assert list(
+        WirelessChassis.objects.filter(pk__in=[chassis.pk for chassis in selected])
+        .order_by("pk")
+        .values_list("status", flat=True)
+    ) == ["online", "offline", "online"]
+
+
 @override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
 def test_queued_refresh_rechecks_actor_tenant_scope(monkeypatch: pytest.MonkeyPatch) -> None:
     """A queued selection cannot refresh a chassis outside the actor's current tenant."""
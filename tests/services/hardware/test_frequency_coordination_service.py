@@ -0,0 +1,137 @@
+"""Intermodulation coordination results, bounds, and scaling."""
+
+from __future__ import annotations
+
+import time
+from itertools import combinations, permutations
+
+import pytest
+
+from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.services.hardware.frequency_coordination_service import (
+    CoordinationRules,
+    FrequencyCoordinationService,
+)
+from tests.factories.hardware import WirelessChassisFactory
+from tests.factories.locations import BuildingFactory, LocationFactory
+from tests.factories.rf_coordination import ExclusionZoneFactory, RegulatoryDomainFactory
+
+RULES = CoordinationRules(
+    spacing_khz=350, imd3_guard_khz=100, imd5_guard_khz=50, step_khz=25, max_conflicts=10000
+)
+
+
+def _conflict_keys(report) -> set[tuple[str, int, tuple[int, ...]]]:
+    return {
+        (conflict.kind, conflict.channel_id, tuple(conflict.source_channel_ids))
+        for conflict in report.conflicts
+    }
+
+
+def _brute_force(carriers: dict[int, int], rules: CoordinationRules) -> set:
+    """Enumerate every product directly, as the engine must agree with it."""
+    expected = set()
+    for a, b in permutations(carriers, 2):
+        if abs(carriers[a] - carriers[b]) < rules.spacing_khz:
+            expected.add(("spacing", a, (b,)))
+        for victim in set(carriers) - {a, b}:
+            if abs(2 * carriers[a] - carriers[b] - carriers[victim]) <= rules.imd3_guard_khz:
+                expected.add(("imd3_2tone", victim, tuple(sorted((a, b)))))
+            if abs(3 * carriers[a] - 2 * carriers[b] - carriers[victim]) <= rules.imd5_guard_khz:
+                expected.add(("imd5_2tone", victim, tuple(sorted((a, b)))))
+    for a, b in combinations(carriers, 2):
+        for c in set(carriers) - {a, b}:
+            for victim in set(carriers) - {a, b, c}:
+                product = carriers[a] + carriers[b] - carriers[c]
+                if abs(product - carriers[victim]) <= rules.imd3_guard_khz:
+                    expected.add(("imd3_3tone", victim, tuple(sorted((a, b, c)))))
+    return expected
+
+
+def test_engine_matches_direct_product_enumeration() -> None:
+    # A coprime stride scatters distinct 25 kHz slots across 470-485 MHz.
+    carriers = {channel_id: 470000 + (channel_id * 233 % 600) * 25 for channel_id in range(1, 25)}
+
+    report = FrequencyCoordinationService.analyze(
+        [(channel_id, khz / 1000) for channel_id, khz in carriers.items()],
+        rules=RULES,
+        suggestions=0,
+    )
+
+    assert report.truncated is False
+    assert _conflict_keys(report) == _brute_force(carriers, RULES)
+    assert {"spacing", "imd3_2tone", "imd5_2tone", "imd3_3tone"} <= {
+        conflict.kind for conflict in report.conflicts
+    }
+
+
+def test_suggestions_add_no_conflicts_and_reports_are_bounded() -> None:
+    carriers = [(1, 520.0), (2, 521.0), (3, 522.05), (4, 530.0), (5, 537.2)]
+
+    report = FrequencyCoordinationService.analyze(
+        carriers, rules=RULES, suggestions=3, search_range_mhz=(519.0, 540.0)
+    )
+    bounded = FrequencyCoordinationService.analyze(
+        carriers, rules=CoordinationRules(max_conflicts=1), suggestions=0
+    )
+
+    assert ("imd3_2tone", 3, (1, 2)) in _conflict_keys(report)
+    assert len(report.suggested_frequencies_mhz) == 3
+    for suggestion in report.suggested_frequencies_mhz:
+        extended = FrequencyCoordinationService.analyze(
+            [*carriers, (99, suggestion)], rules=RULES, suggestions=0
+        )
+        assert _conflict_keys(extended) == _conflict_keys(report)
+    assert len(bounded.conflicts) == 1
+    assert bounded.truncated is True
+
+
+@pytest.mark.django_db
+def test_location_coordination_uses_active_channels_and_building_domain(
+    django_capture_on_commit_callbacks,
+) -> None:
+    with django_capture_on_commit_callbacks(execute=True):
+        domain = RegulatoryDomainFactory(country_code="DE")
+        ExclusionZoneFactory(regulatory_domain=domain)
+    location = LocationFactory(building=BuildingFactory(country="DE", regulatory_domain=None))
+    chassis = WirelessChassisFactory(location=location, max_channels=4)
+    for number, frequency, state in (
+        (1, 500.5, "active"),
+        (2, 560.0, "reserved"),
+        (3, 560.1, "available"),
+        (4, 650.0, "active"),
+    ):
+        RFChannel.objects.filter(chassis=chassis, channel_number=number).update(
+            frequency=frequency, resource_state=state
+        )
+    active = dict(RFChannel.objects.filter(chassis=chassis).values_list("frequency", "pk"))
+
+    report = FrequencyCoordinationService.coordinate_location(location.pk, rules=RULES)
+
+    assert report.carrier_count == 3
+    assert report.regulatory_domain == domain.code
+    assert _conflict_keys(report) == {
+        ("regulatory", active[500.5], ()),
+        ("regulatory", active[650.0], ()),
+    }
+    assert report.suggested_frequencies_mhz == [470.125, 470.475, 470.825, 471.175, 471.525]
+
+
+def test_three_hundred_carriers_coordinate_within_the_wall_clock_budget() -> None:
+    carriers = [
+        (channel_id, 470.0 + (channel_id * 4919 % 9120) * 0.025) for channel_id in range(1, 301)
+    ]
+
+    # Wall clock, as an operator waits for it. The engine needs about 0.3 s; the best of a
+    # few runs keeps parallel test workers sharing cores from tripping the 1 s budget.
+    elapsed = float("inf")
+    for _attempt in range(3):
+        started = time.perf_counter()
+        report = FrequencyCoordinationService.analyze(
+            carriers, rules=RULES, suggestions=5, search_range_mhz=(470.0, 698.0)
+        )
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    assert report.carrier_count == 300
+    assert report.conflicts
+    assert elapsed < 1.0
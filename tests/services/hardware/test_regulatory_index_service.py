@@ -0,0 +1,125 @@
+"""Regulatory index lookups, bulk resolution, and invalidation contracts."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import transaction
+
+import pytest
+
+from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.services.hardware import regulatory_index_service
+from micboard.services.hardware.regulatory_index_service import RegulatoryIndexService
+from micboard.services.hardware.rf_channel_service import get_regulatory_status
+from tests.factories.hardware import WirelessChassisFactory
+from tests.factories.locations import BuildingFactory, LocationFactory
+from tests.factories.rf_coordination import (
+    ExclusionZoneFactory,
+    FrequencyBandFactory,
+    RegulatoryDomainFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_index_answers_band_exclusion_and_allowed_lookups(
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Overlapping bands and zones resolve by frequency within their domain."""
+    with django_capture_on_commit_callbacks(execute=True):
+        domain = RegulatoryDomainFactory(min_frequency_mhz=470.0, max_frequency_mhz=700.0)
+        wide = FrequencyBandFactory(
+            regulatory_domain=domain,
+            start_frequency_mhz=470.0,
+            end_frequency_mhz=608.0,
+        )
+        gap = FrequencyBandFactory(
+            regulatory_domain=domain,
+            start_frequency_mhz=600.0,
+            end_frequency_mhz=614.0,
+            band_type="forbidden",
+        )
+        FrequencyBandFactory(start_frequency_mhz=470.0, end_frequency_mhz=700.0)
+        zone = ExclusionZoneFactory(regulatory_domain=domain)
+        everywhere = ExclusionZoneFactory(
+            regulatory_domain=None,
+            start_frequency_mhz=650.0,
+            end_frequency_mhz=651.0,
+        )
+        ExclusionZoneFactory(regulatory_domain=domain, start_frequency_mhz=520.0, is_active=False)
+
+    index = RegulatoryIndexService.current()
+
+    assert index.bands_at(domain.pk, 470.0) == (wide,)
+    assert index.bands_at(domain.pk, 605.0) == (wide, gap)
+    assert index.bands_at(domain.pk, 690.0) == ()
+    assert index.exclusions_at(domain.pk, 500.5) == (zone,)
+    assert index.exclusions_at(domain.pk, 650.0) == (everywhere,)
+    assert index.is_allowed(domain.pk, 550.0) is True
+    assert index.is_allowed(domain.pk, 610.0) is False
+    assert index.is_allowed(domain.pk, 500.0) is False
+    assert index.is_allowed(domain.pk, 720.0) is False
+    assert index.covered_range(domain.pk, 560.0, 620.0) == (470.0, 608.0)
+
+
+def test_warm_index_resolves_buildings_in_bulk_and_channels_without_queries(
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Compliance checks over many channels reuse one shared index."""
+    with django_capture_on_commit_callbacks(execute=True):
+        explicit = BuildingFactory(country="US")
+        fallback = BuildingFactory(country="DE", regulatory_domain=None)
+        german = RegulatoryDomainFactory(country_code="DE")
+    chassis = WirelessChassisFactory(location=LocationFactory(building=explicit), max_channels=3)
+    RFChannel.objects.filter(chassis=chassis).update(frequency=500.0, resource_state="active")
+    channels = list(RFChannel.objects.filter(chassis=chassis).with_chassis())
+    RegulatoryIndexService.current()
+
+    with django_assert_num_queries(1):
+        domains = RegulatoryIndexService.domains_for_buildings([explicit.pk, fallback.pk])
+    with django_assert_num_queries(0):
+        statuses = [get_regulatory_status(channel) for channel in channels]
+
+    assert domains == {explicit.pk: explicit.regulatory_domain, fallback.pk: german}
+    assert {status["regulatory_domain"] for status in statuses} == {explicit.regulatory_domain.code}
+
+
+def test_rolled_back_compliance_rows_never_reach_the_shared_index(
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Writers see their own uncommitted rows; everyone else keeps the committed index."""
+    shared = RegulatoryIndexService.current()
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        domain = RegulatoryDomainFactory()
+        assert RegulatoryIndexService.current().domain(domain.pk) == domain
+        raise RuntimeError("rolled back")
+
+    assert RegulatoryIndexService.current().domain(domain.pk) is None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        committed = RegulatoryDomainFactory()
+    assert RegulatoryIndexService.current().version != shared.version
+    assert RegulatoryIndexService.current().domain(committed.pk) == committed
+
+
+def test_warm_lookups_recheck_the_shared_generation_only_after_the_refresh_interval(
+    monkeypatch,
+) -> None:
+    """Other processes' edits are noticed within the interval without a read per lookup."""
+    clock = [1_000.0]
+    monkeypatch.setattr(regulatory_index_service.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(RegulatoryIndexService, "_version_snapshot", None)
+    first = RegulatoryIndexService.current()
+    cache.set("micboard:regulatory-index-version", "edited-elsewhere", timeout=None)
+
+    with patch.object(regulatory_index_service.cache, "get", wraps=cache.get) as cache_get:
+        assert RegulatoryIndexService.current() is first
+        cache_get.assert_not_called()
+        clock[0] += regulatory_index_service.DEFAULT_REFRESH_SECONDS
+
+        assert RegulatoryIndexService.current().version == "edited-elsewhere"
+    cache_get.assert_called_once()
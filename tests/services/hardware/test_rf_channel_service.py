@@ -9,6 +9,7 @@ from django.core.exceptions import ValidationError
 
 import pytest
 
+from micboard.models.rf_coordination.rf_channel import RFChannel
 from micboard.services.hardware.rf_channel_service import (
     finalize_channel_save,
     get_needs_regulatory_update,
@@ -19,44 +20,37 @@ from micboard.services.hardware.rf_channel_service import (
     is_receive_channel,
     is_send_channel,
     prepare_channel_for_save,
+    validate_channels_for_save,
 )
-from tests.factories.rf_coordination import RFChannelFactory
+from tests.factories.hardware import WirelessChassisFactory
+from tests.factories.locations import LocationFactory
+from tests.factories.rf_coordination import RegulatoryDomainFactory, RFChannelFactory
 
 pytestmark = pytest.mark.django_db
 
 
 def test_location_domain_resolution_handles_absent_context_and_explicit_domain() -> None:
     """Location resolution prefers explicit building policy and tolerates missing context."""
-    domain = object()
+    location = LocationFactory(building__country="US")
+    domain = location.building.regulatory_domain
 
     assert get_regulatory_domain_for_location(None) is None
     assert get_regulatory_domain_for_location(SimpleNamespace(building=None)) is None
-    assert (
-        get_regulatory_domain_for_location(
-            SimpleNamespace(building=SimpleNamespace(regulatory_domain=domain, country="US"))
-        )
-        is domain
-    )
+    assert get_regulatory_domain_for_location(location) == domain
 
 
 def test_location_domain_resolution_falls_back_to_country_lookup() -> None:
     """Country codes provide the fallback when a building has no explicit domain."""
-    domain = object()
-    queryset = Mock()
-    queryset.first.return_value = domain
-    with patch(
-        "micboard.models.rf_coordination.compliance.RegulatoryDomain.objects.filter",
-        return_value=queryset,
-    ) as filter_:
-        result = get_regulatory_domain_for_location(
-            SimpleNamespace(building=SimpleNamespace(regulatory_domain=None, country="us"))
-        )
+    domain = RegulatoryDomainFactory(country_code="US")
 
-    assert result is domain
-    filter_.assert_called_once_with(country_code="US")
+    result = get_regulatory_domain_for_location(
+        SimpleNamespace(building=SimpleNamespace(regulatory_domain_id=None, country="us"))
+    )
+
+    assert result == domain
     assert (
         get_regulatory_domain_for_location(
-            SimpleNamespace(building=SimpleNamespace(regulatory_domain=None, country=""))
+            SimpleNamespace(building=SimpleNamespace(regulatory_domain_id=None, country=""))
         )
         is None
     )
@@ -65,16 +59,16 @@ def test_location_domain_resolution_falls_back_to_country_lookup() -> None:
 def test_channel_domain_delegates_through_chassis_location() -> None:
     """RF channels use their chassis location as regulatory context."""
     domain = object()
-    channel = SimpleNamespace(
-        chassis=SimpleNamespace(
-            location=SimpleNamespace(
-                building=SimpleNamespace(regulatory_domain=domain, country="US")
-            )
-        )
-    )
+    channel = SimpleNamespace(chassis=SimpleNamespace(location=object()))
 
-    assert get_regulatory_domain(SimpleNamespace(chassis=None)) is None
-    assert get_regulatory_domain(channel) is domain
+    with patch(
+        "micboard.services.hardware.rf_channel_service.get_regulatory_domain_for_location",
+        return_value=domain,
+    ) as resolve:
+        assert get_regulatory_domain(SimpleNamespace(chassis=None)) is None
+        assert get_regulatory_domain(channel) is domain
+
+    resolve.assert_called_once_with(channel.chassis.location)
 
 
 def test_regulatory_coverage_requires_domain_frequency_and_global_bounds(
@@ -236,11 +230,79 @@ def test_existing_channel_allows_unchanged_and_rejects_invalid_transition() -> N
         prepare_channel_for_save(channel)
 
     type(channel).objects.filter(pk=channel.pk).update(resource_state="terminal")
+    channel.refresh_from_db(fields=["resource_state"])
     channel.resource_state = "active"
     with pytest.raises(ValueError, match="Allowed: none"):
         prepare_channel_for_save(channel)
 
 
+def _stored_channel(**fields) -> RFChannel:
+    """Build a channel for an existing row without loading it from the database."""
+    channel = RFChannel(**fields)
+    channel._state.adding = False
+    channel._state.db = "default"
+    return channel
+
+
+def test_loaded_channels_validate_saves_without_rereading_the_row(
+    django_assert_num_queries,
+) -> None:
+    """Polling-style saves of loaded channels validate from their load snapshot."""
+    chassis = WirelessChassisFactory(max_channels=1)
+    channel = RFChannel.objects.get(chassis=chassis, channel_number=1)
+    channel.resource_state = "active"
+
+    with django_assert_num_queries(0):
+        context = prepare_channel_for_save(channel)
+
+    assert context["state_changed"] is True
+    channel.save()
+    assert channel.loaded_state["resource_state"] == "active"
+
+    stored = _stored_channel(
+        pk=channel.pk,
+        chassis_id=chassis.pk,
+        channel_number=1,
+        resource_state="active",
+    )
+    with django_assert_num_queries(1):
+        assert prepare_channel_for_save(stored)["old_resource_state"] == "active"
+
+
+def test_batch_validation_uses_preloaded_chassis_and_one_state_read(
+    django_assert_num_queries,
+) -> None:
+    """Bulk persistence validates transitions and capacity with bounded queries."""
+    chassis = WirelessChassisFactory(max_channels=2)
+    loaded, second = RFChannel.objects.filter(chassis=chassis).order_by("channel_number")
+    second.delete()
+    loaded.resource_state = "active"
+    stored = _stored_channel(
+        pk=loaded.pk,
+        chassis_id=chassis.pk,
+        channel_number=1,
+        resource_state="active",
+        enabled=False,
+    )
+    new_channel = RFChannel(chassis_id=chassis.pk, channel_number=2)
+
+    with django_assert_num_queries(1):
+        contexts = validate_channels_for_save(
+            [loaded, stored, new_channel],
+            chassis_by_id={chassis.pk: chassis},
+        )
+
+    assert [context["state_changed"] for context in contexts] == [True, True, False]
+    assert stored.resource_state == "disabled"
+
+    new_channel.channel_number = 3
+    with (
+        django_assert_num_queries(1),
+        pytest.raises(ValidationError, match="Channel 3 exceeds"),
+    ):
+        validate_channels_for_save([new_channel])
+
+
 def test_finalize_channel_save_logs_only_state_changes() -> None:
     """Audit logging is emitted once for an actual persisted state transition."""
     channel = SimpleNamespace(resource_state="active")
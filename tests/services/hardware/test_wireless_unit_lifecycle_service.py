@@ -182,6 +182,7 @@ def test_prepare_new_unit_has_empty_lifecycle_context() -> None:
     assert prepare_unit_for_save(unit) == {
         "old_status": None,
         "old_battery": None,
+        "old_base_chassis_id": None,
         "status_changed": False,
         "battery_changed": False,
         "update_fields": set(),
@@ -0,0 +1,174 @@
+"""Buffered operational log writes and chunked, summarized retention."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.utils import timezone
+
+import pytest
+
+from micboard.models.audit.activity_log import ServiceSyncLog
+from micboard.models.audit.retention import AuditLogDailySummary
+from micboard.models.telemetry.health import APIHealthLog
+from micboard.services.maintenance.audit import AuditService
+from micboard.services.maintenance.audit_log_buffer import AuditLogBuffer
+from micboard.tasks.maintenance.audit import prune_operational_logs
+from tests.factories.audit import ServiceSyncLogFactory
+from tests.factories.discovery import ManufacturerFactory
+from tests.factories.telemetry import APIHealthLogFactory
+
+
+@pytest.fixture
+def empty_buffer(monkeypatch) -> Iterator[None]:
+    monkeypatch.setattr(AuditLogBuffer, "_pending", {})
+    monkeypatch.setattr(AuditLogBuffer, "_last_flush", time.monotonic())
+    monkeypatch.setattr(AuditLogBuffer, "_exit_hook_registered", True)
+    monkeypatch.setattr(AuditLogBuffer, "_timer", None)
+    yield
+    if AuditLogBuffer._timer is not None:
+        AuditLogBuffer._timer.cancel()
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(MICBOARD_AUDIT_LOG_BUFFER_SIZE=3, MICBOARD_AUDIT_LOG_FLUSH_SECONDS=300)
+def test_buffer_writes_autocommit_rows_in_batches(empty_buffer, django_assert_num_queries) -> None:
+    manufacturer = ManufacturerFactory()
+
+    with django_assert_num_queries(0):
+        for status in ("healthy", "unhealthy"):
+            AuditLogBuffer.add(APIHealthLog(manufacturer=manufacturer, status=status))
+    assert AuditLogBuffer.pending_count() == 2
+
+    with django_assert_num_queries(2):
+        AuditLogBuffer.add(
+            ServiceSyncLog(
+                service=manufacturer,
+                sync_type="full",
+                started_at=timezone.now(),
+                status="success",
+            )
+        )
+
+    assert AuditLogBuffer.pending_count() == 0
+    assert APIHealthLog.objects.count() == 2
+    assert ServiceSyncLog.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(MICBOARD_AUDIT_LOG_BUFFER_SIZE=50, MICBOARD_AUDIT_LOG_FLUSH_SECONDS=1)
+def test_buffer_writes_a_trailing_burst_when_its_flush_window_ends(empty_buffer) -> None:
+    """Rows never wait for a later add(); the window's timer writes them."""
+    AuditLogBuffer.add(APIHealthLog(manufacturer=ManufacturerFactory(), status="healthy"))
+    timer = AuditLogBuffer._timer
+    assert timer is not None
+    assert AuditLogBuffer.pending_count() == 1
+
+    timer.join(timeout=5)
+
+    assert AuditLogBuffer.pending_count() == 0
+    assert AuditLogBuffer._timer is None
+    assert APIHealthLog.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_buffer_writes_rows_inside_transactions_immediately(empty_buffer) -> None:
+    row = APIHealthLog(manufacturer=ManufacturerFactory(), status="healthy")
+
+    AuditLogBuffer.add(row)
+
+    assert row.pk is not None
+    assert AuditLogBuffer.pending_count() == 0
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_AUDIT_PRUNE_CHUNK_SIZE=2, MICBOARD_AUDIT_PRUNE_MAX_CHUNKS=1)
+def test_pruning_deletes_bounded_chunks_and_keeps_daily_summaries() -> None:
+    first, second = ManufacturerFactory(), ManufacturerFactory()
+    day_one = timezone.localtime(timezone.now() - timedelta(days=30)).replace(hour=10, minute=0)
+    day_two = day_one + timedelta(days=1)
+    for minute, (manufacturer, when, status, response_time) in enumerate(
+        (
+            (first, day_one, "healthy", 0.25),
+            (first, day_one, "unhealthy", None),
+            (second, day_one, "healthy", 0.5),
+            (first, day_one, "healthy", 0.75),
+            (first, day_two, "error", 1.0),
+        )
+    ):
+        APIHealthLogFactory(
+            manufacturer=manufacturer,
+            timestamp=when + timedelta(minutes=minute),
+            status=status,
+            response_time=response_time,
+        )
+    fresh = APIHealthLogFactory(manufacturer=first)
+    ServiceSyncLogFactory(service=first, started_at=day_one, device_count=5)
+    ServiceSyncLogFactory(service=first, started_at=day_two, status="failed", device_count=2)
+
+    runs = [AuditService.prune_api_health_logs(retention_days=7) for _ in range(4)]
+    synced = AuditService.prune_service_sync_logs(retention_days=7)
+
+    assert runs == [2, 2, 1, 0]
+    assert synced == 2
+    assert list(APIHealthLog.objects.all()) == [fresh]
+    assert not ServiceSyncLog.objects.exists()
+    summaries = {
+        (summary.kind, summary.manufacturer_id, summary.day): summary
+        for summary in AuditLogDailySummary.objects.all()
+    }
+    health = summaries[("api_health", first.pk, day_one.date())]
+    assert health.row_count == 3
+    assert health.status_counts == {"healthy": 2, "unhealthy": 1}
+    assert health.average_response_time == pytest.approx(0.5)
+    assert summaries[("api_health", second.pk, day_one.date())].row_count == 1
+    assert summaries[("api_health", first.pk, day_two.date())].status_counts == {"error": 1}
+    assert summaries[("service_sync", first.pk, day_one.date())].device_count_total == 5
+    assert summaries[("service_sync", first.pk, day_two.date())].status_counts == {"failed": 1}
+    assert len(summaries) == 5
+
+
+@pytest.mark.django_db
+def test_pruning_folds_into_a_summary_another_run_already_created() -> None:
+    manufacturer = ManufacturerFactory()
+    when = timezone.now() - timedelta(days=30)
+    APIHealthLogFactory(manufacturer=manufacturer, timestamp=when, status="healthy")
+    AuditLogDailySummary.objects.create(
+        kind="api_health",
+        manufacturer=manufacturer,
+        day=timezone.localdate(when),
+        row_count=2,
+        status_counts={"healthy": 2},
+    )
+
+    assert AuditService.prune_api_health_logs(retention_days=7) == 1
+
+    summary = AuditLogDailySummary.objects.get()
+    assert summary.row_count == 3
+    assert summary.status_counts == {"healthy": 3}
+
+
+def test_prune_task_flushes_buffer_and_contains_failures(caplog) -> None:
+    with (
+        patch.object(AuditLogBuffer, "flush", return_value=3),
+        patch.object(AuditService, "prune_service_sync_logs", return_value=4),
+        patch.object(AuditService, "prune_api_health_logs", return_value=5),
+    ):
+        assert prune_operational_logs() == {
+            "flushed": 3,
+            "service_sync_logs": 4,
+            "api_health_logs": 5,
+        }
+
+    with (
+        patch.object(AuditLogBuffer, "flush", return_value=0),
+        patch.object(
+            AuditService, "prune_service_sync_logs", side_effect=RuntimeError("private detail")
+        ),
+    ):
+        assert prune_operational_logs() is None
+    assert "private detail" not in caplog.text
@@ -312,26 +312,28 @@ def test_bulk_identity_index_chunks_reads_below_backend_parameter_limits(
 def test_persistence_locks_before_rebuilding_identity_index(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """The DB-backed global lock closes the identity-index/write race window."""
+    """DB-backed identity locks close the identity-index/write race window."""
     from micboard.models.discovery.manufacturer import Manufacturer
+    from micboard.services.deduplication.identity_mutation_lock import (
+        DeviceIdentityMutationLockService,
+    )
 
     manufacturer = ManufacturerFactory(code="serialized-vendor")
     payload = _payload()
     events: list[str] = []
-    ordered_queryset = Mock()
-    ordered_queryset.first.side_effect = lambda: events.append("sentinel-locked") or manufacturer
     lock_queryset = Mock()
-    lock_queryset.only.return_value.order_by.return_value = ordered_queryset
     lock_queryset.get.side_effect = lambda **_kwargs: events.append("target-locked") or manufacturer
     select_for_update = Mock(return_value=lock_queryset)
     monkeypatch.setattr(Manufacturer.objects, "select_for_update", select_for_update)
+    lock_keys = Mock(side_effect=lambda _keys: events.append("identities-locked"))
+    monkeypatch.setattr(DeviceIdentityMutationLockService, "_lock_keys", lock_keys)
 
     identity_index = object()
     identity_index_class = Mock()
 
     def build_index(*_args: object, **_kwargs: object) -> object:
         assert connection.in_atomic_block is True
-        assert events == ["sentinel-locked", "target-locked"]
+        assert events == ["target-locked", "identities-locked"]
         events.append("indexed")
         return identity_index
 
@@ -339,7 +341,7 @@ def test_persistence_locks_before_rebuilding_identity_index(
 
     def persist(*_args: object, **kwargs: object) -> str:
         assert connection.in_atomic_block is True
-        assert events == ["sentinel-locked", "target-locked", "indexed"]
+        assert events == ["target-locked", "identities-locked", "indexed"]
         assert kwargs["identity_index"] is identity_index
         events.append("written")
         return "created"
@@ -358,11 +360,12 @@ def test_persistence_locks_before_rebuilding_identity_index(
     )
 
     assert result == (1, 0)
-    assert events == ["sentinel-locked", "target-locked", "indexed", "written"]
-    assert select_for_update.call_count == 2
-    lock_queryset.only.assert_called_once_with("pk")
-    lock_queryset.only.return_value.order_by.assert_called_once_with("pk")
+    assert events == ["target-locked", "identities-locked", "indexed", "written"]
+    select_for_update.assert_called_once_with()
     lock_queryset.get.assert_called_once_with(pk=manufacturer.pk)
+    locked_keys = lock_keys.call_args.args[0]
+    assert locked_keys
+    assert locked_keys == sorted(locked_keys)
 
 
 def test_persistence_rolls_back_earlier_mutation_when_later_payload_fails(
@@ -402,13 +405,13 @@ def test_persistence_rolls_back_earlier_mutation_when_later_payload_fails(
     ).exists()
 
 
-def test_persistence_refuses_to_write_without_a_lock_sentinel() -> None:
-    """An absent row is never mistaken for a database-backed serialization lock."""
+def test_persistence_refuses_to_write_for_a_missing_manufacturer() -> None:
+    """An absent manufacturer row is never mistaken for a held serialization lock."""
     from micboard.models.discovery.manufacturer import Manufacturer
 
     identity_index_class = Mock()
 
-    with pytest.raises(Manufacturer.DoesNotExist, match="identity mutation lock is unavailable"):
+    with pytest.raises(Manufacturer.DoesNotExist):
         ManufacturerSyncService._persist_normalized_devices(
             [_payload()],
             manufacturer=SimpleNamespace(pk=404),
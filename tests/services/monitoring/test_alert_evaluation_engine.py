@@ -0,0 +1,273 @@
+"""Coverage for batched, rule-compiled post-poll alert evaluation."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from micboard.models.hardware.wireless_unit import WirelessUnit
+from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.performer import Performer
+from micboard.models.monitoring.performer_assignment import PerformerAssignment
+from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
+from micboard.services.monitoring.alert_evaluation_engine import (
+    AlertEvaluationEngine,
+    AlertEvaluationInputs,
+)
+from micboard.services.monitoring.alert_fanout_dtos import AlertFanoutBudget
+from micboard.services.monitoring.alert_rules import (
+    AlertRuleTable,
+    RecipientAlertRule,
+    UnitAlertSignals,
+)
+from micboard.services.monitoring.poll_alert_service import PollAlertService
+from tests.factories.base import UserFactory
+from tests.factories.discovery import ManufacturerFactory
+from tests.factories.hardware import WirelessChassisFactory, WirelessUnitFactory
+from tests.factories.monitoring import (
+    AlertFactory,
+    PerformerAssignmentFactory,
+    UserAlertPreferenceFactory,
+)
+
+EVALUATION_SECONDS_PER_1000_UNITS_CEILING = 0.5
+
+
+def _alerting_units(count: int, *, manufacturer=None, **unit_fields):
+    """Create channel-assigned units that share one manufacturer and one recipient each."""
+    manufacturer = manufacturer or ManufacturerFactory()
+    with (
+        override_settings(TESTING=True),
+        patch(
+            "micboard.services.manufacturer.plugin_registry.PluginRegistry.get_plugin",
+            return_value=None,
+        ),
+    ):
+        units = []
+        for _ in range(count):
+            chassis = WirelessChassisFactory(manufacturer=manufacturer, max_channels=1)
+            units.append(
+                WirelessUnitFactory(
+                    base_chassis=chassis,
+                    manufacturer=manufacturer,
+                    assigned_resource=chassis.rf_channels.get(channel_number=1),
+                    **unit_fields,
+                )
+            )
+    users = []
+    for unit in units:
+        assignment = PerformerAssignmentFactory(wireless_unit=unit)
+        user = UserFactory()
+        assignment.monitoring_group.users.add(user)
+        users.append(user)
+    cache.delete(PollAlertService._cursor_key(manufacturer.pk))
+    cache.delete(PollAlertService._scope_cursor_key(manufacturer.pk))
+    return manufacturer, units, users
+
+
+@pytest.mark.django_db
+def test_batched_poll_creates_alerts_for_the_whole_page() -> None:
+    """Every offline unit in the page alerts without falling back to per-unit checks."""
+    manufacturer, units, users = _alerting_units(3, status="offline")
+
+    with patch(
+        "micboard.services.monitoring.poll_alert_service.alert_manager.check_hardware_offline_alerts"
+    ) as per_unit:
+        result = PollAlertService.evaluate_manufacturer(manufacturer)
+
+    per_unit.assert_not_called()
+    assert result.scanned == result.batched == 3
+    assert not result.truncated
+    assert result.delivery_attempts == 3
+    assert set(Alert.objects.values_list("user_id", "alert_type")) == {
+        (user.pk, "hardware_offline") for user in users
+    }
+    assert PollAlertService._read_cursor(manufacturer.pk) == units[-1].pk
+
+
+@pytest.mark.django_db
+def test_batched_query_count_does_not_grow_with_the_page() -> None:
+    """Loading, rule evaluation, deduplication, and persistence cost a constant query count."""
+    small_manufacturer, small_units, _users = _alerting_units(2, status="offline")
+    large_manufacturer, large_units, _users = _alerting_units(8, status="offline")
+
+    def evaluate(units: list[WirelessUnit]) -> int:
+        reloaded = list(
+            WirelessUnit.objects.select_related("assigned_resource__chassis").filter(
+                pk__in=[unit.pk for unit in units]
+            )
+        )
+        with CaptureQueriesContext(connection) as context:
+            outcome = AlertEvaluationEngine(budget=AlertFanoutBudget.from_settings()).evaluate(
+                reloaded
+            )
+        assert len(outcome.evaluated_units) == len(units)
+        return len(context.captured_queries)
+
+    assert evaluate(small_units) == evaluate(large_units)
+    assert small_manufacturer != large_manufacturer
+
+
+@pytest.mark.django_db
+def test_batched_dedupe_respects_each_recipients_alert_interval() -> None:
+    """One grouped lookup suppresses repeats inside each recipient's own interval."""
+    _manufacturer, units, users = _alerting_units(2, status="offline")
+    UserAlertPreferenceFactory(user=users[1], min_alert_interval=0)
+    for unit, user in zip(units, users, strict=True):
+        AlertFactory(
+            channel=unit.assigned_resource,
+            user=user,
+            alert_type="hardware_offline",
+            status="pending",
+        )
+
+    outcome = AlertEvaluationEngine(budget=AlertFanoutBudget.from_settings()).evaluate(units)
+
+    assert outcome.candidates == 2
+    assert outcome.alerts_created == 1
+    assert Alert.objects.filter(user=users[0]).count() == 1
+    assert Alert.objects.filter(user=users[1]).count() == 2
+
+
+@pytest.mark.django_db
+def test_compiled_rules_apply_per_recipient_battery_thresholds() -> None:
+    """Thresholds come from each recipient's preference row, read once per run."""
+    _manufacturer, units, users = _alerting_units(1, status="online", battery=102)
+    UserAlertPreferenceFactory(user=users[0], battery_low_threshold=50)
+    default_user = UserFactory()
+    units[0].performer_assignments.get().monitoring_group.users.add(default_user)
+
+    AlertEvaluationEngine(budget=AlertFanoutBudget.from_settings()).evaluate(units)
+
+    assert list(Alert.objects.values_list("user_id", "alert_type")) == [
+        (users[0].pk, "battery_low")
+    ]
+
+
+@pytest.mark.django_db
+def test_recipients_revoked_before_persistence_are_skipped() -> None:
+    """Bulk persistence revalidates every candidate against current assignments."""
+    _manufacturer, units, users = _alerting_units(2, status="offline")
+    engine = AlertEvaluationEngine(budget=AlertFanoutBudget.from_settings())
+    signals = {unit.pk: UnitAlertSignals.from_unit(unit) for unit in units}
+    inputs = engine.load_inputs(units, signals=signals)
+    plan = engine.plan(units, signals=signals, inputs=inputs)
+    users[0].is_active = False
+    users[0].save(update_fields=["is_active"])
+
+    created = AlertDeliveryService.create_alerts(
+        plan.candidates,
+        rules=inputs.rules,
+        budget=engine.budget,
+    )
+
+    assert [alert.user_id for alert in created] == [users[1].pk]
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_POLL_ALERT_MAX_RECIPIENTS=2)
+def test_oversized_fanout_hands_the_unit_to_rotating_per_unit_checks() -> None:
+    """A unit needing a partial recipient page ends the batch instead of starving recipients."""
+    manufacturer, units, _users = _alerting_units(2, status="offline")
+    units[1].performer_assignments.get().monitoring_group.users.add(UserFactory(), UserFactory())
+
+    with patch(
+        "micboard.services.monitoring.poll_alert_service.alert_manager.check_hardware_offline_alerts"
+    ) as per_unit:
+        result = PollAlertService.evaluate_manufacturer(manufacturer)
+
+    assert result.batched == 1
+    assert Alert.objects.filter(channel=units[0].assigned_resource).count() == 1
+    assert [item.args[0].pk for item in per_unit.call_args_list] == [units[1].pk]
+
+
+@pytest.mark.django_db
+def test_batched_failure_falls_back_to_per_unit_checks(caplog) -> None:
+    """A batch failure cannot suppress alerts for the page or disclose exception details."""
+    manufacturer, units, _users = _alerting_units(2, status="offline")
+    secret = "private-batch-payload"
+
+    with (
+        patch.object(AlertEvaluationEngine, "evaluate", side_effect=RuntimeError(secret)),
+        patch(
+            "micboard.services.monitoring.poll_alert_service.alert_manager.check_hardware_offline_alerts"
+        ) as per_unit,
+        patch(
+            "micboard.services.monitoring.poll_alert_service.alert_manager.check_wireless_unit_alerts"
+        ),
+    ):
+        result = PollAlertService.evaluate_manufacturer(manufacturer)
+
+    assert result.batched == 0
+    assert result.scanned == 2
+    assert [item.args[0].pk for item in per_unit.call_args_list] == [unit.pk for unit in units]
+    assert secret not in caplog.text
+    assert "RuntimeError" in caplog.text
+
+
+def test_rule_table_falls_back_to_package_defaults() -> None:
+    """Recipients without a preference row use the documented default thresholds."""
+    preferences = SimpleNamespace(
+        battery_low_threshold=40,
+        battery_critical_threshold=5,
+        min_alert_interval=-3,
+    )
+    table = AlertRuleTable.compile(
+        [SimpleNamespace(pk=1, alert_preferences=preferences), SimpleNamespace(pk=2)]
+    )
+
+    assert table.for_user(1) == RecipientAlertRule(40, 5, 0)
+    assert table.for_user(2) == RecipientAlertRule()
+    assert table.for_user(3) == RecipientAlertRule()
+    assert table.max_interval_minutes == RecipientAlertRule().min_alert_interval_minutes
+
+
+def test_in_memory_evaluation_of_1000_units_stays_within_its_time_ceiling() -> None:
+    """Planning a 1,000-unit page against compiled rules is bounded and database-free."""
+    performer = Performer(name="Benchmark Performer")
+    units = [
+        WirelessUnit(pk=index, name=f"Unit {index}", slot=1, battery=20, status="offline")
+        for index in range(1, 1001)
+    ]
+    inputs = AlertEvaluationInputs(rules=AlertRuleTable())
+    for unit in units:
+        assignment = PerformerAssignment(
+            pk=unit.pk,
+            performer=performer,
+            wireless_unit_id=unit.pk,
+            monitoring_group_id=1,
+        )
+        inputs.assignments_by_unit[unit.pk] = [assignment]
+        inputs.recipients_by_assignment[assignment.pk] = [SimpleNamespace(pk=unit.pk)]
+        inputs.scope_by_user[unit.pk] = {unit.pk}
+    signals = {unit.pk: UnitAlertSignals.from_unit(unit) for unit in units}
+    evaluated = 0
+    candidates = 0
+
+    started = time.perf_counter()
+    for offset in range(0, len(units), 250):
+        budget = AlertFanoutBudget(
+            assignment_limit=500,
+            recipient_limit=1_000,
+            delivery_limit=1_000,
+        )
+        plan = AlertEvaluationEngine(budget=budget).plan(
+            units[offset : offset + 250],
+            signals=signals,
+            inputs=inputs,
+        )
+        evaluated += len(plan.evaluated_units)
+        candidates += len(plan.candidates)
+    elapsed = time.perf_counter() - started
+
+    assert evaluated == 1000
+    assert candidates == 2000
+    assert elapsed < EVALUATION_SECONDS_PER_1000_UNITS_CEILING
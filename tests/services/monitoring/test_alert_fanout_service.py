@@ -5,13 +5,16 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from django.contrib.auth.models import AnonymousUser
+from django.core import mail
 from django.core.cache import cache
 from django.test import override_settings
 
 import pytest
 
 from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
 from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
+from micboard.services.monitoring.alert_email_outbox_service import AlertEmailOutboxService
 from micboard.services.monitoring.alert_fanout_dtos import (
     HARD_ALERT_MAX_ASSIGNMENTS,
     HARD_ALERT_MAX_DELIVERIES,
@@ -51,20 +54,17 @@ def test_single_site_fanout_rejects_inactive_recipient_or_group(
         assigned_unit.assignment.monitoring_group.is_active = False
         assigned_unit.assignment.monitoring_group.save(update_fields=["is_active"])
 
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-    ) as send_email:
-        alert = AlertDeliveryService.create_alert(
-            unit=assigned_unit.unit,
-            user=assigned_unit.user,
-            performer_assignment=assigned_unit.assignment,
-            alert_type="signal_loss",
-            message="Signal lost",
-        )
+    alert = AlertDeliveryService.create_alert(
+        unit=assigned_unit.unit,
+        user=assigned_unit.user,
+        performer_assignment=assigned_unit.assignment,
+        alert_type="signal_loss",
+        message="Signal lost",
+    )
 
     assert alert is None
     assert not Alert.objects.exists()
-    send_email.assert_not_called()
+    assert not AlertEmailOutbox.objects.exists()
 
 
 @pytest.mark.django_db
@@ -104,12 +104,7 @@ def test_assignment_page_excludes_inactive_monitoring_groups(assigned_unit) -> N
 @pytest.mark.django_db
 def test_revocation_before_persistence_and_before_email_is_rechecked(assigned_unit) -> None:
     """Authorization changes at either delivery boundary fail closed."""
-    with (
-        patch.object(AlertFanoutService, "current_authorized_recipient", return_value=None),
-        patch(
-            "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-        ) as send_email,
-    ):
+    with patch.object(AlertFanoutService, "current_authorized_recipient", return_value=None):
         denied = AlertDeliveryService.create_alert(
             unit=assigned_unit.unit,
             user=assigned_unit.user,
@@ -119,28 +114,24 @@ def test_revocation_before_persistence_and_before_email_is_rechecked(assigned_un
         )
     assert denied is None
     assert not Alert.objects.exists()
-    send_email.assert_not_called()
+    assert not AlertEmailOutbox.objects.exists()
 
-    with (
-        patch.object(
-            AlertFanoutService,
-            "current_authorized_recipient",
-            side_effect=[assigned_unit.user, None],
-        ),
-        patch(
-            "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-        ) as send_email,
-    ):
-        persisted = AlertDeliveryService.create_alert(
-            unit=assigned_unit.unit,
-            user=assigned_unit.user,
-            performer_assignment=assigned_unit.assignment,
-            alert_type="signal_loss",
-            message="Signal lost",
-        )
+    persisted = AlertDeliveryService.create_alert(
+        unit=assigned_unit.unit,
+        user=assigned_unit.user,
+        performer_assignment=assigned_unit.assignment,
+        alert_type="signal_loss",
+        message="Signal lost",
+    )
     assert persisted is not None
+    assigned_unit.assignment.monitoring_group.users.remove(assigned_unit.user)
+
+    result = AlertEmailOutboxService.drain()
+
     assert Alert.objects.filter(pk=persisted.pk).exists()
-    send_email.assert_not_called()
+    assert result.cancelled == 1
+    assert AlertEmailOutbox.objects.get().status == "cancelled"
+    assert not mail.outbox
 
 
 @pytest.mark.django_db
@@ -258,14 +249,10 @@ def test_exact_delivery_budget_caps_persistence_and_email(assigned_unit) -> None
     assigned_unit.unit.battery = 0
     budget = _budget(assignments=5, recipients=10, deliveries=2)
 
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification",
-        return_value=True,
-    ) as send_email:
-        AlertManager().check_wireless_unit_alerts(assigned_unit.unit, budget=budget)
+    AlertManager().check_wireless_unit_alerts(assigned_unit.unit, budget=budget)
 
     assert Alert.objects.count() == 2
-    assert send_email.call_count == 2
+    assert AlertEmailOutbox.objects.count() == 2
     assert budget.delivery_attempts == 2
     assert budget.deliveries_truncated
 
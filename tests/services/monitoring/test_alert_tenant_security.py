@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
-
+from django.core import mail
 from django.test import override_settings
 
 import pytest
 
 from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
 from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
+from micboard.services.monitoring.alert_email_outbox_service import AlertEmailOutboxService
 from tests.factories.base import UserFactory
 from tests.factories.hardware import WirelessChassisFactory, WirelessUnitFactory
 from tests.factories.locations import BuildingFactory, LocationFactory
@@ -51,20 +52,17 @@ def test_alert_delivery_intersects_group_recipient_with_unit_tenant() -> None:
         wireless_unit=unit,
         monitoring_group=group,
     )
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-    ) as send_email:
-        denied = AlertDeliveryService.create_alert(
-            unit=unit,
-            user=recipient,
-            performer_assignment=assignment,
-            alert_type="signal_loss",
-            message="Tenant-private device signal",
-        )
+    denied = AlertDeliveryService.create_alert(
+        unit=unit,
+        user=recipient,
+        performer_assignment=assignment,
+        alert_type="signal_loss",
+        message="Tenant-private device signal",
+    )
 
     assert denied is None
     assert not Alert.objects.exists()
-    send_email.assert_not_called()
+    assert not AlertEmailOutbox.objects.exists()
 
     OrganizationMembershipFactory(
         user=recipient,
@@ -72,20 +70,17 @@ def test_alert_delivery_intersects_group_recipient_with_unit_tenant() -> None:
         campus=None,
         role="viewer",
     )
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification",
-        return_value=True,
-    ) as send_email:
-        allowed = AlertDeliveryService.create_alert(
-            unit=unit,
-            user=recipient,
-            performer_assignment=assignment,
-            alert_type="signal_loss",
-            message="Tenant-private device signal",
-        )
+    allowed = AlertDeliveryService.create_alert(
+        unit=unit,
+        user=recipient,
+        performer_assignment=assignment,
+        alert_type="signal_loss",
+        message="Tenant-private device signal",
+    )
 
     assert allowed is not None
-    send_email.assert_called_once_with(allowed, recipients=[recipient.email])
+    assert AlertEmailOutboxService.drain().sent == 1
+    assert [message.to for message in mail.outbox] == [[recipient.email]]
 
 
 @pytest.mark.django_db
@@ -117,17 +112,14 @@ def test_tenant_fanout_rejects_inactive_recipient_or_group(revoked: str) -> None
         group.is_active = False
         group.save(update_fields=["is_active"])
 
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-    ) as send_email:
-        denied = AlertDeliveryService.create_alert(
-            unit=unit,
-            user=recipient,
-            performer_assignment=assignment,
-            alert_type="signal_loss",
-            message="Tenant-private signal",
-        )
+    denied = AlertDeliveryService.create_alert(
+        unit=unit,
+        user=recipient,
+        performer_assignment=assignment,
+        alert_type="signal_loss",
+        message="Tenant-private signal",
+    )
 
     assert denied is None
     assert not Alert.objects.exists()
-    send_email.assert_not_called()
+    assert not AlertEmailOutbox.objects.exists()
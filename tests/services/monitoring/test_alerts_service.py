@@ -11,6 +11,7 @@ from django.utils import timezone
 import pytest
 
 from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
 from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
 from micboard.services.monitoring.alerts import (
     AlertManager,
@@ -48,11 +49,8 @@ def test_wireless_unit_checks_create_and_deduplicate_condition_alerts(assigned_u
     assigned_unit.unit.audio_level = -50
     manager = AlertManager()
 
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-    ) as send_email:
-        manager.check_wireless_unit_alerts(assigned_unit.unit)
-        manager.check_wireless_unit_alerts(assigned_unit.unit)
+    manager.check_wireless_unit_alerts(assigned_unit.unit)
+    manager.check_wireless_unit_alerts(assigned_unit.unit)
 
     alerts = Alert.objects.filter(user=assigned_unit.user)
     assert set(alerts.values_list("alert_type", flat=True)) == {
@@ -60,7 +58,7 @@ def test_wireless_unit_checks_create_and_deduplicate_condition_alerts(assigned_u
         "battery_critical",
         "signal_loss",
     }
-    assert send_email.call_count == 3
+    assert AlertEmailOutbox.objects.filter(alert__in=alerts).count() == 3
     assert all(alert.channel_data["channel_number"] == 1 for alert in alerts)
 
 
@@ -77,10 +75,7 @@ def test_battery_preferences_select_low_alert_and_unknown_battery_is_ignored(
     assigned_unit.unit.battery = 38
     manager = AlertManager()
 
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-    ):
-        manager.check_wireless_unit_alerts(assigned_unit.unit)
+    manager.check_wireless_unit_alerts(assigned_unit.unit)
     assert Alert.objects.get().alert_type == "battery_low"
 
     Alert.objects.all().delete()
@@ -155,10 +150,7 @@ def test_offline_checks_notify_group_users_only_when_device_is_offline(assigned_
     assert not Alert.objects.exists()
 
     assigned_unit.unit.status = "offline"
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification"
-    ):
-        manager.check_hardware_offline_alerts(assigned_unit.unit)
+    manager.check_hardware_offline_alerts(assigned_unit.unit)
 
     alert = Alert.objects.get()
     assert alert.alert_type == "hardware_offline"
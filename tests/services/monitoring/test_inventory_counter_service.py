@@ -0,0 +1,165 @@
+"""Inventory counters: incremental maintenance, rollups, reconciliation, and reads."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+
+import pytest
+
+from micboard.models.monitoring.inventory_counter import InventoryCounter
+from micboard.services.monitoring.alerts import resolve_alert
+from micboard.services.monitoring.inventory_counter_service import (
+    DEPLOYMENT_SCOPE_ID,
+    UNPLACED_LOCATION_ID,
+    InventoryCounterService,
+)
+from micboard.tasks.maintenance.inventory import reconcile_inventory_counters
+from tests.factories.base import UserFactory
+from tests.factories.hardware import ChargerFactory, WirelessChassisFactory, WirelessUnitFactory
+from tests.factories.locations import BuildingFactory, LocationFactory
+from tests.factories.monitoring import AlertFactory
+from tests.factories.multitenancy import OrganizationFactory
+
+pytestmark = pytest.mark.django_db
+
+Scope = InventoryCounter.Scope
+
+
+def _devices(scope: str, scope_id: int) -> int:
+    return InventoryCounterService.totals(scope, scope_id).devices
+
+
+def test_chassis_status_changes_and_moves_update_every_scope() -> None:
+    organization = OrganizationFactory()
+    building = BuildingFactory(organization_id=organization.pk)
+    stage = LocationFactory(building=building)
+    booth = LocationFactory()
+
+    chassis = WirelessChassisFactory(location=stage, status="online")
+    WirelessChassisFactory(location=stage)
+
+    stage_totals = InventoryCounterService.totals(Scope.LOCATION, stage.pk)
+    assert stage_totals.devices == 2
+    assert stage_totals.devices_by_status["online"] == 1
+    assert _devices(Scope.BUILDING, building.pk) == 2
+    assert _devices(Scope.ORGANIZATION, organization.pk) == 2
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 2
+
+    chassis.status = "offline"
+    chassis.save()
+    stage_totals = InventoryCounterService.totals(Scope.LOCATION, stage.pk)
+    assert stage_totals.devices_by_status["online"] == 0
+    assert stage_totals.devices_by_status["offline"] == 1
+
+    chassis.location = booth
+    chassis.save()
+    assert _devices(Scope.LOCATION, stage.pk) == 1
+    assert _devices(Scope.LOCATION, booth.pk) == 1
+    assert _devices(Scope.ORGANIZATION, organization.pk) == 1
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 2
+
+    chassis.location = None
+    chassis.save()
+    assert _devices(Scope.LOCATION, booth.pk) == 0
+    assert _devices(Scope.LOCATION, UNPLACED_LOCATION_ID) == 1
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 2
+
+    chassis.delete()
+    assert _devices(Scope.LOCATION, UNPLACED_LOCATION_ID) == 0
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 1
+    assert InventoryCounterService.reconcile().corrected == 0
+
+
+def test_unchanged_location_totals_skip_the_rollups(django_assert_num_queries) -> None:
+    location = LocationFactory(building=BuildingFactory(organization_id=OrganizationFactory().pk))
+    WirelessChassisFactory(location=location, status="online")
+
+    # Savepoint, location lookup, row create and lock, four inventory counts, release.
+    with django_assert_num_queries(9):
+        assert InventoryCounterService.refresh_locations([location.pk]) == 0
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 1
+
+
+def test_moving_a_building_or_location_carries_its_totals() -> None:
+    first = OrganizationFactory()
+    second = OrganizationFactory()
+    building = BuildingFactory(organization_id=first.pk)
+    location = LocationFactory(building=building)
+    WirelessChassisFactory(location=location)
+
+    building.organization_id = second.pk
+    building.save()
+    assert _devices(Scope.ORGANIZATION, first.pk) == 0
+    assert _devices(Scope.ORGANIZATION, second.pk) == 1
+
+    other = BuildingFactory()
+    location.building = other
+    location.save()
+    assert _devices(Scope.BUILDING, building.pk) == 0
+    assert _devices(Scope.BUILDING, other.pk) == 1
+    assert _devices(Scope.ORGANIZATION, second.pk) == 0
+    assert InventoryCounterService.reconcile().corrected == 0
+
+
+def test_units_chargers_and_alerts_are_counted_per_location() -> None:
+    location = LocationFactory()
+    chassis = WirelessChassisFactory(location=location, max_channels=1)
+    unit = WirelessUnitFactory(base_chassis=chassis, status="online")
+    WirelessUnitFactory(base_chassis=chassis, slot=2)
+    charger = ChargerFactory(location=location, status="online")
+
+    totals = InventoryCounterService.totals(Scope.LOCATION, location.pk)
+    assert (totals.active_units, totals.online_chargers) == (1, 1)
+
+    unit.status = "offline"
+    unit.save()
+    charger.is_active = False
+    charger.save()
+    totals = InventoryCounterService.totals(Scope.LOCATION, location.pk)
+    assert (totals.active_units, totals.online_chargers) == (0, 0)
+
+    channel = chassis.rf_channels.get(channel_number=1)
+    alert = AlertFactory(channel=channel)
+    InventoryCounterService.refresh_channels((channel.pk,))
+    assert InventoryCounterService.totals(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID).open_alerts == 1
+
+    resolve_alert(alert.pk, user=UserFactory(is_superuser=True, is_staff=True))
+    assert InventoryCounterService.totals(Scope.LOCATION, location.pk).open_alerts == 0
+
+
+def test_reconcile_corrects_drifted_rows() -> None:
+    location = LocationFactory()
+    WirelessChassisFactory(location=location)
+    InventoryCounterService.reconcile()
+    InventoryCounter.objects.filter(scope=Scope.LOCATION, scope_id=location.pk).update(
+        devices_discovered=7
+    )
+    InventoryCounter.objects.filter(scope=Scope.DEPLOYMENT).delete()
+
+    result = InventoryCounterService.reconcile()
+
+    assert result.corrected == 2
+    assert _devices(Scope.LOCATION, location.pk) == 1
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 1
+    assert reconcile_inventory_counters() == {"checked": result.checked, "corrected": 0}
+
+
+def test_totals_for_user_follow_visible_inventory() -> None:
+    WirelessChassisFactory(location=LocationFactory())
+    WirelessChassisFactory(location=LocationFactory())
+
+    assert InventoryCounterService.totals_for_user(UserFactory(is_superuser=True)).devices == 2
+    assert InventoryCounterService.totals_for_user(UserFactory()).devices == 0
+
+
+def test_rebuild_inventory_counters_command_reports_corrections() -> None:
+    WirelessChassisFactory(location=LocationFactory())
+    InventoryCounter.objects.all().delete()
+    stdout = StringIO()
+
+    call_command("rebuild_inventory_counters", stdout=stdout)
+
+    assert "corrected" in stdout.getvalue()
+    assert _devices(Scope.DEPLOYMENT, DEPLOYMENT_SCOPE_ID) == 1
@@ -0,0 +1,121 @@
+"""Materialized monitoring location access: maintenance, rebuild, and reads."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+
+import pytest
+
+from micboard.models.monitoring.group import MonitoringGroupLocation
+from micboard.models.monitoring.location_access import LocationAccessGrant
+from micboard.services.monitoring.location_access_service import LocationAccessService
+from micboard.services.monitoring.monitoring_access import MonitoringService
+from tests.factories.base import UserFactory
+from tests.factories.locations import BuildingFactory, LocationFactory
+from tests.factories.monitoring import LocationAccessGrantFactory, MonitoringGroupFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _granted(user) -> set[int]:
+    return set(LocationAccessGrant.objects.filter(user=user).values_list("location_id", flat=True))
+
+
+def test_group_changes_grant_and_revoke_locations_incrementally() -> None:
+    user = UserFactory()
+    group = MonitoringGroupFactory()
+    assigned = LocationFactory()
+    campus = BuildingFactory()
+    anchor = LocationFactory(building=campus)
+    sibling = LocationFactory(building=campus)
+
+    group.users.add(user)
+    group.locations.add(assigned)
+    MonitoringGroupLocation.objects.create(
+        monitoring_group=group, location=anchor, include_all_rooms=True
+    )
+    assert _granted(user) == {assigned.pk, anchor.pk, sibling.pk}
+
+    late = LocationFactory(building=campus)
+    assert late.pk in _granted(user)
+
+    sibling.is_active = False
+    sibling.save()
+    assert _granted(user) == {assigned.pk, anchor.pk, late.pk}
+
+    group.is_active = False
+    group.save()
+    assert _granted(user) == set()
+
+    group.is_active = True
+    group.save()
+    group.users.remove(user)
+    assert _granted(user) == set()
+
+
+def test_moving_a_location_out_of_a_granted_building_revokes_it() -> None:
+    user = UserFactory()
+    group = MonitoringGroupFactory()
+    group.users.add(user)
+    anchor = LocationFactory()
+    MonitoringGroupLocation.objects.create(
+        monitoring_group=group, location=anchor, include_all_rooms=True
+    )
+    moving = LocationFactory(building=anchor.building)
+    assert moving.pk in _granted(user)
+
+    moving.building = BuildingFactory()
+    moving.room = None
+    moving.save()
+
+    assert _granted(user) == {anchor.pk}
+
+
+def test_deleting_a_group_revokes_its_members() -> None:
+    user = UserFactory()
+    group = MonitoringGroupFactory()
+    group.users.add(user)
+    group.locations.add(LocationFactory())
+
+    group.delete()
+
+    assert _granted(user) == set()
+
+
+def test_accessible_locations_read_one_grant_join_without_distinct() -> None:
+    user = UserFactory()
+    group = MonitoringGroupFactory()
+    group.users.add(user)
+    location = LocationFactory()
+    group.locations.add(location)
+    LocationFactory()
+
+    locations = MonitoringService.get_accessible_locations(user)
+    buildings = MonitoringService.get_accessible_buildings(user)
+    rooms = MonitoringService.get_accessible_rooms(user)
+
+    assert list(locations) == [location]
+    assert list(buildings) == [location.building]
+    assert list(rooms) == [location.room]
+    for queryset in (locations, buildings, rooms):
+        assert "DISTINCT" not in str(queryset.query).upper()
+
+
+def test_rebuild_repairs_stale_and_missing_grants() -> None:
+    user = UserFactory()
+    group = MonitoringGroupFactory()
+    group.users.add(user)
+    location = LocationFactory()
+    group.locations.add(location)
+    LocationAccessGrant.objects.all().delete()
+    stray = LocationAccessGrantFactory()
+
+    stdout = StringIO()
+    call_command("rebuild_location_access", stdout=stdout)
+
+    assert _granted(user) == {location.pk}
+    assert not LocationAccessGrant.objects.filter(pk=stray.pk).exists()
+    assert "1 granted, 1 revoked" in stdout.getvalue()
+    assert LocationAccessService.rebuild().created == 0
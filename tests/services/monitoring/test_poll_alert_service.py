@@ -10,6 +10,7 @@ from django.test import override_settings
 import pytest
 
 from micboard.models.monitoring.alert import Alert
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
 from micboard.services.monitoring.poll_alert_service import (
     HARD_POLL_ALERT_MAX_UNITS,
     PollAlertService,
@@ -18,6 +19,10 @@ from tests.factories.base import UserFactory
 from tests.factories.hardware import WirelessUnitFactory
 from tests.factories.monitoring import PerformerAssignmentFactory
 
+# These scenarios patch the per-unit checks directly; batched evaluation is covered in
+# test_alert_evaluation_engine.py.
+PER_UNIT_ENGINE = override_settings(MICBOARD_POLL_ALERT_ENGINE="per_unit")
+
 
 def _assigned_units(count: int):
     units = [WirelessUnitFactory() for _ in range(count)]
@@ -27,6 +32,7 @@ def _assigned_units(count: int):
     return units
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 @override_settings(MICBOARD_POLL_ALERT_MAX_UNITS=2)
 def test_alert_scan_rotates_through_inventory_and_wraps_fairly() -> None:
@@ -93,6 +99,7 @@ def test_alert_scan_invalid_cursor_resets_to_start() -> None:
         assert PollAlertService._read_cursor(1) == 0
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 @override_settings(MICBOARD_POLL_ALERT_MAX_UNITS=2)
 def test_alert_scan_isolates_and_redacts_unit_failures(caplog) -> None:
@@ -125,6 +132,7 @@ def test_alert_scan_isolates_and_redacts_unit_failures(caplog) -> None:
     assert "RuntimeError" in caplog.text
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 def test_alert_scan_continues_when_cursor_cache_fails(caplog) -> None:
     """Cache outages cannot suppress bounded alert evaluation or leak cache errors."""
@@ -154,6 +162,7 @@ def test_alert_scan_continues_when_cursor_cache_fails(caplog) -> None:
     assert secret not in caplog.text
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 @pytest.mark.parametrize("revoked", ["user", "group"])
 def test_alert_scan_excludes_units_without_active_fanout(assigned_unit, revoked: str) -> None:
@@ -199,11 +208,7 @@ def test_poll_shares_one_exact_delivery_budget_across_alert_checks(assigned_unit
     cache.delete(PollAlertService._cursor_key(assigned_unit.unit.manufacturer_id))
     cache.delete(PollAlertService._scope_cursor_key(assigned_unit.unit.manufacturer_id))
 
-    with patch(
-        "micboard.services.monitoring.alert_delivery_service.email_service.send_alert_notification",
-        return_value=True,
-    ) as send_email:
-        result = PollAlertService.evaluate_manufacturer(assigned_unit.unit.manufacturer)
+    result = PollAlertService.evaluate_manufacturer(assigned_unit.unit.manufacturer)
 
     assert result.scanned == 1
     assert not result.units_truncated
@@ -213,9 +218,10 @@ def test_poll_shares_one_exact_delivery_budget_across_alert_checks(assigned_unit
     assert result.assignments_evaluated == 2
     assert result.recipients_evaluated == 6
     assert Alert.objects.count() == 2
-    assert send_email.call_count == 2
+    assert AlertEmailOutbox.objects.count() == 2
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 @override_settings(
     MICBOARD_POLL_ALERT_MAX_UNITS=1,
@@ -257,6 +263,7 @@ def test_poll_rotates_first_access_to_an_exhaustible_scope_budget(assigned_unit)
     assert first.deliveries_truncated and second.deliveries_truncated
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 @override_settings(
     MICBOARD_POLL_ALERT_MAX_UNITS=2,
@@ -303,6 +310,7 @@ def test_exhausted_fanout_budget_advances_to_the_next_unit() -> None:
     assert first.units_truncated and second.units_truncated
 
 
+@PER_UNIT_ENGINE
 @pytest.mark.django_db
 @pytest.mark.parametrize("dimension", ["assignments", "recipients", "deliveries"])
 @override_settings(
@@ -0,0 +1,135 @@
+"""Change notices for pushed HTMX fragment refreshes."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+
+import pytest
+
+from micboard.services.chargers.polling_dtos import (
+    ChargerSlotSnapshot,
+    ChargerStationIdentity,
+    ChargerStationSnapshot,
+)
+from micboard.services.chargers.slot_sync_service import ChargerSlotSyncService
+from micboard.services.monitoring.alerts import acknowledge_alert
+from micboard.services.notification.broadcast_service import BroadcastService
+from micboard.services.notification.live_fragment_service import LiveFragmentService
+from tests.factories.base import UserFactory
+from tests.factories.hardware import (
+    ChargerFactory,
+    ChargerSlotFactory,
+    WirelessChassisFactory,
+    WirelessUnitFactory,
+)
+from tests.factories.locations import BuildingFactory, LocationFactory
+from tests.factories.monitoring import AlertFactory, PerformerAssignmentFactory
+from tests.factories.multitenancy import CampusFactory, OrganizationFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
+def test_notices_route_only_to_the_tenant_owning_the_rows(
+    django_capture_on_commit_callbacks,
+) -> None:
+    organization = OrganizationFactory()
+    campus = CampusFactory(organization=organization)
+    building = BuildingFactory(organization_id=organization.pk, campus_id=campus.pk)
+    chassis = WirelessChassisFactory(location=LocationFactory(building=building), max_channels=1)
+    channel = chassis.rf_channels.get(channel_number=1)
+
+    with (
+        patch.object(BroadcastService, "_send_to_groups") as send,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        LiveFragmentService.alerts_changed((channel.pk, None))
+
+    event, groups = send.call_args.args
+    assert event == {"type": "fragment_change", "fragment": "alerts"}
+    assert list(groups) == [
+        f"micboard_updates.organization.{organization.pk}",
+        f"micboard_updates.organization.{organization.pk}.campus.{campus.pk}",
+    ]
+
+
+def test_notices_wait_for_commit_and_are_dropped_on_rollback(
+    django_capture_on_commit_callbacks,
+) -> None:
+    user = UserFactory(is_superuser=True)
+    alert = AlertFactory(status="pending")
+
+    with (
+        patch.object(BroadcastService, "broadcast_fragment_change") as broadcast,
+        django_capture_on_commit_callbacks(execute=True) as callbacks,
+    ):
+        with pytest.raises(RuntimeError), transaction.atomic():
+            LiveFragmentService.alerts_changed((alert.channel_id,))
+            raise RuntimeError("rolled back")
+        assert not callbacks
+        acknowledge_alert(alert.pk, user=user)
+
+    broadcast.assert_called_once_with(fragment="alerts")
+
+
+def test_direct_model_edits_announce_their_fragments(
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Admin-style saves and deletes refresh live tables without going through a service."""
+    alert = AlertFactory(status="pending")
+    assignment = PerformerAssignmentFactory()
+    previous_unit_id = assignment.wireless_unit_id
+    slot = ChargerSlotFactory()
+
+    with (
+        patch.object(LiveFragmentService, "announce") as announce,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        alert.status = "resolved"
+        alert.save()
+        assignment.wireless_unit = WirelessUnitFactory()
+        assignment.save()
+        slot.battery_percent = 40
+        slot.save()
+        slot.delete()
+
+    assert [call.args for call in announce.call_args_list] == [
+        ("alerts", frozenset({alert.channel_id})),
+        ("assignments", frozenset({previous_unit_id, assignment.wireless_unit_id})),
+        ("chargers", frozenset({slot.charger_id})),
+        ("chargers", frozenset({slot.charger_id})),
+    ]
+
+
+def test_unchanged_charger_slots_send_no_notice(django_capture_on_commit_callbacks) -> None:
+    charger = ChargerFactory(ip="192.0.2.10")
+    station = ChargerStationSnapshot(
+        id="station-1",
+        name="Station",
+        status="online",
+        slots=[ChargerSlotSnapshot(slot_number=1, mic_name="Mic", battery_level=80, charging=True)],
+    )
+    stations = [(ChargerStationIdentity(ip="192.0.2.10"), station)]
+
+    with (
+        patch.object(BroadcastService, "broadcast_fragment_change") as broadcast,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        ChargerSlotSyncService.apply(charger.manufacturer, stations)
+        ChargerSlotSyncService.apply(charger.manufacturer, stations)
+
+    broadcast.assert_called_once_with(fragment="chargers")
+
+
+def test_live_tables_refetch_on_notice_and_poll_only_while_offline(django_client) -> None:
+    django_client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+    page = django_client.get(reverse("micboard:charger_dashboard")).content.decode()
+
+    assert 'data-live-fragment="chargers"' in page
+    assert 'hx-trigger="live-fragment-changed, every 10s [!window.micboardLive]"' in page
+    assert page.count("micboard/js/live-fragments.js") == 1
@@ -206,7 +206,7 @@ def test_project_chassis_uses_stable_primitive_payload(ip, projected_ip) -> None
         model="EW-D",
     )
 
-    projected = RealtimeSubscriptionLifecycleService._project_chassis(chassis)
+    projected = RealtimeSubscriptionLifecycleService._project_chassis(chassis, [])
 
     assert projected == {
         "id": 3,
@@ -215,6 +215,7 @@ def test_project_chassis_uses_stable_primitive_payload(ip, projected_ip) -> None
         "ip": projected_ip,
         "status": "online",
         "model": "EW-D",
+        "tx": [],
     }
 
 
@@ -230,7 +231,13 @@ def test_broadcast_update_resolves_and_broadcasts_canonical_payload(monkeypatch)
     )
     get = Mock(return_value=chassis)
     broadcast = Mock()
+    slot = {"channel": 1, "name": "Vox", "battery": 4}
     monkeypatch.setattr(WirelessChassis.objects, "get", get)
+    monkeypatch.setattr(
+        lifecycle_service.DeviceSnapshotBroadcastService,
+        "slot_states",
+        Mock(return_value={3: [slot]}),
+    )
     monkeypatch.setattr(
         lifecycle_service.BroadcastService,
         "broadcast_device_update",
@@ -254,6 +261,7 @@ def test_broadcast_update_resolves_and_broadcasts_canonical_payload(monkeypatch)
                     "ip": "192.0.2.1",
                     "status": "online",
                     "model": "ULXD",
+                    "tx": [slot],
                 }
             ]
         },
@@ -0,0 +1,81 @@
+"""Passive manufacturer API health windows built from client traffic."""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import override_settings
+
+import pytest
+
+from micboard.services.shared import api_traffic_health
+from micboard.services.shared.api_health import API_HEALTH_SNAPSHOT_CACHE_PREFIX
+from micboard.services.shared.api_traffic_health import APITrafficHealth
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    cache.clear()
+    APITrafficHealth.reset()
+    fake = _Clock()
+    monkeypatch.setattr(api_traffic_health.time, "monotonic", fake)
+    yield fake
+    APITrafficHealth.reset()
+    cache.clear()
+
+
+def test_window_publishes_error_rate_latency_percentiles_and_breaker_state(clock) -> None:
+    APITrafficHealth.observe("vendor", ok=True, latency=0.5, breaker_state="closed")
+    assert APITrafficHealth.recent_snapshot("vendor")["requests"] == 1
+
+    for index in range(1, 19):
+        APITrafficHealth.observe("vendor", ok=True, latency=index / 100, breaker_state="closed")
+    clock.now += 31
+    APITrafficHealth.observe("vendor", ok=False, latency=3.0, breaker_state="closed")
+
+    snapshot = APITrafficHealth.recent_snapshot("vendor")
+    assert snapshot == {
+        "status": "degraded",
+        "response_time": 0.1,
+        "error": "API health check failed; details redacted.",
+        "source": "traffic",
+        "requests": 20,
+        "error_rate": 0.05,
+        "p95_response_time": 0.5,
+        "breaker_state": "closed",
+    }
+    assert cache.get(f"{API_HEALTH_SNAPSHOT_CACHE_PREFIX}vendor") == snapshot
+
+
+@override_settings(MICBOARD_API_HEALTH_WINDOW_SECONDS=60)
+def test_old_outcomes_leave_the_window_and_an_open_breaker_reports_offline(clock) -> None:
+    APITrafficHealth.observe("vendor", ok=False, latency=None, breaker_state="closed")
+    clock.now += 61
+    APITrafficHealth.observe("vendor", ok=True, latency=0.2, breaker_state="closed")
+    assert APITrafficHealth.recent_snapshot("vendor")["status"] == "healthy"
+
+    clock.now += 31
+    APITrafficHealth.observe("vendor", ok=False, latency=0.1, breaker_state="open")
+
+    snapshot = APITrafficHealth.recent_snapshot("vendor")
+    assert snapshot["status"] == "offline"
+    assert snapshot["breaker_state"] == "open"
+    assert snapshot["requests"] == 2
+
+
+def test_cache_failures_never_reach_the_request(clock, monkeypatch) -> None:
+    def fail(*args: object, **kwargs: object) -> None:
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(api_traffic_health.cache, "set_many", fail)
+
+    APITrafficHealth.observe("vendor", ok=True, latency=0.1, breaker_state="closed")
+
+    assert APITrafficHealth.recent_snapshot("vendor") is None
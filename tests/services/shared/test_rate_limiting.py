@@ -0,0 +1,114 @@
+"""Atomic sliding-window rate limiting contracts."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+
+import pytest
+
+from micboard.decorators import rate_limit_user
+from micboard.services.shared import rate_limiting
+from micboard.services.shared.rate_limiting import RateLimitQuota, check_rate_limit
+
+
+@pytest.fixture(autouse=True)
+def isolated_counters(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Pin the clock mid-window and start every test with empty counters."""
+    cache.clear()
+    rate_limiting.local_counters.clear()
+    clock = Mock(return_value=1_005.0)
+    monkeypatch.setattr(rate_limiting.time, "time", clock)
+    return clock
+
+
+def test_burst_extends_the_limit_and_rejections_do_not_consume_quota() -> None:
+    decisions = [check_rate_limit("client", 2, 10, burst=1).allowed for _ in range(5)]
+
+    assert decisions == [True, True, True, False, False]
+    assert cache.get("client:10:100") == 3
+
+
+def test_previous_window_weight_decays_across_the_boundary(isolated_counters: Mock) -> None:
+    for _ in range(4):
+        assert check_rate_limit("client", 4, 10).allowed is True
+
+    isolated_counters.return_value = 1_012.5
+    # A quarter of the previous window has slid out: 4 * 0.75 = 3 requests still count.
+    assert check_rate_limit("client", 4, 10).allowed is True
+    rejected = check_rate_limit("client", 4, 10)
+
+    assert rejected.allowed is False
+    assert rejected.retry_after == 3
+
+
+def test_shared_tenant_quota_limits_users_together() -> None:
+    tenant = [RateLimitQuota("tenant", 3)]
+
+    results = [
+        check_rate_limit(f"user-{user}", 2, 10, shared_quotas=tenant) for user in (1, 2, 1, 2)
+    ]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert results[-1].key == "tenant"
+    assert cache.get("user-2:10:100") == 1
+
+
+def test_window_lengths_keep_separate_counters(isolated_counters: Mock) -> None:
+    # At t=11 both a 4- and a 5-second window are in their window number 2.
+    isolated_counters.return_value = 11.0
+    assert check_rate_limit("client", 1, 4).allowed is True
+
+    assert check_rate_limit("client", 1, 5).allowed is True
+    assert check_rate_limit("client", 1, 4).allowed is False
+
+
+def test_concurrent_checks_cannot_exceed_the_limit() -> None:
+    barrier = threading.Barrier(12)
+    allowed: list[bool] = []
+
+    def hit() -> None:
+        barrier.wait()
+        allowed.append(check_rate_limit("shared", 5, 10).allowed)
+
+    threads = [threading.Thread(target=hit) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert allowed.count(True) == 5
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+def test_in_process_counters_apply_without_a_configured_cache() -> None:
+    assert [check_rate_limit("client", 1, 10).allowed for _ in range(2)] == [True, False]
+
+
+def test_user_decorator_applies_tenant_quota_and_reports_retry_after() -> None:
+    @rate_limit_user(max_requests=5, window_seconds=10, tenant_max_requests=1)
+    def view(request):
+        return "ok"
+
+    requests = []
+    for user_id in (1, 2):
+        request = RequestFactory().get("/")
+        request.user = SimpleNamespace(is_authenticated=True, id=user_id)
+        request.organization = SimpleNamespace(pk=9)
+        requests.append(request)
+
+    assert view(requests[0]) == "ok"
+    response = view(requests[1])
+
+    assert response.status_code == 429
+    assert response["Retry-After"] == "5"
+
+    @rate_limit_user(max_requests=5, window_seconds=10, tenant_max_requests=1)
+    def other_view(request):
+        return "ok"
+
+    assert other_view(requests[1]) == "ok"
@@ -39,11 +39,11 @@ def _server(**overrides: object) -> SimpleNamespace:
 def test_organization_service_counts_devices_and_records_creator() -> None:
     organization = SimpleNamespace(pk=9)
     with patch(
-        "micboard.models.hardware.wireless_chassis.WirelessChassis.objects.filter"
-    ) as chassis_filter:
-        chassis_filter.return_value.count.return_value = 3
+        "micboard.services.monitoring.inventory_counter_service.InventoryCounterService.totals"
+    ) as totals:
+        totals.return_value.devices = 3
         assert get_device_count(organization) == 3
-    chassis_filter.assert_called_once_with(location__building__organization_id=9)
+    totals.assert_called_once_with("organization", 9)
 
     membership = SimpleNamespace(created_by=None)
     user = object()
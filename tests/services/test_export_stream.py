@@ -0,0 +1,116 @@
+"""Streaming export contracts: tenant scope, encodings, and flat memory."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import tracemalloc
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from micboard.models.telemetry.sessions import WirelessUnitSample
+from micboard.services.exports.export_stream_service import ExportStreamService
+from tests.factories.base import UserFactory
+from tests.factories.hardware import WirelessChassisFactory, WirelessUnitFactory
+from tests.factories.locations import BuildingFactory, LocationFactory
+from tests.factories.multitenancy import OrganizationFactory, OrganizationMembershipFactory
+from tests.factories.telemetry import WirelessUnitSampleFactory, WirelessUnitSessionFactory
+
+EXPORT_MEMORY_CEILING_BYTES = 8 * 1024 * 1024
+
+
+def _tenant_session(organization_id: int):
+    chassis = WirelessChassisFactory(
+        location=LocationFactory(building=BuildingFactory(organization_id=organization_id)),
+    )
+    return WirelessUnitSessionFactory(wireless_unit=WirelessUnitFactory(base_chassis=chassis))
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
+def test_telemetry_ndjson_export_is_scoped_to_the_users_tenant() -> None:
+    user = UserFactory()
+    organization = OrganizationFactory()
+    OrganizationMembershipFactory(user=user, organization=organization, campus=None)
+    visible = WirelessUnitSampleFactory(
+        session=_tenant_session(organization.pk), battery=80, status="ok"
+    )
+    WirelessUnitSampleFactory(session=_tenant_session(OrganizationFactory().pk), battery=10)
+
+    body = "".join(
+        ExportStreamService.stream(user=user, dataset="telemetry", export_format="ndjson")
+    )
+
+    records = [json.loads(line) for line in body.splitlines()]
+    assert [record["id"] for record in records] == [visible.pk]
+    assert records[0]["wireless_unit_id"] == visible.session.wireless_unit_id
+    assert records[0]["battery"] == 80
+
+
+@pytest.mark.django_db
+def test_inventory_csv_export_writes_header_and_neutralizes_formulas() -> None:
+    user = UserFactory(is_superuser=True)
+    first = WirelessChassisFactory(name='=HYPERLINK("http://evil")')
+    second = WirelessChassisFactory(name="Stage Left")
+
+    body = "".join(ExportStreamService.stream(user=user, dataset="inventory", export_format="csv"))
+
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert [int(row["id"]) for row in rows] == [first.pk, second.pk]
+    assert rows[0]["name"] == '\'=HYPERLINK("http://evil")'
+    assert rows[1]["name"] == "Stage Left"
+
+
+@pytest.mark.django_db
+def test_export_view_streams_attachment_and_rejects_unknown_requests(client) -> None:
+    client.force_login(UserFactory(is_superuser=True))
+    WirelessChassisFactory()
+
+    response = client.get(reverse("micboard:export", args=["inventory"]), {"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"] == 'attachment; filename="micboard-inventory.csv"'
+    assert b"".join(response.streaming_content).startswith(b"id,api_device_id,")
+    assert client.get(reverse("micboard:export", args=["passwords"])).status_code == 404
+    assert (
+        client.get(reverse("micboard:export", args=["alerts"]), {"format": "xlsx"}).status_code
+        == 400
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_hundred_thousand_row_export_stays_under_a_fixed_memory_ceiling() -> None:
+    user = UserFactory(is_superuser=True)
+    session = WirelessUnitSessionFactory()
+    now = timezone.now()
+    WirelessUnitSample.objects.bulk_create(
+        (
+            WirelessUnitSample(
+                session=session, timestamp=now, battery=index % 100, status="ok", frequency="520.0"
+            )
+            for index in range(100_000)
+        ),
+        batch_size=5_000,
+    )
+
+    line_count = 0
+    tracemalloc.start()
+    try:
+        for block in ExportStreamService.stream(
+            user=user, dataset="telemetry", export_format="ndjson"
+        ):
+            line_count += block.count("\n")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert line_count == 100_000
+    assert peak < EXPORT_MEMORY_CEILING_BYTES
@@ -321,12 +321,13 @@ def test_import_rejects_cross_vendor_durable_identity(
 def test_import_checks_identity_inside_shared_lock_before_write(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Imports classify and persist only while holding the global identity lock."""
+    """Imports classify and persist only while holding the device's identity lock."""
     manufacturer = ManufacturerFactory()
     events: list[str] = []
 
     @contextmanager
-    def acquire(*, manufacturer):
+    def acquire(*, manufacturer, identities):
+        assert [identity.serial_number for identity in identities] == ["ordered-import"]
         events.append("locked")
         yield manufacturer
         events.append("released")
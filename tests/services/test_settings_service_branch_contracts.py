@@ -15,6 +15,7 @@ from micboard.services.settings.dtos import SettingsVisibilityScope
 from micboard.services.settings.presentation_service import SettingsPresentationService
 from micboard.services.settings.settings_service import SettingsService
 from micboard.services.settings.visibility_service import SettingsVisibilityService
+from micboard.settings.deployment_controls import deployment_controls
 from micboard.settings.scope_policy import matches_definition_scope, resolve_scope
 
 
@@ -32,6 +33,24 @@ def test_settings_resolution_honors_each_remaining_fallback_source() -> None:
     assert service.get("definition_only") == "definition"
 
 
+@pytest.mark.parametrize(
+    ("configured", "positive", "non_negative"),
+    [(None, 5, 5), (True, 5, 5), ("many", 5, 5), ("7", 7, 7), (-3, 1, 0), (10**9, 60, 60)],
+)
+def test_bounded_int_settings_clamp_to_package_limits(configured, positive, non_negative) -> None:
+    with override_settings(MICBOARD_TEST_LIMIT=configured):
+        assert (
+            SettingsService().get_bounded_int("MICBOARD_TEST_LIMIT", default=5, hard_limit=60)
+            == positive
+        )
+        assert (
+            deployment_controls.get_bounded_int(
+                "MICBOARD_TEST_LIMIT", default=5, hard_limit=60, minimum=0
+            )
+            == non_negative
+        )
+
+
 @override_settings(
     MICBOARD_MSP_ENABLED=True,
     MICBOARD_MULTI_SITE_MODE=False,
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
+
+import pytest
+
 from micboard.services.shared.api_health import API_HEALTH_AGGREGATE_CACHE_KEY
 from micboard.services.shared.api_health_dtos import PUBLIC_API_HEALTH_ERROR
 from micboard.tasks.monitoring import health as health_tasks
@@ -11,9 +15,16 @@ from micboard.tasks.monitoring import health as health_tasks
 SECRET_SENTINEL = "task-health-secret-sentinel"
 
 
+@pytest.fixture(autouse=True)
+def clear_traffic_health() -> None:
+    """Probe contracts assume no organic traffic snapshot is cached."""
+    cache.clear()
+
+
 def _publisher_patches():
     return (
-        patch.object(health_tasks.APIHealthLog.objects, "create"),
+        patch.object(health_tasks, "APIHealthLog"),
+        patch.object(health_tasks.AuditLogBuffer, "add"),
         patch.object(health_tasks.cache, "set"),
         patch.object(health_tasks.cache, "delete"),
         patch.object(health_tasks.logger, "info"),
@@ -42,11 +53,14 @@ def test_api_health_check_sanitizes_every_published_snapshot() -> None:
         "error": PUBLIC_API_HEALTH_ERROR,
     }
 
-    create_patch, set_patch, delete_patch, info_patch, broadcast_patch = _publisher_patches()
+    log_patch, buffer_patch, set_patch, delete_patch, info_patch, broadcast_patch = (
+        _publisher_patches()
+    )
     with (
         patch.object(health_tasks.Manufacturer.objects, "get", return_value=manufacturer),
         patch.object(health_tasks, "get_manufacturer_plugin", return_value=plugin_class),
-        create_patch as create_log,
+        log_patch as health_log,
+        buffer_patch as buffer_add,
         set_patch as cache_set,
         delete_patch as cache_delete,
         info_patch as info,
@@ -54,20 +68,59 @@ def test_api_health_check_sanitizes_every_published_snapshot() -> None:
     ):
         health_tasks.check_manufacturer_api_health(17)
 
-    create_log.assert_called_once_with(
+    health_log.assert_called_once_with(
         manufacturer=manufacturer,
         status="unhealthy",
         response_time=0.125,
         error_message=PUBLIC_API_HEALTH_ERROR,
         details=safe_health,
     )
+    buffer_add.assert_called_once_with(health_log.return_value)
     cache_set.assert_called_once_with("api_health_shure", safe_health, timeout=60)
     cache_delete.assert_called_once_with(API_HEALTH_AGGREGATE_CACHE_KEY)
     info.assert_called_once_with("API health for %s: %s", "shure", safe_health)
     broadcast.assert_called_once_with(manufacturer=manufacturer, health_data=safe_health)
     assert SECRET_SENTINEL not in str(
-        (create_log.call_args, cache_set.call_args, info.call_args, broadcast.call_args)
+        (health_log.call_args, cache_set.call_args, info.call_args, broadcast.call_args)
+    )
+
+
+def test_api_health_check_publishes_recent_traffic_without_probing() -> None:
+    """Organic traffic replaces the synthetic vendor probe while it is fresh."""
+    manufacturer = Mock(code="shure")
+    traffic_health = {
+        "status": "healthy",
+        "response_time": 0.05,
+        "source": "traffic",
+        "requests": 40,
+        "error_rate": 0.0,
+        "p95_response_time": 0.2,
+        "breaker_state": "closed",
+    }
+
+    log_patch, buffer_patch, set_patch, delete_patch, info_patch, broadcast_patch = (
+        _publisher_patches()
     )
+    with (
+        patch.object(health_tasks.Manufacturer.objects, "get", return_value=manufacturer),
+        patch.object(
+            health_tasks.APITrafficHealth, "recent_snapshot", return_value=traffic_health
+        ) as recent_snapshot,
+        patch.object(health_tasks, "get_manufacturer_plugin") as get_plugin,
+        log_patch as health_log,
+        buffer_patch,
+        set_patch as cache_set,
+        delete_patch,
+        info_patch,
+        broadcast_patch as broadcast,
+    ):
+        health_tasks.check_manufacturer_api_health(17)
+
+    recent_snapshot.assert_called_once_with("shure")
+    get_plugin.assert_not_called()
+    assert health_log.call_args.kwargs["details"] == traffic_health
+    cache_set.assert_called_once_with("api_health_shure", traffic_health, timeout=60)
+    broadcast.assert_called_once_with(manufacturer=manufacturer, health_data=traffic_health)
 
 
 def test_api_health_check_handles_missing_manufacturer() -> None:
@@ -114,12 +167,15 @@ def test_api_health_check_persists_stable_snapshot_after_plugin_failure() -> Non
     error = RuntimeError(f"plugin unavailable: {SECRET_SENTINEL}")
     safe_health = {"status": "error", "error": PUBLIC_API_HEALTH_ERROR}
 
-    create_patch, set_patch, delete_patch, info_patch, broadcast_patch = _publisher_patches()
+    log_patch, buffer_patch, set_patch, delete_patch, info_patch, broadcast_patch = (
+        _publisher_patches()
+    )
     with (
         patch.object(health_tasks.Manufacturer.objects, "get", return_value=manufacturer),
         patch.object(health_tasks, "get_manufacturer_plugin", side_effect=error),
         patch.object(health_tasks.logger, "exception") as exception,
-        create_patch as create_log,
+        log_patch as health_log,
+        buffer_patch as buffer_add,
         set_patch as cache_set,
         delete_patch,
         info_patch,
@@ -127,13 +183,14 @@ def test_api_health_check_persists_stable_snapshot_after_plugin_failure() -> Non
     ):
         health_tasks.check_manufacturer_api_health(9)
 
-    create_log.assert_called_once_with(
+    health_log.assert_called_once_with(
         manufacturer=manufacturer,
         status="error",
         response_time=None,
         error_message=PUBLIC_API_HEALTH_ERROR,
         details=safe_health,
     )
+    buffer_add.assert_called_once_with(health_log.return_value)
     cache_set.assert_called_once_with("api_health_shure", safe_health, timeout=60)
     broadcast.assert_called_once_with(manufacturer=manufacturer, health_data=safe_health)
     exception_args = exception.call_args
@@ -155,7 +212,8 @@ def test_api_health_publication_failure_logs_sanitized_exception() -> None:
     with (
         patch.object(health_tasks.Manufacturer.objects, "get", return_value=manufacturer),
         patch.object(health_tasks, "get_manufacturer_plugin", return_value=plugin_class),
-        patch.object(health_tasks.APIHealthLog.objects, "create", side_effect=error),
+        patch.object(health_tasks, "APIHealthLog"),
+        patch.object(health_tasks.AuditLogBuffer, "add", side_effect=error),
         patch.object(health_tasks.logger, "exception") as exception,
     ):
         health_tasks.check_manufacturer_api_health(11)
@@ -0,0 +1,88 @@
+"""Dispatch and drain contracts for the alert email outbox task."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.cache import cache
+from django.test import override_settings
+
+import pytest
+
+from micboard.models.monitoring.alert_outbox import AlertEmailOutbox
+from micboard.services.monitoring.alert_delivery_service import AlertDeliveryService
+from micboard.tasks.monitoring import email_outbox as outbox_tasks
+from tests.factories.base import UserFactory
+from tests.factories.hardware import WirelessChassisFactory, WirelessUnitFactory
+from tests.factories.monitoring import PerformerAssignmentFactory
+
+
+@pytest.fixture
+def assigned_unit(db):
+    with (
+        override_settings(TESTING=True),
+        patch(
+            "micboard.services.manufacturer.plugin_registry.PluginRegistry.get_plugin",
+            return_value=None,
+        ),
+    ):
+        chassis = WirelessChassisFactory(max_channels=1)
+        unit = WirelessUnitFactory(
+            base_chassis=chassis,
+            manufacturer=chassis.manufacturer,
+            assigned_resource=chassis.rf_channels.get(channel_number=1),
+        )
+    assignment = PerformerAssignmentFactory(wireless_unit=unit, alert_on_audio_low=True)
+    user = UserFactory()
+    assignment.monitoring_group.users.add(user)
+    cache.delete(outbox_tasks.ALERT_EMAIL_DRAIN_DISPATCH_KEY)
+    return unit, assignment, user
+
+
+def _create_alert(assigned_unit, alert_type: str) -> None:
+    unit, assignment, user = assigned_unit
+    AlertDeliveryService.create_alert(
+        unit=unit,
+        user=user,
+        performer_assignment=assignment,
+        alert_type=alert_type,
+        message="Signal lost",
+    )
+
+
+def test_committed_alert_wakes_one_drain(assigned_unit, django_capture_on_commit_callbacks):
+    """The email leaves through the Huey drain only after the alert commits."""
+    with django_capture_on_commit_callbacks(execute=True):
+        _create_alert(assigned_unit, "signal_loss")
+        assert not mail.outbox
+
+    assert len(mail.outbox) == 1
+    assert AlertEmailOutbox.objects.get().status == "sent"
+
+
+@override_settings(MICBOARD_ALERT_EMAIL_BATCH_SIZE=1)
+def test_backlogged_drain_requeues_itself(assigned_unit, django_capture_on_commit_callbacks):
+    """A full batch enqueues another drain until the due backlog is empty."""
+    _create_alert(assigned_unit, "signal_loss")
+    _create_alert(assigned_unit, "audio_low")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        result = outbox_tasks.drain_alert_email_outbox()
+
+    assert result is not None
+    assert result["sent"] == 1
+    assert len(mail.outbox) == 2
+    assert not AlertEmailOutbox.objects.filter(status="pending").exists()
+
+
+def test_drain_task_contains_service_failure(caplog) -> None:
+    """A failing drain is logged without details and leaves no dispatch claim behind."""
+    secret = "outbox-task-secret"
+    with patch.object(
+        outbox_tasks.AlertEmailOutboxService, "drain", side_effect=RuntimeError(secret)
+    ):
+        assert outbox_tasks.drain_alert_email_outbox() is None
+
+    assert secret not in caplog.text
+    assert cache.get(outbox_tasks.ALERT_EMAIL_DRAIN_DISPATCH_KEY) is None
@@ -5,8 +5,14 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import Mock, call, patch
 
+from django.core.cache import cache
+
 from micboard.models.discovery.manufacturer import Manufacturer
 from micboard.models.integrations import ManufacturerAPIServer
+from micboard.tasks.monitoring.email_outbox import (
+    ALERT_EMAIL_DRAIN_DISPATCH_KEY,
+    drain_alert_email_outbox,
+)
 from micboard.tasks.sync.polling import (
     poll_api_server_device,
     poll_manufacturer_devices,
@@ -75,6 +81,7 @@ def test_repeated_polling_runs_alerts_without_enqueuing_realtime_supervisors() -
     scan_result = SimpleNamespace(failed=0, scanned=2)
     service = Mock()
     service.poll_manufacturer.return_value = result
+    cache.delete(ALERT_EMAIL_DRAIN_DISPATCH_KEY)
     with (
         patch(
             "micboard.tasks.sync.polling.Manufacturer.objects.get",
@@ -95,7 +102,8 @@ def test_repeated_polling_runs_alerts_without_enqueuing_realtime_supervisors() -
         assert poll_manufacturer_devices(7) == result
 
     assert alert_scan.call_args_list == [call(manufacturer), call(manufacturer)]
-    enqueue.assert_not_called()
+    # Only the coalesced alert email drain is queued; no supervisor is started.
+    assert enqueue.call_args_list == [call(drain_alert_email_outbox)]
 
 
 def test_poll_task_handles_missing_manufacturer() -> None:
@@ -0,0 +1,156 @@
+"""Task lane routing, singleton dispatch, worker budgets, and backpressure statistics."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+
+import pytest
+from huey.exceptions import RetryTask
+
+from micboard.tasks.maintenance.audit import prune_operational_logs
+from micboard.tasks.sync.polling import poll_manufacturer_devices
+from micboard.utils import task_lanes
+from micboard.utils.dependencies import enqueue_huey_task
+from micboard.utils.task_lanes import (
+    DISPATCH_KWARG,
+    TaskLane,
+    TaskRoute,
+    lane_budget,
+    lane_entrypoint,
+    lane_snapshot,
+    task_route,
+)
+
+_POLLED: list[int] = []
+
+
+def _singleton_poll(manufacturer_id: int) -> int:
+    _POLLED.append(manufacturer_id)
+    return manufacturer_id
+
+
+def _discovery_step() -> str:
+    return "ran"
+
+
+@pytest.fixture(autouse=True)
+def _clean_lanes(monkeypatch):
+    cache.clear()
+    _POLLED.clear()
+    monkeypatch.setitem(
+        task_lanes.TASK_ROUTES,
+        f"{__name__}._singleton_poll",
+        TaskRoute(TaskLane.POLLING, singleton=True),
+    )
+    monkeypatch.setitem(
+        task_lanes.TASK_ROUTES,
+        f"{__name__}._discovery_step",
+        TaskRoute(TaskLane.DISCOVERY),
+    )
+    yield
+    cache.clear()
+
+
+def test_micboard_tasks_are_routed_to_named_lanes() -> None:
+    assert task_route(poll_manufacturer_devices) == TaskRoute(TaskLane.POLLING, singleton=True)
+    assert task_route(prune_operational_logs) == TaskRoute(TaskLane.MAINTENANCE, singleton=True)
+    assert task_route(_increment_unrouted).lane is TaskLane.MAINTENANCE
+    assert lane_budget(TaskLane.REALTIME).priority > lane_budget(TaskLane.DISCOVERY).priority
+
+
+def _increment_unrouted(value: int) -> int:
+    return value + 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_duplicate_singleton_enqueues_collapse_into_one_pending_execution() -> None:
+    with transaction.atomic():
+        first = enqueue_huey_task(_singleton_poll, 1)
+        duplicate = enqueue_huey_task(_singleton_poll, 1)
+        other = enqueue_huey_task(_singleton_poll, 2)
+
+    assert first is not None
+    assert duplicate is None
+    assert other is not None
+    assert _POLLED == [1, 2]
+
+    # The claim is released once the pending execution starts.
+    enqueue_huey_task(_singleton_poll, 1)
+    assert _POLLED == [1, 2, 1]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_singleton_dispatch_leaves_no_pending_claim() -> None:
+    class RollbackError(Exception):
+        pass
+
+    with pytest.raises(RollbackError), transaction.atomic():
+        assert enqueue_huey_task(_singleton_poll, 5) is not None
+        raise RollbackError
+
+    assert _POLLED == []
+    with transaction.atomic():
+        assert enqueue_huey_task(_singleton_poll, 5) is not None
+        assert enqueue_huey_task(_singleton_poll, 5) is None
+    assert _POLLED == [5]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lane_statistics_record_depth_starts_and_wait() -> None:
+    enqueue_huey_task(_singleton_poll, 3)
+
+    polling = next(status for status in lane_snapshot() if status.lane is TaskLane.POLLING)
+
+    assert polling.depth == 0
+    assert polling.enqueued == 1
+    assert polling.started == 1
+    assert polling.last_wait_seconds is not None
+    assert polling.average_wait_seconds is not None
+
+
+@override_settings(MICBOARD_TASK_LANES={"discovery": {"workers": 1}})
+def test_busy_lane_retries_instead_of_taking_another_worker() -> None:
+    run = lane_entrypoint(_discovery_step, immediate=False)
+    cache.add("micboard:task-lane:v1:slot:discovery:0", "other-worker")
+
+    with pytest.raises(RetryTask):
+        run(**{DISPATCH_KWARG: {"lane": "discovery", "enqueued_at": 0.0}})
+
+    cache.delete("micboard:task-lane:v1:slot:discovery:0")
+    assert run() == "ran"
+    assert cache.get("micboard:task-lane:v1:slot:discovery:0") is None
+
+
+def test_busy_singleton_keeps_its_claim_while_waiting_for_a_worker() -> None:
+    run = lane_entrypoint(_singleton_poll, immediate=False)
+    for index in range(lane_budget(TaskLane.POLLING).workers):
+        cache.add(f"micboard:task-lane:v1:slot:polling:{index}", "other-worker")
+
+    with pytest.raises(RetryTask):
+        run(4, **{DISPATCH_KWARG: {"lane": "polling", "pending_key": "pending-key"}})
+
+    assert cache.get("pending-key") is True
+    assert _POLLED == []
+
+
+@override_settings(MICBOARD_TASK_LANES={"polling": {"priority": 99, "workers": 0}})
+def test_lane_overrides_ignore_invalid_worker_budgets() -> None:
+    budget = lane_budget(TaskLane.POLLING)
+
+    assert budget.priority == 99
+    assert budget.workers == task_lanes.DEFAULT_LANE_BUDGETS[TaskLane.POLLING].workers
+
+
+def test_task_lane_status_command_lists_every_lane() -> None:
+    stdout = StringIO()
+
+    call_command("task_lane_status", stdout=stdout)
+
+    output = stdout.getvalue()
+    for lane in TaskLane:
+        assert lane.value in output
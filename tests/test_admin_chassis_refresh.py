@@ -99,6 +99,7 @@ def test_native_huey_task_preserves_actor_ids_and_database_alias(refresh_ids: Ma
     assert result == {
         "synced_count": 1,
         "failed_count": 1,
+        "failed_chassis_ids": [],
         "denied": False,
         "truncated": False,
     }
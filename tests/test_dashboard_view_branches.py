@@ -94,10 +94,10 @@ def test_charger_dashboard_post_updates_width_and_supports_htmx() -> None:
 
 def test_simple_dashboard_pages_build_expected_contexts() -> None:
     dashboard_request = request(path="/?manufacturer=vendor")
-    receivers = MagicMock()
+    inventory = MagicMock()
     groups = MagicMock()
     with (
-        patch.object(dashboard.WirelessChassis.objects, "for_user", return_value=receivers),
+        patch.object(dashboard.InventoryCounterService, "totals_for_user", return_value=inventory),
         patch.object(
             dashboard.MonitoringService, "get_user_monitoring_groups", return_value=groups
         ),
@@ -106,7 +106,8 @@ def test_simple_dashboard_pages_build_expected_contexts() -> None:
         view(dashboard.index)(dashboard_request)
         view(dashboard.about)(dashboard_request)
     assert render.call_args_list[0].args[2] == {
-        "device_count": receivers.count.return_value,
+        "device_count": inventory.devices,
+        "inventory": inventory,
         "group_count": groups.count.return_value,
     }
     assert render.call_args_list[1].args[1] == "micboard/about.html"
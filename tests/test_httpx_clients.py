@@ -311,6 +311,24 @@ def test_sse_event_dispatch_rejects_oversized_payload_before_json_decode(caplog)
     assert "exceeded the byte limit" in caplog.text
 
 
+def test_sse_event_dispatch_logs_invalid_json_without_the_payload(caplog) -> None:
+    """Malformed events are dropped with a warning that redacts the decoder error."""
+    callback = AsyncMock()
+
+    with caplog.at_level(logging.WARNING, logger=sennheiser_sse_module.__name__):
+        asyncio.run(
+            sennheiser_sse_module._dispatch_sse_event(
+                b'data: {"secret":"vendor-payload"',
+                callback=callback,
+                max_event_bytes=1024,
+            )
+        )
+
+    callback.assert_not_awaited()
+    assert "invalid JSON" in caplog.text
+    assert "vendor-payload" not in caplog.text
+
+
 def test_sennheiser_sse_missing_content_location_propagates_failure(monkeypatch) -> None:
     """A malformed stream handshake must leave connection tracking as failed."""
 
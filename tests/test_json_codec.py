@@ -0,0 +1,117 @@
+"""Pluggable JSON codec, DRF renderer/parser pair, and codec-backed JSON responses."""
+
+from __future__ import annotations
+
+import io
+import json
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from micboard.api.v1.renderers import FastJSONParser, FastJSONRenderer
+from micboard.utils import json_codec
+from micboard.utils.json_codec import FastJsonResponse, codec_for
+
+AVAILABLE_BACKENDS = [
+    name for name in json_codec.JSON_BACKENDS if name == "stdlib" or json_codec.is_installed(name)
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_codecs() -> None:
+    codec_for.cache_clear()
+    yield
+    codec_for.cache_clear()
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_backends_encode_compact_utf8_with_native_rich_types(backend: str) -> None:
+    codec = codec_for(backend)
+    value = {
+        "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "id": uuid.UUID(int=1),
+        "frequency": Decimal("572.125"),
+        "name": "Bühne",
+        "units": [1, None, True],
+    }
+
+    encoded = codec.dumps(value)
+
+    assert codec.name == backend
+    assert b" " not in encoded
+    assert "Bühne".encode() in encoded
+    assert codec.loads(encoded) == {
+        "at": "2026-01-02T03:04:05Z",
+        "id": "00000000-0000-0000-0000-000000000001",
+        "frequency": "572.125",
+        "name": "Bühne",
+        "units": [1, None, True],
+    }
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+@pytest.mark.parametrize("value", [range(2), MappingProxyType({"a": 1}), (item for item in "ab")])
+def test_backends_reject_types_json_dumps_rejects(backend: str, value: object) -> None:
+    with pytest.raises(TypeError):
+        codec_for(backend).dumps({"value": value})
+
+
+def test_unknown_or_missing_backends_fall_back_to_stdlib(settings, monkeypatch) -> None:
+    monkeypatch.setattr(json_codec, "is_installed", lambda name: False)
+
+    assert codec_for("auto").name == "stdlib"
+    assert codec_for("orjson").name == "stdlib"
+    assert codec_for("yaml").name == "stdlib"
+
+    settings.MICBOARD_JSON_BACKEND = "stdlib"
+    assert json_codec.active_codec().name == "stdlib"
+    assert json_codec.dumps_text({"a": [1]}) == '{"a":[1]}'
+
+
+def test_fast_renderer_matches_the_stock_renderer() -> None:
+    data = {"results": [{"id": 1, "name": "Rack\u2028A", "level": -58.5}], "next": None}
+
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    assert FastJSONRenderer().render(None) == b""
+    assert FastJSONRenderer().render(data, renderer_context={"indent": 2}) == (
+        JSONRenderer().render(data, renderer_context={"indent": 2})
+    )
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_fast_renderer_keeps_drf_encoder_semantics(settings, backend: str) -> None:
+    settings.MICBOARD_JSON_BACKEND = backend
+    data = {"tags": {"a"}, "pair": (item for item in "ab"), "at": datetime(2026, 1, 2, tzinfo=UTC)}
+
+    assert json.loads(FastJSONRenderer().render(data)) == {
+        "tags": ["a"],
+        "pair": ["a", "b"],
+        "at": "2026-01-02T00:00:00Z",
+    }
+
+
+def test_fast_parser_decodes_utf8_and_rejects_malformed_bodies() -> None:
+    parser = FastJSONParser()
+
+    assert parser.parse(io.BytesIO('{"name": "Bühne"}'.encode())) == {"name": "Bühne"}
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b"{not json"))
+
+
+def test_fast_json_response_mirrors_json_response() -> None:
+    response = FastJsonResponse({"status": "ok"}, status=429, headers={"Retry-After": "5"})
+
+    assert response.status_code == 429
+    assert response["Content-Type"] == "application/json"
+    assert response["Retry-After"] == "5"
+    assert json.loads(response.content) == {"status": "ok"}
+    with pytest.raises(TypeError):
+        FastJsonResponse([1, 2])
+    assert json.loads(FastJsonResponse([1, 2], safe=False).content) == [1, 2]
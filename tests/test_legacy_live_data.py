@@ -0,0 +1,117 @@
+"""Pushed device updates carry the per-slot state the legacy channel view applies."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from micboard.services.notification.broadcast_service import BroadcastService
+from micboard.services.notification.device_broadcast_service import (
+    DeviceSnapshotBroadcastService,
+)
+from micboard.websockets.consumers import MicboardConsumer
+from tests.factories.discovery import ManufacturerFactory
+from tests.factories.hardware import WirelessChassisFactory, WirelessUnitFactory
+
+pytestmark = pytest.mark.django_db
+
+# Fields ``updateSlot`` in static/micboard/js/channelview.js reads from each slot, plus the
+# receiver channel static/micboard/js/data.js maps to the configured global tile slot.
+LEGACY_SLOT_FIELDS = {
+    "channel",
+    "name",
+    "status",
+    "battery",
+    "runtime",
+    "antenna",
+    "tx_offset",
+    "quality",
+    "frequency",
+}
+
+
+def _forward(event: dict) -> dict:
+    consumer = object.__new__(MicboardConsumer)
+    consumer.scope = {"user": SimpleNamespace(pk=1, is_authenticated=True)}
+    consumer._can_forward_event = AsyncMock(return_value=True)
+    consumer.send = AsyncMock()
+
+    asyncio.run(consumer.device_update(event))
+
+    return json.loads(consumer.send.await_args.kwargs["text_data"])
+
+
+def test_broadcast_payload_reaches_the_browser_with_slot_states() -> None:
+    manufacturer = ManufacturerFactory(code="legacy-view")
+    chassis = WirelessChassisFactory(manufacturer=manufacturer, status="online", max_channels=2)
+    WirelessUnitFactory(
+        base_chassis=chassis,
+        slot=2,
+        name="Vox 2",
+        battery=3,
+        battery_runtime="04:10",
+        frequency="470.250",
+    )
+    WirelessUnitFactory(base_chassis=chassis, slot=1, name="Vox 1", battery=5)
+    WirelessChassisFactory(manufacturer=manufacturer, status="online")
+
+    with patch.object(BroadcastService, "broadcast_device_update") as broadcast:
+        DeviceSnapshotBroadcastService.broadcast(
+            manufacturer=manufacturer,
+            namespace="legacy",
+            max_devices=10,
+            chunk_size=10,
+        )
+    message = _forward({"type": "device_update", "data": broadcast.call_args.kwargs["data"]})
+
+    assert message["type"] == "device_update"
+    first, second = message["data"]["receivers"]
+    assert first["id"] == chassis.pk
+    assert second["tx"] == []
+    assert [slot["channel"] for slot in first["tx"]] == [1, 2]
+    assert all(slot.keys() >= LEGACY_SLOT_FIELDS for slot in first["tx"])
+    assert first["tx"][1] == {
+        "channel": 2,
+        "name": "Vox 2",
+        "status": "discovered",
+        "battery": 3,
+        "runtime": "04:10",
+        "antenna": "",
+        "tx_offset": 255,
+        "quality": 255,
+        "frequency": "470.250",
+        "audio_level": 0,
+        "rf_level": 0,
+    }
+
+
+def test_same_channel_on_two_receivers_stays_addressable_per_receiver() -> None:
+    """Channel 1 of each receiver must not land on one shared global ``slot`` tile."""
+    manufacturer = ManufacturerFactory(code="legacy-two-rx")
+    left = WirelessChassisFactory(manufacturer=manufacturer, status="online", ip="192.0.2.11")
+    right = WirelessChassisFactory(manufacturer=manufacturer, status="online", ip="192.0.2.12")
+    WirelessUnitFactory(base_chassis=left, slot=1, name="Left Vox")
+    WirelessUnitFactory(base_chassis=right, slot=1, name="Right Vox")
+
+    with patch.object(BroadcastService, "broadcast_device_update") as broadcast:
+        DeviceSnapshotBroadcastService.broadcast(
+            manufacturer=manufacturer,
+            namespace="legacy-two-rx",
+            max_devices=10,
+            chunk_size=10,
+        )
+    message = _forward({"type": "device_update", "data": broadcast.call_args.kwargs["data"]})
+
+    tiles = {
+        (receiver["ip"], unit["channel"]): unit["name"]
+        for receiver in message["data"]["receivers"]
+        for unit in receiver["tx"]
+    }
+    assert tiles == {("192.0.2.11", 1): "Left Vox", ("192.0.2.12", 1): "Right Vox"}
+    assert not any(
+        "slot" in unit for receiver in message["data"]["receivers"] for unit in receiver["tx"]
+    )
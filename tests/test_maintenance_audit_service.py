@@ -105,19 +105,17 @@ def test_audit_individual_pruners_and_retention_validation(monkeypatch) -> None:
             api_health_log_retention_days=30,
         ),
     )
-    sync_query = MagicMock()
-    sync_query.delete.return_value = (4, {})
-    health_query = MagicMock()
-    health_query.delete.return_value = (5, {})
-    monkeypatch.setattr(
-        audit_module.ServiceSyncLog.objects, "filter", Mock(return_value=sync_query)
-    )
-    monkeypatch.setattr(
-        audit_module.APIHealthLog.objects, "filter", Mock(return_value=health_query)
-    )
+    now = datetime(2026, 3, 1, tzinfo=UTC)
+    monkeypatch.setattr(audit_module.timezone, "now", Mock(return_value=now))
+    prune = Mock(side_effect=[4, 5])
+    monkeypatch.setattr(audit_module.AuditLogRetentionService, "prune", prune)
 
     assert AuditService.prune_service_sync_logs() == 4
     assert AuditService.prune_api_health_logs(retention_days=7) == 5
+    assert prune.call_args_list == [
+        (("service_sync",), {"cutoff": now - timedelta(days=20)}),
+        (("api_health",), {"cutoff": now - timedelta(days=7)}),
+    ]
     assert AuditService._resolve_retention_days(None, default=3) == 3
     assert AuditService._resolve_retention_days(0, default=3) == 0
     with pytest.raises(ValueError, match="zero or greater"):
@@ -2,30 +2,39 @@
 
 from __future__ import annotations
 
+import logging
 from unittest.mock import Mock, call
 
+import pytest
+
 from micboard.services.maintenance import logging_mode as mode_module
-from micboard.services.maintenance.logging_mode import LoggingModeService
+from micboard.services.maintenance.logging_mode import LoggingModeFilter, LoggingModeService
+
+
+@pytest.fixture(autouse=True)
+def _fresh_snapshot(monkeypatch) -> None:
+    monkeypatch.setattr(LoggingModeService, "_snapshot", None)
 
 
 def test_logging_mode_expiry_set_and_priority(monkeypatch) -> None:
-    original_set_mode = LoggingModeService.set_mode
     monkeypatch.setattr(mode_module.time, "time", Mock(return_value=100.0))
-    cache_get = Mock(side_effect=["high", 99.0])
-    monkeypatch.setattr(mode_module.cache, "get", cache_get)
-    set_mode = Mock()
-    monkeypatch.setattr(LoggingModeService, "set_mode", set_mode)
+    monkeypatch.setattr(
+        mode_module.cache,
+        "get_many",
+        Mock(return_value={mode_module.CACHE_KEY: "high", mode_module.CACHE_EXPIRY_KEY: 99.0}),
+    )
+    cache_set = Mock()
+    monkeypatch.setattr(mode_module.cache, "set", cache_set)
+    monkeypatch.setattr(mode_module.cache, "delete", Mock())
     assert LoggingModeService.get_current_mode() == "normal"
-    set_mode.assert_called_once_with("normal")
+    cache_set.assert_not_called()
 
-    monkeypatch.setattr(mode_module.cache, "set", Mock())
-    monkeypatch.setattr(mode_module.cache, "delete", Mock())
-    monkeypatch.setattr(LoggingModeService, "set_mode", original_set_mode)
     LoggingModeService.set_mode("high", ttl_seconds=30)
-    assert mode_module.cache.set.call_args_list == [
+    assert cache_set.call_args_list == [
         call(mode_module.CACHE_KEY, "high", timeout=None),
         call(mode_module.CACHE_EXPIRY_KEY, 130.0, timeout=None),
     ]
+    assert LoggingModeService.get_current_mode() == "high"
     LoggingModeService.set_mode("normal")
     mode_module.cache.delete.assert_called_once_with(mode_module.CACHE_EXPIRY_KEY)
 
@@ -37,5 +46,40 @@ def test_logging_mode_expiry_set_and_priority(monkeypatch) -> None:
 
 
 def test_logging_mode_returns_nonexpired_cached_mode(monkeypatch) -> None:
-    monkeypatch.setattr(mode_module.cache, "get", Mock(side_effect=["passive", None]))
+    monkeypatch.setattr(
+        mode_module.cache, "get_many", Mock(return_value={mode_module.CACHE_KEY: "passive"})
+    )
     assert LoggingModeService.get_current_mode() == "passive"
+
+
+def test_logging_mode_checks_reuse_the_local_snapshot_until_refresh(monkeypatch) -> None:
+    clock = Mock(return_value=1000.0)
+    monkeypatch.setattr(mode_module.time, "monotonic", clock)
+    get_many = Mock(return_value={mode_module.CACHE_KEY: "high"})
+    monkeypatch.setattr(mode_module.cache, "get_many", get_many)
+
+    assert all(LoggingModeService.should_log("high") for _ in range(100))
+    get_many.assert_called_once()
+
+    get_many.return_value = {mode_module.CACHE_KEY: "bogus"}
+    clock.return_value = 1000.0 + mode_module.DEFAULT_REFRESH_SECONDS
+    assert LoggingModeService.get_current_mode() == "normal"
+    assert get_many.call_count == 2
+
+
+def test_logging_mode_filter_follows_the_current_mode(monkeypatch) -> None:
+    mode_filter = LoggingModeFilter()
+    records = {
+        level: logging.LogRecord("micboard", level, __file__, 1, "message", None, None)
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING)
+    }
+    admitted = {}
+    for mode in ("passive", "normal", "high"):
+        monkeypatch.setattr(LoggingModeService, "get_current_mode", Mock(return_value=mode))
+        admitted[mode] = [level for level, record in records.items() if mode_filter.filter(record)]
+
+    assert admitted == {
+        "passive": [logging.WARNING],
+        "normal": [logging.INFO, logging.WARNING],
+        "high": [logging.DEBUG, logging.INFO, logging.WARNING],
+    }
@@ -177,5 +177,5 @@ def test_base_user_filter_requires_multitenancy_app() -> None:
     """MSP mode fails closed if its ownership application is unavailable."""
     user = SimpleNamespace(is_authenticated=True, is_superuser=False)
     queryset = TenantOptimizedQuerySet(WirelessChassis, using="default")
-    with patch("micboard.models.base_managers.apps.is_installed", return_value=False):
+    with patch("micboard.multitenancy.context.apps.is_installed", return_value=False):
         assert queryset.for_user(user=user).query.is_empty()
@@ -14,6 +14,7 @@ from django.test import override_settings
 import pytest
 
 from micboard.multitenancy.admin import SuperuserOnlyAdmin
+from micboard.multitenancy.context import TenantMembership
 from micboard.multitenancy.middleware import (
     TenantMiddleware,
     _get_org_from_membership,
@@ -142,19 +143,23 @@ def test_tenant_resolvers_cover_empty_inactive_and_disabled_contexts() -> None:
 
 def test_tenant_membership_and_subdomain_missing_rows_return_none() -> None:
     authenticated = _tenant_request(user=SimpleNamespace(is_authenticated=True, is_superuser=False))
-    chain = MagicMock()
-    chain.select_related.return_value.order_by.return_value.first.return_value = None
     with patch(
-        "micboard.multitenancy.models.OrganizationMembership._default_manager.filter",
-        return_value=chain,
+        "micboard.multitenancy.middleware.tenant_context_for_user",
+        return_value=SimpleNamespace(memberships=()),
     ):
         assert _get_org_from_membership(authenticated) is None
-    chain.select_related.return_value.order_by.return_value.first.return_value = SimpleNamespace(
-        organization=SimpleNamespace(is_active=False)
-    )
-    with patch(
-        "micboard.multitenancy.models.OrganizationMembership._default_manager.filter",
-        return_value=chain,
+    chain = MagicMock()
+    chain.first.return_value = None
+    with (
+        patch(
+            "micboard.multitenancy.middleware.tenant_context_for_user",
+            return_value=SimpleNamespace(
+                memberships=(
+                    TenantMembership(organization_id=2, campus_id=None, role="viewer", site_id=1),
+                )
+            ),
+        ),
+        patch.object(Organization._default_manager, "filter", return_value=chain),
     ):
         assert _get_org_from_membership(authenticated) is None
 
@@ -191,12 +196,10 @@ def test_current_tenant_resolution_falls_through_and_campus_handles_no_restricti
     ):
         assert get_current_organization(request) == "subdomain"
 
-    membership = MagicMock(campus_id=None)
-    membership_filter = MagicMock()
-    membership_filter.first.return_value = membership
+    membership = TenantMembership(organization_id=3, campus_id=None, role="viewer", site_id=1)
     with patch(
-        "micboard.multitenancy.models.OrganizationMembership._default_manager.filter",
-        return_value=membership_filter,
+        "micboard.multitenancy.middleware.tenant_context_for_user",
+        return_value=SimpleNamespace(membership_for=lambda organization_id: membership),
     ):
         assert get_current_campus(request) is None
     request.session = {"current_campus_id": 8}
@@ -25,6 +25,7 @@ from micboard.models.monitoring.group import MonitoringGroup
 from micboard.models.monitoring.performer import Performer
 from micboard.models.monitoring.performer_assignment import PerformerAssignment
 from micboard.models.rf_coordination.rf_channel import RFChannel
+from micboard.multitenancy.context import TenantMembership
 from micboard.multitenancy.middleware import (
     TenantMiddleware,
     _get_org_from_membership,
@@ -210,7 +211,7 @@ def test_msp_user_filter_denies_users_without_memberships() -> None:
     queryset = _queryset_with_model(organization_id=None)
     queryset.none.return_value = "none"
     memberships = MagicMock()
-    memberships.filter.return_value.values_list.return_value = []
+    memberships.filter.return_value.order_by.return_value.values_list.return_value = []
     user = SimpleNamespace(is_superuser=False, org_memberships=memberships)
     assert _for_user(queryset, user=user) == "none"
 
@@ -220,12 +221,12 @@ def test_msp_user_filter_applies_every_membership() -> None:
     """Verify that msp user filter applies every membership."""
     queryset = _queryset_with_model(organization_id=None)
     queryset.for_memberships.return_value = queryset
-    membership_rows = [(2, None), (3, 5)]
+    membership_rows = [(2, None, "viewer", 1), (3, 5, "admin", 1)]
     memberships = MagicMock()
-    memberships.filter.return_value.values_list.return_value = membership_rows
+    memberships.filter.return_value.order_by.return_value.values_list.return_value = membership_rows
     user = SimpleNamespace(is_superuser=False, org_memberships=memberships)
     assert _for_user(queryset, user=user) is queryset
-    queryset.for_memberships.assert_called_once_with(membership_rows)
+    queryset.for_memberships.assert_called_once_with([(2, None), (3, 5)])
 
 
 @override_settings(MICBOARD_MSP_ENABLED=False, MICBOARD_MULTI_SITE_MODE=True)
@@ -324,8 +325,10 @@ def test_session_organization_accepts_superuser_and_clears_denied_access(
         session={"current_organization_id": 4},
         user=SimpleNamespace(is_authenticated=True, is_superuser=False),
     )
-    with patch.object(OrganizationMembership._default_manager, "filter") as membership_filter:
-        membership_filter.return_value.exists.return_value = False
+    with patch(
+        "micboard.multitenancy.middleware.tenant_context_for_user",
+        return_value=SimpleNamespace(organization_ids=frozenset({5})),
+    ):
         assert _get_org_from_session(denied_request) is None
     assert "current_organization_id" not in denied_request.session
 
@@ -350,14 +353,18 @@ def test_profile_organization_requires_authenticated_active_profile() -> None:
     assert _get_org_from_user_profile(_request()) is None
 
 
-@patch.object(OrganizationMembership._default_manager, "filter")
+@patch.object(Organization._default_manager, "filter")
 def test_membership_organization_returns_only_active_organization(mock_filter: MagicMock) -> None:
     """Verify that membership organization returns only active organization."""
     active = SimpleNamespace(is_active=True)
-    chain = mock_filter.return_value.select_related.return_value.order_by.return_value
-    chain.first.return_value = SimpleNamespace(organization=active)
+    mock_filter.return_value.first.return_value = active
+    context = SimpleNamespace(
+        memberships=(TenantMembership(organization_id=9, campus_id=None, role="viewer", site_id=1),)
+    )
     user = SimpleNamespace(is_authenticated=True)
-    assert _get_org_from_membership(_request(user=user)) is active
+    with patch("micboard.multitenancy.middleware.tenant_context_for_user", return_value=context):
+        assert _get_org_from_membership(_request(user=user)) is active
+    mock_filter.assert_called_once_with(pk=9, is_active=True)
     assert _get_org_from_membership(_request()) is None
 
 
@@ -407,18 +414,23 @@ def test_tenant_resolution_is_disabled_by_default() -> None:
 
 
 @override_settings(MICBOARD_MSP_ENABLED=True)
-@patch.object(OrganizationMembership._default_manager, "filter")
-def test_current_campus_prefers_session_then_membership(mock_filter: MagicMock) -> None:
+def test_current_campus_prefers_session_then_membership() -> None:
     """Verify that current campus prefers session then membership."""
     request = _request(session={"current_campus_id": 6})
     assert get_current_campus(request) == 6
 
     request = _request(
         user=SimpleNamespace(is_authenticated=True),
-        organization=object(),
+        organization=SimpleNamespace(pk=4),
+    )
+    context = SimpleNamespace(
+        membership_for=Mock(
+            return_value=TenantMembership(organization_id=4, campus_id=8, role="viewer", site_id=1)
+        )
     )
-    mock_filter.return_value.first.return_value = SimpleNamespace(campus_id=8)
-    assert get_current_campus(request) == 8
+    with patch("micboard.multitenancy.middleware.tenant_context_for_user", return_value=context):
+        assert get_current_campus(request) == 8
+    context.membership_for.assert_called_once_with(4)
 
 
 @patch("micboard.multitenancy.middleware.get_current_campus", return_value=7)
@@ -54,9 +54,12 @@ def test_app_config_registers_every_native_huey_entrypoint() -> None:
     ):
         app_config._register_background_tasks()
 
-    assert register.call_count == 12
+    assert register.call_count == 15
     assert {call.args[0].__name__ for call in register.call_args_list} == {
+        "prune_operational_logs",
         "poll_charger_data",
+        "reconcile_inventory_counters",
+        "drain_alert_email_outbox",
         "check_manufacturer_api_health",
         "check_realtime_connection_health",
         "check_selected_api_server_connections",
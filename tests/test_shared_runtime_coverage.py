@@ -77,28 +77,16 @@ def test_unrestricted_tenant_access_requires_both_conditions(
         )
 
 
-def test_rate_limit_success_limit_and_cache_failures(monkeypatch) -> None:
+def test_rate_limit_falls_back_to_local_counters_when_cache_fails(monkeypatch) -> None:
     monkeypatch.setattr(rate_limiting.time, "time", Mock(return_value=100.0))
-    cache_get = Mock(return_value=[90.0, 99.0])
-    cache_set = Mock()
-    monkeypatch.setattr(rate_limiting.cache, "get", cache_get)
-    monkeypatch.setattr(rate_limiting.cache, "set", cache_set)
+    monkeypatch.setattr(rate_limiting.cache, "incr", Mock(side_effect=RuntimeError("cache down")))
+    rate_limiting.local_counters.clear()
 
-    allowed, retry_after, times = rate_limiting.check_rate_limit("client", 3, 10)
-    assert allowed is True
-    assert retry_after is None
-    assert times == [99.0, 100.0]
-    cache_set.assert_called_once_with("client_window", times, timeout=11)
+    assert rate_limiting.check_rate_limit("client", 1, 10).allowed is True
+    rejected = rate_limiting.check_rate_limit("client", 1, 10)
 
-    cache_get.return_value = [99.0, 99.5, 99.75]
-    allowed, retry_after, times = rate_limiting.check_rate_limit("client", 3, 10)
-    assert allowed is False
-    assert retry_after == 10
-    assert len(times) == 3
-
-    cache_get.side_effect = RuntimeError("cache down")
-    cache_set.side_effect = RuntimeError("cache down")
-    assert rate_limiting.check_rate_limit("client", 1, 10)[0] is True
+    assert rejected.allowed is False
+    assert rejected.retry_after == 10
 
 
 def test_rate_limit_request_identity_helpers() -> None:
@@ -118,3 +106,6 @@ def test_rate_limit_request_identity_helpers() -> None:
     )
     assert rate_limiting.get_user_cache_key(authenticated, "view") == "rate_limit_user_7"
     assert rate_limiting.get_user_cache_key(direct, "view") == ("rate_limit_anon_view_192.0.2.1")
+    assert rate_limiting.get_tenant_cache_key(direct, "view") is None
+    tenant = SimpleNamespace(organization=SimpleNamespace(pk=4))
+    assert rate_limiting.get_tenant_cache_key(tenant, "view") == "rate_limit_tenant_view_4"
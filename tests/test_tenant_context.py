@@ -0,0 +1,101 @@
+"""Request-scoped tenant context resolution, sharing, and invalidation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import override_settings
+
+import pytest
+
+from micboard.models.hardware.wireless_chassis import WirelessChassis
+from micboard.models.locations.structure import Building
+from micboard.multitenancy import context as tenant_context
+from micboard.multitenancy.context import tenant_context_for_user
+from micboard.multitenancy.middleware import TenantMiddleware
+from micboard.multitenancy.models import Campus, Organization, OrganizationMembership
+
+
+@pytest.fixture
+def tenant(django_user_model):
+    user = django_user_model.objects.create_user(username="context-operator")
+    organization = Organization.objects.create(name="Context tenant", slug="context-tenant")
+    campus = Campus.objects.create(organization=organization, name="North", slug="north")
+    OrganizationMembership.objects.create(
+        user=user, organization=organization, campus=campus, role="admin"
+    )
+    visible = Building.objects.create(
+        name="Visible", organization_id=organization.pk, campus_id=campus.pk
+    )
+    Building.objects.create(name="Other campus", organization_id=organization.pk, campus_id=0)
+    return SimpleNamespace(user=user, organization=organization, campus=campus, visible=visible)
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
+def test_scope_queries_share_one_context_per_user_object(tenant, django_assert_num_queries) -> None:
+    context = tenant_context_for_user(tenant.user)
+
+    assert context.scopes == [(tenant.organization.pk, tenant.campus.pk)]
+    assert context.is_tenant_admin is True
+    with django_assert_num_queries(1):
+        assert context.visible_building_ids == frozenset({tenant.visible.pk})
+    with django_assert_num_queries(0):
+        assert tenant_context_for_user(tenant.user) is context
+        assert context.visible_building_ids == frozenset({tenant.visible.pk})
+    with django_assert_num_queries(1):
+        assert list(WirelessChassis.objects.for_user(user=tenant.user)) == []
+    with django_assert_num_queries(1):
+        assert list(Building.objects.filter(pk__in=context.visible_buildings())) == [tenant.visible]
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
+def test_memoized_contexts_recheck_the_shared_generation_after_the_refresh_interval(
+    tenant, monkeypatch
+) -> None:
+    clock = [1_000.0]
+    monkeypatch.setattr(tenant_context.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(tenant_context, "_version_snapshot", None)
+    context = tenant_context_for_user(tenant.user)
+    tenant_context.cache.set("micboard:tenant-context-version", "edited-elsewhere", timeout=None)
+
+    with patch.object(tenant_context.cache, "get", wraps=tenant_context.cache.get) as cache_get:
+        assert tenant_context_for_user(tenant.user) is context
+        cache_get.assert_not_called()
+        clock[0] += tenant_context.DEFAULT_REFRESH_SECONDS
+
+        assert tenant_context_for_user(tenant.user).version == "edited-elsewhere"
+    cache_get.assert_called_once()
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
+def test_membership_changes_retire_memoized_contexts(tenant) -> None:
+    context = tenant_context_for_user(tenant.user)
+    other = Organization.objects.create(name="Second tenant", slug="second-tenant")
+    OrganizationMembership.objects.create(user=tenant.user, organization=other)
+
+    refreshed = tenant_context_for_user(tenant.user)
+
+    assert refreshed is not context
+    assert refreshed.organization_ids == {tenant.organization.pk, other.pk}
+
+    tenant.organization.is_active = False
+    tenant.organization.save()
+    assert tenant_context_for_user(tenant.user).organization_ids == {other.pk}
+
+
+@pytest.mark.django_db
+@override_settings(MICBOARD_MSP_ENABLED=True, MICBOARD_ALLOW_CROSS_ORG_VIEW=False)
+def test_middleware_attaches_context_with_the_selected_tenant(tenant, rf) -> None:
+    request = rf.get("/")
+    request.user = tenant.user
+    request.session = {}
+
+    context = TenantMiddleware(lambda incoming: incoming.tenant_context)(request)
+
+    assert context.organization_id == tenant.organization.pk
+    assert context.campus_id == tenant.campus.pk
+    assert context.memberships == tenant_context_for_user(tenant.user).memberships
@@ -12,6 +12,7 @@ import pytest
 
 from micboard.context_processors import api_health
 from micboard.decorators import rate_limit_user, rate_limit_view
+from micboard.services.shared.rate_limiting import RateLimitDecision
 from micboard.templatetags.micboard_tags import get_item, wireless_battery_percentage
 
 
@@ -47,12 +48,17 @@ def test_rate_limit_view_allows_default_ip_key() -> None:
 
     with (
         patch("micboard.decorators.get_client_ip", return_value="192.0.2.5"),
-        patch("micboard.decorators.check_rate_limit", return_value=(True, 0, 1)) as check,
+        patch(
+            "micboard.decorators.check_rate_limit",
+            return_value=RateLimitDecision(allowed=True, limit=2),
+        ) as check,
     ):
         response = rate_limit_view(max_requests=2, window_seconds=10)(view)(request, 4, flag=True)
 
     assert response.content == b"ok"
-    check.assert_called_once_with("rate_limit_sample_view_192.0.2.5", 2, 10)
+    check.assert_called_once_with(
+        "rate_limit_sample_view_192.0.2.5", 2, 10, burst=0, shared_quotas=[]
+    )
     view.assert_called_once_with(request, 4, flag=True)
 
 
@@ -61,7 +67,10 @@ def test_rate_limit_view_rejects_custom_key_with_retry_header() -> None:
     key_func = Mock(return_value="custom-key")
     view = Mock(__name__="sample_view")
 
-    with patch("micboard.decorators.check_rate_limit", return_value=(False, 17, 2)):
+    with patch(
+        "micboard.decorators.check_rate_limit",
+        return_value=RateLimitDecision(allowed=False, retry_after=17, limit=4),
+    ):
         response = rate_limit_view(4, 30, key_func)(view)(request)
 
     assert response.status_code == 429
@@ -81,10 +90,13 @@ def test_rate_limit_user_uses_authenticated_user_key() -> None:
 
     with (
         patch("micboard.decorators.get_user_cache_key", return_value="user:3") as get_key,
-        patch("micboard.decorators.check_rate_limit", return_value=(True, 0, 1)) as check,
+        patch(
+            "micboard.decorators.check_rate_limit",
+            return_value=RateLimitDecision(allowed=True, limit=2),
+        ) as check,
     ):
         response = rate_limit_user(8, 45)(view)(request)
 
     assert response.status_code == 200
     get_key.assert_called_once_with(request, view_func_name="protected")
-    check.assert_called_once_with("user:3", 8, 45)
+    check.assert_called_once_with("user:3", 8, 45, burst=0, shared_quotas=[])
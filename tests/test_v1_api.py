@@ -8,11 +8,14 @@ the test integrates cleanly with the rest of the suite.
 from __future__ import annotations
 
 from django.urls import reverse
+from django.utils import timezone
 
 import pytest
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
+from micboard.api.v1.renderers import FastJSONRenderer
 from micboard.models.discovery.manufacturer import Manufacturer
 from micboard.models.discovery.registry import DiscoveredDevice
 from micboard.models.hardware.wireless_chassis import WirelessChassis
@@ -200,7 +203,13 @@ class TestV1SuperuserScoping:
         api_client.force_authenticate(user=superuser)
         response = api_client.get(reverse("micboard:api_v1:chassis-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data["results"]) == 1
+
+    def test_lists_render_through_the_json_codec(self, api_client, superuser, _api_seed) -> None:
+        api_client.force_authenticate(user=superuser)
+        response = api_client.get(reverse("micboard:api_v1:chassis-list"))
+        assert isinstance(response.accepted_renderer, FastJSONRenderer)
+        assert response.content == JSONRenderer().render(response.data)
 
     def test_superuser_sees_all_discovery(self, api_client, superuser, _api_seed) -> None:
         api_client.force_authenticate(user=superuser)
@@ -223,7 +232,7 @@ class TestV1RegularUserScoping:
         api_client.force_authenticate(user=regular_user)
         response = api_client.get(reverse("micboard:api_v1:chassis-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data["results"]) == 1
 
     def test_regular_user_cannot_see_discovery(self, api_client, regular_user, _api_seed) -> None:
         api_client.force_authenticate(user=regular_user)
@@ -288,3 +297,97 @@ class TestV1RedactionRules:
         alert = next(a for a in response.data if a["id"] == alert_for_user.pk)
         assert alert["channel_data"]["secret_token"] == "********"
         assert alert["channel_data"]["rf_level"] == -85
+
+
+@pytest.mark.django_db
+class TestV1HardwareSync:
+    """Hardware lists page by keyset, filter by change time, and render sparse fields."""
+
+    @pytest.fixture()
+    def inventory(self, _api_seed):
+        chassis = _api_seed["chassis"]
+        for index in range(2, 7):
+            WirelessChassis.objects.create(
+                manufacturer=chassis.manufacturer,
+                api_device_id=f"chassis-{index}",
+                role="receiver",
+                ip=f"192.0.2.{index}",
+                location=chassis.location,
+            )
+        return chassis
+
+    def _walk(self, api_client, url: str, params: dict[str, object]) -> list[list[dict]]:
+        pages = []
+        response = api_client.get(url, params)
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.data["results"])
+            if response.data["next"] is None:
+                return pages
+            response = api_client.get(response.data["next"])
+
+    def test_keyset_pages_cover_every_row_at_a_constant_query_count(
+        self, api_client, superuser, inventory, django_assert_max_num_queries
+    ) -> None:
+        api_client.force_authenticate(user=superuser)
+        url = reverse("micboard:api_v1:chassis-list")
+
+        pages = self._walk(api_client, url, {"page_size": 2})
+
+        assert [len(page) for page in pages] == [2, 2, 2]
+        rows = [row for page in pages for row in page]
+        assert len({row["id"] for row in rows}) == WirelessChassis.objects.count() == 6
+        assert {row["manufacturer"] for row in rows} == {inventory.manufacturer_id}
+        with django_assert_max_num_queries(1):
+            api_client.get(url, {"page_size": 500})
+
+    def test_updated_since_returns_only_changed_rows(
+        self, api_client, superuser, inventory
+    ) -> None:
+        api_client.force_authenticate(user=superuser)
+        checkpoint = timezone.now()
+        changed = WirelessChassis.objects.get(api_device_id="chassis-3")
+        changed.name = "Renamed"
+        changed.save(update_fields=["name"])
+
+        response = api_client.get(
+            reverse("micboard:api_v1:chassis-list"),
+            {"updated_since": checkpoint.isoformat()},
+        )
+
+        assert [row["api_device_id"] for row in response.data["results"]] == ["chassis-3"]
+
+    def test_sparse_fieldset_renders_only_requested_fields(
+        self, api_client, superuser, _api_seed
+    ) -> None:
+        api_client.force_authenticate(user=superuser)
+
+        response = api_client.get(
+            reverse("micboard:api_v1:channels-list"),
+            {"fields": "id,channel_number,chassis"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0] == {
+            "id": _api_seed["chassis"].rf_channels.get(channel_number=1).pk,
+            "channel_number": 1,
+            "chassis": _api_seed["chassis"].pk,
+        }
+
+    @pytest.mark.parametrize(
+        ("params", "expected_status"),
+        [
+            ({"fields": "id,password"}, status.HTTP_400_BAD_REQUEST),
+            ({"fields": ","}, status.HTTP_400_BAD_REQUEST),
+            ({"updated_since": "yesterday"}, status.HTTP_400_BAD_REQUEST),
+            ({"cursor": "not-a-cursor"}, status.HTTP_404_NOT_FOUND),
+        ],
+    )
+    def test_invalid_sync_parameters_are_rejected(
+        self, api_client, superuser, _api_seed, params, expected_status
+    ) -> None:
+        api_client.force_authenticate(user=superuser)
+
+        response = api_client.get(reverse("micboard:api_v1:units-list"), params)
+
+        assert response.status_code == expected_status
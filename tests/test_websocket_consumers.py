@@ -70,6 +70,11 @@ def test_consumer_adapters_disconnect_receive_and_forward(monkeypatch) -> None:
     for handler, event, expected_type in (
         (consumer.device_update, {"data": {"id": 1}}, "device_update"),
         (consumer.status_update, {"message": "ready"}, "status"),
+        (
+            consumer.fragment_change,
+            {"type": "fragment_change", "fragment": "alerts"},
+            "fragment_change",
+        ),
     ):
         asyncio.run(handler(event))
         assert json.loads(consumer.send.await_args.kwargs["text_data"])["type"] == expected_type